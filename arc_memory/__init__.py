@@ -2,5 +2,17 @@
 
 __version__ = "0.7.4"
 
-# Export the Arc class for easy import
-from arc_memory.sdk.core import Arc
+__all__ = ["Arc", "__version__"]
+
+
+def __getattr__(name):
+    """Import the Arc class on first access.
+
+    Importing the SDK pulls in the database, schema and framework adapter
+    modules, which CLI commands such as ``arc version`` never need.
+    """
+    if name == "Arc":
+        from arc_memory.sdk.core import Arc
+
+        return Arc
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,10 @@
 
 import json
 import os
+import threading
 import time
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 import keyring
@@ -34,6 +35,11 @@ ENV_CLIENT_ID = "ARC_GITHUB_CLIENT_ID"
 ENV_CLIENT_SECRET = "ARC_GITHUB_CLIENT_SECRET"
 
 
+# Keyring values read by this process, with the keyring backend they came from
+_keyring_values: Dict[Tuple[str, str], Tuple[Any, Optional[str]]] = {}
+_keyring_lock = threading.Lock()
+
+
 class GitHubAppConfig(BaseModel):
     """Configuration for a GitHub App."""
 
@@ -43,6 +49,42 @@ class GitHubAppConfig(BaseModel):
     client_secret: str
 
 
+def _get_keyring_password(username: str) -> Optional[str]:
+    """Read a value from the system keyring, at most once per process.
+
+    Keyring backends can be slow (some talk to a desktop service over D-Bus),
+    and a build looks up the same credentials several times. Values are
+    remembered per backend, so switching backends reads them again.
+
+    Args:
+        username: The keyring username under the Arc Memory service.
+
+    Returns:
+        The stored value, or None if there is none.
+
+    Raises:
+        Exception: If the keyring can't be read; failures aren't remembered.
+    """
+    backend = keyring.get_keyring()
+    key = (KEYRING_SERVICE, username)
+    with _keyring_lock:
+        cached = _keyring_values.get(key)
+    if cached is not None and cached[0] is backend:
+        return cached[1]
+
+    value = keyring.get_password(KEYRING_SERVICE, username)
+    with _keyring_lock:
+        _keyring_values[key] = (backend, value)
+    return value
+
+
+def _set_keyring_password(username: str, value: str) -> None:
+    """Store a value in the system keyring and remember it."""
+    keyring.set_password(KEYRING_SERVICE, username, value)
+    with _keyring_lock:
+        _keyring_values[(KEYRING_SERVICE, username)] = (keyring.get_keyring(), value)
+
+
 def get_token_from_env() -> Optional[str]:
     """Get a GitHub token from environment variables.
 
@@ -73,7 +115,7 @@ def get_token_from_keyring() -> Optional[str]:
         The token, or None if not found.
     """
     try:
-        token = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        token = _get_keyring_password(KEYRING_USERNAME)
         if token:
             logger.info("Found GitHub token in system keyring")
             return token
@@ -122,7 +164,7 @@ def get_github_app_config_from_keyring() -> Optional[GitHubAppConfig]:
         The GitHub App configuration, or None if not found.
     """
     try:
-        config_json = keyring.get_password(KEYRING_SERVICE, KEYRING_APP_USERNAME)
+        config_json = _get_keyring_password(KEYRING_APP_USERNAME)
         if config_json:
             config_dict = json.loads(config_json)
             logger.info(f"Found GitHub App configuration in system keyring (App ID: {config_dict.get('app_id')})")
@@ -143,7 +185,7 @@ def store_token_in_keyring(token: str) -> bool:
         True if successful, False otherwise.
     """
     try:
-        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, token)
+        _set_keyring_password(KEYRING_USERNAME, token)
         logger.info("Stored GitHub token in system keyring")
         return True
     except Exception as e:
@@ -162,7 +204,7 @@ def store_github_app_config_in_keyring(config: GitHubAppConfig) -> bool:
     """
     try:
         config_json = json.dumps(config.model_dump())
-        keyring.set_password(KEYRING_SERVICE, KEYRING_APP_USERNAME, config_json)
+        _set_keyring_password(KEYRING_APP_USERNAME, config_json)
         logger.info(f"Stored GitHub App configuration in system keyring (App ID: {config.app_id})")
         return True
     except Exception as e:
@@ -194,6 +236,11 @@ def get_installation_token_for_repo(
 ) -> Optional[str]:
     """Get an installation token for a repository.
 
+    Tokens are cached in memory and in an encrypted file shared by all `arc`
+    processes (see arc_memory.auth.token_cache), together with the
+    installation ID, and refreshed in the background shortly before they
+    expire. GitHub is only asked for a token when no cached one is valid.
+
     Args:
         owner: The repository owner.
         repo: The repository name.
@@ -202,17 +249,23 @@ def get_installation_token_for_repo(
     Returns:
         The installation token, or None if it could not be obtained.
     """
+    from arc_memory.auth.token_cache import get_token_cache
+
     if not app_config:
         app_config = get_github_app_config()
         if not app_config:
             logger.warning("No GitHub App configuration found")
             return None
 
-    try:
-        installation_id = get_installation_id(app_config.app_id, app_config.private_key, owner, repo)
-        token, _ = get_installation_token(app_config.app_id, app_config.private_key, installation_id)
+    def fetch(installation_id: Optional[str]) -> Tuple[str, Optional[datetime], str]:
+        if installation_id is None:
+            installation_id = get_installation_id(app_config.app_id, app_config.private_key, owner, repo)
+        token, expires_at = get_installation_token(app_config.app_id, app_config.private_key, installation_id)
         logger.info(f"Got installation token for {owner}/{repo}")
-        return token
+        return token, expires_at, installation_id
+
+    try:
+        return get_token_cache().get_token(f"{app_config.app_id}:{owner}/{repo}".lower(), fetch)
     except GitHubAuthError as e:
         logger.warning(f"Failed to get installation token: {e}")
         return None
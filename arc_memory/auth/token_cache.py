@@ -0,0 +1,328 @@
+"""Cache for GitHub App installation tokens.
+
+Getting an installation token takes a signed JWT and two GitHub API calls
+(the repository's installation ID, then the token itself). Tokens are valid
+for an hour, so they are cached with their expiry:
+
+- in memory, so one process asks GitHub at most once per token lifetime;
+- on disk, encrypted with a machine-specific key, so short-lived `arc`
+  invocations (such as CI jobs) share tokens; a lock file keeps concurrent
+  processes from minting the same token twice;
+- installation IDs are kept with the tokens, so a refresh is a single call.
+
+Tokens that are close to expiring are refreshed in the background while the
+current token is still handed out. Only tokens that were used since their
+last refresh are refreshed; idle tokens are left to expire, so unused
+installations don't use up the rate limit.
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+# Environment variable overriding the location of the token cache file
+ENV_TOKEN_CACHE_PATH = "ARC_GITHUB_TOKEN_CACHE"
+
+# Tokens expiring within this many seconds are refreshed in the background
+DEFAULT_REFRESH_MARGIN = 5 * 60
+
+# Tokens expiring within this many seconds are never handed out
+MIN_TOKEN_VALIDITY = 60
+
+# Salt for deriving the cache encryption key
+ENCRYPTION_SALT = b"arc_memory_github_tokens"
+
+# A function that gets a new token for a cached installation ID (or None if
+# the ID isn't known yet) and returns (token, expires_at, installation_id)
+TokenFetcher = Callable[[Optional[str]], Tuple[str, Optional[datetime], str]]
+
+
+def get_default_cache_path() -> Path:
+    """Get the path of the token cache file.
+
+    Returns:
+        The path from ARC_GITHUB_TOKEN_CACHE, or ~/.arc/github_tokens.enc.
+    """
+    path = os.environ.get(ENV_TOKEN_CACHE_PATH)
+    if path:
+        return Path(path).expanduser()
+    return Path.home() / ".arc" / "github_tokens.enc"
+
+
+@lru_cache(maxsize=1)
+def _encryption_key() -> bytes:
+    """Derive the cache encryption key from the machine's hostname and user.
+
+    A cache file copied to another machine can't be decrypted there.
+    """
+    try:
+        username = os.environ.get("USER") or os.environ.get("USERNAME") or "unknown"
+        hostname = os.uname().nodename if hasattr(os, "uname") else "unknown"
+        machine_identifier = f"{hostname}:{username}".encode()
+    except Exception:
+        machine_identifier = b"arc_memory_default_machine"
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=ENCRYPTION_SALT,
+        iterations=100000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(machine_identifier))
+
+
+class InstallationTokenCache:
+    """In-memory and on-disk cache of GitHub App installation tokens.
+
+    Entries are keyed by an opaque string (the GitHub module uses the app ID
+    and repository) and hold the token, its expiry as a Unix timestamp and
+    the installation ID.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        min_validity: float = MIN_TOKEN_VALIDITY,
+        background: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the encrypted cache file. If None, uses the default path.
+            refresh_margin: Seconds before expiry at which tokens are refreshed
+                in the background.
+            min_validity: Minimum remaining validity, in seconds, of a token
+                that is handed out; older tokens are refreshed first.
+            background: Whether to refresh tokens on background threads.
+            clock: Clock returning the current Unix time (overridable for tests).
+        """
+        self.path = Path(path) if path else get_default_cache_path()
+        self.refresh_margin = refresh_margin
+        self.min_validity = min_validity
+        self.background = background
+        self.clock = clock
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._timers: Dict[str, threading.Timer] = {}
+        self._refreshing: set = set()
+        # When each token was last handed out from the cache and last refreshed
+        self._last_used: Dict[str, float] = {}
+        self._refreshed_at: Dict[str, float] = {}
+
+    def get_token(self, key: str, fetch: TokenFetcher) -> str:
+        """Get a cached token, fetching a new one if needed.
+
+        Args:
+            key: The cache key.
+            fetch: Function that gets a new token.
+
+        Returns:
+            A token valid for at least `min_validity` seconds.
+
+        Raises:
+            Exception: Whatever `fetch` raises if no usable token is cached.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._entries.update(self._read())
+                self._loaded = True
+            entry = self._entries.get(key)
+            if entry and entry["expires_at"] <= self.clock():
+                del self._entries[key]
+
+        if self._is_usable(entry):
+            with self._lock:
+                self._last_used[key] = self.clock()
+            self._schedule_refresh(key, fetch, entry)
+            return entry["token"]
+        return self._refresh(key, fetch)["token"]
+
+    def clear(self) -> None:
+        """Forget every token in memory and cancel scheduled refreshes."""
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._entries.clear()
+            self._last_used.clear()
+            self._refreshed_at.clear()
+            self._loaded = False
+
+    def _is_usable(self, entry: Optional[Dict[str, Any]]) -> bool:
+        """Check whether an entry's token is valid for long enough to hand out."""
+        return bool(entry) and entry["expires_at"] - self.clock() > self.min_validity
+
+    def _refresh(self, key: str, fetch: TokenFetcher) -> Dict[str, Any]:
+        """Get a new token unless another process or thread just did.
+
+        Args:
+            key: The cache key.
+            fetch: Function that gets a new token.
+
+        Returns:
+            The cache entry; the token isn't cached if GitHub gave no expiry.
+        """
+        entry: Optional[Dict[str, Any]] = None
+        try:
+            with self._file_lock():
+                on_disk = self._read()
+                current = on_disk.get(key)
+                # Another process may have refreshed it while we waited for the lock
+                if self._is_usable(current) and current["expires_at"] - self.clock() > self.refresh_margin:
+                    entry = current
+                else:
+                    entry = self._fetch(fetch, self._installation_id(key, current))
+                    if entry["expires_at"] is None:
+                        return entry
+                    on_disk[key] = entry
+                    self._write(on_disk)
+        except OSError as e:
+            # Without a usable cache file, the token is only cached in memory
+            logger.debug(f"Could not use token cache {self.path}: {e}")
+            if entry is None:
+                entry = self._fetch(fetch, self._installation_id(key, None))
+                if entry["expires_at"] is None:
+                    return entry
+
+        with self._lock:
+            self._entries[key] = entry
+            self._refreshed_at[key] = self.clock()
+        self._schedule_refresh(key, fetch, entry)
+        return entry
+
+    def _installation_id(self, key: str, entry: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Get the installation ID known for a key, if any."""
+        known = entry or self._entries.get(key)
+        return known.get("installation_id") if known else None
+
+    @staticmethod
+    def _fetch(fetch: TokenFetcher, installation_id: Optional[str]) -> Dict[str, Any]:
+        """Get a new token, looking up the installation ID again if the cached one fails."""
+        try:
+            token, expires_at, installation_id = fetch(installation_id)
+        except Exception:
+            if installation_id is None:
+                raise
+            # The app may have been reinstalled under a new installation ID
+            token, expires_at, installation_id = fetch(None)
+        return {
+            "token": token,
+            "expires_at": expires_at.timestamp() if expires_at else None,
+            "installation_id": installation_id,
+        }
+
+    def _schedule_refresh(self, key: str, fetch: TokenFetcher, entry: Dict[str, Any]) -> None:
+        """Refresh a token on a background thread shortly before it expires."""
+        if not self.background:
+            return
+        delay = entry["expires_at"] - self.refresh_margin - self.clock()
+        with self._lock:
+            if key in self._refreshing:
+                return
+            scheduled = self._timers.get(key)
+            if scheduled is not None:
+                # A timer that should already have fired (e.g. after the
+                # machine slept) is replaced by an immediate refresh
+                if delay > 0:
+                    return
+                scheduled.cancel()
+            timer = threading.Timer(max(0.0, delay), self._refresh_in_background, (key, fetch))
+            timer.daemon = True
+            self._timers[key] = timer
+        timer.start()
+
+    def _refresh_in_background(self, key: str, fetch: TokenFetcher) -> None:
+        """Refresh a token, keeping the current one if that fails.
+
+        Tokens that weren't used since their last refresh aren't refreshed,
+        and aren't scheduled again; the next use fetches a new token.
+        """
+        with self._lock:
+            self._timers.pop(key, None)
+            if self._last_used.get(key, float("-inf")) < self._refreshed_at.get(key, 0.0):
+                logger.debug(f"Letting idle GitHub installation token {key} expire")
+                self._last_used.pop(key, None)
+                self._refreshed_at.pop(key, None)
+                return
+            self._refreshing.add(key)
+        try:
+            self._refresh(key, fetch)
+        except Exception as e:
+            logger.warning(f"Background refresh of GitHub installation token failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the cache file across processes."""
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            fcntl = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read the unexpired entries of the cache file."""
+        try:
+            data = Fernet(_encryption_key()).decrypt(self.path.read_bytes())
+            entries = json.loads(data)
+        except FileNotFoundError:
+            return {}
+        except (OSError, InvalidToken, ValueError) as e:
+            logger.debug(f"Ignoring unreadable token cache {self.path}: {e}")
+            return {}
+        now = self.clock()
+        return {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and entry.get("expires_at", 0) > now
+        }
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Encrypt and atomically replace the cache file."""
+        data = Fernet(_encryption_key()).encrypt(json.dumps(entries).encode())
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+
+_default_cache: Optional[InstallationTokenCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> InstallationTokenCache:
+    """Get the process-wide installation token cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = InstallationTokenCache()
+        return _default_cache
@@ -10,10 +10,14 @@ from arc_memory.auto_refresh.core import (
     refresh_source,
     refresh_knowledge_graph,
 )
+from arc_memory.auto_refresh.daemon import RefreshDaemon
+from arc_memory.auto_refresh.webhooks import WebhookReceiver
 
 __all__ = [
     "check_refresh_needed",
     "refresh_all_sources",
     "refresh_source",
     "refresh_knowledge_graph",
+    "RefreshDaemon",
+    "WebhookReceiver",
 ]
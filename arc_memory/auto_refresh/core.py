@@ -4,18 +4,24 @@ This module provides the core functionality for automatically refreshing the kno
 with the latest data from various sources.
 """
 
+import math
 import os
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union, Any
 
 from arc_memory.db import get_adapter
 from arc_memory.db.metadata import (
     get_refresh_timestamp,
     get_all_refresh_timestamps,
 )
+from arc_memory.db.registry import SharedAdapter, get_adapter_registry, shared_adapter
 from arc_memory.errors import AutoRefreshError
 from arc_memory.ingest.adr import ADRIngestor
 from arc_memory.ingest.change_patterns import ChangePatternIngestor
@@ -29,6 +35,8 @@ from arc_memory.plugins import get_ingestor_plugins
 from arc_memory.process.kgot import enhance_with_reasoning_structures
 from arc_memory.process.semantic_analysis import enhance_with_semantic_analysis
 from arc_memory.process.temporal_analysis import enhance_with_temporal_analysis
+from arc_memory.profiling import span, trace_connection
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
 from arc_memory.schema.models import Edge, Node
 from arc_memory.sql.db import add_nodes_and_edges, compress_db, ensure_arc_dir, ensure_path, get_db_path, init_db
 
@@ -44,62 +52,260 @@ from arc_memory.process.architecture_extraction import extract_architecture
 
 logger = get_logger(__name__)
 
+# Default number of sources refreshed concurrently
+DEFAULT_MAX_CONCURRENT_REFRESHES = 4
 
-def get_ingestor_metadata(ingestor_name, db_path, verbose=False):
+# Ingestors that share no clients and can run at the same time during a build
+CONCURRENT_INGESTORS = ("git", "github", "linear", "adr")
+
+# Metadata key prefix of incremental ingestor metadata on adapters without SQL
+INGESTOR_METADATA_PREFIX = "ingestor_metadata:"
+
+
+class RefreshWriter:
+    """Single-writer queue that owns the database adapter during a refresh.
+
+    Source refreshes run on worker threads, but every database call they make is
+    executed on one dedicated writer thread through a queue. This keeps writes
+    serialized on a single connection while fetching from GitHub, Linear, etc.
+    happens in parallel. Unless an adapter is given, the writer uses the
+    process-wide shared adapter of the database, so refresh bookkeeping written
+    through `arc_memory.db.metadata` goes through the same connection.
+    """
+
+    def __init__(
+        self,
+        adapter_type: Optional[str] = None,
+        adapter: Any = None,
+        db_path: Optional[Union[str, Path]] = None,
+        connection_params: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            adapter_type: The type of database adapter to use. If None, uses the
+                configured adapter.
+            adapter: An adapter to use instead of the shared one. It must not be
+                used by any other thread while the writer is running. It is
+                connected if needed, and then disconnected when the writer closes.
+            db_path: Path to the database. If None, uses the default path.
+            connection_params: Extra parameters used if the connection is opened.
+        """
+        self.adapter_type = adapter_type
+        self.adapter = adapter
+        self._handle: Optional[SharedAdapter] = None
+        self._connected_adapter = False
+        self.db_path = db_path
+        self.connection_params = connection_params or {}
+        self._traced = False
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple[Callable[[Any], Any], Future]]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="arc-refresh-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            func, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with self._locked_adapter() as adapter:
+                    future.set_result(func(adapter))
+            except BaseException as e:
+                future.set_exception(e)
+
+        if self._handle is not None:
+            self._handle.release()
+        # Connections can only be closed by the thread that opened them
+        if self._connected_adapter and self.adapter.is_connected():
+            self.adapter.disconnect()
+
+    @contextmanager
+    def _locked_adapter(self) -> Iterator[Any]:
+        """Get the adapter, holding the shared adapter's lock if it is used."""
+        if self.adapter is None and self._handle is None:
+            self._handle = shared_adapter(
+                self.adapter_type, self.db_path, self.connection_params, factory=get_adapter
+            )
+
+        if self._handle is not None:
+            with self._handle.locked() as adapter:
+                self._trace(adapter)
+                yield adapter
+        else:
+            if not self.adapter.is_connected():
+                db_path = self.db_path or get_db_path()
+                self.adapter.connect({"db_path": str(db_path), **self.connection_params})
+                self.adapter.init_db()
+                self._connected_adapter = True
+            self._trace(self.adapter)
+            yield self.adapter
+
+    def _trace(self, adapter: Any) -> None:
+        if not self._traced:
+            trace_connection(getattr(adapter, "conn", None))
+            self._traced = True
+
+    def submit(self, func: Callable[[Any], Any]) -> Future:
+        """Queue a function to run with the adapter on the writer thread.
+
+        Once the writer is closed, the returned future fails with an
+        `AutoRefreshError` instead of waiting for a thread that has stopped.
+        """
+        future: Future = Future()
+        with self._close_lock:
+            if not self._closed:
+                self._queue.put((func, future))
+                return future
+
+        future.set_exception(AutoRefreshError("Refresh writer is closed"))
+        return future
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call an adapter method on the writer thread and wait for the result."""
+        def run(adapter: Any) -> Any:
+            with span(f"db.{method}"):
+                return getattr(adapter, method)(*args, **kwargs)
+
+        return self.submit(run).result()
+
+    def adapter_for(self, source: str) -> "_QueuedAdapter":
+        """Get an adapter proxy for a source that routes calls through the queue."""
+        return _QueuedAdapter(self, source)
+
+    def close(self) -> None:
+        """Drain the queue and stop the writer thread. Later calls are rejected."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+
+class _QueuedAdapter:
+    """Adapter proxy handed to source refresh functions running on worker threads.
+
+    Calls are forwarded to the `RefreshWriter` thread. Once a source is cancelled
+    (for example after a timeout), any further calls from its worker are rejected,
+    so an abandoned fetch can never write partial results.
+    """
+
+    def __init__(self, writer: RefreshWriter, source: str):
+        self._writer = writer
+        self._source = source
+        self.cancelled = threading.Event()
+
+    def is_connected(self) -> bool:
+        return True
+
+    def run(self, func: Callable[[Any], Any]) -> Any:
+        """Run a function with the real adapter on the writer thread.
+
+        Nothing else writes between the calls the function makes, so it can
+        read, change and save a value in one step.
+        """
+        self._check_cancelled("run")
+        return self._writer.submit(func).result()
+
+    def _check_cancelled(self, name: str) -> None:
+        if self.cancelled.is_set():
+            raise AutoRefreshError(
+                f"Refresh of source '{self._source}' was cancelled",
+                details={"source": self._source, "method": name},
+            )
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        def method(*args: Any, **kwargs: Any) -> Any:
+            self._check_cancelled(name)
+            return self._writer.call(name, *args, **kwargs)
+
+        return method
+
+
+def _load_ingestor_metadata(adapter: Any, ingestor_name: str) -> Optional[Dict[str, Any]]:
+    """Read an ingestor's metadata with a connected adapter."""
+    if getattr(adapter, "conn", None) is None:
+        # Adapters without a SQL connection keep it with their other metadata
+        return adapter.get_metadata(f"{INGESTOR_METADATA_PREFIX}{ingestor_name}")
+
+    rows = adapter.conn.execute(
+        "SELECT metadata FROM refresh_timestamps WHERE source = ?",
+        (ingestor_name,)
+    ).fetchall()
+
+    if rows and rows[0][0]:
+        import json
+        return json.loads(rows[0][0])
+    return None
+
+
+def _store_ingestor_metadata(adapter: Any, ingestor_name: str, metadata: Dict[str, Any]) -> None:
+    """Write an ingestor's metadata with a connected adapter."""
+    import json
+
+    if getattr(adapter, "conn", None) is None:
+        adapter.save_metadata(f"{INGESTOR_METADATA_PREFIX}{ingestor_name}", metadata)
+        return
+
+    adapter.conn.execute(
+        "INSERT OR REPLACE INTO refresh_timestamps (source, timestamp, metadata) VALUES (?, ?, ?)",
+        (ingestor_name, datetime.now().isoformat(), json.dumps(metadata))
+    )
+    adapter.conn.commit()
+
+
+def get_ingestor_metadata(ingestor_name, db_path, verbose=False, writer=None, adapter_type=None):
     """Get the last processed metadata for an ingestor.
 
-    This function handles running the migration to ensure the metadata column exists,
-    and then retrieves the last processed metadata for the specified ingestor.
+    During a refresh the metadata is read through the refresh's `RefreshWriter`.
+    Otherwise the database is read through the process-wide shared adapter, so
+    looking up the metadata of every ingestor opens (and migrates) the database
+    once.
 
     Args:
         ingestor_name: The name of the ingestor.
         db_path: Path to the database file.
         verbose: Whether to print verbose output.
+        writer: The `RefreshWriter` that owns the database, if any.
+        adapter_type: The type of database adapter to use without a writer. If
+            None, uses the configured adapter.
 
     Returns:
         The last processed metadata for the ingestor, or None if not found.
     """
-    from arc_memory.sql.db import get_connection
-
-    # Run the migration to ensure the metadata column exists
-    try:
-        from arc_memory.migrations.add_metadata_column import run_migration
-        run_migration(Path(db_path))
-    except Exception as e:
+    if not Path(db_path).exists():
         if verbose:
-            print(f"  Warning: Failed to run migration: {e}")
+            print(f"  No last processed metadata found for {ingestor_name}: no database at {db_path}")
+        return None
 
-    # Check if the database exists and get the last processed metadata
-    db_conn = None
     last_processed = None
     try:
-        db_conn = get_connection(Path(db_path), check_exists=True)
-
-        # Try to get the last processed metadata for this ingestor
-        cursor = db_conn.cursor()
-        cursor.execute(
-            "SELECT metadata FROM refresh_timestamps WHERE source = ?",
-            (ingestor_name,)
-        )
-        result = cursor.fetchone()
+        if writer is not None:
+            last_processed = writer.submit(
+                lambda adapter: _load_ingestor_metadata(adapter, ingestor_name)
+            ).result()
+        else:
+            with shared_adapter(adapter_type, db_path) as handle, handle.locked() as adapter:
+                last_processed = _load_ingestor_metadata(adapter, ingestor_name)
 
-        if result and result[0]:
-            import json
-            last_processed = json.loads(result[0])
-            if verbose:
-                print(f"  Found last processed metadata for {ingestor_name}")
+        if last_processed and verbose:
+            print(f"  Found last processed metadata for {ingestor_name}")
     except Exception as e:
         if verbose:
             print(f"  No last processed metadata found for {ingestor_name}: {e}")
         last_processed = None
-    finally:
-        if db_conn:
-            db_conn.close()
 
     return last_processed
 
 
-def save_ingestor_metadata(ingestor_name, metadata, db_path, verbose=False):
+def save_ingestor_metadata(ingestor_name, metadata, db_path, verbose=False, writer=None, adapter_type=None):
     """Save metadata for an ingestor for future incremental updates.
 
     Args:
@@ -107,6 +313,10 @@ def save_ingestor_metadata(ingestor_name, metadata, db_path, verbose=False):
         metadata: The metadata to save.
         db_path: Path to the database file.
         verbose: Whether to print verbose output.
+        writer: The `RefreshWriter` that owns the database, if any. If None, the
+            metadata is written through the process-wide shared adapter.
+        adapter_type: The type of database adapter to use without a writer. If
+            None, uses the configured adapter.
 
     Returns:
         True if successful, False otherwise.
@@ -114,30 +324,15 @@ def save_ingestor_metadata(ingestor_name, metadata, db_path, verbose=False):
     if not metadata:
         return False
 
-    from arc_memory.sql.db import get_connection
-
     try:
-        # Connect to the database
-        db_conn = get_connection(Path(db_path), check_exists=False)
-
-        # Create the refresh_timestamps table if it doesn't exist
-        cursor = db_conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS refresh_timestamps (
-                source TEXT PRIMARY KEY,
-                timestamp TEXT,
-                metadata TEXT
-            )
-        """)
-
-        # Save the metadata
-        import json
-        cursor.execute(
-            "INSERT OR REPLACE INTO refresh_timestamps (source, timestamp, metadata) VALUES (?, ?, ?)",
-            (ingestor_name, datetime.now().isoformat(), json.dumps(metadata))
-        )
-        db_conn.commit()
-        db_conn.close()
+        if writer is not None:
+            writer.submit(
+                lambda adapter: _store_ingestor_metadata(adapter, ingestor_name, metadata)
+            ).result()
+        else:
+            # The shared adapter creates the database and its tables on first use
+            with shared_adapter(adapter_type, db_path, {"check_exists": False}) as handle, handle.locked() as adapter:
+                _store_ingestor_metadata(adapter, ingestor_name, metadata)
 
         if verbose:
             print(f"  Saved metadata for {ingestor_name} for future incremental updates")
@@ -270,7 +465,8 @@ def refresh_source(
     source: str,
     force: bool = False,
     min_interval: Optional[timedelta] = None,
-    adapter_type: Optional[str] = None
+    adapter_type: Optional[str] = None,
+    adapter: Any = None,
 ) -> bool:
     """Refresh a specific source.
 
@@ -279,6 +475,7 @@ def refresh_source(
         force: Whether to force a refresh even if the minimum interval hasn't elapsed.
         min_interval: The minimum interval between refreshes. If None, defaults to 1 hour.
         adapter_type: The type of database adapter to use. If None, uses the configured adapter.
+        adapter: The database adapter to use. If None, a new adapter is created.
 
     Returns:
         True if the source was refreshed, False otherwise.
@@ -287,7 +484,8 @@ def refresh_source(
         AutoRefreshError: If refreshing the source fails.
     """
     # Get the database adapter
-    adapter = get_adapter(adapter_type)
+    if adapter is None:
+        adapter = get_adapter(adapter_type)
     if not adapter.is_connected():
         from arc_memory.sql.db import get_db_path
         db_path = get_db_path()
@@ -322,7 +520,8 @@ def refresh_source(
 
         # Call the source-specific refresh function with the adapter
         logger.info(f"Refreshing source '{source}'")
-        refresh_func(adapter)
+        with span(f"refresh.{source}"):
+            refresh_func(adapter)
 
         # Update the refresh timestamp directly using the adapter
         now = datetime.now()
@@ -356,19 +555,61 @@ def refresh_source(
         )
 
 
+def _start_worker(func: Callable[..., Any], *args: Any) -> Future:
+    """Run a function on a new daemon thread.
+
+    Unlike `ThreadPoolExecutor` workers, which the interpreter joins at exit,
+    daemon threads let a caller abandon a source that is stuck in a network
+    call.
+
+    Args:
+        func: The function to run.
+        *args: Arguments for the function.
+
+    Returns:
+        A future for the result.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="arc-refresh-worker", daemon=True).start()
+    return future
+
+
 def refresh_all_sources(
     sources: Optional[List[str]] = None,
     force: bool = False,
     min_interval: Optional[timedelta] = None,
-    adapter_type: Optional[str] = None
+    adapter_type: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
 ) -> Dict[str, bool]:
-    """Refresh all specified sources.
+    """Refresh all specified sources concurrently.
+
+    Each source is fetched on its own worker thread, up to `max_workers` at a time,
+    while all database reads and writes go through a single `RefreshWriter` queue.
+    A slow or failing source therefore doesn't delay the others: the total refresh
+    time is roughly that of the slowest source rather than the sum of all of them.
 
     Args:
         sources: A list of source names to refresh. If None, refreshes all known sources.
         force: Whether to force a refresh even if the minimum interval hasn't elapsed.
         min_interval: The minimum interval between refreshes. If None, defaults to 1 hour.
         adapter_type: The type of database adapter to use. If None, uses the configured adapter.
+        max_workers: Maximum number of sources refreshed at the same time. Defaults to
+            DEFAULT_MAX_CONCURRENT_REFRESHES.
+        timeout: Maximum time in seconds a single source may take. A source that
+            exceeds it is abandoned and reported as failed, and any later writes
+            from it are rejected. The whole refresh is limited to `timeout` for
+            every round of `max_workers` sources, and sources that couldn't
+            start by then are failed too. If None, sources are not timed out.
 
     Returns:
         A dictionary mapping source names to booleans indicating whether they were refreshed.
@@ -384,26 +625,80 @@ def refresh_all_sources(
         sources_needing_refresh = get_sources_needing_refresh(sources, min_interval, adapter_type)
         sources_to_refresh = list(sources_needing_refresh.keys())
 
-    results = {}
-    errors = []
+    results: Dict[str, bool] = {}
+    errors: Dict[str, str] = {}
 
-    for source in sources_to_refresh:
-        try:
-            refreshed = refresh_source(source, force, min_interval, adapter_type)
-            results[source] = refreshed
-        except Exception as e:
-            logger.error(f"Error refreshing source '{source}': {e}")
-            results[source] = False
-            errors.append((source, str(e)))
+    if not sources_to_refresh:
+        return results
+
+    max_workers = max(1, min(max_workers or DEFAULT_MAX_CONCURRENT_REFRESHES, len(sources_to_refresh)))
+
+    # Sources are started as slots free up. Timed-out sources are abandoned
+    # and give up their slot, so every round of `max_workers` sources takes
+    # at most `timeout` seconds and the whole refresh is bounded by that.
+    queued = list(sources_to_refresh)
+    deadline = None
+    if timeout is not None:
+        deadline = time.monotonic() + timeout * math.ceil(len(queued) / max_workers)
+
+    def fail(source: str, error_msg: str) -> None:
+        logger.error(f"Error refreshing source '{source}': {error_msg}")
+        results[source] = False
+        errors[source] = error_msg
+
+    writer = RefreshWriter(adapter_type)
+    running: Dict[Future, Tuple[str, _QueuedAdapter, float]] = {}
+    try:
+        while queued or running:
+            while queued and len(running) < max_workers:
+                source = queued.pop(0)
+                source_adapter = writer.adapter_for(source)
+                future = _start_worker(refresh_source, source, force, min_interval, adapter_type, source_adapter)
+                running[future] = (source, source_adapter, time.monotonic())
+
+            wait_timeout = None
+            if timeout is not None:
+                source_deadline = min(started + timeout for _, _, started in running.values())
+                wait_timeout = max(0.0, min(source_deadline, deadline) - time.monotonic())
+
+            done, _ = wait(running, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                source, _, _ = running.pop(future)
+                try:
+                    results[source] = future.result()
+                except Exception as e:
+                    fail(source, str(e))
+
+            if timeout is not None:
+                now = time.monotonic()
+                for future, (source, source_adapter, started) in list(running.items()):
+                    if now - started >= timeout or now >= deadline:
+                        # Abandon the worker; its later writes are rejected
+                        source_adapter.cancelled.set()
+                        del running[future]
+                        fail(source, f"Timed out after {now - started:.1f}s")
+                if now >= deadline:
+                    for source in queued:
+                        fail(source, "Timed out before starting")
+                    queued = []
+    finally:
+        # Don't wait for abandoned workers: they run on daemon threads, so
+        # they can't keep the process alive, and their writes are rejected
+        for _, source_adapter, _ in running.values():
+            source_adapter.cancelled.set()
+        writer.close()
+
+    # Report results in the requested order
+    results = {source: results[source] for source in sources_to_refresh if source in results}
 
     if errors:
-        error_details = {source: error for source, error in errors}
-        error_msg = f"Failed to refresh {len(errors)} sources: {', '.join(source for source, _ in errors)}"
+        error_msg = f"Failed to refresh {len(errors)} sources: {', '.join(errors)}"
         logger.error(error_msg)
         raise AutoRefreshError(
             error_msg,
             details={
-                "errors": error_details,
+                "errors": errors,
                 "results": results,
             }
         )
@@ -431,6 +726,7 @@ def refresh_knowledge_graph(
     llm_enhancement_level: str = "standard",
     verbose: bool = False,
     repo_id: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_CONCURRENT_REFRESHES,
 ) -> Dict[str, Any]:
     """Refresh the knowledge graph with the latest data.
 
@@ -449,6 +745,7 @@ def refresh_knowledge_graph(
         llm_enhancement_level: The level of LLM enhancement to apply ("none", "fast", "standard", "deep").
         verbose: Whether to print verbose output.
         repo_id: Optional repository ID to associate with nodes. If None, generates one from the repo_path.
+        max_workers: Maximum number of ingestors run concurrently.
 
     Returns:
         A dictionary with the results of the refresh operation.
@@ -659,80 +956,91 @@ Generate structured JSON following the requested schema for each enhancement tas
                     print("⚠️ Warning: Ollama not available, continuing without enhancement")
                 use_llm = False
 
-    # Process nodes and edges using ingestors
-    all_nodes = []
-    all_edges = []
+    # Process nodes and edges using ingestors. Results are kept in compact
+    # columnar batches rather than as lists of Pydantic models
+    all_nodes = NodeBatch()
+    all_edges = EdgeBatch()
 
     if verbose:
         print(f"Running {len(ingestors)} ingestors...")
 
-    for idx, ingestor in enumerate(ingestors, 1):
-        ingestor_name = ingestor.get_name()
-
-        if verbose:
-            print(f"[{idx}/{len(ingestors)}] Processing {ingestor_name}...")
+    # The build writes a SQLite file, so its incremental metadata goes through
+    # a single writer on that file. It's read up front so worker threads never
+    # touch the database.
+    writer = RefreshWriter("sqlite", db_path=db_path, connection_params={"check_exists": False})
+    last_processed_by_name = {
+        ingestor.get_name(): get_ingestor_metadata(ingestor.get_name(), db_path, verbose, writer=writer)
+        for ingestor in ingestors
+    }
 
+    def run_ingestor(ingestor: Any) -> Tuple[List[Node], List[Edge], Dict[str, Any], float]:
+        ingestor_name = ingestor.get_name()
+        last_processed = last_processed_by_name.get(ingestor_name)
         ingestor_start = time.time()
 
-        try:
-            # Get the last processed metadata for this ingestor
-            last_processed = get_ingestor_metadata(ingestor_name, db_path, verbose)
-
-            # Call the ingest method with the appropriate parameters for each ingestor type
-            if ingestor_name == "git":
-                nodes, edges, metadata = ingestor.ingest(
-                    repo_path=repo_path,
-                    last_processed=last_processed,  # Use last_processed for incremental builds
-                )
-            elif ingestor_name == "github":
-                nodes, edges, metadata = ingestor.ingest(
-                    repo_path=repo_path,
-                    last_processed=last_processed,  # Use last_processed for incremental builds
-                )
-            elif ingestor_name == "adr":
-                nodes, edges, metadata = ingestor.ingest(
-                    repo_path=repo_path,
-                    last_processed=last_processed,
-                )
-            elif ingestor_name == "code_analysis":
-                nodes, edges, metadata = ingestor.ingest(
-                    repo_path=repo_path,
-                    last_processed=last_processed,
-                    llm_enhancement_level=llm_enhancement_level if use_llm else "none",
-                    ollama_client=llm_client if llm_provider == "ollama" and use_llm else None,
-                )
-            elif ingestor_name == "change_patterns":
-                nodes, edges, metadata = ingestor.ingest(
-                    repo_path=repo_path,
-                    last_processed=last_processed,
-                    llm_enhancement_level=llm_enhancement_level if use_llm else "none",
-                    ollama_client=llm_client if llm_provider == "ollama" and use_llm else None,
-                )
-            else:
-                # Default handling for other ingestors
-                if hasattr(ingestor, "ingest") and "repo_path" in ingestor.ingest.__code__.co_varnames:
+        with span(f"ingest.{ingestor_name}"):
+            try:
+                # Call the ingest method with the appropriate parameters for each ingestor type
+                if ingestor_name in ("git", "github", "adr"):
                     nodes, edges, metadata = ingestor.ingest(
                         repo_path=repo_path,
-                        last_processed=last_processed,
+                        last_processed=last_processed,  # Use last_processed for incremental builds
                     )
-                else:
+                elif ingestor_name in ("code_analysis", "change_patterns"):
                     nodes, edges, metadata = ingestor.ingest(
+                        repo_path=repo_path,
                         last_processed=last_processed,
+                        llm_enhancement_level=llm_enhancement_level if use_llm else "none",
+                        ollama_client=llm_client if llm_provider == "ollama" and use_llm else None,
                     )
-        except Exception as e:
-            if verbose:
-                print(f"❌ Error processing {ingestor_name}: {e}")
-            nodes, edges, metadata = [], [], {}
+                else:
+                    # Default handling for other ingestors
+                    if hasattr(ingestor, "ingest") and "repo_path" in ingestor.ingest.__code__.co_varnames:
+                        nodes, edges, metadata = ingestor.ingest(
+                            repo_path=repo_path,
+                            last_processed=last_processed,
+                        )
+                    else:
+                        nodes, edges, metadata = ingestor.ingest(
+                            last_processed=last_processed,
+                        )
+            except Exception as e:
+                if verbose:
+                    print(f"❌ Error processing {ingestor_name}: {e}")
+                nodes, edges, metadata = [], [], {}
 
-        ingestor_time = time.time() - ingestor_start
-        all_nodes.extend(nodes)
-        all_edges.extend(edges)
+        return nodes, edges, metadata, time.time() - ingestor_start
 
-        # Save the metadata for this ingestor for future incremental updates
-        save_ingestor_metadata(ingestor_name, metadata, db_path, verbose)
+    # The built-in source ingestors are independent, so they run concurrently.
+    # The LLM-backed ingestors and plugins share the LLM client, so they run one
+    # at a time on a pool of their own. Results are merged and their metadata
+    # saved in the original order on this thread.
+    workers = max(1, min(max_workers, len(ingestors)))
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arc-ingest") as executor, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="arc-ingest-serial") as serial_executor:
+            futures = [
+                (executor if ingestor.get_name() in CONCURRENT_INGESTORS else serial_executor).submit(
+                    run_ingestor, ingestor
+                )
+                for ingestor in ingestors
+            ]
 
-        if verbose:
-            print(f"✅ [{idx}/{len(ingestors)}] {ingestor_name}: {len(nodes)} nodes, {len(edges)} edges ({ingestor_time:.1f}s)")
+            for idx, (ingestor, future) in enumerate(zip(ingestors, futures), 1):
+                ingestor_name = ingestor.get_name()
+                nodes, edges, metadata, ingestor_time = future.result()
+                all_nodes.extend(nodes)
+                all_edges.extend(edges)
+
+                # Save the metadata for this ingestor for future incremental updates
+                save_ingestor_metadata(ingestor_name, metadata, db_path, verbose, writer=writer)
+
+                if verbose:
+                    print(f"✅ [{idx}/{len(ingestors)}] {ingestor_name}: {len(nodes)} nodes, {len(edges)} edges ({ingestor_time:.1f}s)")
+    finally:
+        writer.close()
+        # The graph is written below with a connection of its own
+        get_adapter_registry().close(db_path)
 
     # Extract architecture components if enabled
     if include_architecture:
@@ -740,24 +1048,25 @@ Generate structured JSON following the requested schema for each enhancement tas
             print("Extracting architecture components...")
 
         arch_start = time.time()
-        try:
-            # Create a repository ID if not provided
-            if repo_id is None:
-                import hashlib
-                repo_id = f"repository:{hashlib.md5(str(repo_path.absolute()).encode()).hexdigest()}"
+        with span("architecture"):
+            try:
+                # Create a repository ID if not provided
+                if repo_id is None:
+                    import hashlib
+                    repo_id = f"repository:{hashlib.md5(str(repo_path.absolute()).encode()).hexdigest()}"
 
-            # Extract architecture components
-            arch_nodes, arch_edges = extract_architecture(all_nodes, all_edges, repo_path, repo_id)
+                # Extract architecture components
+                arch_nodes, arch_edges = extract_architecture(all_nodes, all_edges, repo_path, repo_id)
 
-            # Add architecture nodes and edges to the graph
-            all_nodes.extend(arch_nodes)
-            all_edges.extend(arch_edges)
+                # Add architecture nodes and edges to the graph
+                all_nodes.extend(arch_nodes)
+                all_edges.extend(arch_edges)
 
-            if verbose:
-                print(f"✅ Architecture extraction complete: {len(arch_nodes)} nodes, {len(arch_edges)} edges ({time.time() - arch_start:.1f}s)")
-        except Exception as e:
-            if verbose:
-                print(f"❌ Architecture extraction failed: {e}")
+                if verbose:
+                    print(f"✅ Architecture extraction complete: {len(arch_nodes)} nodes, {len(arch_edges)} edges ({time.time() - arch_start:.1f}s)")
+            except Exception as e:
+                if verbose:
+                    print(f"❌ Architecture extraction failed: {e}")
 
     # Apply LLM enhancements if enabled
     if use_llm and llm_client is not None:
@@ -766,69 +1075,76 @@ Generate structured JSON following the requested schema for each enhancement tas
 
         enhancement_start = time.time()
 
+        # The enhancement stages work on node and edge models
+        all_nodes = all_nodes.to_nodes()
+        all_edges = all_edges.to_edges()
+
         # Apply semantic analysis
         if verbose:
             print("Enhancing with semantic analysis...")
 
-        try:
-            all_nodes, all_edges = enhance_with_semantic_analysis(
-                all_nodes,
-                all_edges,
-                repo_path=repo_path,
-                enhancement_level=llm_enhancement_level,
-                ollama_client=llm_client if llm_provider == "ollama" else None,
-                openai_client=openai_client if llm_provider == "openai" else None,
-                llm_provider=llm_provider,
-            )
-            if verbose:
-                print(f"✅ Semantic analysis complete ({time.time() - enhancement_start:.1f}s)")
-        except Exception as e:
-            if verbose:
-                print(f"❌ Semantic analysis failed: {e}")
+        with span("enhance.semantic"):
+            try:
+                all_nodes, all_edges = enhance_with_semantic_analysis(
+                    all_nodes,
+                    all_edges,
+                    repo_path=repo_path,
+                    enhancement_level=llm_enhancement_level,
+                    ollama_client=llm_client if llm_provider == "ollama" else None,
+                    openai_client=openai_client if llm_provider == "openai" else None,
+                    llm_provider=llm_provider,
+                )
+                if verbose:
+                    print(f"✅ Semantic analysis complete ({time.time() - enhancement_start:.1f}s)")
+            except Exception as e:
+                if verbose:
+                    print(f"❌ Semantic analysis failed: {e}")
 
         # Apply temporal analysis
         temporal_start = time.time()
         if verbose:
             print("Enhancing with temporal analysis...")
 
-        try:
-            all_nodes, all_edges = enhance_with_temporal_analysis(
-                all_nodes,
-                all_edges,
-                repo_path=repo_path,
-                enhancement_level=llm_enhancement_level,
-                ollama_client=llm_client if llm_provider == "ollama" else None,
-                openai_client=openai_client if llm_provider == "openai" else None,
-                llm_provider=llm_provider,
-            )
-            if verbose:
-                print(f"✅ Temporal analysis complete ({time.time() - temporal_start:.1f}s)")
-        except Exception as e:
-            if verbose:
-                print(f"❌ Temporal analysis failed: {e}")
-
-        # Apply KGoT reasoning structures (only in standard or deep mode)
-        if llm_enhancement_level in ["standard", "deep"]:
-            kgot_start = time.time()
-            if verbose:
-                print("Generating reasoning structures...")
-
+        with span("enhance.temporal"):
             try:
-                all_nodes, all_edges = enhance_with_reasoning_structures(
+                all_nodes, all_edges = enhance_with_temporal_analysis(
                     all_nodes,
                     all_edges,
                     repo_path=repo_path,
+                    enhancement_level=llm_enhancement_level,
                     ollama_client=llm_client if llm_provider == "ollama" else None,
                     openai_client=openai_client if llm_provider == "openai" else None,
                     llm_provider=llm_provider,
-                    enhancement_level=llm_enhancement_level,
-                    system_prompt=system_prompt
                 )
                 if verbose:
-                    print(f"✅ Reasoning structures complete ({time.time() - kgot_start:.1f}s)")
+                    print(f"✅ Temporal analysis complete ({time.time() - temporal_start:.1f}s)")
             except Exception as e:
                 if verbose:
-                    print(f"❌ Reasoning structures failed: {e}")
+                    print(f"❌ Temporal analysis failed: {e}")
+
+        # Apply KGoT reasoning structures (only in standard or deep mode)
+        if llm_enhancement_level in ["standard", "deep"]:
+            kgot_start = time.time()
+            if verbose:
+                print("Generating reasoning structures...")
+
+            with span("enhance.reasoning"):
+                try:
+                    all_nodes, all_edges = enhance_with_reasoning_structures(
+                        all_nodes,
+                        all_edges,
+                        repo_path=repo_path,
+                        ollama_client=llm_client if llm_provider == "ollama" else None,
+                        openai_client=openai_client if llm_provider == "openai" else None,
+                        llm_provider=llm_provider,
+                        enhancement_level=llm_enhancement_level,
+                        system_prompt=system_prompt
+                    )
+                    if verbose:
+                        print(f"✅ Reasoning structures complete ({time.time() - kgot_start:.1f}s)")
+                except Exception as e:
+                    if verbose:
+                        print(f"❌ Reasoning structures failed: {e}")
 
         enhancement_time = time.time() - enhancement_start
         if verbose:
@@ -838,18 +1154,21 @@ Generate structured JSON following the requested schema for each enhancement tas
     if verbose:
         print(f"Writing graph to database ({len(all_nodes)} nodes, {len(all_edges)} edges)...")
 
-    # Initialize the database
-    # The init_db function will handle string paths
-    conn = init_db(db_path)
+    with span("db.write", nodes=len(all_nodes), edges=len(all_edges)):
+        # Initialize the database
+        # The init_db function will handle string paths
+        conn = init_db(db_path)
+        trace_connection(conn)
 
-    # Add nodes and edges
-    add_nodes_and_edges(conn, all_nodes, all_edges)
+        # Add nodes and edges
+        add_nodes_and_edges(conn, all_nodes, all_edges)
 
     # Compress the database
     if verbose:
         print("Compressing database...")
 
-    compressed_path = compress_db(db_path)
+    with span("db.compress"):
+        compressed_path = compress_db(db_path)
 
     # Get file sizes for reporting
     original_size = os.path.getsize(db_path)
@@ -0,0 +1,560 @@
+"""Resident refresh daemon for Arc Memory.
+
+This module provides a long-running alternative to the cron-based scheduler in
+`arc_memory.scheduler`. Instead of spawning a fresh `arc refresh` process on a fixed
+interval, the daemon keeps a single database connection open, watches the local Git
+repository for new commits, and schedules incremental per-source refreshes on a
+debounced priority queue.
+"""
+
+import heapq
+import importlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from arc_memory.errors import AutoRefreshError
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+# Sources refreshed by default
+DEFAULT_SOURCES = ["github", "linear", "adr"]
+
+# Sources that can change when a local commit is made, mapped to their priority.
+# Lower values are refreshed first.
+GIT_TRIGGERED_SOURCES = {"adr": 0, "github": 1}
+
+# Priority used for periodic (watermark-based) refreshes
+PERIODIC_PRIORITY = 5
+
+
+class GitChangeWatcher:
+    """Detect local repository changes by polling `.git/refs` and `.git/logs/HEAD`.
+
+    Polling a handful of `stat` calls is cheap and avoids a dependency on a
+    platform-specific file system notification library.
+    """
+
+    def __init__(self, repo_path: Union[str, Path]):
+        """Initialize the watcher.
+
+        Args:
+            repo_path: Path to the Git repository (working tree or bare).
+        """
+        self.repo_path = Path(repo_path)
+        self.git_dir = self._resolve_git_dir(self.repo_path)
+        self._last_snapshot: Optional[Tuple[int, int, int]] = None
+
+    @staticmethod
+    def _resolve_git_dir(repo_path: Path) -> Optional[Path]:
+        """Resolve the Git directory, following `gitdir:` files used by worktrees."""
+        dot_git = repo_path / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:"):].strip())
+                if not git_dir.is_absolute():
+                    git_dir = repo_path / git_dir
+                return git_dir
+        if (repo_path / "HEAD").exists() and (repo_path / "refs").is_dir():
+            return repo_path
+        return None
+
+    def snapshot(self) -> Tuple[int, int, int]:
+        """Take a cheap fingerprint of the repository refs.
+
+        Returns:
+            A tuple of (newest mtime in nanoseconds, number of ref files, size of the
+            HEAD reflog).
+        """
+        if self.git_dir is None:
+            return (0, 0, 0)
+
+        newest = 0
+        count = 0
+        for path in [self.git_dir / "packed-refs", self.git_dir / "HEAD"]:
+            try:
+                newest = max(newest, path.stat().st_mtime_ns)
+            except OSError:
+                pass
+
+        refs_dir = self.git_dir / "refs"
+        for root, _dirs, files in os.walk(refs_dir):
+            for name in files:
+                try:
+                    newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+                    count += 1
+                except OSError:
+                    continue
+
+        try:
+            head_log_size = (self.git_dir / "logs" / "HEAD").stat().st_size
+        except OSError:
+            head_log_size = 0
+
+        return (newest, count, head_log_size)
+
+    def poll(self) -> bool:
+        """Check whether the refs changed since the previous call.
+
+        The first call only records a baseline and returns False.
+
+        Returns:
+            True if a change was detected, False otherwise.
+        """
+        current = self.snapshot()
+        previous = self._last_snapshot
+        self._last_snapshot = current
+        return previous is not None and current != previous
+
+
+@dataclass
+class SourceState:
+    """Per-source watermarks and counters tracked by the daemon."""
+
+    last_success: Optional[datetime] = None
+    last_attempt: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_duration: float = 0.0
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    triggers: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the state to a JSON-serializable dictionary."""
+        return {
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_attempt": self.last_attempt.isoformat() if self.last_attempt else None,
+            "last_error": self.last_error,
+            "last_duration": self.last_duration,
+            "runs": self.runs,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "triggers": dict(self.triggers),
+        }
+
+
+class RefreshDaemon:
+    """Long-running refresh service with change-driven triggers.
+
+    The daemon keeps one database adapter open for its whole lifetime and calls the
+    source-specific `refresh(adapter)` functions from `arc_memory.auto_refresh.sources`
+    directly, so each refresh only pays for the incremental ingest itself.
+
+    Refreshes are scheduled on a priority queue ordered by due time and priority.
+    Repeated triggers for the same source are debounced: each trigger pushes the
+    refresh back by `debounce_seconds`, but never more than `max_delay_seconds`
+    after the first pending trigger.
+
+    Example:
+        daemon = RefreshDaemon(repo_path=".", status_port=8765)
+        daemon.run_forever()
+    """
+
+    def __init__(
+        self,
+        repo_path: Union[str, Path],
+        sources: Optional[List[str]] = None,
+        db_path: Optional[Union[str, Path]] = None,
+        adapter_type: Optional[str] = None,
+        min_interval: Optional[timedelta] = None,
+        debounce_seconds: float = 5.0,
+        max_delay_seconds: float = 60.0,
+        poll_interval: float = 2.0,
+        status_host: str = "127.0.0.1",
+        status_port: Optional[int] = None,
+        adapter: Any = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the refresh daemon.
+
+        Args:
+            repo_path: Path to the Git repository to watch.
+            sources: Sources to keep fresh. Defaults to github, linear and adr.
+            db_path: Path to the database file. If None, uses the default path.
+            adapter_type: The type of database adapter to use. If None, uses the
+                configured adapter.
+            min_interval: Interval between periodic refreshes of each source when no
+                change is detected. Defaults to 1 hour.
+            debounce_seconds: Quiet period after a trigger before a refresh starts.
+            max_delay_seconds: Maximum time a triggered refresh can be postponed by
+                further triggers.
+            poll_interval: Interval in seconds between repository change checks.
+            status_host: Host for the status and metrics endpoint.
+            status_port: Port for the status and metrics endpoint. If None, the
+                endpoint is disabled.
+            adapter: An already connected database adapter to use instead of
+                opening a new one.
+            clock: Monotonic clock used for scheduling (overridable for tests).
+        """
+        self.repo_path = Path(repo_path)
+        self.sources = list(sources or DEFAULT_SOURCES)
+        self.db_path = db_path
+        self.adapter_type = adapter_type
+        self.min_interval = min_interval or timedelta(hours=1)
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.poll_interval = poll_interval
+        self.status_host = status_host
+        self.status_port = status_port
+        self.adapter = adapter
+        self.clock = clock
+
+        self.watcher = GitChangeWatcher(self.repo_path)
+        self.states: Dict[str, SourceState] = {s: SourceState() for s in self.sources}
+        self.started_at: Optional[datetime] = None
+        self.git_changes = 0
+
+        self._queue: List[Tuple[float, int, int, str]] = []
+        self._pending: Dict[str, Tuple[float, float, int, int]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._refresh_funcs: Dict[str, Callable[[Any], bool]] = {}
+        self._status_server: Optional[ThreadingHTTPServer] = None
+        self._current: Optional[str] = None
+
+    # Scheduling
+
+    def trigger(
+        self,
+        source: str,
+        reason: str = "manual",
+        priority: int = PERIODIC_PRIORITY,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Request a refresh of a source.
+
+        Args:
+            source: The source name.
+            reason: Why the refresh was requested (used for metrics).
+            priority: Priority of the refresh; lower values run first.
+            delay: Seconds to wait before refreshing. Defaults to the debounce period.
+        """
+        if source not in self.states:
+            raise AutoRefreshError(
+                f"Source '{source}' is not managed by this daemon",
+                details={"source": source, "sources": self.sources},
+            )
+
+        now = self.clock()
+        delay = self.debounce_seconds if delay is None else delay
+
+        with self._lock:
+            state = self.states[source]
+            state.triggers[reason] = state.triggers.get(reason, 0) + 1
+
+            pending = self._pending.get(source)
+            if pending is None:
+                first_trigger = now
+                due = now + delay
+            else:
+                _, first_trigger, old_priority, _ = pending
+                priority = min(priority, old_priority)
+                due = min(now + delay, first_trigger + self.max_delay_seconds)
+
+            self._seq += 1
+            self._pending[source] = (due, first_trigger, priority, self._seq)
+            heapq.heappush(self._queue, (due, priority, self._seq, source))
+
+    def pending_sources(self) -> Dict[str, float]:
+        """Get the sources waiting to be refreshed and their due times."""
+        with self._lock:
+            return {source: entry[0] for source, entry in self._pending.items()}
+
+    def next_due(self) -> Optional[float]:
+        """Get the due time of the next pending refresh, if any."""
+        with self._lock:
+            self._discard_stale()
+            return self._queue[0][0] if self._queue else None
+
+    def _discard_stale(self) -> None:
+        """Drop queue entries superseded by a later trigger (caller holds the lock)."""
+        while self._queue:
+            _, _, seq, source = self._queue[0]
+            pending = self._pending.get(source)
+            if pending is not None and pending[3] == seq:
+                return
+            heapq.heappop(self._queue)
+
+    def _pop_due(self, now: float) -> Optional[str]:
+        with self._lock:
+            self._discard_stale()
+            if not self._queue or self._queue[0][0] > now:
+                return None
+            _, _, _, source = heapq.heappop(self._queue)
+            del self._pending[source]
+            return source
+
+    def schedule_initial_refreshes(self) -> None:
+        """Schedule the first refresh of each source from its stored watermark."""
+        adapter = self._get_adapter()
+        now = datetime.now()
+
+        for source in self.sources:
+            last_refresh = None
+            try:
+                last_refresh = adapter.get_refresh_timestamp(source)
+            except Exception as e:
+                logger.warning(f"Could not read refresh timestamp for {source}: {e}")
+
+            self.states[source].last_success = last_refresh
+            if last_refresh is None:
+                delay = 0.0
+            else:
+                elapsed = (now - last_refresh).total_seconds()
+                delay = max(0.0, self.min_interval.total_seconds() - elapsed)
+            self.trigger(source, reason="periodic", priority=PERIODIC_PRIORITY, delay=delay)
+
+    # Execution
+
+    def _get_adapter(self) -> Any:
+        """Get the daemon's database adapter, connecting it on first use."""
+        if self.adapter is None:
+            from arc_memory.db import get_adapter
+
+            self.adapter = get_adapter(self.adapter_type)
+
+        if not self.adapter.is_connected():
+            from arc_memory.sql.db import get_db_path
+
+            db_path = self.db_path or get_db_path()
+            self.adapter.connect({"db_path": str(db_path)})
+            self.adapter.init_db()
+
+        return self.adapter
+
+    def _get_refresh_func(self, source: str) -> Callable[[Any], bool]:
+        """Import a source's refresh function once and cache it."""
+        refresh_func = self._refresh_funcs.get(source)
+        if refresh_func is None:
+            try:
+                module = importlib.import_module(f"arc_memory.auto_refresh.sources.{source}")
+                refresh_func = getattr(module, "refresh")
+            except (ImportError, AttributeError) as e:
+                raise AutoRefreshError(
+                    f"Source '{source}' is not supported for auto-refresh: {e}",
+                    details={"source": source, "error": str(e)},
+                )
+            self._refresh_funcs[source] = refresh_func
+        return refresh_func
+
+    def refresh(self, source: str) -> bool:
+        """Refresh a single source immediately using the shared adapter.
+
+        Args:
+            source: The source name.
+
+        Returns:
+            True if the refresh succeeded, False otherwise.
+        """
+        state = self.states[source]
+        started = time.perf_counter()
+        state.last_attempt = datetime.now()
+        state.runs += 1
+        self._current = source
+
+        try:
+            adapter = self._get_adapter()
+            self._get_refresh_func(source)(adapter)
+            now = datetime.now()
+            adapter.save_refresh_timestamp(source, now)
+            state.last_success = now
+            state.last_error = None
+            state.consecutive_failures = 0
+            logger.info(f"Daemon refreshed source '{source}'")
+            return True
+        except Exception as e:
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.last_error = str(e)
+            logger.error(f"Daemon failed to refresh source '{source}': {e}")
+            return False
+        finally:
+            state.last_duration = time.perf_counter() - started
+            self._current = None
+
+    def _retry_delay(self, source: str) -> float:
+        """Get the delay before the next periodic refresh of a source.
+
+        Failures back off exponentially from one minute, capped at the periodic
+        interval.
+        """
+        interval = self.min_interval.total_seconds()
+        failures = self.states[source].consecutive_failures
+        if failures == 0:
+            return interval
+        return min(interval, 60.0 * (2 ** (failures - 1)))
+
+    def run_pending(self) -> List[str]:
+        """Run every refresh that is due now.
+
+        Returns:
+            The sources that were refreshed (successfully or not).
+        """
+        ran = []
+        while not self._stop_event.is_set():
+            source = self._pop_due(self.clock())
+            if source is None:
+                break
+            self.refresh(source)
+            ran.append(source)
+            self.trigger(
+                source,
+                reason="periodic",
+                priority=PERIODIC_PRIORITY,
+                delay=self._retry_delay(source),
+            )
+        return ran
+
+    def check_repository(self) -> bool:
+        """Poll the repository and trigger Git-dependent sources on change.
+
+        Returns:
+            True if a change was detected, False otherwise.
+        """
+        if not self.watcher.poll():
+            return False
+
+        self.git_changes += 1
+        logger.info("Detected local repository change")
+        for source, priority in GIT_TRIGGERED_SOURCES.items():
+            if source in self.states:
+                self.trigger(source, reason="git", priority=priority)
+        return True
+
+    def run_forever(self) -> None:
+        """Run the daemon until `stop()` is called or the process is interrupted."""
+        self.started_at = datetime.now()
+        os.environ.setdefault("ARC_REPO_PATH", str(self.repo_path))
+
+        if self.status_port is not None:
+            self.start_status_server()
+
+        try:
+            self.watcher.poll()
+            self.schedule_initial_refreshes()
+
+            while not self._stop_event.is_set():
+                self.check_repository()
+                self.run_pending()
+
+                next_due = self.next_due()
+                timeout = self.poll_interval
+                if next_due is not None:
+                    timeout = max(0.0, min(timeout, next_due - self.clock()))
+                self._stop_event.wait(timeout)
+        except KeyboardInterrupt:
+            logger.info("Refresh daemon interrupted")
+        finally:
+            self.shutdown()
+
+    def stop(self) -> None:
+        """Ask the daemon loop to exit."""
+        self._stop_event.set()
+
+    def shutdown(self) -> None:
+        """Stop the status endpoint and close the database connection."""
+        self.stop_status_server()
+        if self.adapter is not None and self.adapter.is_connected():
+            try:
+                self.adapter.disconnect()
+            except Exception as e:
+                logger.warning(f"Error disconnecting refresh daemon adapter: {e}")
+
+    # Status and metrics
+
+    def status(self) -> Dict[str, Any]:
+        """Get the daemon status as a JSON-serializable dictionary."""
+        now = self.clock()
+        pending = {
+            source: max(0.0, due - now)
+            for source, due in self.pending_sources().items()
+        }
+        return {
+            "repo_path": str(self.repo_path),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "running": self._current,
+            "git_changes": self.git_changes,
+            "pending": pending,
+            "sources": {source: state.to_dict() for source, state in self.states.items()},
+        }
+
+    def metrics(self) -> str:
+        """Render daemon metrics in the Prometheus text exposition format."""
+        lines = [
+            "# TYPE arc_refresh_runs_total counter",
+            "# TYPE arc_refresh_failures_total counter",
+            "# TYPE arc_refresh_last_duration_seconds gauge",
+            "# TYPE arc_refresh_last_success_timestamp_seconds gauge",
+            "# TYPE arc_refresh_git_changes_total counter",
+        ]
+        for source, state in self.states.items():
+            label = f'{{source="{source}"}}'
+            lines.append(f"arc_refresh_runs_total{label} {state.runs}")
+            lines.append(f"arc_refresh_failures_total{label} {state.failures}")
+            lines.append(f"arc_refresh_last_duration_seconds{label} {state.last_duration:.6f}")
+            last_success = state.last_success.timestamp() if state.last_success else 0
+            lines.append(f"arc_refresh_last_success_timestamp_seconds{label} {last_success:.3f}")
+        lines.append(f"arc_refresh_git_changes_total {self.git_changes}")
+        return "\n".join(lines) + "\n"
+
+    def start_status_server(self) -> Tuple[str, int]:
+        """Start the HTTP status endpoint in a background thread.
+
+        The endpoint serves `GET /status` (JSON) and `GET /metrics` (Prometheus text).
+
+        Returns:
+            The (host, port) the server is bound to.
+        """
+        daemon = self
+
+        class _StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+                if self.path in ("/", "/status"):
+                    body = json.dumps(daemon.status()).encode("utf-8")
+                    content_type = "application/json"
+                elif self.path == "/metrics":
+                    body = daemon.metrics().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"Status endpoint: {format % args}")
+
+        self._status_server = ThreadingHTTPServer(
+            (self.status_host, self.status_port or 0), _StatusHandler
+        )
+        thread = threading.Thread(
+            target=self._status_server.serve_forever,
+            name="arc-refresh-status",
+            daemon=True,
+        )
+        thread.start()
+        host, port = self._status_server.server_address[:2]
+        logger.info(f"Refresh daemon status endpoint listening on http://{host}:{port}")
+        return host, port
+
+    def stop_status_server(self) -> None:
+        """Stop the HTTP status endpoint if it is running."""
+        if self._status_server is not None:
+            self._status_server.shutdown()
+            self._status_server.server_close()
+            self._status_server = None
@@ -6,3 +6,52 @@ with the latest data from various sources.
 
 # Import source-specific modules
 # These will be imported dynamically by the core module when needed
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+
+import requests
+
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_repo_path() -> Path:
+    """Get the repository being refreshed.
+
+    Returns:
+        The path in the ARC_REPO_PATH environment variable (set by the refresh
+        daemon), or the current working directory.
+    """
+    repo_path = os.environ.get("ARC_REPO_PATH")
+    if repo_path:
+        return Path(repo_path)
+
+    repo_path = Path.cwd()
+    logger.info(f"Using current directory as repository path: {repo_path}")
+    return repo_path
+
+
+def get_http_session(source: str) -> requests.Session:
+    """Get the HTTP session of a source, creating it on first use.
+
+    The session lives as long as the process, so a resident refresh daemon
+    reuses its pooled connections between runs instead of opening new ones.
+
+    Args:
+        source: The source name.
+
+    Returns:
+        The source's session.
+    """
+    with _sessions_lock:
+        session = _sessions.get(source)
+        if session is None:
+            session = _sessions[source] = requests.Session()
+        return session
@@ -4,20 +4,16 @@ This module provides ADR-specific implementation for refreshing the knowledge gr
 with the latest data from Architectural Decision Records (ADRs).
 """
 
-import logging
-import os
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-from arc_memory.db.metadata import get_refresh_timestamp
+from arc_memory.auto_refresh.sources import get_repo_path
 from arc_memory.errors import AutoRefreshError
 from arc_memory.ingest.adr import ADRIngestor
 from arc_memory.logging_conf import get_logger
 
-
 logger = get_logger(__name__)
 
+# Metadata key holding the content hashes of the ADRs processed by the last sync
+MANIFEST_METADATA_KEY = "adr_manifest"
+
 
 def refresh(adapter=None) -> bool:
     """Refresh the knowledge graph with the latest data from ADRs.
@@ -32,36 +28,40 @@ def refresh(adapter=None) -> bool:
         AutoRefreshError: If refreshing from ADRs fails.
     """
     try:
-        # Get the current working directory
-        cwd = Path.cwd()
-
-        # Get the last refresh timestamp
-        last_refresh = get_refresh_timestamp("adr")
+        # Use the provided adapter or get a new one
+        if adapter is None:
+            from arc_memory.db import get_adapter
+            from arc_memory.sql.db import get_db_path
+
+            adapter = get_adapter()
+            if not adapter.is_connected():
+                db_path = get_db_path()
+                adapter.connect({"db_path": str(db_path)})
+                adapter.init_db()
+
+        repo_path = get_repo_path()
+
+        # Get the content manifest of the last sync, falling back to the last
+        # refresh timestamp (which means a full reprocess) for older graphs
+        last_processed = adapter.get_metadata(MANIFEST_METADATA_KEY)
+        if not last_processed:
+            last_refresh = adapter.get_refresh_timestamp("adr")
+            last_processed = {"last_refresh": last_refresh.isoformat()} if last_refresh else None
 
         # Create an ADR ingestor
         ingestor = ADRIngestor()
 
         # Ingest data from ADRs
-        logger.info("Ingesting data from ADRs")
-        nodes, edges, last_processed = ingestor.ingest(
-            last_processed={"last_refresh": last_refresh.isoformat()} if last_refresh else None
+        logger.info(f"Ingesting data from ADRs in {repo_path}")
+        nodes, edges, metadata = ingestor.ingest(
+            repo_path=repo_path,
+            last_processed=last_processed,
         )
 
         # Add the nodes and edges to the knowledge graph
         if nodes or edges:
             logger.info(f"Adding {len(nodes)} nodes and {len(edges)} edges to the knowledge graph")
 
-            # Use the provided adapter or get a new one
-            if adapter is None:
-                from arc_memory.db import get_adapter
-                from arc_memory.sql.db import get_db_path
-
-                adapter = get_adapter()
-                if not adapter.is_connected():
-                    db_path = get_db_path()
-                    adapter.connect({"db_path": str(db_path)})
-                    adapter.init_db()
-
             # Add nodes and edges directly using the adapter
             adapter.add_nodes_and_edges(nodes, edges)
 
@@ -69,6 +69,10 @@ def refresh(adapter=None) -> bool:
         else:
             logger.info("No new data to add from ADRs")
 
+        # Save the manifest only once the data it covers has been written
+        if "files" in metadata:
+            adapter.save_metadata(MANIFEST_METADATA_KEY, {"files": metadata["files"]})
+
         return True
     except Exception as e:
         error_msg = f"Failed to refresh ADR data: {e}"
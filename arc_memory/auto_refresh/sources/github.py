@@ -4,16 +4,48 @@ This module provides GitHub-specific implementation for refreshing the knowledge
 with the latest data from GitHub.
 """
 
-
-
 from arc_memory.auth.github import get_github_token
-from arc_memory.db.metadata import get_refresh_timestamp
+from arc_memory.auto_refresh.sources import get_http_session, get_repo_path
 from arc_memory.errors import AutoRefreshError, GitHubAuthError
-from arc_memory.ingest.github import GitHubIngestor
+from arc_memory.ingest.github import GitHubIngestor, merge_known_ids
 from arc_memory.logging_conf import get_logger
 
 logger = get_logger(__name__)
 
+# Metadata key holding the per-repository ``updated_at`` cursors of the last sync
+SYNC_METADATA_KEY = "github_sync"
+
+
+def merge_sync_state(adapter, repositories) -> None:
+    """Merge per-repository sync state into the stored sync metadata.
+
+    The stored state is read again right before it is written, and known PR
+    and issue IDs are merged instead of replaced, so IDs the webhook receiver
+    recorded while a sync was running are kept. Other values, such as the
+    cursors, replace the stored ones. Adapters handed out by a `RefreshWriter`
+    do the read and the write as one step on the writer thread.
+
+    Args:
+        adapter: The database adapter.
+        repositories: Sync state by repository name.
+    """
+    def merge(adapter) -> None:
+        stored = adapter.get_metadata(SYNC_METADATA_KEY) or {}
+        stored_repositories = stored.setdefault("repositories", {})
+        for repository, state in repositories.items():
+            current = stored_repositories.setdefault(repository, {})
+            for key, value in state.items():
+                if key in ("pr_ids", "issue_ids"):
+                    current[key] = merge_known_ids(current.get(key) or {}, value)
+                else:
+                    current[key] = value
+        adapter.save_metadata(SYNC_METADATA_KEY, stored)
+
+    if getattr(type(adapter), "run", None) is not None:
+        adapter.run(merge)
+    else:
+        merge(adapter)
+
 
 def refresh(adapter=None) -> bool:
     """Refresh the knowledge graph with the latest data from GitHub.
@@ -35,51 +67,41 @@ def refresh(adapter=None) -> bool:
             logger.error(error_msg)
             raise GitHubAuthError(error_msg)
 
-        # Get the last refresh timestamp using the provided adapter
-        if adapter:
+        # Use the provided adapter or get a new one
+        if adapter is None:
+            from arc_memory.db import get_adapter
+            from arc_memory.sql.db import get_db_path
+
+            adapter = get_adapter()
+            if not adapter.is_connected():
+                db_path = get_db_path()
+                adapter.connect({"db_path": str(db_path)})
+                adapter.init_db()
+
+        # Get the per-repository cursors from the last sync, falling back to
+        # the last refresh timestamp for graphs synced before cursors existed
+        last_processed = adapter.get_metadata(SYNC_METADATA_KEY)
+        if not last_processed:
             last_refresh = adapter.get_refresh_timestamp("github")
-        else:
-            last_refresh = get_refresh_timestamp("github")
+            last_processed = {"last_refresh": last_refresh.isoformat()} if last_refresh else None
 
-        # Get the current repository path
-        import os
-        from pathlib import Path
-
-        # Try to get the repository path from the environment
-        repo_path = os.environ.get("ARC_REPO_PATH")
-        if repo_path:
-            repo_path = Path(repo_path)
-        else:
-            # Fall back to the current working directory
-            repo_path = Path.cwd()
-            logger.info(f"Using current directory as repository path: {repo_path}")
+        repo_path = get_repo_path()
 
-        # Create a GitHub ingestor
-        ingestor = GitHubIngestor()
+        # Create a GitHub ingestor that reuses this process's HTTP connections
+        ingestor = GitHubIngestor(session=get_http_session("github"))
 
         # Ingest data from GitHub
         logger.info(f"Ingesting data from GitHub repository at {repo_path}")
-        nodes, edges, _ = ingestor.ingest(
+        nodes, edges, metadata = ingestor.ingest(
             repo_path=repo_path,
             token=token,
-            last_processed={"last_refresh": last_refresh.isoformat()} if last_refresh else None
+            last_processed=last_processed,
         )
 
         # Add the nodes and edges to the knowledge graph
         if nodes or edges:
             logger.info(f"Adding {len(nodes)} nodes and {len(edges)} edges to the knowledge graph")
 
-            # Use the provided adapter or get a new one
-            if adapter is None:
-                from arc_memory.db import get_adapter
-                from arc_memory.sql.db import get_db_path
-
-                adapter = get_adapter()
-                if not adapter.is_connected():
-                    db_path = get_db_path()
-                    adapter.connect({"db_path": str(db_path)})
-                    adapter.init_db()
-
             # Add nodes and edges directly using the adapter
             adapter.add_nodes_and_edges(nodes, edges)
 
@@ -87,6 +109,10 @@ def refresh(adapter=None) -> bool:
         else:
             logger.info("No new data to add from GitHub")
 
+        # Save the cursors only once the data they cover has been written
+        if metadata.get("repositories"):
+            merge_sync_state(adapter, metadata["repositories"])
+
         return True
     except Exception as e:
         error_msg = f"Failed to refresh GitHub data: {e}"
@@ -4,17 +4,12 @@ This module provides Linear-specific implementation for refreshing the knowledge
 with the latest data from Linear.
 """
 
-import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
-
 from arc_memory.auth.linear import get_linear_token
-from arc_memory.db.metadata import get_refresh_timestamp
+from arc_memory.auto_refresh.sources import get_http_session, get_repo_path
 from arc_memory.errors import AutoRefreshError, LinearAuthError
 from arc_memory.ingest.linear import LinearIngestor
 from arc_memory.logging_conf import get_logger
 
-
 logger = get_logger(__name__)
 
 
@@ -38,33 +33,35 @@ def refresh(adapter=None) -> bool:
             logger.error(error_msg)
             raise LinearAuthError(error_msg)
 
+        # Use the provided adapter or get a new one
+        if adapter is None:
+            from arc_memory.db import get_adapter
+            from arc_memory.sql.db import get_db_path
+
+            adapter = get_adapter()
+            if not adapter.is_connected():
+                db_path = get_db_path()
+                adapter.connect({"db_path": str(db_path)})
+                adapter.init_db()
+
         # Get the last refresh timestamp
-        last_refresh = get_refresh_timestamp("linear")
+        last_refresh = adapter.get_refresh_timestamp("linear")
 
-        # Create a Linear ingestor
-        ingestor = LinearIngestor()
+        # Create a Linear ingestor that reuses this process's HTTP connections
+        ingestor = LinearIngestor(session=get_http_session("linear"))
 
         # Ingest data from Linear
         logger.info("Ingesting data from Linear")
         nodes, edges, last_processed = ingestor.ingest(
-            last_processed={"last_refresh": last_refresh.isoformat()} if last_refresh else None
+            repo_path=get_repo_path(),
+            token=token,
+            last_processed={"last_refresh": last_refresh.isoformat()} if last_refresh else None,
         )
 
         # Add the nodes and edges to the knowledge graph
         if nodes or edges:
             logger.info(f"Adding {len(nodes)} nodes and {len(edges)} edges to the knowledge graph")
 
-            # Use the provided adapter or get a new one
-            if adapter is None:
-                from arc_memory.db import get_adapter
-                from arc_memory.sql.db import get_db_path
-
-                adapter = get_adapter()
-                if not adapter.is_connected():
-                    db_path = get_db_path()
-                    adapter.connect({"db_path": str(db_path)})
-                    adapter.init_db()
-
             # Add nodes and edges directly using the adapter
             adapter.add_nodes_and_edges(nodes, edges)
 
@@ -0,0 +1,796 @@
+"""Webhook receiver for push-based graph updates.
+
+Polling sources (`arc refresh`, the scheduler and the refresh daemon) re-read
+GitHub and Linear on an interval. This module provides a small local HTTP
+receiver for their webhooks instead: each delivery is turned into a graph delta
+(the nodes and edges it changes) with the same node and mention-edge builders
+the ingestors use, and the deltas are written in batches by a single writer
+thread that owns the database connection.
+
+GitHub `pull_request`, `issues`, `issue_comment` and `push` events and Linear
+`Issue` events are supported. Deliveries are identified by their delivery ID
+(`X-GitHub-Delivery` / `Linear-Delivery`), so redelivered payloads are only
+applied once. Deliveries that can't be written are kept in a spool file next
+to the database and applied again when the receiver next starts.
+"""
+
+import hashlib
+import hmac
+import ipaddress
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from arc_memory.ingest.github import merge_known_ids
+from arc_memory.logging_conf import get_logger
+from arc_memory.schema.models import CommitNode, Edge, EdgeRel, Node
+
+logger = get_logger(__name__)
+
+# GitHub events converted into graph deltas
+GITHUB_EVENTS = ("pull_request", "issues", "issue_comment", "push")
+
+# Number of delivery IDs remembered for de-duplication
+MAX_REMEMBERED_DELIVERIES = 10000
+
+# Largest request body accepted, in bytes (GitHub caps payloads at 25 MB)
+MAX_BODY_BYTES = 25 * 1024 * 1024
+
+
+@dataclass
+class GraphDelta:
+    """The nodes and edges changed by one webhook delivery."""
+
+    source: str
+    event: str
+    delivery_id: str = ""
+    nodes: List[Node] = field(default_factory=list)
+    edges: List[Edge] = field(default_factory=list)
+    repository: Optional[str] = None
+    pr_ids: Dict[str, str] = field(default_factory=dict)
+    issue_ids: Dict[str, str] = field(default_factory=dict)
+    # Comments on PRs whose node ID isn't known yet, as (PR number, text)
+    pending_mentions: List[Tuple[str, str]] = field(default_factory=list)
+    # The decoded payload, kept so failed deliveries can be spooled
+    payload: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a webhook's HMAC-SHA256 signature.
+
+    Args:
+        secret: The webhook secret.
+        body: The raw request body.
+        signature: The signature header, as a hex digest optionally prefixed
+            with ``sha256=`` (GitHub's format).
+
+    Returns:
+        True if the signature matches, False otherwise.
+    """
+    if not signature:
+        return False
+    if signature.startswith("sha256="):
+        signature = signature[len("sha256="):]
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def _github_pull_request(pr: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a REST pull request payload to the GraphQL shape the fetcher expects."""
+    merged = bool(pr.get("merged") or pr.get("merged_at"))
+    return {
+        "id": pr.get("node_id"),
+        "number": pr.get("number"),
+        "title": pr.get("title"),
+        "body": pr.get("body"),
+        "state": "MERGED" if merged else str(pr.get("state", "unknown")).upper(),
+        "createdAt": pr.get("created_at"),
+        "updatedAt": pr.get("updated_at"),
+        "closedAt": pr.get("closed_at"),
+        "mergedAt": pr.get("merged_at"),
+        "author": {"login": (pr.get("user") or {}).get("login")},
+        "baseRefName": (pr.get("base") or {}).get("ref"),
+        "headRefName": (pr.get("head") or {}).get("ref"),
+        "url": pr.get("html_url"),
+        "mergeCommit": {"oid": pr["merge_commit_sha"]} if merged and pr.get("merge_commit_sha") else None,
+    }
+
+
+def _github_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a REST issue payload to the GraphQL shape the fetcher expects."""
+    return {
+        "id": issue.get("node_id"),
+        "number": issue.get("number"),
+        "title": issue.get("title"),
+        "body": issue.get("body"),
+        "state": str(issue.get("state", "unknown")).upper(),
+        "createdAt": issue.get("created_at"),
+        "updatedAt": issue.get("updated_at"),
+        "closedAt": issue.get("closed_at"),
+        "author": {"login": (issue.get("user") or {}).get("login")},
+        "url": issue.get("html_url"),
+        "labels": {"nodes": [{"name": label.get("name")} for label in issue.get("labels") or []]},
+    }
+
+
+def _mention_edges(
+    fetcher: Any, source_id: str, text: Optional[str], issue_ids: Dict[str, str], pr_ids: Dict[str, str]
+) -> List[Edge]:
+    """Build the mention edges of a text from known issue and PR IDs by number."""
+    if not text:
+        return []
+    return fetcher.create_mention_edges(
+        source_id,
+        text,
+        [{"number": int(number), "id": node_id} for number, node_id in issue_ids.items()],
+        [{"number": int(number), "id": node_id} for number, node_id in pr_ids.items()],
+    )
+
+
+def _github_commit(commit: Dict[str, Any]) -> CommitNode:
+    """Convert a commit of a push payload into a commit node."""
+    message = commit.get("message") or ""
+    timestamp = commit.get("timestamp")
+    files = [*(commit.get("added") or []), *(commit.get("modified") or []), *(commit.get("removed") or [])]
+    return CommitNode(
+        id=f"commit:{commit['id']}",
+        title=message.split("\n", 1)[0],
+        body=message,
+        ts=datetime.fromisoformat(timestamp.replace("Z", "+00:00")) if timestamp else None,
+        author=(commit.get("author") or {}).get("name") or "",
+        files=files,
+        sha=commit["id"],
+    )
+
+
+def github_delta(
+    event: str,
+    payload: Dict[str, Any],
+    fetcher: Any,
+    known: Optional[Dict[str, Dict[str, str]]] = None,
+    fetch_details: bool = False,
+) -> Optional[GraphDelta]:
+    """Convert a GitHub webhook payload into a graph delta.
+
+    Args:
+        event: The event name from the ``X-GitHub-Event`` header.
+        payload: The decoded payload.
+        fetcher: A `GitHubFetcher` used to build nodes and mention edges.
+        known: PR and issue node IDs already in the graph for the payload's
+            repository, as ``{"pr_ids": {number: id}, "issue_ids": {number: id}}``.
+            Mentions of other items resolve against these. Comments on PRs
+            that aren't known are left in the delta's ``pending_mentions``.
+        fetch_details: Whether to fetch files, reviews and comments for changed
+            PRs and issues over the REST API, as a full ingest does.
+
+    Returns:
+        The delta, or None if the event doesn't change the graph.
+    """
+    if event not in GITHUB_EVENTS:
+        return None
+    if payload.get("action") in ("deleted", "transferred"):
+        return None
+
+    repository = (payload.get("repository") or {}).get("full_name")
+    owner, _, repo = (repository or "").partition("/")
+    known = known or {}
+    delta = GraphDelta(source="github", event=event, repository=repository)
+
+    def mentions(source_id: str, text: Optional[str]) -> List[Edge]:
+        issue_ids = {**known.get("issue_ids", {}), **delta.issue_ids}
+        pr_ids = {**known.get("pr_ids", {}), **delta.pr_ids}
+        return _mention_edges(fetcher, source_id, text, issue_ids, pr_ids)
+
+    if event == "pull_request":
+        pr = _github_pull_request(payload["pull_request"])
+        details = fetcher.fetch_pr_details_sync(owner, repo, pr["number"]) if fetch_details else None
+        pr_node = fetcher.create_pr_node(pr, details or {})
+        delta.pr_ids[str(pr["number"])] = pr_node.id
+        delta.nodes.append(pr_node)
+        delta.edges.extend(mentions(pr_node.id, pr.get("body")))
+        if pr_node.merged_commit_sha:
+            delta.edges.append(
+                Edge(
+                    src=pr_node.id,
+                    dst=pr_node.merged_commit_sha,
+                    rel=EdgeRel.MERGES,
+                    properties={"merged_at": pr_node.merged_at.isoformat() if pr_node.merged_at else None},
+                )
+            )
+    elif event == "issues":
+        issue = _github_issue(payload["issue"])
+        details = fetcher.fetch_issue_details_sync(owner, repo, issue["number"]) if fetch_details else None
+        issue_node = fetcher.create_issue_node(issue, details or {})
+        delta.issue_ids[str(issue["number"])] = issue_node.id
+        delta.nodes.append(issue_node)
+        delta.edges.extend(mentions(issue_node.id, issue.get("body")))
+    elif event == "issue_comment":
+        # Comments on PRs arrive as issue comments; mentions hang off the PR
+        # node, whose ID differs from the node ID of the issue in the payload
+        issue = payload["issue"]
+        number = str(issue.get("number"))
+        text = (payload.get("comment") or {}).get("body")
+        if "pull_request" not in issue:
+            source_id = known.get("issue_ids", {}).get(number, issue.get("node_id"))
+            delta.edges.extend(mentions(source_id, text))
+        elif number in known.get("pr_ids", {}):
+            delta.edges.extend(mentions(known["pr_ids"][number], text))
+        elif text:
+            delta.pending_mentions.append((number, text))
+    elif event == "push":
+        for commit in payload.get("commits") or []:
+            if not commit.get("id"):
+                continue
+            commit_node = _github_commit(commit)
+            delta.nodes.append(commit_node)
+            delta.edges.extend(mentions(commit_node.id, commit_node.body))
+
+    return delta
+
+
+def linear_delta(payload: Dict[str, Any], repo_name: str) -> Optional[GraphDelta]:
+    """Convert a Linear webhook payload into a graph delta.
+
+    Args:
+        payload: The decoded payload.
+        repo_name: Name of the repository Linear issues are linked to.
+
+    Returns:
+        The delta, or None if the event doesn't change the graph.
+    """
+    from arc_memory.ingest.linear import create_linear_issue_node
+
+    if payload.get("type") != "Issue" or payload.get("action") not in ("create", "update"):
+        return None
+    issue_node, edge = create_linear_issue_node(payload["data"], repo_name)
+    return GraphDelta(source="linear", event="Issue", nodes=[issue_node], edges=[edge])
+
+
+def is_loopback(host: str) -> bool:
+    """Check whether a host name or address only accepts local connections."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class WebhookReceiver:
+    """HTTP receiver that applies GitHub and Linear webhooks to the graph.
+
+    Requests are verified and converted on the server's handler threads, then
+    queued. A single writer thread applies the queued deltas in batches: it
+    waits up to `flush_interval` seconds for more deliveries after the first
+    one, merges nodes and edges changed several times, and writes them with one
+    `add_nodes_and_edges` call through a `RefreshWriter`, which uses the
+    process-wide shared connection to the database. Batches that fail are
+    spooled to disk and applied again on the next start.
+
+    Example:
+        receiver = WebhookReceiver(port=8787, github_secret="...")
+        receiver.serve_forever()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        github_secret: Optional[str] = None,
+        linear_secret: Optional[str] = None,
+        repo_path: Optional[Union[str, Path]] = None,
+        db_path: Optional[Union[str, Path]] = None,
+        adapter_type: Optional[str] = None,
+        adapter: Any = None,
+        fetcher: Any = None,
+        fetch_details: bool = False,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        spool_path: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the receiver.
+
+        Args:
+            host: Host to bind to. Unless it is a loopback address, deliveries
+                from a source without a secret are rejected.
+            port: Port to bind to; 0 picks a free port.
+            github_secret: Secret for GitHub signatures. Defaults to the
+                ``ARC_GITHUB_WEBHOOK_SECRET`` environment variable. Without a
+                secret, GitHub deliveries are accepted unsigned on loopback.
+            linear_secret: Secret for Linear signatures. Defaults to the
+                ``ARC_LINEAR_WEBHOOK_SECRET`` environment variable.
+            repo_path: Repository Linear issues are linked to. Defaults to
+                ``ARC_REPO_PATH`` or the current directory.
+            db_path: Path to the database file. If None, uses the default path.
+            adapter_type: The type of database adapter to use. If None, uses the
+                configured adapter.
+            adapter: An adapter to use instead of the process-wide shared one.
+                It must not be used by any other thread while the receiver is
+                running.
+            fetcher: A `GitHubFetcher` to use instead of creating one with the
+                configured GitHub token.
+            fetch_details: Whether to fetch files, reviews and comments of
+                changed PRs and issues, which needs a GitHub token. The
+                requests are made before the delivery is acknowledged, so
+                GitHub may time out and redeliver on slow connections.
+            batch_size: Maximum number of deliveries written together.
+            flush_interval: Seconds to wait for more deliveries before writing.
+            spool_path: File failed deliveries are kept in until they are
+                applied. Defaults to ``<database>.webhooks.jsonl``.
+        """
+        self.host = host
+        self.port = port
+        self.github_secret = github_secret or os.environ.get("ARC_GITHUB_WEBHOOK_SECRET")
+        self.linear_secret = linear_secret or os.environ.get("ARC_LINEAR_WEBHOOK_SECRET")
+        self.repo_path = Path(repo_path or os.environ.get("ARC_REPO_PATH") or Path.cwd())
+        self.db_path = db_path
+        self.adapter_type = adapter_type
+        self.adapter = adapter
+        self.fetch_details = fetch_details
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_path = Path(spool_path) if spool_path else None
+
+        self.counts: Dict[str, int] = {
+            "received": 0,
+            "rejected": 0,
+            "duplicates": 0,
+            "ignored": 0,
+            "queued": 0,
+            "applied": 0,
+            "failed": 0,
+            "spooled": 0,
+            "batches": 0,
+        }
+        self.last_applied: Optional[datetime] = None
+
+        self._queue: "queue.Queue[Optional[GraphDelta]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._deliveries: "OrderedDict[str, None]" = OrderedDict()
+        self._known: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._fetcher = fetcher
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._writer: Optional[threading.Thread] = None
+        self._db: Any = None
+
+    # Receiving
+
+    def _get_fetcher(self) -> Any:
+        """Get the fetcher used to build GitHub nodes, creating it on first use."""
+        if self._fetcher is None:
+            from arc_memory.auth.github import get_github_token
+            from arc_memory.ingest.github_fetcher import GitHubFetcher
+
+            # The token is also used to look up PRs that comments refer to
+            token = get_github_token(allow_failure=True)
+            if self.fetch_details and not token:
+                logger.warning("No GitHub token found; webhook PRs and issues are stored without details")
+                self.fetch_details = False
+            self._fetcher = GitHubFetcher(token or "")
+        return self._fetcher
+
+    def _remember(self, delivery_id: str) -> bool:
+        """Record a delivery ID, returning False if it was already seen."""
+        with self._lock:
+            if delivery_id in self._deliveries:
+                return False
+            self._deliveries[delivery_id] = None
+            while len(self._deliveries) > MAX_REMEMBERED_DELIVERIES:
+                self._deliveries.popitem(last=False)
+            return True
+
+    def _forget(self, delivery_id: str) -> None:
+        """Forget a delivery ID so a redelivery is accepted again."""
+        with self._lock:
+            self._deliveries.pop(delivery_id, None)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def handle(self, source: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Verify, de-duplicate and queue one webhook delivery.
+
+        Args:
+            source: ``github`` or ``linear``.
+            headers: The request headers.
+            body: The raw request body.
+
+        Returns:
+            A tuple of (HTTP status, JSON response).
+        """
+        self._count("received")
+        headers = {key.lower(): value for key, value in headers.items()}
+
+        secret = self.github_secret if source == "github" else self.linear_secret
+        signature_header = "x-hub-signature-256" if source == "github" else "linear-signature"
+        if not secret and not is_loopback(self.host):
+            self._count("rejected")
+            return 401, {"error": f"no {source} webhook secret is configured"}
+        if secret and not verify_signature(secret, body, headers.get(signature_header)):
+            self._count("rejected")
+            return 401, {"error": "invalid signature"}
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._count("rejected")
+            return 400, {"error": "invalid JSON"}
+
+        if source == "github":
+            event = headers.get("x-github-event", "")
+            delivery_id = headers.get("x-github-delivery")
+        else:
+            event = str(payload.get("type", ""))
+            delivery_id = headers.get("linear-delivery")
+            if not delivery_id and payload.get("webhookId"):
+                delivery_id = f"{payload['webhookId']}:{payload.get('webhookTimestamp')}"
+        delivery_id = f"{source}:{delivery_id or hashlib.sha256(body).hexdigest()}"
+
+        if not self._remember(delivery_id):
+            self._count("duplicates")
+            return 200, {"status": "duplicate", "delivery": delivery_id}
+
+        try:
+            delta = self._convert(source, event, payload)
+        except Exception as e:
+            logger.error(f"Failed to convert {source} {event} webhook: {e}")
+            self._forget(delivery_id)
+            self._count("rejected")
+            return 422, {"error": str(e)}
+
+        if delta is None:
+            self._count("ignored")
+            return 200, {"status": "ignored", "event": event}
+
+        self._enqueue(delta, delivery_id)
+        return 202, {"status": "queued", "delivery": delivery_id}
+
+    def _convert(self, source: str, event: str, payload: Dict[str, Any]) -> Optional[GraphDelta]:
+        """Convert a delivery into a delta, or None if it changes nothing."""
+        if source == "github":
+            with self._lock:
+                known = self._known.get((payload.get("repository") or {}).get("full_name"), {})
+            delta = github_delta(event, payload, self._get_fetcher(), known, self.fetch_details)
+        else:
+            delta = linear_delta(payload, self.repo_path.name)
+
+        if delta is None or not (delta.nodes or delta.edges or delta.pending_mentions):
+            return None
+        delta.payload = payload
+        return delta
+
+    def _enqueue(self, delta: GraphDelta, delivery_id: str) -> None:
+        """Queue a delta for the writer thread."""
+        delta.delivery_id = delivery_id
+        if delta.repository:
+            # Later deliveries can mention these items before the batch is written
+            self._record_known(delta.repository, delta.pr_ids, delta.issue_ids)
+        self._queue.put(delta)
+        self._count("queued")
+
+    def _record_known(self, repository: str, pr_ids: Dict[str, str], issue_ids: Dict[str, str]) -> None:
+        with self._lock:
+            known = self._known.setdefault(repository, {"pr_ids": {}, "issue_ids": {}})
+            known["pr_ids"] = merge_known_ids(known["pr_ids"], pr_ids)
+            known["issue_ids"] = merge_known_ids(known["issue_ids"], issue_ids)
+
+    # Writing
+
+    def _get_spool_path(self) -> Path:
+        if self.spool_path is None:
+            from arc_memory.sql.db import get_db_path
+
+            db_path = Path(self.db_path or get_db_path())
+            self.spool_path = db_path.with_name(f"{db_path.name}.webhooks.jsonl")
+        return self.spool_path
+
+    def _spool(self, batch: List[GraphDelta]) -> None:
+        """Keep the deliveries of a batch that couldn't be written."""
+        spool_path = self._get_spool_path()
+        with open(spool_path, "a", encoding="utf-8") as f:
+            for delta in batch:
+                record = {"source": delta.source, "event": delta.event, "delivery": delta.delivery_id}
+                f.write(json.dumps({**record, "payload": delta.payload}) + "\n")
+        with self._lock:
+            self.counts["spooled"] += len(batch)
+        logger.warning(f"Kept {len(batch)} webhook deliveries in {spool_path} to apply on the next start")
+
+    def _replay_spool(self) -> None:
+        """Queue the deliveries left in the spool by an earlier run."""
+        spool_path = self._get_spool_path()
+        # Deliveries that fail again are appended to a new spool. A replay file
+        # left by a run that stopped while replaying is read first.
+        replaying = spool_path.with_name(f"{spool_path.name}.replay")
+        if spool_path.exists():
+            if replaying.exists():
+                with open(replaying, "a", encoding="utf-8") as f:
+                    f.write(spool_path.read_text(encoding="utf-8"))
+                spool_path.unlink()
+            else:
+                os.replace(spool_path, replaying)
+        if not replaying.exists():
+            return
+        count = 0
+        with open(replaying, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if not self._remember(record["delivery"]):
+                        continue
+                    delta = self._convert(record["source"], record["event"], record["payload"])
+                except Exception as e:
+                    logger.error(f"Dropping unreadable spooled webhook delivery: {e}")
+                    continue
+                if delta is not None:
+                    self._enqueue(delta, record["delivery"])
+                    count += 1
+        replaying.unlink()
+        if count:
+            logger.info(f"Queued {count} spooled webhook deliveries")
+
+    def _resolve_mentions(self, batch: List[GraphDelta]) -> None:
+        """Build the mention edges of comments on PRs that weren't known when they arrived."""
+        for delta in batch:
+            pending, delta.pending_mentions = delta.pending_mentions, []
+            for number, text in pending:
+                pr_id = self._resolve_pr_id(delta.repository, number)
+                if pr_id is None:
+                    logger.debug(f"Skipping mentions of a comment on unknown PR #{number} of {delta.repository}")
+                    continue
+                delta.pr_ids[number] = pr_id
+                self._record_known(delta.repository, {number: pr_id}, {})
+                with self._lock:
+                    known = dict(self._known.get(delta.repository, {}))
+                delta.edges.extend(
+                    _mention_edges(
+                        self._get_fetcher(), pr_id, text, known.get("issue_ids", {}), known.get("pr_ids", {})
+                    )
+                )
+
+    def _resolve_pr_id(self, repository: Optional[str], number: str) -> Optional[str]:
+        """Get the node ID of a PR from the known IDs, or else from GitHub."""
+        with self._lock:
+            pr_id = self._known.get(repository, {}).get("pr_ids", {}).get(number)
+        if pr_id or not repository:
+            return pr_id
+        fetcher = self._get_fetcher()
+        if not fetcher.token:
+            return None
+        try:
+            return fetcher.rest_client.request("GET", f"/repos/{repository}/pulls/{number}").get("node_id")
+        except Exception as e:
+            logger.warning(f"Could not look up PR #{number} of {repository}: {e}")
+            return None
+
+    def _load_known(self, adapter: Any) -> None:
+        """Load the PR and issue IDs recorded by the last GitHub sync."""
+        from arc_memory.auto_refresh.sources.github import SYNC_METADATA_KEY
+
+        try:
+            stored = adapter.get_metadata(SYNC_METADATA_KEY) or {}
+        except Exception as e:
+            logger.warning(f"Could not read GitHub sync metadata: {e}")
+            return
+        with self._lock:
+            for repository, state in (stored.get("repositories") or {}).items():
+                known = self._known.setdefault(repository, {"pr_ids": {}, "issue_ids": {}})
+                known["pr_ids"] = merge_known_ids(state.get("pr_ids") or {}, known["pr_ids"])
+                known["issue_ids"] = merge_known_ids(state.get("issue_ids") or {}, known["issue_ids"])
+
+    def _next_batch(self) -> Optional[List[GraphDelta]]:
+        """Wait for a delivery, then collect more until the batch is full or the interval ends."""
+        first = self._queue.get()
+        if first is None:
+            self._queue.task_done()
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                delta = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if delta is None:
+                # Put the stop marker back so the loop exits after this batch
+                self._queue.task_done()
+                self._queue.put(None)
+                break
+            batch.append(delta)
+        return batch
+
+    def apply(self, adapter: Any, batch: List[GraphDelta]) -> None:
+        """Write a batch of deltas with a single call.
+
+        Nodes and edges changed by several deliveries are written once, with
+        the latest delivery's version.
+
+        Args:
+            adapter: The database adapter.
+            batch: The deltas, in delivery order.
+        """
+        nodes: Dict[str, Node] = {}
+        edges: Dict[Tuple[str, str, str], Edge] = {}
+        for delta in batch:
+            for node in delta.nodes:
+                nodes[node.id] = node
+            for edge in delta.edges:
+                edges[(edge.src, edge.dst, str(edge.rel))] = edge
+        adapter.add_nodes_and_edges(list(nodes.values()), list(edges.values()))
+
+        # Record new PR and issue IDs so polling syncs and restarts resolve mentions of them
+        repositories: Dict[str, Dict[str, Dict[str, str]]] = {}
+        for delta in batch:
+            if delta.repository and (delta.pr_ids or delta.issue_ids):
+                state = repositories.setdefault(delta.repository, {"pr_ids": {}, "issue_ids": {}})
+                state["pr_ids"] = merge_known_ids(state["pr_ids"], delta.pr_ids)
+                state["issue_ids"] = merge_known_ids(state["issue_ids"], delta.issue_ids)
+        if repositories:
+            from arc_memory.auto_refresh.sources.github import merge_sync_state
+
+            merge_sync_state(adapter, repositories)
+
+    def _run_writer(self) -> None:
+        try:
+            self._db.submit(self._load_known).result()
+        except Exception as e:
+            logger.error(f"Webhook receiver could not open the database: {e}")
+        try:
+            self._replay_spool()
+        except Exception as e:
+            logger.error(f"Could not replay spooled webhook deliveries: {e}")
+        self._ready.set()
+
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            try:
+                self._resolve_mentions(batch)
+                self._db.submit(lambda adapter: self.apply(adapter, batch)).result()
+                with self._lock:
+                    self.counts["applied"] += len(batch)
+                    self.counts["batches"] += 1
+                self.last_applied = datetime.now()
+                logger.info(f"Applied {len(batch)} webhook deliveries")
+            except Exception as e:
+                # The senders already got a 2xx and won't redeliver
+                logger.error(f"Failed to apply {len(batch)} webhook deliveries: {e}")
+                with self._lock:
+                    self.counts["failed"] += len(batch)
+                try:
+                    self._spool(batch)
+                except OSError as spool_error:
+                    logger.error(f"Lost {len(batch)} webhook deliveries: {spool_error}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until every queued delivery has been written (or failed)."""
+        self._queue.join()
+
+    # Lifecycle
+
+    def status(self) -> Dict[str, Any]:
+        """Get the receiver status as a JSON-serializable dictionary."""
+        with self._lock:
+            counts = dict(self.counts)
+        return {
+            "counts": counts,
+            "pending": self._queue.qsize(),
+            "last_applied": self.last_applied.isoformat() if self.last_applied else None,
+            "github_signed": bool(self.github_secret),
+            "linear_signed": bool(self.linear_secret),
+        }
+
+    def start(self) -> Tuple[str, int]:
+        """Start the writer thread and the HTTP server in the background.
+
+        The server accepts ``POST /github`` and ``POST /linear`` and serves
+        ``GET /status``.
+
+        Returns:
+            The (host, port) the server is bound to.
+        """
+        receiver = self
+
+        class _WebhookHandler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+                source = self.path.strip("/").split("?")[0]
+                if source not in ("github", "linear"):
+                    self.send_error(404)
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self.close_connection = True
+                    self._reply(400, {"error": "invalid Content-Length"})
+                    return
+                if length > MAX_BODY_BYTES:
+                    # Don't read the body; close the connection instead
+                    self.close_connection = True
+                    receiver._count("rejected")
+                    self._reply(413, {"error": f"body larger than {MAX_BODY_BYTES} bytes"})
+                    return
+                body = self.rfile.read(length)
+                self._reply(*receiver.handle(source, dict(self.headers.items()), body))
+
+            def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+                if self.path in ("/", "/status"):
+                    self._reply(200, receiver.status())
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"Webhook endpoint: {format % args}")
+
+        from arc_memory.auto_refresh.core import RefreshWriter
+
+        self._db = RefreshWriter(self.adapter_type, adapter=self.adapter, db_path=self.db_path)
+        self._writer = threading.Thread(target=self._run_writer, name="arc-webhook-writer", daemon=True)
+        self._writer.start()
+        self._ready.wait()
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _WebhookHandler)
+        thread = threading.Thread(target=self._server.serve_forever, name="arc-webhooks", daemon=True)
+        thread.start()
+        host, port = self._server.server_address[:2]
+        logger.info(f"Webhook receiver listening on http://{host}:{port}")
+        if not (self.github_secret and self.linear_secret):
+            if is_loopback(self.host):
+                logger.warning("Webhook secrets not configured; unsigned deliveries will be accepted")
+            else:
+                logger.warning("Webhook secrets not configured; unsigned deliveries will be rejected")
+        return host, port
+
+    def serve_forever(self) -> None:
+        """Run the receiver until `stop()` is called or the process is interrupted."""
+        self.start()
+        try:
+            self._stop_event.wait()
+        except KeyboardInterrupt:
+            logger.info("Webhook receiver interrupted")
+        finally:
+            self.shutdown()
+
+    def stop(self) -> None:
+        """Ask `serve_forever` to return."""
+        self._stop_event.set()
+
+    def shutdown(self) -> None:
+        """Stop the server, write the remaining deliveries and close the database."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
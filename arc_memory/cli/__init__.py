@@ -1,47 +1,87 @@
 """Command-line interface for Arc Memory."""
 
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
+from typer.models import CommandInfo
 
 import arc_memory
 
+# Sub-commands are imported only when they are invoked (or listed in --help),
+# so a call such as `arc trace file` does not pay for the imports of every
+# other command. Maps command name to (module, attribute); the attribute is
+# either a Typer sub-app or a single command function.
+LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "auth": ("arc_memory.cli.auth", "app"),
+    "build": ("arc_memory.cli.build", "build"),
+    "doctor": ("arc_memory.cli.doctor", "app"),
+    "migrate": ("arc_memory.cli.migrate", "app"),
+    "refresh": ("arc_memory.cli.refresh", "app"),
+    "repo": ("arc_memory.cli.repo", "app"),
+    "trace": ("arc_memory.cli.trace", "app"),
+    "why": ("arc_memory.cli.why", "app"),
+    "relate": ("arc_memory.cli.relate", "app"),
+    "serve": ("arc_memory.cli.serve", "app"),
+    "rl": ("arc_memory.cli.rl", "app"),
+    "export": ("arc_memory.cli.export", "export"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports the commands in LAZY_COMMANDS on first use."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List the lazy commands followed by the eagerly registered ones."""
+        eager = [name for name in super().list_commands(ctx) if name not in LAZY_COMMANDS]
+        return list(LAZY_COMMANDS) + eager
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing and registering it if it is lazy."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_COMMANDS:
+            command = _load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+
+def _load_command(name: str) -> click.Command:
+    """Import a lazy command and convert it to a click command.
+
+    Args:
+        name: The command name in LAZY_COMMANDS.
+
+    Returns:
+        The click command or group.
+    """
+    module_name, attribute = LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attribute)
+    if isinstance(target, typer.Typer):
+        return typer.main.get_group(target)
+    return typer.main.get_command_from_info(
+        CommandInfo(name=name, callback=target),
+        pretty_exceptions_short=app.pretty_exceptions_short,
+        rich_markup_mode=app.rich_markup_mode,
+    )
+
+
 app = typer.Typer(
     name="arc",
     help="Arc Memory - Local bi-temporal knowledge graph for code repositories.",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
 console = Console()
 
-# Import commands to register them with the app
-from arc_memory.cli.auth import app as auth_app
-from arc_memory.cli.build import build as build_command
-from arc_memory.cli.doctor import app as doctor_app
-from arc_memory.cli.export import export as export_command
-from arc_memory.cli.migrate import app as migrate_app
-from arc_memory.cli.refresh import app as refresh_app
-from arc_memory.cli.repo import app as repo_app
-from arc_memory.cli.trace import app as trace_app
-from arc_memory.cli.why import app as why_app
-from arc_memory.cli.relate import app as relate_app
-from arc_memory.cli.serve import app as serve_app
-from arc_memory.cli.rl import app as rl_app
-
-# Add commands to the main app
-app.add_typer(auth_app, name="auth")
-app.command()(build_command)  # Add build command directly
-app.add_typer(doctor_app, name="doctor")
-app.add_typer(migrate_app, name="migrate")
-app.add_typer(refresh_app, name="refresh")
-app.add_typer(repo_app, name="repo")
-app.add_typer(trace_app, name="trace")
-app.add_typer(why_app, name="why")
-app.add_typer(relate_app, name="relate")
-app.add_typer(serve_app, name="serve")
-app.add_typer(rl_app, name="rl")
-
-# Add export command directly to the main app
-app.command()(export_command)
+
+@app.callback()
+def main() -> None:
+    """Arc Memory - Local bi-temporal knowledge graph for code repositories."""
+
 
 @app.command()
 def version():
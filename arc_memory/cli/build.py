@@ -36,6 +36,8 @@ from arc_memory.plugins import get_ingestor_plugins
 from arc_memory.process.kgot import enhance_with_reasoning_structures
 from arc_memory.process.semantic_analysis import enhance_with_semantic_analysis
 from arc_memory.process.temporal_analysis import enhance_with_temporal_analysis
+from arc_memory.profiling import Profiler, span, trace_connection
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
 from arc_memory.schema.models import Edge, Node
 from arc_memory.sql.db import add_nodes_and_edges, compress_db, ensure_arc_dir, init_db
 
@@ -111,6 +113,14 @@ def build(
         False, "--ci-mode", help="Run in CI mode with optimized parameters."
     ),
     debug: bool = typer.Option(False, "--debug", help="Enable debug logging."),
+    profile: Optional[Path] = typer.Option(
+        None, "--profile", help="Write a Chrome trace of the build stages to this file and print a stage summary."
+    ),
+    profile_capture: Optional[str] = typer.Option(
+        None,
+        "--profile-capture",
+        help="Also profile each stage with 'cprofile' or 'pyinstrument'; output is written next to the trace.",
+    ),
 ) -> None:
     """Build the knowledge graph from a Git repository and other sources.
 
@@ -145,8 +155,15 @@ def build(
 
         # Build with LLM enhancement
         arc build --llm-enhancement standard
+
+        # Profile the build stages
+        arc build --profile build-trace.json --profile-capture cprofile
     """
+    profiler = None
     try:
+        if profile is not None:
+            profiler = Profiler(capture=profile_capture, capture_dir=profile.parent).start()
+
         start_time = time.time()
 
         # Print welcome message
@@ -490,9 +507,10 @@ Prioritize precision over coverage in your enhancements. Follow Arc Memory's sch
                 print("⚠️ Supported providers: openai, ollama")
                 llm_enhancement = LLMEnhancementLevel.NONE
 
-        # Process nodes and edges using ingestors
-        all_nodes = []
-        all_edges = []
+        # Process nodes and edges using ingestors. Results are kept in compact
+        # columnar batches rather than as lists of Pydantic models
+        all_nodes = NodeBatch()
+        all_edges = EdgeBatch()
 
         total_ingestors = len(ingestors)
         print(f"\n🔍 Running {total_ingestors} ingestors...\n")
@@ -511,52 +529,53 @@ Prioritize precision over coverage in your enhancements. Follow Arc Memory's sch
 
             ingestor_start = time.time()
 
-            try:
-                # Call the ingest method with the appropriate parameters for each ingestor type
-                if ingestor_name == "git":
-                    nodes, edges, metadata = ingestor.ingest(
-                        repo_path=repo_path,
-                        max_commits=max_commits,
-                        days=days,
-                        last_processed=None,  # Use None for full builds or populate for incremental
-                    )
-                elif ingestor_name == "github":
-                    nodes, edges, metadata = ingestor.ingest(
-                        repo_path=repo_path,
-                        token=token,
-                        last_processed=None,  # Use None for full builds or populate for incremental
-                    )
-                elif ingestor_name == "adr":
-                    nodes, edges, metadata = ingestor.ingest(
-                        repo_path=repo_path,
-                        last_processed=None,
-                    )
-                elif ingestor_name == "code_analysis":
-                    nodes, edges, metadata = ingestor.ingest(
-                        repo_path=repo_path,
-                        last_processed=None,
-                        llm_enhancement_level=llm_enhancement.value,
-                    )
-                elif ingestor_name == "change_patterns":
-                    nodes, edges, metadata = ingestor.ingest(
-                        repo_path=repo_path,
-                        last_processed=None,
-                        llm_enhancement_level=llm_enhancement.value,
-                    )
-                else:
-                    # Default handling for other ingestors - handle the case where repo_path might be needed
-                    if hasattr(ingestor, "ingest") and "repo_path" in ingestor.ingest.__code__.co_varnames:
+            with span(f"ingest.{ingestor_name}"):
+                try:
+                    # Call the ingest method with the appropriate parameters for each ingestor type
+                    if ingestor_name == "git":
+                        nodes, edges, metadata = ingestor.ingest(
+                            repo_path=repo_path,
+                            max_commits=max_commits,
+                            days=days,
+                            last_processed=None,  # Use None for full builds or populate for incremental
+                        )
+                    elif ingestor_name == "github":
+                        nodes, edges, metadata = ingestor.ingest(
+                            repo_path=repo_path,
+                            token=token,
+                            last_processed=None,  # Use None for full builds or populate for incremental
+                        )
+                    elif ingestor_name == "adr":
                         nodes, edges, metadata = ingestor.ingest(
                             repo_path=repo_path,
                             last_processed=None,
                         )
-                    else:
+                    elif ingestor_name == "code_analysis":
+                        nodes, edges, metadata = ingestor.ingest(
+                            repo_path=repo_path,
+                            last_processed=None,
+                            llm_enhancement_level=llm_enhancement.value,
+                        )
+                    elif ingestor_name == "change_patterns":
                         nodes, edges, metadata = ingestor.ingest(
+                            repo_path=repo_path,
                             last_processed=None,
+                            llm_enhancement_level=llm_enhancement.value,
                         )
-            except Exception as e:
-                print(f"\r❌ Error processing {ingestor_name}: {e}")
-                nodes, edges, metadata = [], [], {}
+                    else:
+                        # Default handling for other ingestors - handle the case where repo_path might be needed
+                        if hasattr(ingestor, "ingest") and "repo_path" in ingestor.ingest.__code__.co_varnames:
+                            nodes, edges, metadata = ingestor.ingest(
+                                repo_path=repo_path,
+                                last_processed=None,
+                            )
+                        else:
+                            nodes, edges, metadata = ingestor.ingest(
+                                last_processed=None,
+                            )
+                except Exception as e:
+                    print(f"\r❌ Error processing {ingestor_name}: {e}")
+                    nodes, edges, metadata = [], [], {}
 
             ingestor_time = time.time() - ingestor_start
             all_nodes.extend(nodes)
@@ -572,95 +591,102 @@ Prioritize precision over coverage in your enhancements. Follow Arc Memory's sch
             print("\n🧠 Applying LLM enhancements...")
             enhancement_start = time.time()
 
+            # The enhancement stages work on node and edge models
+            all_nodes = all_nodes.to_nodes()
+            all_edges = all_edges.to_edges()
+
             # Apply semantic analysis
             spinner_idx = 0
             sys.stdout.write("\r⠋ Enhancing with semantic analysis...")
             sys.stdout.flush()
 
-            try:
-                if llm_provider == "openai" and openai_client is not None:
-                    all_nodes, all_edges = enhance_with_semantic_analysis(
-                        all_nodes,
-                        all_edges,
-                        repo_path=repo_path,
-                        enhancement_level=llm_enhancement.value,
-                        openai_client=openai_client,
-                        llm_provider="openai",
-                        llm_model=openai_model
-                    )
-                else:
-                    all_nodes, all_edges = enhance_with_semantic_analysis(
-                        all_nodes,
-                        all_edges,
-                        repo_path=repo_path,
-                        enhancement_level=llm_enhancement.value,
-                        ollama_client=ollama_client,
-                        llm_provider="ollama"
-                    )
-                sys.stdout.write(f"\r✅ Semantic analysis complete ({time.time() - enhancement_start:.1f}s)\n")
-            except Exception as e:
-                sys.stdout.write(f"\r❌ Semantic analysis failed: {e}\n")
+            with span("enhance.semantic"):
+                try:
+                    if llm_provider == "openai" and openai_client is not None:
+                        all_nodes, all_edges = enhance_with_semantic_analysis(
+                            all_nodes,
+                            all_edges,
+                            repo_path=repo_path,
+                            enhancement_level=llm_enhancement.value,
+                            openai_client=openai_client,
+                            llm_provider="openai",
+                            llm_model=openai_model
+                        )
+                    else:
+                        all_nodes, all_edges = enhance_with_semantic_analysis(
+                            all_nodes,
+                            all_edges,
+                            repo_path=repo_path,
+                            enhancement_level=llm_enhancement.value,
+                            ollama_client=ollama_client,
+                            llm_provider="ollama"
+                        )
+                    sys.stdout.write(f"\r✅ Semantic analysis complete ({time.time() - enhancement_start:.1f}s)\n")
+                except Exception as e:
+                    sys.stdout.write(f"\r❌ Semantic analysis failed: {e}\n")
 
             # Apply temporal analysis
             temporal_start = time.time()
             sys.stdout.write("\r⠋ Enhancing with temporal analysis...")
             sys.stdout.flush()
 
-            try:
-                if llm_provider == "openai" and openai_client is not None:
-                    all_nodes, all_edges = enhance_with_temporal_analysis(
-                        all_nodes,
-                        all_edges,
-                        repo_path=repo_path,
-                        enhancement_level=llm_enhancement.value,
-                        openai_client=openai_client,
-                        llm_provider="openai",
-                        llm_model=openai_model
-                    )
-                else:
-                    all_nodes, all_edges = enhance_with_temporal_analysis(
-                        all_nodes,
-                        all_edges,
-                        repo_path=repo_path,
-                        enhancement_level=llm_enhancement.value,
-                        ollama_client=ollama_client,
-                        llm_provider="ollama"
-                    )
-                sys.stdout.write(f"\r✅ Temporal analysis complete ({time.time() - temporal_start:.1f}s)\n")
-            except Exception as e:
-                sys.stdout.write(f"\r❌ Temporal analysis failed: {e}\n")
-
-            # Apply KGoT reasoning structures (only in standard or deep mode)
-            if llm_enhancement in [LLMEnhancementLevel.STANDARD, LLMEnhancementLevel.DEEP]:
-                kgot_start = time.time()
-                sys.stdout.write("\r⠋ Generating reasoning structures...")
-                sys.stdout.flush()
-
+            with span("enhance.temporal"):
                 try:
                     if llm_provider == "openai" and openai_client is not None:
-                        all_nodes, all_edges = enhance_with_reasoning_structures(
+                        all_nodes, all_edges = enhance_with_temporal_analysis(
                             all_nodes,
                             all_edges,
                             repo_path=repo_path,
+                            enhancement_level=llm_enhancement.value,
                             openai_client=openai_client,
                             llm_provider="openai",
-                            enhancement_level=llm_enhancement.value,
-                            system_prompt=system_prompt,
                             llm_model=openai_model
                         )
                     else:
-                        all_nodes, all_edges = enhance_with_reasoning_structures(
+                        all_nodes, all_edges = enhance_with_temporal_analysis(
                             all_nodes,
                             all_edges,
                             repo_path=repo_path,
-                            ollama_client=ollama_client,
-                            llm_provider="ollama",
                             enhancement_level=llm_enhancement.value,
-                            system_prompt=system_prompt
+                            ollama_client=ollama_client,
+                            llm_provider="ollama"
                         )
-                    sys.stdout.write(f"\r✅ Reasoning structures complete ({time.time() - kgot_start:.1f}s)\n")
+                    sys.stdout.write(f"\r✅ Temporal analysis complete ({time.time() - temporal_start:.1f}s)\n")
                 except Exception as e:
-                    sys.stdout.write(f"\r❌ Reasoning structures failed: {e}\n")
+                    sys.stdout.write(f"\r❌ Temporal analysis failed: {e}\n")
+
+            # Apply KGoT reasoning structures (only in standard or deep mode)
+            if llm_enhancement in [LLMEnhancementLevel.STANDARD, LLMEnhancementLevel.DEEP]:
+                kgot_start = time.time()
+                sys.stdout.write("\r⠋ Generating reasoning structures...")
+                sys.stdout.flush()
+
+                with span("enhance.reasoning"):
+                    try:
+                        if llm_provider == "openai" and openai_client is not None:
+                            all_nodes, all_edges = enhance_with_reasoning_structures(
+                                all_nodes,
+                                all_edges,
+                                repo_path=repo_path,
+                                openai_client=openai_client,
+                                llm_provider="openai",
+                                enhancement_level=llm_enhancement.value,
+                                system_prompt=system_prompt,
+                                llm_model=openai_model
+                            )
+                        else:
+                            all_nodes, all_edges = enhance_with_reasoning_structures(
+                                all_nodes,
+                                all_edges,
+                                repo_path=repo_path,
+                                ollama_client=ollama_client,
+                                llm_provider="ollama",
+                                enhancement_level=llm_enhancement.value,
+                                system_prompt=system_prompt
+                            )
+                        sys.stdout.write(f"\r✅ Reasoning structures complete ({time.time() - kgot_start:.1f}s)\n")
+                    except Exception as e:
+                        sys.stdout.write(f"\r❌ Reasoning structures failed: {e}\n")
 
             enhancement_time = time.time() - enhancement_start
             print(f"✅ LLM enhancements complete ({enhancement_time:.1f}s)")
@@ -669,15 +695,18 @@ Prioritize precision over coverage in your enhancements. Follow Arc Memory's sch
         print(f"\n💾 Writing graph to database ({len(all_nodes)} nodes, {len(all_edges)} edges)...")
         db_start = time.time()
 
-        # Initialize the database
-        conn = init_db(output_path)
+        with span("db.write", nodes=len(all_nodes), edges=len(all_edges)):
+            # Initialize the database
+            conn = init_db(output_path)
+            trace_connection(conn)
 
-        # Add nodes and edges
-        add_nodes_and_edges(conn, all_nodes, all_edges)
+            # Add nodes and edges
+            add_nodes_and_edges(conn, all_nodes, all_edges)
 
         # Compress the database
         print("🗜️  Compressing database...")
-        compressed_path = compress_db(output_path)
+        with span("db.compress"):
+            compressed_path = compress_db(output_path)
 
         # Get file sizes for reporting
         original_size = output_path.stat().st_size
@@ -692,3 +721,22 @@ Prioritize precision over coverage in your enhancements. Follow Arc Memory's sch
 
     except Exception as e:
         raise GraphBuildError(f"Error building graph: {e}")
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            _report_profile(profiler, profile)
+
+
+def _report_profile(profiler: Profiler, trace_path: Path) -> None:
+    """Print the stage summary of a profiled build and write its trace.
+
+    Args:
+        profiler: The profiler of the build.
+        trace_path: File to write the Chrome trace to.
+    """
+    print("\n⏱️  Build profile")
+    print(profiler.format_summary())
+    profiler.write_chrome_trace(trace_path)
+    print(f"Trace written to {trace_path}")
+    for capture in profiler.captures:
+        print(f"Stage profile written to {capture}")
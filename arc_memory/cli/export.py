@@ -31,6 +31,13 @@ def export(
     compress: bool = typer.Option(
         True, help="Compress the output file"
     ),
+    compression: str = typer.Option(
+        "gzip", "--compression", help="Compression codec to use (gzip or zstd)"
+    ),
+    export_format: str = typer.Option(
+        "json", "--format",
+        help="Export format: json (single document) or jsonl (one record per line)"
+    ),
     sign: bool = typer.Option(
         False, help="Sign the output file with GPG"
     ),
@@ -76,6 +83,7 @@ def export(
     Examples:
         arc export abc123 --out arc-graph.json
         arc export abc123 --out arc-graph.json.gz --compress
+        arc export abc123 --out arc-graph.jsonl --format jsonl --compression zstd
         arc export abc123 --out arc-graph.json --sign --key ABCD1234
         arc export abc123 --out arc-graph.json --max-hops 3
         arc export abc123 --out arc-graph.json --no-enhance-for-llm
@@ -88,6 +96,8 @@ def export(
         "pr": pr,
         "out": str(out),
         "compress": compress,
+        "compression": compression,
+        "format": export_format,
         "sign": sign,
         "key": key,
         "repo_path": str(repo_path) if repo_path else None,
@@ -128,6 +138,8 @@ def export(
             output_path=out,
             pr_sha=pr,
             compress=compress,
+            compression=compression,
+            format=export_format,
             sign=sign,
             key_id=key,
             base_branch=base_branch,
@@ -7,7 +7,8 @@ from various sources, either manually or automatically on a schedule.
 import sys
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 import typer
 from rich.console import Console
@@ -18,6 +19,7 @@ from arc_memory.config import get_config, update_config
 from arc_memory.db.metadata import get_all_refresh_timestamps
 from arc_memory.errors import AutoRefreshError
 from arc_memory.logging_conf import configure_logging, get_logger, is_debug_mode
+from arc_memory.profiling import Profiler
 from arc_memory.scheduler import (
     get_refresh_schedule,
     schedule_refresh,
@@ -54,6 +56,14 @@ def callback(
     debug: bool = typer.Option(
         False, "--debug", help="Enable debug logging."
     ),
+    profile: Optional[Path] = typer.Option(
+        None, "--profile", help="Write a Chrome trace of the refresh to this file and print a stage summary."
+    ),
+    profile_capture: Optional[str] = typer.Option(
+        None,
+        "--profile-capture",
+        help="Also profile each stage with 'cprofile' or 'pyinstrument'; output is written next to the trace.",
+    ),
 ) -> None:
     """Refresh the knowledge graph with the latest data from various sources.
 
@@ -66,6 +76,7 @@ def callback(
         arc refresh --source github
         arc refresh --force
         arc refresh --silent
+        arc refresh --profile refresh-trace.json
     """
     configure_logging(debug=debug or is_debug_mode())
 
@@ -122,7 +133,15 @@ def callback(
             if force:
                 console.print("[yellow]Force refresh enabled[/yellow]")
 
-        results = refresh_all_sources(sources_to_refresh, force, min_interval)
+        profiler = Profiler(capture=profile_capture, capture_dir=profile.parent) if profile else None
+        if profiler is None:
+            results = refresh_all_sources(sources_to_refresh, force, min_interval)
+        else:
+            try:
+                with profiler.activate():
+                    results = refresh_all_sources(sources_to_refresh, force, min_interval)
+            finally:
+                _report_profile(profiler, profile, silent)
 
         if not silent:
             # Print results
@@ -145,6 +164,23 @@ def callback(
         sys.exit(1)
 
 
+def _report_profile(profiler: Profiler, trace_path: Path, silent: bool) -> None:
+    """Write the trace of a profiled refresh and print its stage summary.
+
+    Args:
+        profiler: The profiler of the refresh.
+        trace_path: File to write the Chrome trace to.
+        silent: Whether to suppress output.
+    """
+    profiler.write_chrome_trace(trace_path)
+    if not silent:
+        console.print("\n[bold]Refresh Profile:[/bold]")
+        console.print(profiler.format_summary(), markup=False, highlight=False)
+        console.print(f"Trace written to {trace_path}")
+        for capture in profiler.captures:
+            console.print(f"Stage profile written to {capture}")
+
+
 @app.command("status")
 def status(
     debug: bool = typer.Option(
@@ -333,3 +369,151 @@ def unschedule_command(
         console.print(f"\n[red]Error unscheduling auto-refresh: {e}[/red]")
         logger.error(f"Error unscheduling auto-refresh: {e}")
         sys.exit(1)
+
+
+@app.command("daemon")
+def daemon_command(
+    repo_path: Optional[Path] = typer.Option(
+        None, "--repo", help="Path to the Git repository to watch (default: current directory)."
+    ),
+    source: Optional[List[Source]] = typer.Option(
+        None, "--source", "-s", help="Source to keep fresh (repeatable; default: all)."
+    ),
+    interval_minutes: Optional[int] = typer.Option(
+        None, "--interval", "-i",
+        help="Minutes between periodic refreshes (default: from config interval_hours)."
+    ),
+    debounce: float = typer.Option(
+        5.0, "--debounce", help="Seconds to wait for further changes before refreshing."
+    ),
+    port: Optional[int] = typer.Option(
+        None, "--port", "-p", help="Port for the /status and /metrics endpoint (disabled if omitted)."
+    ),
+    debug: bool = typer.Option(
+        False, "--debug", help="Enable debug logging."
+    ),
+) -> None:
+    """Run a resident refresh service that reacts to repository changes.
+
+    Unlike 'arc refresh schedule', which starts a new process on a fixed interval,
+    the daemon stays running, keeps the database open, watches the repository for
+    new commits and refreshes each source incrementally as soon as it changes.
+
+    Examples:
+        arc refresh daemon
+        arc refresh daemon --source github --source adr --interval 15
+        arc refresh daemon --port 8765
+    """
+    from arc_memory.auto_refresh.daemon import RefreshDaemon
+
+    configure_logging(debug=debug or is_debug_mode())
+
+    # Track command usage
+    track_cli_command("refresh", subcommand="daemon", args={
+        "source": [s.value for s in source] if source else None,
+        "interval_minutes": interval_minutes,
+        "debounce": debounce,
+        "port": port,
+        "debug": debug,
+    })
+
+    if interval_minutes is None:
+        config = get_config()
+        interval_minutes = config.get("refresh", {}).get("interval_hours", 24) * 60
+
+    sources = None
+    if source and Source.ALL not in source:
+        sources = [s.value for s in source]
+
+    daemon = RefreshDaemon(
+        repo_path=repo_path or Path.cwd(),
+        sources=sources,
+        min_interval=timedelta(minutes=interval_minutes),
+        debounce_seconds=debounce,
+        status_port=port,
+    )
+
+    console.print("\n🔄 [bold]Arc Memory Refresh Daemon[/bold]")
+    console.print(f"Watching [bold]{daemon.repo_path}[/bold] for sources: {', '.join(daemon.sources)}")
+    if port is not None:
+        console.print(f"Status: http://127.0.0.1:{port}/status  Metrics: http://127.0.0.1:{port}/metrics")
+    console.print("Press Ctrl+C to stop.")
+
+    try:
+        daemon.run_forever()
+    except AutoRefreshError as e:
+        console.print(f"\n[red]Refresh daemon error: {e}[/red]")
+        logger.error(f"Refresh daemon error: {e}")
+        sys.exit(1)
+
+
+@app.command("webhooks")
+def webhooks_command(
+    host: str = typer.Option(
+        "127.0.0.1", "--host", help="Host to bind the webhook receiver to."
+    ),
+    port: int = typer.Option(
+        8787, "--port", "-p", help="Port to bind the webhook receiver to."
+    ),
+    repo_path: Optional[Path] = typer.Option(
+        None, "--repo", help="Repository Linear issues are linked to (default: current directory)."
+    ),
+    details: bool = typer.Option(
+        False, "--details",
+        help="Fetch files, reviews and comments of changed PRs and issues from GitHub."
+    ),
+    flush_interval: float = typer.Option(
+        1.0, "--flush-interval", help="Seconds to collect deliveries before writing them together."
+    ),
+    debug: bool = typer.Option(
+        False, "--debug", help="Enable debug logging."
+    ),
+) -> None:
+    """Receive GitHub and Linear webhooks and apply them to the graph as they arrive.
+
+    Point GitHub webhooks (pull_request, issues, issue_comment, push) at /github
+    and Linear issue webhooks at /linear. Signatures are checked when the
+    ARC_GITHUB_WEBHOOK_SECRET and ARC_LINEAR_WEBHOOK_SECRET environment variables
+    are set; they are required unless the receiver is bound to a loopback
+    address. Periodic refreshes can then run much less often.
+
+    Examples:
+        arc refresh webhooks
+        arc refresh webhooks --host 0.0.0.0 --port 9000 --details
+    """
+    from arc_memory.auto_refresh.webhooks import WebhookReceiver, is_loopback
+
+    configure_logging(debug=debug or is_debug_mode())
+
+    # Track command usage
+    track_cli_command("refresh", subcommand="webhooks", args={
+        "port": port,
+        "details": details,
+        "flush_interval": flush_interval,
+        "debug": debug,
+    })
+
+    receiver = WebhookReceiver(
+        host=host,
+        port=port,
+        repo_path=repo_path,
+        fetch_details=details,
+        flush_interval=flush_interval,
+    )
+
+    console.print("\n🔔 [bold]Arc Memory Webhook Receiver[/bold]")
+    console.print(f"GitHub: http://{host}:{port}/github  Linear: http://{host}:{port}/linear")
+    console.print(f"Status: http://{host}:{port}/status")
+    if not receiver.github_secret or not receiver.linear_secret:
+        if is_loopback(host):
+            console.print("[yellow]Webhook secrets not set; unsigned deliveries will be accepted.[/yellow]")
+        else:
+            console.print("[yellow]Webhook secrets not set; unsigned deliveries will be rejected.[/yellow]")
+    console.print("Press Ctrl+C to stop.")
+
+    try:
+        receiver.serve_forever()
+    except OSError as e:
+        console.print(f"\n[red]Webhook receiver error: {e}[/red]")
+        logger.error(f"Webhook receiver error: {e}")
+        sys.exit(1)
@@ -11,14 +11,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from arc_memory.sdk.core import Arc
-from arc_memory.rl.run import (
-    train_pipeline,
-    evaluate_pipeline,
-    collect_and_train_offline,
-    demo_pipeline,
-    initialize_pipeline,
-)
 
 app = typer.Typer(
     name="rl",
@@ -67,6 +59,10 @@ def run(
     - demo: Demonstrate a trained agent
     """
     try:
+        # The RL pipeline pulls in numpy and the SDK, so import it only when run
+        from arc_memory.rl.run import demo_pipeline, evaluate_pipeline, train_pipeline
+        from arc_memory.sdk.core import Arc
+
         # Initialize the SDK
         sdk = Arc("./")  # Initialize with current directory
         
@@ -130,6 +126,8 @@ def run(
         
         elif mode == Mode.COLLECT:
             console.print(f"[bold]Collecting experiences for {num_episodes} episodes and training for {num_training_epochs} epochs...[/bold]")
+            from arc_memory.rl.run import collect_and_train_offline
+
             collect_and_train_offline(
                 sdk,
                 num_collection_episodes=num_episodes,
@@ -225,6 +223,9 @@ def test():
     console.print("[bold]Running RL pipeline test...[/bold]")
     
     try:
+        from arc_memory.rl.run import train_pipeline
+        from arc_memory.sdk.core import Arc
+
         # Initialize the SDK
         sdk = Arc("./")
         
@@ -8,7 +8,7 @@ import json
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 from rich.console import Console
@@ -281,6 +281,10 @@ def query(
     debug: bool = typer.Option(
         False, "--debug", help="Enable debug logging"
     ),
+    stream: bool = typer.Option(
+        True, "--stream/--no-stream",
+        help="Show evidence and answer text as they arrive (text format only)"
+    ),
 ) -> None:
     """Query the knowledge graph using natural language.
 
@@ -323,6 +327,10 @@ def query(
                 "deep": 4
             }.get(depth.lower(), 3)
 
+            if stream and format == Format.TEXT:
+                _print_streamed_answer(arc, question, max_results, max_hops)
+                return
+
             # Query the knowledge graph
             query_result = arc.query(
                 question=question,
@@ -481,59 +489,7 @@ def query(
 
             # Supporting evidence
             if "results" in query_results and query_results["results"]:
-                console.print("\n[bold]Supporting Evidence:[/bold]")
-
-                for result in query_results["results"]:
-                    # Create a panel for each result
-                    title = f"[bold]{result['type'].upper()}[/bold]: {result['title']}"
-                    content = f"ID: {result['id']}\n"
-                    if "timestamp" in result:
-                        content += f"Timestamp: {result['timestamp'] or 'N/A'}\n"
-                    if "relevance" in result:
-                        content += f"Relevance: {result['relevance']}\n\n"
-
-                    # Add type-specific details
-                    if result["type"] == "commit":
-                        if "author" in result:
-                            content += f"Author: {result['author']}\n"
-                        if "sha" in result:
-                            content += f"SHA: {result['sha']}\n"
-                    elif result["type"] == "pr":
-                        if "number" in result:
-                            content += f"PR #{result['number']}\n"
-                        if "state" in result:
-                            content += f"State: {result['state']}\n"
-                        if "url" in result:
-                            content += f"URL: {result['url']}\n"
-                    elif result["type"] == "issue":
-                        if "number" in result:
-                            content += f"Issue #{result['number']}\n"
-                        if "state" in result:
-                            content += f"State: {result['state']}\n"
-                        if "url" in result:
-                            content += f"URL: {result['url']}\n"
-                    elif result["type"] == "adr":
-                        if "status" in result:
-                            content += f"Status: {result['status']}\n"
-                        if "decision_makers" in result:
-                            content += f"Decision Makers: {', '.join(result['decision_makers'])}\n"
-                        if "path" in result:
-                            content += f"Path: {result['path']}\n"
-
-                    # Add reasoning if available
-                    if "reasoning" in result:
-                        content += f"\n{result['reasoning']}"
-
-                    # Determine panel style based on node type
-                    style = {
-                        "commit": "cyan",
-                        "pr": "green",
-                        "issue": "yellow",
-                        "adr": "blue",
-                        "file": "magenta"
-                    }.get(result["type"], "white")
-
-                    console.print(Panel(content, title=title, style=style))
+                _print_evidence(query_results["results"])
 
             # Confidence level
             if "confidence" in query_results:
@@ -552,3 +508,88 @@ def query(
         # Track error
         track_command_usage("why_query", success=False, error=e, context=context)
         sys.exit(1)
+
+
+def _print_streamed_answer(arc: Arc, question: str, max_results: int, max_hops: int) -> None:
+    """Print a query's evidence and answer progressively as they are generated."""
+    for event in arc.query_stream(question=question, max_results=max_results, max_hops=max_hops):
+        if event.type == "results":
+            if event.query_understanding:
+                console.print(Panel(event.query_understanding,
+                                    title="[bold blue]Query Understanding[/bold blue]",
+                                    style="blue"))
+            if event.evidence:
+                _print_evidence(event.evidence)
+            console.print("\n[bold yellow]Detailed Answer:[/bold yellow]")
+        elif event.type == "token":
+            console.print(event.text, end="", markup=False, highlight=False, soft_wrap=True)
+        elif event.result is not None:
+            result = event.result
+            if not result.evidence:
+                console.print("[yellow]No relevant information found for your question.[/yellow]")
+                console.print("Try rephrasing your question or using more specific terms.")
+                return
+
+            console.print()
+            summary = result.answer.split(".")[0] if result.answer else "No summary available"
+            console.print(Panel(f"[bold]{summary}[/bold]",
+                                title="[bold green]Answer[/bold green]",
+                                style="green"))
+            console.print(f"\n[bold]Confidence:[/bold] {result.confidence * 10:.0f}/10")
+
+
+def _print_evidence(results: List[Dict[str, Any]]) -> None:
+    """Print a panel for each supporting evidence node."""
+    console.print("\n[bold]Supporting Evidence:[/bold]")
+
+    for result in results:
+        # Create a panel for each result
+        title = f"[bold]{result['type'].upper()}[/bold]: {result['title']}"
+        content = f"ID: {result['id']}\n"
+        if "timestamp" in result:
+            content += f"Timestamp: {result['timestamp'] or 'N/A'}\n"
+        if "relevance" in result:
+            content += f"Relevance: {result['relevance']}\n\n"
+
+        # Add type-specific details
+        if result["type"] == "commit":
+            if "author" in result:
+                content += f"Author: {result['author']}\n"
+            if "sha" in result:
+                content += f"SHA: {result['sha']}\n"
+        elif result["type"] == "pr":
+            if "number" in result:
+                content += f"PR #{result['number']}\n"
+            if "state" in result:
+                content += f"State: {result['state']}\n"
+            if "url" in result:
+                content += f"URL: {result['url']}\n"
+        elif result["type"] == "issue":
+            if "number" in result:
+                content += f"Issue #{result['number']}\n"
+            if "state" in result:
+                content += f"State: {result['state']}\n"
+            if "url" in result:
+                content += f"URL: {result['url']}\n"
+        elif result["type"] == "adr":
+            if "status" in result:
+                content += f"Status: {result['status']}\n"
+            if "decision_makers" in result:
+                content += f"Decision Makers: {', '.join(result['decision_makers'])}\n"
+            if "path" in result:
+                content += f"Path: {result['path']}\n"
+
+        # Add reasoning if available
+        if "reasoning" in result:
+            content += f"\n{result['reasoning']}"
+
+        # Determine panel style based on node type
+        style = {
+            "commit": "cyan",
+            "pr": "green",
+            "issue": "yellow",
+            "adr": "blue",
+            "file": "magenta"
+        }.get(result["type"], "white")
+
+        console.print(Panel(content, title=title, style=style))
@@ -34,7 +34,10 @@ DEFAULT_CONFIG = {
     },
     "database": {
         "adapter": "sqlite",  # Default database adapter
-    }
+    },
+    "semantic_analysis": {
+        "max_concept_chunks": 50,  # Chunks sent to the LLM per concept extraction (0 for no limit)
+    },
 }
 
 
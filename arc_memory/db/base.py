@@ -7,13 +7,21 @@ allowing Arc Memory to work with different database backends (SQLite, Neo4j).
 import abc
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple, Union
 
+from arc_memory.db.prefetch import PrefetchingAdapter
+from arc_memory.db.temporal import AsOfAdapter
 from arc_memory.logging_conf import get_logger
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
 from arc_memory.schema.models import BuildManifest, Edge, Node, EdgeRel, NodeType
 
 logger = get_logger(__name__)
 
+# Directions and orderings accepted by DatabaseAdapter.iter_related; orderings
+# map to the sort direction on the related node's timestamp
+RELATED_DIRECTIONS = ("outgoing", "incoming", "both")
+RELATED_ORDERINGS = {"timestamp": "ASC", "-timestamp": "DESC"}
+
 
 class DatabaseAdapter(Protocol):
     """Protocol defining the interface for database adapters.
@@ -77,23 +85,27 @@ class DatabaseAdapter(Protocol):
         """
         ...
 
-    def add_nodes_and_edges(self, nodes: List[Node], edges: List[Edge]) -> None:
+    def add_nodes_and_edges(
+        self, nodes: Union[List[Node], NodeBatch], edges: Union[List[Edge], EdgeBatch]
+    ) -> None:
         """Add nodes and edges to the database.
 
         Args:
-            nodes: The nodes to add.
-            edges: The edges to add.
+            nodes: The nodes to add, as a list or a NodeBatch.
+            edges: The edges to add, as a list or an EdgeBatch.
 
         Raises:
             GraphBuildError: If adding nodes and edges fails.
         """
         ...
 
-    def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
+    def get_node_by_id(self, node_id: str, as_of: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """Get a node by its ID.
 
         Args:
             node_id: The ID of the node.
+            as_of: Optional point in time; if given, the node is only returned
+                if it was valid at that time.
 
         Returns:
             The node as a dictionary, or None if it doesn't exist.
@@ -103,6 +115,24 @@ class DatabaseAdapter(Protocol):
         """
         ...
 
+    def get_nodes_by_ids(
+        self, node_ids: Sequence[str], as_of: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get many nodes by their IDs.
+
+        Args:
+            node_ids: The IDs of the nodes.
+            as_of: Optional point in time; if given, only nodes valid at that
+                time are returned.
+
+        Returns:
+            A dictionary mapping the ID of each node that exists to the node.
+
+        Raises:
+            GraphQueryError: If getting the nodes fails.
+        """
+        ...
+
     def get_node_count(self) -> int:
         """Get the number of nodes in the database.
 
@@ -125,12 +155,52 @@ class DatabaseAdapter(Protocol):
         """
         ...
 
-    def get_edges_by_src(self, src_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+    def get_type_counts(self) -> Dict[str, int]:
+        """Get the number of nodes of each type.
+
+        Returns:
+            A dictionary mapping node types to counts.
+
+        Raises:
+            GraphQueryError: If getting the counts fails.
+        """
+        ...
+
+    def get_relationship_counts(self) -> Dict[str, int]:
+        """Get the number of edges of each relationship type.
+
+        Returns:
+            A dictionary mapping relationship types to counts.
+
+        Raises:
+            GraphQueryError: If getting the counts fails.
+        """
+        ...
+
+    def get_degrees(self, node_ids: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """Get the in- and out-degree of nodes.
+
+        Args:
+            node_ids: The IDs of the nodes.
+
+        Returns:
+            A dictionary mapping each node ID to ``(in_degree, out_degree)``.
+
+        Raises:
+            GraphQueryError: If getting the degrees fails.
+        """
+        ...
+
+    def get_edges_by_src(
+        self, src_id: str, rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get edges by source node ID.
 
         Args:
             src_id: The ID of the source node.
             rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose other endpoint was also valid are returned.
 
         Returns:
             A list of edges as dictionaries.
@@ -140,12 +210,16 @@ class DatabaseAdapter(Protocol):
         """
         ...
 
-    def get_edges_by_dst(self, dst_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+    def get_edges_by_dst(
+        self, dst_id: str, rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get edges by destination node ID.
 
         Args:
             dst_id: The ID of the destination node.
             rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose other endpoint was also valid are returned.
 
         Returns:
             A list of edges as dictionaries.
@@ -155,6 +229,78 @@ class DatabaseAdapter(Protocol):
         """
         ...
 
+    def get_edges_by_srcs(
+        self, src_ids: Sequence[str], rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the outgoing edges of many nodes.
+
+        Args:
+            src_ids: The IDs of the source nodes.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time, as for ``get_edges_by_src``.
+
+        Returns:
+            A dictionary mapping every source ID to its edges.
+
+        Raises:
+            GraphQueryError: If getting the edges fails.
+        """
+        ...
+
+    def get_edges_by_dsts(
+        self, dst_ids: Sequence[str], rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the incoming edges of many nodes.
+
+        Args:
+            dst_ids: The IDs of the destination nodes.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time, as for ``get_edges_by_dst``.
+
+        Returns:
+            A dictionary mapping every destination ID to its edges.
+
+        Raises:
+            GraphQueryError: If getting the edges fails.
+        """
+        ...
+
+    def iter_related(
+        self,
+        entity_id: str,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_of: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Get the entities directly related to an entity with a single query.
+
+        Relationship filters, direction, ordering and the limit are applied by
+        the database, and every edge is returned together with the node at its
+        other end, so no per-edge node lookups are needed.
+
+        Args:
+            entity_id: The ID of the entity.
+            rel_types: Optional relationship types to include.
+            direction: "outgoing", "incoming" or "both".
+            order_by: Optional ordering, "timestamp" (oldest first) or
+                "-timestamp" (newest first) by the related node's timestamp.
+                By default outgoing edges come before incoming ones.
+            limit: Optional maximum number of rows.
+            as_of: Optional point in time; only edges and nodes valid at that
+                time are returned.
+
+        Returns:
+            An iterator over ``{"node", "edge", "direction"}`` dictionaries,
+            read from the database as it is consumed.
+
+        Raises:
+            ValueError: If the direction or ordering is not supported.
+            GraphQueryError: If the query fails.
+        """
+        ...
+
     def search_entities(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for entities in the database.
 
@@ -203,6 +349,41 @@ class DatabaseAdapter(Protocol):
         """
         ...
 
+    def remove_repository_nodes(
+        self, repo_id: str, delete: bool = True, batch_size: Optional[int] = None
+    ) -> int:
+        """Delete or detach the nodes of a repository in batches.
+
+        Args:
+            repo_id: The ID of the repository.
+            delete: Whether to delete the nodes and their edges. If False, the
+                nodes are kept and their repo_id is cleared.
+            batch_size: Optional number of nodes per batch.
+
+        Returns:
+            The number of nodes deleted or detached.
+
+        Raises:
+            GraphBuildError: If removing the nodes fails.
+        """
+        ...
+
+    def remove_repository(self, repo_id: str, delete_nodes: bool = False) -> int:
+        """Remove a repository, deleting or detaching its nodes first.
+
+        Args:
+            repo_id: The ID of the repository.
+            delete_nodes: Whether to delete the nodes and their edges. If
+                False, the nodes are kept and their repo_id is cleared.
+
+        Returns:
+            The number of nodes deleted or detached.
+
+        Raises:
+            GraphBuildError: If removing the repository fails.
+        """
+        ...
+
     def save_metadata(self, key: str, value: Any) -> None:
         """Save metadata to the database.
 
@@ -277,3 +458,101 @@ class DatabaseAdapter(Protocol):
             DatabaseError: If getting the timestamps fails.
         """
         ...
+
+
+def check_related_query(direction: str, order_by: Optional[str]) -> Optional[str]:
+    """Validate the direction and ordering of an iter_related query.
+
+    Args:
+        direction: The requested direction.
+        order_by: The requested ordering, or None.
+
+    Returns:
+        The sort direction ("ASC" or "DESC"), or None if no ordering was requested.
+
+    Raises:
+        ValueError: If the direction or ordering is not supported.
+    """
+    if direction not in RELATED_DIRECTIONS:
+        raise ValueError(f"Invalid direction: {direction}")
+    if order_by is None:
+        return None
+    if order_by not in RELATED_ORDERINGS:
+        raise ValueError(
+            f"Invalid ordering: {order_by}. Expected one of: {', '.join(RELATED_ORDERINGS)}"
+        )
+    return RELATED_ORDERINGS[order_by]
+
+
+def supports_related_query(adapter: Any) -> bool:
+    """Check whether an adapter can fetch related entities with a single query.
+
+    A point-in-time view supports it if the adapter it wraps does.
+
+    Args:
+        adapter: The database adapter to check.
+
+    Returns:
+        True if the adapter class defines ``iter_related``, False otherwise.
+    """
+    if isinstance(adapter, PrefetchingAdapter):
+        return supports_related_query(adapter.adapter)
+    if isinstance(adapter, AsOfAdapter):
+        adapter = adapter.adapter
+    return callable(getattr(type(adapter), "iter_related", None))
+
+
+def supports_graph_stats(adapter: Any) -> bool:
+    """Check whether an adapter can answer count and degree queries without scans.
+
+    Point-in-time views never do: the maintained statistics describe the
+    current graph, so views count with lookups that respect validity.
+
+    Args:
+        adapter: The database adapter to check.
+
+    Returns:
+        True if the adapter class defines ``get_degrees``, False otherwise.
+    """
+    if isinstance(adapter, PrefetchingAdapter):
+        return supports_graph_stats(adapter.adapter)
+    if isinstance(adapter, AsOfAdapter):
+        return False
+    return callable(getattr(type(adapter), "get_degrees", None))
+
+
+def supports_traversal(adapter: Any) -> bool:
+    """Check whether an adapter can run multi-hop traversals on the server.
+
+    Adapters that define a ``traverse`` method (such as the Neo4j adapter) let
+    callers replace per-node edge lookups with a single traversal query.
+
+    Args:
+        adapter: The database adapter to check.
+
+    Returns:
+        True if the adapter class defines ``traverse``, False otherwise.
+    """
+    if isinstance(adapter, PrefetchingAdapter):
+        return supports_traversal(adapter.adapter)
+    return callable(getattr(type(adapter), "traverse", None))
+
+
+def supports_batch_lookup(adapter: Any) -> bool:
+    """Check whether an adapter can look up many nodes or edge lists in one query.
+
+    A point-in-time view supports it if the adapter it wraps does.
+
+    Args:
+        adapter: The database adapter to check.
+
+    Returns:
+        True if the adapter class defines ``get_nodes_by_ids``,
+        ``get_edges_by_srcs`` and ``get_edges_by_dsts``, False otherwise.
+    """
+    if isinstance(adapter, (AsOfAdapter, PrefetchingAdapter)):
+        return supports_batch_lookup(adapter.adapter)
+    return all(
+        callable(getattr(type(adapter), name, None))
+        for name in ("get_nodes_by_ids", "get_edges_by_srcs", "get_edges_by_dsts")
+    )
@@ -1,13 +1,15 @@
 """Metadata utilities for Arc Memory.
 
 This module provides utility functions for working with metadata and refresh timestamps
-in the Arc Memory database.
+in the Arc Memory database. The functions share one connection per database through
+the process-wide adapter registry instead of connecting on every call.
 """
 
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from arc_memory.db import get_adapter
+from arc_memory.db.registry import SharedAdapter, shared_adapter
 from arc_memory.errors import DatabaseError
 from arc_memory.logging_conf import get_logger
 
@@ -28,6 +30,18 @@ def ensure_adapter_connected(adapter):
         adapter.init_db()
 
 
+def _shared_adapter(adapter_type: Optional[str]) -> SharedAdapter:
+    """Get a handle to the process-wide adapter of the default database.
+
+    Args:
+        adapter_type: The type of database adapter to use. If None, uses the configured adapter.
+
+    Returns:
+        A handle to use as a context manager.
+    """
+    return shared_adapter(adapter_type, factory=get_adapter)
+
+
 def save_refresh_timestamp(source: str, timestamp: datetime, adapter_type: Optional[str] = None) -> None:
     """Save the last refresh timestamp for a source.
 
@@ -39,25 +53,21 @@ def save_refresh_timestamp(source: str, timestamp: datetime, adapter_type: Optio
     Raises:
         DatabaseError: If saving the timestamp fails.
     """
-    adapter = get_adapter(adapter_type)
-
-    # Ensure the adapter is connected
-    ensure_adapter_connected(adapter)
-
-    try:
-        adapter.save_refresh_timestamp(source, timestamp)
-        logger.info(f"Saved refresh timestamp for {source}: {timestamp.isoformat()}")
-    except Exception as e:
-        error_msg = f"Failed to save refresh timestamp for {source}: {e}"
-        logger.error(error_msg)
-        raise DatabaseError(
-            error_msg,
-            details={
-                "source": source,
-                "timestamp": timestamp.isoformat(),
-                "error": str(e),
-            }
-        )
+    with _shared_adapter(adapter_type) as adapter:
+        try:
+            adapter.save_refresh_timestamp(source, timestamp)
+            logger.info(f"Saved refresh timestamp for {source}: {timestamp.isoformat()}")
+        except Exception as e:
+            error_msg = f"Failed to save refresh timestamp for {source}: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "source": source,
+                    "timestamp": timestamp.isoformat(),
+                    "error": str(e),
+                }
+            )
 
 
 def get_refresh_timestamp(source: str, adapter_type: Optional[str] = None) -> Optional[datetime]:
@@ -73,28 +83,24 @@ def get_refresh_timestamp(source: str, adapter_type: Optional[str] = None) -> Op
     Raises:
         DatabaseError: If getting the timestamp fails.
     """
-    adapter = get_adapter(adapter_type)
-
-    # Ensure the adapter is connected
-    ensure_adapter_connected(adapter)
-
-    try:
-        timestamp = adapter.get_refresh_timestamp(source)
-        if timestamp:
-            logger.debug(f"Retrieved refresh timestamp for {source}: {timestamp.isoformat()}")
-        else:
-            logger.debug(f"No refresh timestamp found for {source}")
-        return timestamp
-    except Exception as e:
-        error_msg = f"Failed to get refresh timestamp for {source}: {e}"
-        logger.error(error_msg)
-        raise DatabaseError(
-            error_msg,
-            details={
-                "source": source,
-                "error": str(e),
-            }
-        )
+    with _shared_adapter(adapter_type) as adapter:
+        try:
+            timestamp = adapter.get_refresh_timestamp(source)
+            if timestamp:
+                logger.debug(f"Retrieved refresh timestamp for {source}: {timestamp.isoformat()}")
+            else:
+                logger.debug(f"No refresh timestamp found for {source}")
+            return timestamp
+        except Exception as e:
+            error_msg = f"Failed to get refresh timestamp for {source}: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "source": source,
+                    "error": str(e),
+                }
+            )
 
 
 def get_all_refresh_timestamps(adapter_type: Optional[str] = None) -> Dict[str, datetime]:
@@ -109,23 +115,19 @@ def get_all_refresh_timestamps(adapter_type: Optional[str] = None) -> Dict[str,
     Raises:
         DatabaseError: If getting the timestamps fails.
     """
-    adapter = get_adapter(adapter_type)
-
-    # Ensure the adapter is connected
-    ensure_adapter_connected(adapter)
-
-    try:
-        # Use the adapter's get_all_refresh_timestamps method
-        return adapter.get_all_refresh_timestamps()
-    except Exception as e:
-        error_msg = f"Failed to get all refresh timestamps: {e}"
-        logger.error(error_msg)
-        raise DatabaseError(
-            error_msg,
-            details={
-                "error": str(e),
-            }
-        )
+    with _shared_adapter(adapter_type) as adapter:
+        try:
+            # Use the adapter's get_all_refresh_timestamps method
+            return adapter.get_all_refresh_timestamps()
+        except Exception as e:
+            error_msg = f"Failed to get all refresh timestamps: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "error": str(e),
+                }
+            )
 
 
 def save_metadata(key: str, value: Any, adapter_type: Optional[str] = None) -> None:
@@ -139,21 +141,20 @@ def save_metadata(key: str, value: Any, adapter_type: Optional[str] = None) -> N
     Raises:
         DatabaseError: If saving the metadata fails.
     """
-    adapter = get_adapter(adapter_type)
-
-    try:
-        adapter.save_metadata(key, value)
-        logger.info(f"Saved metadata for {key}")
-    except Exception as e:
-        error_msg = f"Failed to save metadata for {key}: {e}"
-        logger.error(error_msg)
-        raise DatabaseError(
-            error_msg,
-            details={
-                "key": key,
-                "error": str(e),
-            }
-        )
+    with _shared_adapter(adapter_type) as adapter:
+        try:
+            adapter.save_metadata(key, value)
+            logger.info(f"Saved metadata for {key}")
+        except Exception as e:
+            error_msg = f"Failed to save metadata for {key}: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "key": key,
+                    "error": str(e),
+                }
+            )
 
 
 def get_metadata(key: str, default: Any = None, adapter_type: Optional[str] = None) -> Any:
@@ -170,22 +171,21 @@ def get_metadata(key: str, default: Any = None, adapter_type: Optional[str] = No
     Raises:
         DatabaseError: If getting the metadata fails.
     """
-    adapter = get_adapter(adapter_type)
-
-    try:
-        value = adapter.get_metadata(key, default)
-        logger.debug(f"Retrieved metadata for {key}")
-        return value
-    except Exception as e:
-        error_msg = f"Failed to get metadata for {key}: {e}"
-        logger.error(error_msg)
-        raise DatabaseError(
-            error_msg,
-            details={
-                "key": key,
-                "error": str(e),
-            }
-        )
+    with _shared_adapter(adapter_type) as adapter:
+        try:
+            value = adapter.get_metadata(key, default)
+            logger.debug(f"Retrieved metadata for {key}")
+            return value
+        except Exception as e:
+            error_msg = f"Failed to get metadata for {key}: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "key": key,
+                    "error": str(e),
+                }
+            )
 
 
 def get_all_metadata(adapter_type: Optional[str] = None) -> Dict[str, Any]:
@@ -200,18 +200,17 @@ def get_all_metadata(adapter_type: Optional[str] = None) -> Dict[str, Any]:
     Raises:
         DatabaseError: If getting the metadata fails.
     """
-    adapter = get_adapter(adapter_type)
-
-    try:
-        metadata = adapter.get_all_metadata()
-        logger.debug(f"Retrieved all metadata ({len(metadata)} keys)")
-        return metadata
-    except Exception as e:
-        error_msg = f"Failed to get all metadata: {e}"
-        logger.error(error_msg)
-        raise DatabaseError(
-            error_msg,
-            details={
-                "error": str(e),
-            }
-        )
+    with _shared_adapter(adapter_type) as adapter:
+        try:
+            metadata = adapter.get_all_metadata()
+            logger.debug(f"Retrieved all metadata ({len(metadata)} keys)")
+            return metadata
+        except Exception as e:
+            error_msg = f"Failed to get all metadata: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "error": str(e),
+                }
+            )
@@ -3,26 +3,75 @@
 This module provides a Neo4j implementation of the DatabaseAdapter protocol.
 It is designed to be compatible with Neo4j's GraphRAG capabilities.
 
-Note: This is a stub implementation that will be completed in a future release.
+Writes are sent as batched ``UNWIND $rows MERGE ...`` statements in tunable
+chunks, so a build of tens of thousands of nodes needs a few dozen round trips
+instead of one per node. Multi-hop reads (related entities, impact analysis) run
+as server-side variable-length traversals via ``traverse``.
 """
 
 import json
+import re
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from arc_memory.db.base import check_related_query
+from arc_memory.db.sqlite_adapter import DateTimeEncoder
 from arc_memory.errors import DatabaseError, DatabaseInitializationError, GraphBuildError, GraphQueryError
 from arc_memory.logging_conf import get_logger
-from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
+from arc_memory.schema.models import Edge, EdgeRel, Node
+from arc_memory.sql.temporal import as_of_key, utc_iso
 
 logger = get_logger(__name__)
 
+# Default number of rows sent per UNWIND statement
+DEFAULT_BATCH_SIZE = 1000
+
+# Driver options that may be passed through connection_params
+_DRIVER_OPTIONS = (
+    "max_connection_pool_size",
+    "connection_acquisition_timeout",
+    "max_connection_lifetime",
+)
+
+# Relationship types are interpolated into Cypher, so only allow safe identifiers
+_REL_TYPE_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+_MERGE_NODES_QUERY = """
+UNWIND $rows AS row
+MERGE (n:Node {id: row.id})
+SET n += row.props
+"""
+
+_MERGE_EDGES_QUERY = """
+UNWIND $rows AS row
+MERGE (s:Node {id: row.src})
+MERGE (d:Node {id: row.dst})
+MERGE (s)-[r:%s]->(d)
+SET r.properties = row.properties, r.valid_from = row.valid_from, r.valid_until = row.valid_until
+"""
+
+_EDGE_RETURN = """
+RETURN s.id AS src, d.id AS dst, type(r) AS rel, r.properties AS properties,
+       r.valid_from AS valid_from, r.valid_until AS valid_until
+"""
+
+# As-of predicates, with the same semantics as arc_memory.db.temporal
+_NODE_VALID_CYPHER = (
+    "coalesce({n}.valid_from, {n}.timestamp, '') <= $as_of "
+    "AND coalesce({n}.valid_until, '9999') > $as_of"
+)
+_EDGE_VALID_CYPHER = (
+    "coalesce(r.valid_from, '') <= $as_of AND coalesce(r.valid_until, '9999') > $as_of"
+)
+
 
 class Neo4jAdapter:
     """Neo4j implementation of the DatabaseAdapter protocol.
 
-    This adapter is designed to be compatible with Neo4j's GraphRAG capabilities.
-    It is a stub implementation that will be completed in a future release.
+    Nodes are stored with the ``Node`` label and keyed by ``id``; edges are stored
+    as relationships whose type is the ``EdgeRel`` value, which lets traversals
+    filter by relationship type on the server.
     """
 
     def __init__(self):
@@ -30,6 +79,9 @@ class Neo4jAdapter:
         self.driver = None
         self.uri = None
         self.database = None
+        self.batch_size = DEFAULT_BATCH_SIZE
+        self._session_handle = None
+        self._transaction = None
 
     def get_name(self) -> str:
         """Get the name of the database adapter.
@@ -55,6 +107,9 @@ class Neo4jAdapter:
                 - uri: Neo4j URI (e.g., 'neo4j://localhost:7687')
                 - auth: Tuple of (username, password)
                 - database: Database name (default: 'neo4j')
+                - batch_size: Rows per UNWIND write statement (default: 1000)
+                - max_connection_pool_size, connection_acquisition_timeout,
+                  max_connection_lifetime: Optional driver pool settings
 
         Raises:
             DatabaseError: If connecting to the database fails.
@@ -89,10 +144,26 @@ class Neo4jAdapter:
                 details={"hint": "Provide an 'auth' parameter as (username, password)"}
             )
 
+        batch_size = int(connection_params.get("batch_size", DEFAULT_BATCH_SIZE))
+        if batch_size < 1:
+            raise DatabaseError(
+                f"Invalid Neo4j batch size: {batch_size}",
+                details={"hint": "Provide a positive 'batch_size' parameter"}
+            )
+
+        driver_options = {
+            name: connection_params[name]
+            for name in _DRIVER_OPTIONS
+            if connection_params.get(name) is not None
+        }
+
         try:
-            self.driver = GraphDatabase.driver(uri, auth=auth)
+            # The driver keeps a pool of connections that sessions borrow from,
+            # so sessions are opened per operation and closed straight away
+            self.driver = GraphDatabase.driver(uri, auth=auth, **driver_options)
             self.uri = uri
             self.database = database
+            self.batch_size = batch_size
 
             # Test the connection
             with self.driver.session(database=self.database) as session:
@@ -119,6 +190,7 @@ class Neo4jAdapter:
         """
         if self.driver is not None:
             try:
+                self._close_transaction()
                 self.driver.close()
                 self.driver = None
                 logger.info(f"Disconnected from Neo4j database: {self.uri}/{self.database}")
@@ -155,7 +227,7 @@ class Neo4jAdapter:
             raise DatabaseError("Not connected to database")
 
         try:
-            with self.driver.session(database=self.database) as session:
+            with self._session() as session:
                 # Create constraints for nodes
                 session.run("""
                     CREATE CONSTRAINT node_id IF NOT EXISTS
@@ -173,6 +245,17 @@ class Neo4jAdapter:
                     FOR (n:Node) ON (n.timestamp)
                 """)
 
+                session.run("""
+                    CREATE INDEX node_repo_id IF NOT EXISTS
+                    FOR (n:Node) ON (n.repo_id)
+                """)
+
+                # Full-text index used by search_entities
+                session.run("""
+                    CREATE FULLTEXT INDEX node_text IF NOT EXISTS
+                    FOR (n:Node) ON EACH [n.title, n.body]
+                """)
+
                 # Create constraints for metadata
                 session.run("""
                     CREATE CONSTRAINT metadata_key IF NOT EXISTS
@@ -198,12 +281,18 @@ class Neo4jAdapter:
                 }
             )
 
-    def add_nodes_and_edges(self, nodes: List[Node], edges: List[Edge]) -> None:
+    def add_nodes_and_edges(
+        self, nodes: Union[List[Node], NodeBatch], edges: Union[List[Edge], EdgeBatch]
+    ) -> None:
         """Add nodes and edges to the database.
 
+        Nodes are merged first so that edges attach to fully populated nodes.
+        Edges are grouped by relationship type, since Cypher cannot parameterize
+        relationship types, and every group is written in ``batch_size`` chunks.
+
         Args:
-            nodes: The nodes to add.
-            edges: The edges to add.
+            nodes: The nodes to add, as a list or a NodeBatch.
+            edges: The edges to add, as a list or an EdgeBatch.
 
         Raises:
             GraphBuildError: If adding nodes and edges fails.
@@ -211,40 +300,44 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter add_nodes_and_edges is a stub implementation (nodes={len(nodes)}, edges={len(edges)})")
-
-        # In a real implementation, we would use Neo4j's GraphRAG patterns for adding nodes and edges
-        # For example, using the neo4j-graphrag library:
-        # https://pypi.org/project/neo4j-graphrag/
-
-        # Example implementation (commented out):
-        # try:
-        #     with self.driver.session(database=self.database) as session:
-        #         # Add nodes in batches
-        #         for node_batch in self._batch_items(nodes, 100):
-        #             self._add_nodes_batch(session, node_batch)
-        #
-        #         # Add edges in batches
-        #         for edge_batch in self._batch_items(edges, 100):
-        #             self._add_edges_batch(session, edge_batch)
-        # except Exception as e:
-        #     error_msg = f"Failed to add nodes and edges to Neo4j database: {e}"
-        #     logger.error(error_msg)
-        #     raise GraphBuildError(
-        #         error_msg,
-        #         details={
-        #             "uri": self.uri,
-        #             "database": self.database,
-        #             "error": str(e),
-        #         }
-        #     )
-
-    def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            node_rows = [self._node_to_row(node) for node in nodes]
+
+            edge_rows: Dict[str, List[Dict[str, Any]]] = {}
+            for edge in edges:
+                rel = self._validate_rel_type(self._rel_value(edge.rel))
+                edge_rows.setdefault(rel, []).append({
+                    "src": edge.src,
+                    "dst": edge.dst,
+                    "properties": json.dumps(edge.properties, cls=DateTimeEncoder),
+                    "valid_from": utc_iso(edge.valid_from),
+                    "valid_until": utc_iso(edge.valid_until),
+                })
+
+            self._write_rows(_MERGE_NODES_QUERY, node_rows)
+            for rel, rows in edge_rows.items():
+                self._write_rows(_MERGE_EDGES_QUERY % rel, rows)
+
+            logger.info(f"Added {len(nodes)} nodes and {len(edges)} edges to database")
+        except Exception as e:
+            error_msg = f"Failed to add nodes and edges: {e}"
+            logger.error(error_msg)
+            raise GraphBuildError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "database": self.database,
+                    "error": str(e),
+                }
+            )
+
+    def get_node_by_id(self, node_id: str, as_of: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """Get a node by its ID.
 
         Args:
             node_id: The ID of the node.
+            as_of: Optional point in time; if given, the node is only returned
+                if it was valid at that time.
 
         Returns:
             The node as a dictionary, or None if it doesn't exist.
@@ -255,9 +348,73 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter get_node_by_id is a stub implementation (node_id={node_id})")
-        return None
+        try:
+            if as_of is None:
+                records = self._read(
+                    "MATCH (n:Node {id: $id}) RETURN properties(n) AS node",
+                    id=node_id,
+                )
+            else:
+                records = self._read(
+                    "MATCH (n:Node {id: $id}) WHERE "
+                    + _NODE_VALID_CYPHER.format(n="n")
+                    + " RETURN properties(n) AS node",
+                    id=node_id,
+                    as_of=as_of_key(as_of),
+                )
+            if not records:
+                return None
+            return self._node_from_properties(records[0]["node"])
+        except Exception as e:
+            error_msg = f"Failed to get node by ID: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                f"Failed to get node by ID '{node_id}': {e}",
+                details={
+                    "node_id": node_id,
+                    "error": str(e),
+                }
+            )
+
+    def get_nodes_by_ids(
+        self, node_ids: Sequence[str], as_of: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get many nodes by their IDs with a single query.
+
+        Args:
+            node_ids: The IDs of the nodes.
+            as_of: Optional point in time; if given, only nodes valid at that
+                time are returned.
+
+        Returns:
+            A dictionary mapping the ID of each node that exists to the node.
+
+        Raises:
+            GraphQueryError: If getting the nodes fails.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        ids = list(dict.fromkeys(node_ids))
+        try:
+            query = "MATCH (n:Node) WHERE n.id IN $ids"
+            params: Dict[str, Any] = {"ids": ids}
+            if as_of is not None:
+                query += " AND " + _NODE_VALID_CYPHER.format(n="n")
+                params["as_of"] = as_of_key(as_of)
+            records = self._read(query + " RETURN properties(n) AS node", **params)
+            nodes = (self._node_from_properties(record["node"]) for record in records)
+            return {node["id"]: node for node in nodes if node}
+        except Exception as e:
+            error_msg = f"Failed to get nodes by ID: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "node_count": len(ids),
+                    "error": str(e),
+                }
+            )
 
     def get_node_count(self) -> int:
         """Get the number of nodes in the database.
@@ -271,9 +428,19 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning("Neo4j adapter get_node_count is a stub implementation")
-        return 0
+        try:
+            records = self._read("MATCH (n:Node) RETURN count(n) AS count")
+            return records[0]["count"] if records else 0
+        except Exception as e:
+            error_msg = f"Failed to get node count: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
 
     def get_edge_count(self) -> int:
         """Get the number of edges in the database.
@@ -287,16 +454,118 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning("Neo4j adapter get_edge_count is a stub implementation")
-        return 0
+        try:
+            records = self._read("MATCH (:Node)-[r]->(:Node) RETURN count(r) AS count")
+            return records[0]["count"] if records else 0
+        except Exception as e:
+            error_msg = f"Failed to get edge count: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
+
+    def get_type_counts(self) -> Dict[str, int]:
+        """Get the number of nodes of each type.
 
-    def get_edges_by_src(self, src_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+        Returns:
+            A dictionary mapping node types to counts.
+
+        Raises:
+            GraphQueryError: If getting the counts fails.
+        """
+        return self._read_stats(
+            "MATCH (n:Node) RETURN n.type AS key, count(n) AS count", "node type counts"
+        )
+
+    def get_relationship_counts(self) -> Dict[str, int]:
+        """Get the number of edges of each relationship type.
+
+        Returns:
+            A dictionary mapping relationship types to counts.
+
+        Raises:
+            GraphQueryError: If getting the counts fails.
+        """
+        return self._read_stats(
+            "MATCH (:Node)-[r]->(:Node) RETURN type(r) AS key, count(r) AS count",
+            "relationship counts",
+        )
+
+    def get_degrees(self, node_ids: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """Get the in- and out-degree of nodes.
+
+        Neo4j stores relationship counts with each node, so the degrees are
+        read without expanding any relationships.
+
+        Args:
+            node_ids: The IDs of the nodes.
+
+        Returns:
+            A dictionary mapping each node ID to ``(in_degree, out_degree)``;
+            nodes without edges map to ``(0, 0)``.
+
+        Raises:
+            GraphQueryError: If getting the degrees fails.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        degrees = {node_id: (0, 0) for node_id in node_ids}
+        try:
+            records = self._read(
+                """
+                UNWIND $ids AS id
+                MATCH (n:Node {id: id})
+                RETURN n.id AS id, COUNT { (n)<--() } AS in_degree, COUNT { (n)-->() } AS out_degree
+                """,
+                ids=list(degrees),
+            )
+        except Exception as e:
+            error_msg = f"Failed to get node degrees: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
+        for record in records:
+            degrees[record["id"]] = (record["in_degree"], record["out_degree"])
+        return degrees
+
+    def _read_stats(self, query: str, what: str) -> Dict[str, int]:
+        """Run a key and count aggregation into a dictionary."""
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        try:
+            return {record["key"]: record["count"] for record in self._read(query)}
+        except Exception as e:
+            error_msg = f"Failed to get {what}: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
+
+    def get_edges_by_src(
+        self, src_id: str, rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get edges by source node ID.
 
         Args:
             src_id: The ID of the source node.
             rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose destination node was also valid are returned.
 
         Returns:
             A list of edges as dictionaries.
@@ -307,16 +576,30 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter get_edges_by_src is a stub implementation (src_id={src_id}, rel_type={rel_type})")
-        return []
+        try:
+            return self._get_edges("s", src_id, rel_type, as_of)
+        except Exception as e:
+            error_msg = f"Failed to get edges by source: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                f"Failed to get edges by source node '{src_id}': {e}",
+                details={
+                    "src_id": src_id,
+                    "rel_type": self._rel_value(rel_type) if rel_type else None,
+                    "error": str(e),
+                }
+            )
 
-    def get_edges_by_dst(self, dst_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+    def get_edges_by_dst(
+        self, dst_id: str, rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get edges by destination node ID.
 
         Args:
             dst_id: The ID of the destination node.
             rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose source node was also valid are returned.
 
         Returns:
             A list of edges as dictionaries.
@@ -327,9 +610,281 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter get_edges_by_dst is a stub implementation (dst_id={dst_id}, rel_type={rel_type})")
-        return []
+        try:
+            return self._get_edges("d", dst_id, rel_type, as_of)
+        except Exception as e:
+            error_msg = f"Failed to get edges by destination: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                f"Failed to get edges by destination node '{dst_id}': {e}",
+                details={
+                    "dst_id": dst_id,
+                    "rel_type": self._rel_value(rel_type) if rel_type else None,
+                    "error": str(e),
+                }
+            )
+
+    def get_edges_by_srcs(
+        self, src_ids: Sequence[str], rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the outgoing edges of many nodes with a single query.
+
+        Args:
+            src_ids: The IDs of the source nodes.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose destination node was also valid are returned.
+
+        Returns:
+            A dictionary mapping every source ID to its edges.
+
+        Raises:
+            GraphQueryError: If getting the edges fails.
+        """
+        return self._get_edges_by_many("s", src_ids, rel_type, as_of)
+
+    def get_edges_by_dsts(
+        self, dst_ids: Sequence[str], rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the incoming edges of many nodes with a single query.
+
+        Args:
+            dst_ids: The IDs of the destination nodes.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose source node was also valid are returned.
+
+        Returns:
+            A dictionary mapping every destination ID to its edges.
+
+        Raises:
+            GraphQueryError: If getting the edges fails.
+        """
+        return self._get_edges_by_many("d", dst_ids, rel_type, as_of)
+
+    def _get_edges_by_many(
+        self, anchor: str, node_ids: Sequence[str], rel_type: Optional[EdgeRel], as_of: Optional[datetime]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the edges attached to many nodes, grouped by anchoring node."""
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        edges: Dict[str, List[Dict[str, Any]]] = {node_id: [] for node_id in node_ids}
+        key = "src" if anchor == "s" else "dst"
+        try:
+            for edge in self._get_edges(anchor, list(edges), rel_type, as_of):
+                edges[edge[key]].append(edge)
+        except Exception as e:
+            error_msg = f"Failed to get edges by {'source' if anchor == 's' else 'destination'}: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "node_count": len(edges),
+                    "rel_type": self._rel_value(rel_type) if rel_type else None,
+                    "error": str(e),
+                }
+            )
+        return edges
+
+    def traverse(
+        self,
+        start_ids: Union[str, Sequence[str]],
+        max_depth: int = 1,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        exclude_ids: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        distinct_nodes: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Traverse the graph from one or more start nodes on the server.
+
+        The whole traversal runs as a single variable-length Cypher match, so
+        a multi-hop neighbourhood costs one round trip instead of one query per
+        visited node.
+
+        Args:
+            start_ids: The ID, or IDs, of the nodes to start from.
+            max_depth: Maximum number of hops to follow.
+            rel_types: Optional relationship types to follow. All types are
+                followed if not provided.
+            direction: "outgoing", "incoming", or "both".
+            exclude_ids: Optional node IDs to leave out of the results. Start
+                nodes are always excluded.
+            limit: Optional maximum number of results to return.
+            distinct_nodes: If True, return each reachable node once, via its
+                shortest path. If False, return one result per path.
+
+        Returns:
+            A list of dictionaries ordered by depth, each with the reached
+            ``node``, the ``source`` node of the last hop, the last ``edge``,
+            the ``path`` of node IDs and the ``depth``.
+
+        Raises:
+            GraphQueryError: If the traversal fails.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        if isinstance(start_ids, str):
+            start_ids = [start_ids]
+
+        try:
+            if direction not in ("outgoing", "incoming", "both"):
+                raise ValueError(f"Invalid direction: {direction}")
+            max_depth = int(max_depth)
+            if max_depth < 1 or not start_ids:
+                return []
+
+            rel_filter = ""
+            if rel_types:
+                rel_filter = ":" + "|".join(
+                    self._validate_rel_type(rel.upper()) for rel in rel_types
+                )
+            pattern = f"-[{rel_filter}*1..{max_depth}]-"
+            if direction == "outgoing":
+                pattern += ">"
+            elif direction == "incoming":
+                pattern = "<" + pattern
+
+            query = f"""
+                MATCH (s:Node) WHERE s.id IN $start_ids
+                MATCH p = (s){pattern}(n:Node)
+                WHERE NOT n.id IN $exclude_ids
+            """
+            if distinct_nodes:
+                query += """
+                WITH n, p ORDER BY length(p)
+                WITH n, collect(p)[0] AS p
+                """
+            query += """
+                WITH n, p, last(relationships(p)) AS r
+                RETURN properties(n) AS node,
+                       properties(nodes(p)[-2]) AS source,
+                       startNode(r).id AS src, endNode(r).id AS dst,
+                       type(r) AS rel, r.properties AS properties,
+                       [x IN nodes(p) | x.id] AS path, length(p) AS depth
+                ORDER BY depth
+            """
+            params: Dict[str, Any] = {
+                "start_ids": list(start_ids),
+                "exclude_ids": list(start_ids) + list(exclude_ids or []),
+            }
+            if limit is not None:
+                query += " LIMIT $limit"
+                params["limit"] = int(limit)
+
+            results = []
+            for record in self._read(query, **params):
+                results.append({
+                    "node": self._node_from_properties(record["node"]),
+                    "source": self._node_from_properties(record["source"]),
+                    "edge": self._edge_from_record(record),
+                    "path": list(record["path"]),
+                    "depth": record["depth"],
+                })
+            return results
+        except Exception as e:
+            error_msg = f"Failed to traverse graph: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "start_ids": list(start_ids),
+                    "max_depth": max_depth,
+                    "direction": direction,
+                    "error": str(e),
+                }
+            )
+
+    def iter_related(
+        self,
+        entity_id: str,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_of: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Get the entities directly related to an entity with a single query.
+
+        Args:
+            entity_id: The ID of the entity.
+            rel_types: Optional relationship types to include.
+            direction: "outgoing", "incoming" or "both".
+            order_by: Optional ordering, "timestamp" or "-timestamp".
+            limit: Optional maximum number of rows.
+            as_of: Optional point in time to filter by validity.
+
+        Returns:
+            An iterator over ``{"node", "edge", "direction"}`` dictionaries.
+
+        Raises:
+            ValueError: If the direction or ordering is not supported.
+            GraphQueryError: If the query fails.
+        """
+        sort = check_related_query(direction, order_by)
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        params: Dict[str, Any] = {"id": entity_id}
+        conditions = []
+        if rel_types:
+            conditions.append("type(r) IN $rels")
+            params["rels"] = [
+                self._validate_rel_type(self._rel_value(rel).upper()) for rel in rel_types
+            ]
+        if as_of is not None:
+            conditions.append(_EDGE_VALID_CYPHER)
+            conditions.append(_NODE_VALID_CYPHER.format(n="n"))
+            params["as_of"] = as_of_key(as_of)
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+
+        branches = []
+        if direction in ("outgoing", "both"):
+            branches.append(
+                f"MATCH (a:Node {{id: $id}})-[r]->(n:Node){where} "
+                "RETURN 'outgoing' AS direction, a.id AS src, n.id AS dst, r, n"
+            )
+        if direction in ("incoming", "both"):
+            branches.append(
+                f"MATCH (n:Node)-[r]->(a:Node {{id: $id}}){where} "
+                "RETURN 'incoming' AS direction, n.id AS src, a.id AS dst, r, n"
+            )
+
+        query = "CALL { " + " UNION ALL ".join(branches) + " } "
+        query += """
+            RETURN direction, src, dst, type(r) AS rel, r.properties AS properties,
+                   r.valid_from AS valid_from, r.valid_until AS valid_until,
+                   properties(n) AS node
+        """
+        if sort:
+            query += f" ORDER BY node.timestamp {sort}"
+        if limit is not None:
+            query += " LIMIT $limit"
+            params["limit"] = int(limit)
+
+        try:
+            records = self._read(query, **params)
+        except Exception as e:
+            error_msg = f"Failed to get related entities: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                f"Failed to get entities related to '{entity_id}': {e}",
+                details={
+                    "entity_id": entity_id,
+                    "direction": direction,
+                    "error": str(e),
+                }
+            )
+        return (
+            {
+                "node": self._node_from_properties(record["node"]),
+                "edge": self._edge_from_record(record),
+                "direction": record["direction"],
+            }
+            for record in records
+        )
 
     def search_entities(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for entities in the database.
@@ -347,13 +902,70 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter search_entities is a stub implementation (query={query}, limit={limit})")
-        return []
+        try:
+            try:
+                # Try the full-text index first
+                records = self._read(
+                    """
+                    CALL db.index.fulltext.queryNodes('node_text', $query)
+                    YIELD node, score
+                    RETURN node.id AS id, node.type AS type, node.title AS title,
+                           node.body AS body, score
+                    LIMIT $limit
+                    """,
+                    query=query,
+                    limit=limit,
+                )
+            except Exception as e:
+                # Fall back to a substring scan if the index is unavailable
+                logger.warning(f"Full-text search failed, falling back to basic search: {e}")
+                records = self._read(
+                    """
+                    MATCH (n:Node)
+                    WHERE toLower(n.title) CONTAINS toLower($query)
+                       OR toLower(n.body) CONTAINS toLower($query)
+                    RETURN n.id AS id, n.type AS type, n.title AS title,
+                           n.body AS body, 1.0 AS score
+                    LIMIT $limit
+                    """,
+                    query=query,
+                    limit=limit,
+                )
+
+            results = []
+            for record in records:
+                snippet = record["body"] or ""
+                if len(snippet) > 100:
+                    snippet = snippet[:100] + "..."
+
+                results.append(
+                    {
+                        "id": record["id"],
+                        "type": record["type"],
+                        "title": record["title"] or "",
+                        "snippet": snippet,
+                        "score": record["score"],
+                    }
+                )
+            return results
+        except Exception as e:
+            error_msg = f"Failed to search entities: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "query": query,
+                    "limit": limit,
+                    "error": str(e),
+                }
+            )
 
     def begin_transaction(self) -> Any:
         """Begin a transaction.
 
+        Writes and reads made through this adapter are routed through the open
+        transaction until it is committed or rolled back.
+
         Returns:
             A transaction object.
 
@@ -363,9 +975,24 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning("Neo4j adapter begin_transaction is a stub implementation")
-        return None
+        if self._transaction is not None:
+            raise DatabaseError("A transaction is already in progress")
+
+        try:
+            self._session_handle = self._session()
+            self._transaction = self._session_handle.begin_transaction()
+            return self._transaction
+        except Exception as e:
+            self._close_transaction()
+            error_msg = f"Failed to begin transaction: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
 
     def commit_transaction(self, transaction: Any) -> None:
         """Commit a transaction.
@@ -379,8 +1006,24 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter commit_transaction is a stub implementation (transaction={transaction})")
+        transaction = transaction or self._transaction
+        if transaction is None:
+            return
+
+        try:
+            transaction.commit()
+        except Exception as e:
+            error_msg = f"Failed to commit transaction: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
+        finally:
+            self._close_transaction()
 
     def rollback_transaction(self, transaction: Any) -> None:
         """Rollback a transaction.
@@ -394,8 +1037,96 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter rollback_transaction is a stub implementation (transaction={transaction})")
+        transaction = transaction or self._transaction
+        if transaction is None:
+            return
+
+        try:
+            transaction.rollback()
+        except Exception as e:
+            error_msg = f"Failed to rollback transaction: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "error": str(e),
+                }
+            )
+        finally:
+            self._close_transaction()
+
+    def remove_repository_nodes(
+        self, repo_id: str, delete: bool = True, batch_size: Optional[int] = None
+    ) -> int:
+        """Delete or detach the nodes of a repository in batches.
+
+        Each batch is its own write transaction, so removing a large
+        repository never holds locks on the whole partition at once.
+
+        Args:
+            repo_id: The ID of the repository.
+            delete: Whether to delete the nodes and their relationships. If
+                False, the nodes are kept and their repo_id is removed.
+            batch_size: Number of nodes per batch; defaults to the adapter's
+                batch size.
+
+        Returns:
+            The number of nodes deleted or detached.
+
+        Raises:
+            GraphBuildError: If removing the nodes fails.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        action = "DETACH DELETE n" if delete else "REMOVE n.repo_id"
+        query = f"""
+            MATCH (n:Node {{repo_id: $repo_id}})
+            WITH n LIMIT $limit
+            {action}
+            RETURN count(*) AS count
+        """
+        limit = batch_size or self.batch_size
+        removed = 0
+        try:
+            while True:
+                count = self._write_count(query, repo_id=repo_id, limit=limit)
+                removed += count
+                if count < limit:
+                    break
+        except Exception as e:
+            error_msg = f"Failed to remove nodes of repository {repo_id}: {e}"
+            logger.error(error_msg)
+            raise GraphBuildError(
+                error_msg,
+                details={
+                    "uri": self.uri,
+                    "repo_id": repo_id,
+                    "removed": removed,
+                    "error": str(e),
+                }
+            )
+        return removed
+
+    def remove_repository(self, repo_id: str, delete_nodes: bool = False) -> int:
+        """Remove a repository, deleting or detaching its nodes.
+
+        Repositories aren't registered in Neo4j, so only their nodes are
+        removed (see ``remove_repository_nodes``).
+
+        Args:
+            repo_id: The ID of the repository.
+            delete_nodes: Whether to delete the nodes and their relationships.
+                If False, the nodes are kept and their repo_id is removed.
+
+        Returns:
+            The number of nodes deleted or detached.
+
+        Raises:
+            GraphBuildError: If removing the nodes fails.
+        """
+        return self.remove_repository_nodes(repo_id, delete=delete_nodes)
 
     def save_metadata(self, key: str, value: Any) -> None:
         """Save metadata to the database.
@@ -410,8 +1141,22 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter save_metadata is a stub implementation (key={key}, value_type={type(value).__name__})")
+        try:
+            self._write(
+                "MERGE (m:Metadata {key: $key}) SET m.value = $value",
+                key=key,
+                value=json.dumps(value, cls=DateTimeEncoder),
+            )
+        except Exception as e:
+            error_msg = f"Failed to save metadata: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "key": key,
+                    "error": str(e),
+                }
+            )
 
     def get_metadata(self, key: str, default: Any = None) -> Any:
         """Get metadata from the database.
@@ -429,9 +1174,24 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter get_metadata is a stub implementation (key={key})")
-        return default
+        try:
+            records = self._read(
+                "MATCH (m:Metadata {key: $key}) RETURN m.value AS value",
+                key=key,
+            )
+            if not records:
+                return default
+            return json.loads(records[0]["value"])
+        except Exception as e:
+            error_msg = f"Failed to get metadata: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "key": key,
+                    "error": str(e),
+                }
+            )
 
     def get_all_metadata(self) -> Dict[str, Any]:
         """Get all metadata from the database.
@@ -445,9 +1205,18 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning("Neo4j adapter get_all_metadata is a stub implementation")
-        return {}
+        try:
+            records = self._read("MATCH (m:Metadata) RETURN m.key AS key, m.value AS value")
+            return {record["key"]: json.loads(record["value"]) for record in records}
+        except Exception as e:
+            error_msg = f"Failed to get all metadata: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "error": str(e),
+                }
+            )
 
     def save_refresh_timestamp(self, source: str, timestamp: datetime) -> None:
         """Save the last refresh timestamp for a source.
@@ -462,8 +1231,23 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter save_refresh_timestamp is a stub implementation (source={source}, timestamp={timestamp})")
+        try:
+            self._write(
+                "MERGE (r:RefreshTimestamp {source: $source}) SET r.timestamp = $timestamp",
+                source=source,
+                timestamp=timestamp.isoformat(),
+            )
+        except Exception as e:
+            error_msg = f"Failed to save refresh timestamp: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "source": source,
+                    "timestamp": timestamp.isoformat(),
+                    "error": str(e),
+                }
+            )
 
     def get_refresh_timestamp(self, source: str) -> Optional[datetime]:
         """Get the last refresh timestamp for a source.
@@ -480,9 +1264,24 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning(f"Neo4j adapter get_refresh_timestamp is a stub implementation (source={source})")
-        return None
+        try:
+            records = self._read(
+                "MATCH (r:RefreshTimestamp {source: $source}) RETURN r.timestamp AS timestamp",
+                source=source,
+            )
+            if not records:
+                return None
+            return datetime.fromisoformat(records[0]["timestamp"])
+        except Exception as e:
+            error_msg = f"Failed to get refresh timestamp: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "source": source,
+                    "error": str(e),
+                }
+            )
 
     def get_all_refresh_timestamps(self) -> Dict[str, datetime]:
         """Get all refresh timestamps.
@@ -496,6 +1295,257 @@ class Neo4jAdapter:
         if not self.is_connected():
             raise DatabaseError("Not connected to database")
 
-        # This is a stub implementation that will be completed in a future release
-        logger.warning("Neo4j adapter get_all_refresh_timestamps is a stub implementation")
-        return {}
+        try:
+            records = self._read(
+                "MATCH (r:RefreshTimestamp) RETURN r.source AS source, r.timestamp AS timestamp"
+            )
+            return {
+                record["source"]: datetime.fromisoformat(record["timestamp"])
+                for record in records
+            }
+        except Exception as e:
+            error_msg = f"Failed to get all refresh timestamps: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(
+                error_msg,
+                details={
+                    "error": str(e),
+                }
+            )
+
+    # Session and query helpers
+
+    def _session(self) -> Any:
+        """Open a session backed by the driver's connection pool."""
+        return self.driver.session(database=self.database)
+
+    def _close_transaction(self) -> None:
+        """Forget the open transaction and return its session to the pool."""
+        session = self._session_handle
+        self._session_handle = None
+        self._transaction = None
+        if session is not None:
+            try:
+                session.close()
+            except Exception as e:
+                logger.warning(f"Failed to close Neo4j session: {e}")
+
+    def _read(self, query: str, **params: Any) -> List[Any]:
+        """Run a read query and return all of its records.
+
+        Args:
+            query: The Cypher query.
+            **params: Query parameters.
+
+        Returns:
+            The result records.
+        """
+        if self._transaction is not None:
+            return list(self._transaction.run(query, **params))
+        with self._session() as session:
+            return list(session.run(query, **params))
+
+    def _write(self, query: str, **params: Any) -> None:
+        """Run a single write query.
+
+        Args:
+            query: The Cypher query.
+            **params: Query parameters.
+        """
+        if self._transaction is not None:
+            self._transaction.run(query, **params).consume()
+            return
+        with self._session() as session:
+            session.execute_write(_run_write, query, params)
+
+    def _write_count(self, query: str, **params: Any) -> int:
+        """Run a write query that returns a single ``count`` column.
+
+        Args:
+            query: The Cypher query.
+            **params: Query parameters.
+
+        Returns:
+            The count returned by the query.
+        """
+        if self._transaction is not None:
+            return _count_of(self._transaction.run(query, **params))
+        with self._session() as session:
+            return session.execute_write(_run_write_count, query, params)
+
+    def _write_rows(self, query: str, rows: List[Dict[str, Any]]) -> None:
+        """Write rows with an UNWIND query in ``batch_size`` chunks.
+
+        Outside an explicit transaction each chunk is its own managed write
+        transaction, so the driver retries transient failures (such as lock
+        contention with concurrent writers) one chunk at a time.
+
+        Args:
+            query: A Cypher query that unwinds ``$rows``.
+            rows: The rows to write.
+        """
+        if not rows:
+            return
+
+        if self._transaction is not None:
+            for chunk in _chunks(rows, self.batch_size):
+                self._transaction.run(query, rows=chunk).consume()
+            return
+
+        with self._session() as session:
+            for chunk in _chunks(rows, self.batch_size):
+                session.execute_write(_run_write, query, {"rows": chunk})
+
+    def _get_edges(
+        self,
+        anchor: str,
+        node_ids: Union[str, Sequence[str]],
+        rel_type: Optional[EdgeRel],
+        as_of: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the edges attached to one or more nodes.
+
+        Args:
+            anchor: "s" to match edges by source, "d" to match by destination.
+            node_ids: The ID of the anchoring node, or a list of IDs.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time to filter by validity.
+
+        Returns:
+            A list of edges as dictionaries.
+        """
+        rel_filter = ""
+        if rel_type is not None:
+            rel_filter = ":" + self._validate_rel_type(self._rel_value(rel_type))
+        if isinstance(node_ids, str):
+            query = f"MATCH (s:Node)-[r{rel_filter}]->(d:Node) WHERE {anchor}.id = $id"
+            params: Dict[str, Any] = {"id": node_ids}
+        else:
+            query = f"MATCH (s:Node)-[r{rel_filter}]->(d:Node) WHERE {anchor}.id IN $ids"
+            params = {"ids": list(node_ids)}
+        if as_of is not None:
+            other = "d" if anchor == "s" else "s"
+            query += f" AND {_EDGE_VALID_CYPHER} AND " + _NODE_VALID_CYPHER.format(n=other)
+            params["as_of"] = as_of_key(as_of)
+        records = self._read(query + _EDGE_RETURN, **params)
+        return [self._edge_from_record(record) for record in records]
+
+    # Conversion helpers
+
+    @staticmethod
+    def _rel_value(rel: Union[EdgeRel, str]) -> str:
+        """Get the string value of a relationship type."""
+        return rel.value if isinstance(rel, EdgeRel) else str(rel)
+
+    @staticmethod
+    def _validate_rel_type(rel: str) -> str:
+        """Check that a relationship type is safe to interpolate into Cypher.
+
+        Raises:
+            ValueError: If the relationship type is not a plain identifier.
+        """
+        if not _REL_TYPE_PATTERN.match(rel):
+            raise ValueError(f"Invalid relationship type: {rel!r}")
+        return rel
+
+    @staticmethod
+    def _node_to_row(node: Node) -> Dict[str, Any]:
+        """Convert a node to an UNWIND row.
+
+        Args:
+            node: The node to convert.
+
+        Returns:
+            A dictionary with the node ``id`` and its property map.
+        """
+        created_at = node.created_at or node.ts
+        updated_at = node.updated_at or node.ts
+        metadata = node.metadata or {}
+        metadata_json = json.dumps(metadata, cls=DateTimeEncoder)
+        return {
+            "id": node.id,
+            "props": {
+                "type": node.type.value,
+                "title": node.title,
+                "body": node.body,
+                "timestamp": utc_iso(node.ts),
+                "repo_id": node.repo_id,
+                "extra": metadata_json,
+                "metadata": metadata_json if metadata else None,
+                "created_at": utc_iso(created_at),
+                "updated_at": utc_iso(updated_at),
+                "valid_from": utc_iso(node.valid_from),
+                "valid_until": utc_iso(node.valid_until),
+                "embedding": list(node.embedding) if node.embedding else None,
+                "url": node.url,
+            },
+        }
+
+    @staticmethod
+    def _node_from_properties(props: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Convert stored node properties to the dictionary shape used by the SQLite adapter.
+
+        Args:
+            props: The node properties.
+
+        Returns:
+            The node as a dictionary, or None if no properties were given.
+        """
+        if props is None:
+            return None
+
+        props = dict(props)
+        result = {
+            "id": props.get("id"),
+            "type": props.get("type"),
+            "title": props.get("title"),
+            "body": props.get("body"),
+            "timestamp": props.get("timestamp"),
+            "repo_id": props.get("repo_id"),
+            "extra": json.loads(props["extra"]) if props.get("extra") else {},
+        }
+        for field in ("created_at", "updated_at", "valid_from", "valid_until", "embedding", "url"):
+            if props.get(field):
+                result[field] = props[field]
+        if props.get("metadata"):
+            result["metadata"] = json.loads(props["metadata"])
+        elif result["extra"]:
+            result["metadata"] = result["extra"]
+        return result
+
+    @staticmethod
+    def _edge_from_record(record: Any) -> Dict[str, Any]:
+        """Convert a record with src, dst, rel and properties columns to an edge dictionary."""
+        edge = {
+            "src": record["src"],
+            "dst": record["dst"],
+            "rel": record["rel"],
+            "properties": json.loads(record["properties"]) if record["properties"] else {},
+        }
+        for field in ("valid_from", "valid_until"):
+            if record.get(field):
+                edge[field] = record[field]
+        return edge
+
+
+def _run_write(tx: Any, query: str, params: Dict[str, Any]) -> None:
+    """Run a write query inside a managed transaction."""
+    tx.run(query, **params).consume()
+
+
+def _run_write_count(tx: Any, query: str, params: Dict[str, Any]) -> int:
+    """Run a write query returning a count inside a managed transaction."""
+    return _count_of(tx.run(query, **params))
+
+
+def _count_of(result: Any) -> int:
+    """Get the ``count`` column of the first record of a result."""
+    for record in result:
+        return record["count"]
+    return 0
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Split rows into chunks of at most ``size`` items."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
@@ -0,0 +1,143 @@
+"""Shared lookups for batch SDK calls.
+
+Analyzing many entities one call at a time repeats the same lookups: files
+changed in one PR share neighbors, commits and co-change partners. A
+`PrefetchingAdapter` wraps a database adapter for the duration of one batch
+call, remembers every node, edge list and degree it reads, and can prefetch
+them for many IDs at once on adapters with bulk lookups.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from arc_memory.schema.models import EdgeRel
+
+# Anchors of the edge lookups, by direction
+_ANCHORS = {"outgoing": ("src",), "incoming": ("dst",), "both": ("src", "dst")}
+
+
+def _rel_value(rel: Union[EdgeRel, str, None]) -> Optional[str]:
+    """Get the string value of an optional relationship type."""
+    if rel is None:
+        return None
+    return rel.value if isinstance(rel, EdgeRel) else str(rel)
+
+
+class PrefetchingAdapter:
+    """A read-through cache over a database adapter.
+
+    Node, edge and degree lookups are answered from memory once read, so SDK
+    functions run unchanged against it share their lookups. Everything else is
+    delegated to the wrapped adapter. The cache never expires, so a wrapper
+    should only live as long as one batch call.
+
+    Attributes:
+        adapter: The wrapped database adapter.
+    """
+
+    def __init__(self, adapter: Any):
+        """Initialize the cache.
+
+        Args:
+            adapter: The database adapter to wrap.
+        """
+        self.adapter = adapter
+        self._nodes: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._edges: Dict[Tuple[str, str, Optional[str]], List[Dict[str, Any]]] = {}
+        self._degrees: Dict[str, Tuple[int, int]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped adapter."""
+        return getattr(self.adapter, name)
+
+    def __repr__(self) -> str:
+        return f"PrefetchingAdapter({self.adapter!r})"
+
+    def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node by its ID, reading it at most once."""
+        if node_id not in self._nodes:
+            self._nodes[node_id] = self.adapter.get_node_by_id(node_id)
+        return self._nodes[node_id]
+
+    def get_edges_by_src(self, src_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+        """Get the outgoing edges of a node, reading them at most once."""
+        return self._get_edges("src", src_id, rel_type)
+
+    def get_edges_by_dst(self, dst_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+        """Get the incoming edges of a node, reading them at most once."""
+        return self._get_edges("dst", dst_id, rel_type)
+
+    def get_degrees(self, node_ids: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """Get the in- and out-degree of nodes, reading each at most once."""
+        missing = [node_id for node_id in dict.fromkeys(node_ids) if node_id not in self._degrees]
+        if missing:
+            self._degrees.update(self.adapter.get_degrees(missing))
+        return {node_id: self._degrees.get(node_id, (0, 0)) for node_id in node_ids}
+
+    def _get_edges(self, anchor: str, node_id: str, rel_type: Union[EdgeRel, str, None]) -> List[Dict[str, Any]]:
+        """Get the edges attached to a node from memory or the wrapped adapter."""
+        rel = _rel_value(rel_type)
+        key = (anchor, node_id, rel)
+        if key not in self._edges:
+            unfiltered = self._edges.get((anchor, node_id, None))
+            if unfiltered is not None:
+                self._edges[key] = [edge for edge in unfiltered if edge["rel"] == rel]
+            elif anchor == "src":
+                self._edges[key] = self.adapter.get_edges_by_src(node_id, rel_type=rel_type)
+            else:
+                self._edges[key] = self.adapter.get_edges_by_dst(node_id, rel_type=rel_type)
+        return self._edges[key]
+
+    def prefetch_nodes(self, node_ids: Iterable[str]) -> None:
+        """Read the nodes that haven't been read yet, in bulk if the adapter can.
+
+        Args:
+            node_ids: The IDs of the nodes.
+        """
+        from arc_memory.db.base import supports_batch_lookup
+
+        missing = [node_id for node_id in dict.fromkeys(node_ids) if node_id not in self._nodes]
+        if not missing:
+            return
+        if supports_batch_lookup(self.adapter):
+            found = self.adapter.get_nodes_by_ids(missing)
+            for node_id in missing:
+                self._nodes[node_id] = found.get(node_id)
+        else:
+            for node_id in missing:
+                self.get_node_by_id(node_id)
+
+    def prefetch_edges(
+        self,
+        node_ids: Iterable[str],
+        direction: str = "both",
+        rel_type: Union[EdgeRel, str, None] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read the edges of nodes that haven't been read yet, in bulk if the adapter can.
+
+        Args:
+            node_ids: The IDs of the nodes.
+            direction: "outgoing", "incoming" or "both".
+            rel_type: Optional relationship type to filter by.
+
+        Returns:
+            The edges of all the nodes in the given direction, including ones
+            read earlier.
+        """
+        from arc_memory.db.base import supports_batch_lookup
+
+        node_ids = list(dict.fromkeys(node_ids))
+        rel = _rel_value(rel_type)
+        edges: List[Dict[str, Any]] = []
+        for anchor in _ANCHORS[direction]:
+            missing = [
+                node_id for node_id in node_ids
+                if (anchor, node_id, rel) not in self._edges and (anchor, node_id, None) not in self._edges
+            ]
+            if missing and supports_batch_lookup(self.adapter):
+                fetch = self.adapter.get_edges_by_srcs if anchor == "src" else self.adapter.get_edges_by_dsts
+                for node_id, node_edges in fetch(missing, rel_type=rel_type).items():
+                    self._edges[(anchor, node_id, rel)] = node_edges
+            for node_id in node_ids:
+                edges.extend(self._get_edges(anchor, node_id, rel_type))
+        return edges
@@ -0,0 +1,269 @@
+"""Process-wide registry of shared database adapters.
+
+Helpers that read or write a little bookkeeping (refresh timestamps, ingestor
+metadata, etc.) used to create, connect and initialize a new adapter on every
+call, so a single refresh could open dozens of connections and rerun the
+schema checks for each. The registry keeps one connected adapter per database
+and hands out reference-counted handles to it:
+
+    with shared_adapter(db_path=db_path) as adapter:
+        adapter.get_refresh_timestamp("github")
+
+Handles can be used from any thread. Calls through a handle are serialized on
+the shared adapter, and SQLite connections are opened with
+`check_same_thread=False`. The raw connection is only reachable through
+`SharedAdapter.locked`. Connections stay open between uses and are closed
+by `AdapterRegistry.close` or when the process exits.
+"""
+
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from arc_memory.errors import DatabaseError
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+# A function that creates an unconnected adapter of a given type
+AdapterFactory = Callable[[str], Any]
+
+# Adapter attributes holding the raw connection, which handles don't expose
+CONNECTION_ATTRIBUTES = frozenset({"conn", "driver"})
+
+
+class _Entry:
+    """A shared adapter with its lock and reference count."""
+
+    def __init__(self, adapter: Any, db_path: str):
+        self.adapter = adapter
+        self.db_path = db_path
+        self.lock = threading.RLock()
+        self.refs = 0
+        self.closing = False
+
+
+class SharedAdapter:
+    """A handle to an adapter shared through an `AdapterRegistry`.
+
+    Method calls are forwarded to the shared adapter while holding its lock, so
+    handles can be used from several threads at once. The raw connection
+    (``conn`` or ``driver``) isn't exposed, since using it would bypass the
+    lock; use `locked` to make several calls, or to use the connection,
+    without other threads interleaving. A handle must be released, either explicitly or by using it
+    as a context manager; `disconnect` releases the handle instead of closing
+    the shared connection.
+    """
+
+    def __init__(self, registry: "AdapterRegistry", entry: _Entry):
+        self._registry = registry
+        self._entry: Optional[_Entry] = entry
+
+    def __getattr__(self, name: str) -> Any:
+        if name in CONNECTION_ATTRIBUTES:
+            raise AttributeError(
+                f"Shared adapters don't expose '{name}'; use SharedAdapter.locked() to use the connection"
+            )
+        entry = self._get_entry()
+        attr = getattr(entry.adapter, name)
+        # Only adapter methods are locked; plain attributes are returned as they are
+        if not callable(getattr(type(entry.adapter), name, None)):
+            return attr
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            with entry.lock:
+                return attr(*args, **kwargs)
+
+        return method
+
+    def __repr__(self) -> str:
+        entry = self._entry
+        return f"SharedAdapter({entry.adapter!r})" if entry else "SharedAdapter(released)"
+
+    def __enter__(self) -> "SharedAdapter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    @contextmanager
+    def locked(self) -> Iterator[Any]:
+        """Hold the adapter's lock for a sequence of calls.
+
+        Yields:
+            The shared adapter itself.
+        """
+        entry = self._get_entry()
+        with entry.lock:
+            yield entry.adapter
+
+    def disconnect(self) -> None:
+        """Release the handle; the shared connection stays open for other users."""
+        self.release()
+
+    def release(self) -> None:
+        """Release the handle. Releasing a handle twice has no effect."""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._registry._release(entry)
+
+    def _get_entry(self) -> _Entry:
+        if self._entry is None:
+            raise DatabaseError("Shared database adapter was already released")
+        return self._entry
+
+
+class AdapterRegistry:
+    """Registry of connected database adapters, keyed by database path.
+
+    An adapter is created, connected and initialized the first time its
+    database is acquired, and reused by every later `acquire` until the
+    registry is closed. Adapters created by different factories are never
+    shared.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._entries: Dict[Tuple[Any, str, str], _Entry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        adapter_type: Optional[str] = None,
+        db_path: Optional[Union[str, Path]] = None,
+        connection_params: Optional[Dict[str, Any]] = None,
+        factory: Optional[AdapterFactory] = None,
+    ) -> SharedAdapter:
+        """Get a handle to the shared adapter of a database.
+
+        Args:
+            adapter_type: The type of database adapter. If None, uses the
+                configured adapter.
+            db_path: Path to the database. If None, uses the default path.
+            connection_params: Extra parameters for connecting. They only apply
+                when the shared connection is opened.
+            factory: Function that creates an adapter of a given type. If None,
+                uses `arc_memory.db.get_adapter`.
+
+        Returns:
+            A handle that must be released after use.
+
+        Raises:
+            DatabaseError: If connecting to the database fails.
+        """
+        if factory is None:
+            from arc_memory.db import get_adapter as factory
+        if adapter_type is None:
+            from arc_memory.config import get_config
+
+            adapter_type = get_config().get("database", {}).get("adapter", "sqlite")
+        if db_path is None:
+            from arc_memory.sql.db import get_db_path
+
+            db_path = get_db_path()
+        path = os.path.abspath(os.path.expanduser(str(db_path)))
+
+        key = (factory, adapter_type, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(factory(adapter_type), path)
+                self._entries[key] = entry
+            entry.refs += 1
+
+        try:
+            with entry.lock:
+                if not entry.adapter.is_connected():
+                    params = {"db_path": path, "check_same_thread": False}
+                    params.update(connection_params or {})
+                    entry.adapter.connect(params)
+                    entry.adapter.init_db()
+        except BaseException:
+            self._release(entry)
+            raise
+
+        return SharedAdapter(self, entry)
+
+    def close(self, db_path: Optional[Union[str, Path]] = None) -> None:
+        """Close shared adapters.
+
+        Adapters that are not in use are disconnected now; the others are
+        disconnected when their last handle is released. Later `acquire` calls
+        open new connections.
+
+        Args:
+            db_path: Only close the adapters of this database. If None, closes
+                every adapter.
+        """
+        path = os.path.abspath(os.path.expanduser(str(db_path))) if db_path is not None else None
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if path is None or entry.db_path == path]
+            entries = [self._entries.pop(key) for key in keys]
+            idle = []
+            for entry in entries:
+                entry.closing = True
+                if entry.refs == 0:
+                    idle.append(entry)
+
+        for entry in idle:
+            self._disconnect(entry)
+
+    def _release(self, entry: _Entry) -> None:
+        """Drop a reference to an entry, disconnecting it if it was closed."""
+        with self._lock:
+            entry.refs -= 1
+            should_close = entry.closing and entry.refs == 0
+
+        if should_close:
+            self._disconnect(entry)
+
+    @staticmethod
+    def _disconnect(entry: _Entry) -> None:
+        with entry.lock:
+            try:
+                if entry.adapter.is_connected():
+                    entry.adapter.disconnect()
+            except Exception as e:
+                logger.warning(f"Failed to close shared database adapter for {entry.db_path}: {e}")
+
+
+_default_registry: Optional[AdapterRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_adapter_registry() -> AdapterRegistry:
+    """Get the process-wide adapter registry.
+
+    Its adapters are closed when the process exits.
+    """
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = AdapterRegistry()
+            atexit.register(_default_registry.close)
+        return _default_registry
+
+
+def shared_adapter(
+    adapter_type: Optional[str] = None,
+    db_path: Optional[Union[str, Path]] = None,
+    connection_params: Optional[Dict[str, Any]] = None,
+    factory: Optional[AdapterFactory] = None,
+) -> SharedAdapter:
+    """Get a handle to a shared adapter from the process-wide registry.
+
+    Args:
+        adapter_type: The type of database adapter. If None, uses the
+            configured adapter.
+        db_path: Path to the database. If None, uses the default path.
+        connection_params: Extra parameters used if the connection is opened.
+        factory: Function that creates an adapter of a given type. If None,
+            uses `arc_memory.db.get_adapter`.
+
+    Returns:
+        A handle to use as a context manager, or to release explicitly.
+    """
+    return get_adapter_registry().acquire(adapter_type, db_path, connection_params, factory)
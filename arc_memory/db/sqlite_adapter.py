@@ -7,14 +7,30 @@ import json
 import sqlite3
 from datetime import datetime, date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from arc_memory.db.base import check_related_query
 from arc_memory.errors import DatabaseError, DatabaseInitializationError, GraphBuildError, GraphQueryError
 from arc_memory.logging_conf import get_logger
+from arc_memory.migrations.registry import ensure_schema
+from arc_memory.profiling import span
+from arc_memory.schema.batch import EdgeBatch, NodeBatch, edge_keys, edge_rows, node_keys, node_rows
 from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sql.stats import apply_write_stats, has_graph_stats
+from arc_memory.sql.temporal import as_of_key, edge_valid_sql, node_valid_sql
 
 logger = get_logger(__name__)
 
+# Nodes per transaction when removing a repository; also keeps the ID lists
+# under SQLite's bound parameter limit
+REPOSITORY_BATCH_SIZE = 500
+
+# Columns read for a node, in the order expected by _node_from_row
+_NODE_COLUMNS = (
+    "id, type, title, body, timestamp, repo_id, extra, created_at, updated_at, "
+    "valid_from, valid_until, metadata, embedding, url"
+)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime and date objects."""
@@ -25,6 +41,11 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _rel_value(rel: Union[EdgeRel, str]) -> str:
+    """Get the string value of a relationship type."""
+    return rel.value if isinstance(rel, EdgeRel) else str(rel)
+
+
 class SQLiteAdapter:
     """SQLite implementation of the DatabaseAdapter protocol."""
 
@@ -56,6 +77,8 @@ class SQLiteAdapter:
             connection_params: Parameters for connecting to the database.
                 - db_path: Path to the database file.
                 - check_exists: Whether to check if the database file exists.
+                - check_same_thread: Whether only the connecting thread may use
+                  the connection (default True).
 
         Raises:
             DatabaseError: If connecting to the database fails.
@@ -123,7 +146,10 @@ class SQLiteAdapter:
             self.db_path.parent.mkdir(exist_ok=True, parents=True)
 
             # Connect to the database
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=connection_params.get("check_same_thread", True),
+            )
             self.conn.row_factory = sqlite3.Row
             logger.info(f"Connected to database: {self.db_path}")
             return
@@ -181,159 +207,9 @@ class SQLiteAdapter:
             raise DatabaseError("Not connected to database")
 
         try:
-            # Create repositories table if it doesn't exist
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS repositories (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    url TEXT,
-                    local_path TEXT NOT NULL,
-                    default_branch TEXT DEFAULT 'main',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    metadata TEXT
-                )
-                """
-            )
-
-            # Create tables if they don't exist with enhanced schema
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS nodes(
-                    id TEXT PRIMARY KEY,
-                    type TEXT NOT NULL,
-                    title TEXT,
-                    body TEXT,
-                    timestamp TEXT,
-                    repo_id TEXT,
-                    extra TEXT,
-                    created_at TEXT,
-                    updated_at TEXT,
-                    valid_from TEXT,
-                    valid_until TEXT,
-                    metadata TEXT,
-                    embedding BLOB,
-                    url TEXT
-                )
-                """
-            )
-
-            # Create index on timestamp column
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_timestamp ON nodes(timestamp)
-                """
-            )
-
-            # Create index on repo_id column
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_repo_id ON nodes(repo_id)
-                """
-            )
-
-            # Create indices for new temporal fields
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_created_at ON nodes(created_at)
-                """
-            )
-
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_updated_at ON nodes(updated_at)
-                """
-            )
-
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_valid_from ON nodes(valid_from)
-                """
-            )
-
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_valid_until ON nodes(valid_until)
-                """
-            )
-
-            # Create index on url for faster lookups
-            self.conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_nodes_url ON nodes(url)
-                """
-            )
-
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS edges(
-                    src TEXT NOT NULL,
-                    dst TEXT NOT NULL,
-                    rel TEXT NOT NULL,
-                    properties TEXT,
-                    PRIMARY KEY (src, dst, rel)
-                )
-                """
-            )
-
-            # Create metadata table
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS metadata(
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-                """
-            )
-
-            # Create refresh_timestamps table
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS refresh_timestamps(
-                    source TEXT PRIMARY KEY,
-                    timestamp TEXT NOT NULL
-                )
-                """
-            )
-
-            logger.info(f"Initialized database schema: {self.db_path}")
-
-            # Run migrations automatically
-            try:
-                from arc_memory.migrations.add_timestamp_column import migrate_database
-                migrate_success = migrate_database(self.db_path)
-                if migrate_success:
-                    logger.info(f"Successfully ran timestamp column migration for {self.db_path}")
-                else:
-                    logger.warning(f"Failed to run timestamp column migration for {self.db_path}")
-
-                # Run repository migration
-                from arc_memory.migrations.add_repo_id_column import migrate_database as migrate_repo_id
-                repo_migrate_success = migrate_repo_id(self.db_path)
-                if repo_migrate_success:
-                    logger.info(f"Successfully ran repository migration for {self.db_path}")
-                else:
-                    logger.warning(f"Failed to run repository migration for {self.db_path}")
-
-                # Run architecture schema migration
-                from arc_memory.migrations.add_architecture_schema import migrate_database as migrate_architecture
-                arch_migrate_success = migrate_architecture(self.db_path)
-                if arch_migrate_success:
-                    logger.info(f"Successfully ran architecture schema migration for {self.db_path}")
-                else:
-                    logger.warning(f"Failed to run architecture schema migration for {self.db_path}")
-
-                # Run enhanced schema migration
-                from arc_memory.migrations.add_enhanced_schema import migrate_database as migrate_enhanced_schema
-                enhanced_schema_success = migrate_enhanced_schema(self.db_path)
-                if enhanced_schema_success:
-                    logger.info(f"Successfully ran enhanced schema migration for {self.db_path}")
-                else:
-                    logger.warning(f"Failed to run enhanced schema migration for {self.db_path}")
-            except Exception as migrate_error:
-                logger.warning(f"Error running database migrations: {migrate_error}")
-                # Don't fail initialization if migrations fail
-                # The database is still usable, just might not have the latest schema
+            # A database at the current schema version costs a single read
+            if ensure_schema(self.conn, self.db_path):
+                logger.info(f"Initialized database schema: {self.db_path}")
         except Exception as e:
             error_msg = f"Failed to initialize database schema: {e}"
             logger.error(error_msg)
@@ -345,12 +221,14 @@ class SQLiteAdapter:
                 }
             )
 
-    def add_nodes_and_edges(self, nodes: List[Node], edges: List[Edge]) -> None:
+    def add_nodes_and_edges(
+        self, nodes: Union[List[Node], NodeBatch], edges: Union[List[Edge], EdgeBatch]
+    ) -> None:
         """Add nodes and edges to the database.
 
         Args:
-            nodes: The nodes to add.
-            edges: The edges to add.
+            nodes: The nodes to add, as a list or a NodeBatch.
+            edges: The edges to add, as a list or an EdgeBatch.
 
         Raises:
             GraphBuildError: If adding nodes and edges fails.
@@ -379,30 +257,14 @@ class SQLiteAdapter:
             if not in_transaction:
                 self.conn.execute("BEGIN TRANSACTION")
 
-            # Add nodes
-            for node in nodes:
-                # Extract timestamp from node
-                timestamp_str = None
-                if hasattr(node, 'ts') and node.ts:
-                    timestamp_str = node.ts.isoformat()
-
-                # Set and extract temporal fields using helper functions
-                self._set_default_temporal_fields(node)
-                created_at_str = self._get_datetime_field_as_iso(node, 'created_at')
-                updated_at_str = self._get_datetime_field_as_iso(node, 'updated_at')
-                valid_from_str = self._get_datetime_field_as_iso(node, 'valid_from')
-                valid_until_str = self._get_datetime_field_as_iso(node, 'valid_until')
-
-                # Handle embedding (convert to bytes if present)
-                embedding_bytes = self._convert_embedding_to_bytes(node)
-
-                # Get URL if present
-                url = self._get_node_field(node, 'url')
+            # Account for the batch in the statistics tables before replacing rows
+            if has_graph_stats(self.conn):
+                with span("db.graph_stats"):
+                    apply_write_stats(self.conn, node_keys(nodes), edge_keys(edges))
 
-                # Use metadata if present, otherwise fall back to extra
-                metadata_json = self._get_metadata_json(node)
-
-                self.conn.execute(
+            # Add nodes, reading rows straight from batches without building models
+            with span("db.insert_nodes"):
+                self.conn.executemany(
                     """
                     INSERT OR REPLACE INTO nodes(
                         id, type, title, body, timestamp, repo_id, extra,
@@ -412,36 +274,19 @@ class SQLiteAdapter:
                     VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                     (
-                        node.id,
-                        node.type.value,
-                        node.title,
-                        node.body,
-                        timestamp_str,
-                        node.repo_id,
-                        json.dumps(node.extra if hasattr(node, 'extra') and node.extra else {}, cls=DateTimeEncoder),
-                        created_at_str,
-                        updated_at_str,
-                        valid_from_str,
-                        valid_until_str,
-                        metadata_json,
-                        embedding_bytes,
-                        url,
+                        row[:12] + (self._embedding_to_bytes(row[12]), row[13])
+                        for row in node_rows(nodes)
                     ),
                 )
 
             # Add edges
-            for edge in edges:
-                self.conn.execute(
+            with span("db.insert_edges"):
+                self.conn.executemany(
                     """
-                    INSERT OR REPLACE INTO edges(src, dst, rel, properties)
-                    VALUES(?, ?, ?, ?)
+                    INSERT OR REPLACE INTO edges(src, dst, rel, properties, valid_from, valid_until)
+                    VALUES(?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        edge.src,
-                        edge.dst,
-                        edge.rel.value,
-                        json.dumps(edge.properties, cls=DateTimeEncoder),
-                    ),
+                    edge_rows(edges),
                 )
 
             # Commit transaction if we started it
@@ -469,11 +314,13 @@ class SQLiteAdapter:
                 }
             )
 
-    def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
+    def get_node_by_id(self, node_id: str, as_of: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """Get a node by its ID.
 
         Args:
             node_id: The ID of the node.
+            as_of: Optional point in time; if given, the node is only returned
+                if it was valid at that time.
 
         Returns:
             The node as a dictionary, or None if it doesn't exist.
@@ -485,70 +332,17 @@ class SQLiteAdapter:
             raise DatabaseError("Not connected to database")
 
         try:
-            cursor = self.conn.execute(
-                """
-                SELECT id, type, title, body, timestamp, repo_id, extra,
-                       created_at, updated_at, valid_from, valid_until,
-                       metadata, embedding, url
-                FROM nodes
-                WHERE id = ?
-                """,
-                (node_id,),
-            )
+            query = f"SELECT {_NODE_COLUMNS} FROM nodes WHERE id = ?"
+            params: Tuple[Any, ...] = (node_id,)
+            if as_of is not None:
+                key = as_of_key(as_of)
+                query += f" AND {node_valid_sql()}"
+                params += (key, key)
+            cursor = self.conn.execute(query, params)
             row = cursor.fetchone()
             if row is None:
                 return None
-
-            # Process embedding if present
-            embedding = None
-            if row[12]:  # embedding column
-                try:
-                    import numpy as np
-                    embedding = np.frombuffer(row[12], dtype=np.float32).tolist()
-                except ImportError:
-                    logger.warning("NumPy not available, trying to parse embedding as JSON")
-                    try:
-                        # Try to parse as JSON string
-                        embedding = json.loads(row[12].decode('utf-8'))
-                    except Exception as e:
-                        logger.warning(f"Failed to parse embedding: {e}")
-                except Exception as e:
-                    logger.warning(f"Failed to convert embedding from bytes: {e}")
-
-            # Build result with all fields
-            result = {
-                "id": row[0],
-                "type": row[1],
-                "title": row[2],
-                "body": row[3],
-                "timestamp": row[4],
-                "repo_id": row[5],
-                "extra": json.loads(row[6]) if row[6] else {},
-            }
-
-            # Add new fields if they have values
-            if row[7]:  # created_at
-                result["created_at"] = row[7]
-            if row[8]:  # updated_at
-                result["updated_at"] = row[8]
-            if row[9]:  # valid_from
-                result["valid_from"] = row[9]
-            if row[10]:  # valid_until
-                result["valid_until"] = row[10]
-            if row[11]:  # metadata
-                result["metadata"] = json.loads(row[11]) if row[11] else {}
-                # For backward compatibility, if metadata exists but extra doesn't have the same content,
-                # update extra to match metadata
-                if result["metadata"] and result["metadata"] != result["extra"]:
-                    result["extra"] = result["metadata"]
-            elif result["extra"]:  # If no metadata but extra exists, use extra for metadata
-                result["metadata"] = result["extra"]
-            if embedding:
-                result["embedding"] = embedding
-            if row[13]:  # url
-                result["url"] = row[13]
-
-            return result
+            return self._node_from_row(row)
         except Exception as e:
             error_msg = f"Failed to get node by ID: {e}"
             logger.error(error_msg)
@@ -560,6 +354,107 @@ class SQLiteAdapter:
                 }
             )
 
+    def get_nodes_by_ids(
+        self, node_ids: Sequence[str], as_of: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get many nodes by their IDs.
+
+        Nodes are read with one query per 500 IDs instead of one per node.
+
+        Args:
+            node_ids: The IDs of the nodes.
+            as_of: Optional point in time; if given, only nodes valid at that
+                time are returned.
+
+        Returns:
+            A dictionary mapping the ID of each node that exists to the node.
+
+        Raises:
+            GraphQueryError: If getting the nodes fails.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        ids = list(dict.fromkeys(node_ids))
+        nodes: Dict[str, Dict[str, Any]] = {}
+        try:
+            # Stay under SQLite's bound parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                query = f"SELECT {_NODE_COLUMNS} FROM nodes WHERE id IN ({', '.join('?' for _ in chunk)})"
+                params: List[Any] = list(chunk)
+                if as_of is not None:
+                    key = as_of_key(as_of)
+                    query += f" AND {node_valid_sql()}"
+                    params.extend((key, key))
+                for row in self.conn.execute(query, params):
+                    nodes[row[0]] = self._node_from_row(row)
+        except Exception as e:
+            error_msg = f"Failed to get nodes by ID: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "node_count": len(ids),
+                    "error": str(e),
+                }
+            )
+        return nodes
+
+    @staticmethod
+    def _node_from_row(row: Sequence[Any]) -> Dict[str, Any]:
+        """Convert a row of the node columns to a node dictionary."""
+        # Process embedding if present
+        embedding = None
+        if row[12]:  # embedding column
+            try:
+                import numpy as np
+                embedding = np.frombuffer(row[12], dtype=np.float32).tolist()
+            except ImportError:
+                logger.warning("NumPy not available, trying to parse embedding as JSON")
+                try:
+                    # Try to parse as JSON string
+                    embedding = json.loads(row[12].decode('utf-8'))
+                except Exception as e:
+                    logger.warning(f"Failed to parse embedding: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to convert embedding from bytes: {e}")
+
+        # Build result with all fields
+        result = {
+            "id": row[0],
+            "type": row[1],
+            "title": row[2],
+            "body": row[3],
+            "timestamp": row[4],
+            "repo_id": row[5],
+            "extra": json.loads(row[6]) if row[6] else {},
+        }
+
+        # Add new fields if they have values
+        if row[7]:  # created_at
+            result["created_at"] = row[7]
+        if row[8]:  # updated_at
+            result["updated_at"] = row[8]
+        if row[9]:  # valid_from
+            result["valid_from"] = row[9]
+        if row[10]:  # valid_until
+            result["valid_until"] = row[10]
+        if row[11]:  # metadata
+            result["metadata"] = json.loads(row[11]) if row[11] else {}
+            # For backward compatibility, if metadata exists but extra doesn't have the same content,
+            # update extra to match metadata
+            if result["metadata"] and result["metadata"] != result["extra"]:
+                result["extra"] = result["metadata"]
+        elif result["extra"]:  # If no metadata but extra exists, use extra for metadata
+            result["metadata"] = result["extra"]
+        if embedding:
+            result["embedding"] = embedding
+        if row[13]:  # url
+            result["url"] = row[13]
+
+        return result
+
     def get_node_count(self) -> int:
         """Get the number of nodes in the database.
 
@@ -612,12 +507,103 @@ class SQLiteAdapter:
                 }
             )
 
-    def get_edges_by_src(self, src_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+    def get_type_counts(self) -> Dict[str, int]:
+        """Get the number of nodes of each type.
+
+        Read from the node_type_counts table, which triggers keep current.
+
+        Returns:
+            A dictionary mapping node types to counts.
+
+        Raises:
+            GraphQueryError: If getting the counts fails.
+        """
+        return self._read_stats("SELECT type, count FROM node_type_counts", "node type counts")
+
+    def get_relationship_counts(self) -> Dict[str, int]:
+        """Get the number of edges of each relationship type.
+
+        Read from the edge_rel_counts table, which triggers keep current.
+
+        Returns:
+            A dictionary mapping relationship types to counts.
+
+        Raises:
+            GraphQueryError: If getting the counts fails.
+        """
+        return self._read_stats("SELECT rel, count FROM edge_rel_counts", "relationship counts")
+
+    def get_degrees(self, node_ids: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """Get the in- and out-degree of nodes.
+
+        Each degree is a primary key lookup in the node_degrees table.
+
+        Args:
+            node_ids: The IDs of the nodes.
+
+        Returns:
+            A dictionary mapping each node ID to ``(in_degree, out_degree)``;
+            nodes without edges map to ``(0, 0)``.
+
+        Raises:
+            GraphQueryError: If getting the degrees fails.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        degrees = {node_id: (0, 0) for node_id in node_ids}
+        ids = list(degrees)
+        try:
+            # Stay under SQLite's bound parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                cursor = self.conn.execute(
+                    "SELECT id, in_degree, out_degree FROM node_degrees "
+                    f"WHERE id IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                )
+                for node_id, in_degree, out_degree in cursor:
+                    degrees[node_id] = (in_degree, out_degree)
+        except Exception as e:
+            error_msg = f"Failed to get node degrees: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "db_path": str(self.db_path),
+                    "error": str(e),
+                }
+            )
+        return degrees
+
+    def _read_stats(self, query: str, what: str) -> Dict[str, int]:
+        """Read a key and count statistics table into a dictionary."""
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        try:
+            return {key: count for key, count in self.conn.execute(query)}
+        except Exception as e:
+            error_msg = f"Failed to get {what}: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "db_path": str(self.db_path),
+                    "error": str(e),
+                }
+            )
+
+    def get_edges_by_src(
+        self, src_id: str, rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get edges by source node ID.
 
         Args:
             src_id: The ID of the source node.
             rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose destination node was also valid are returned.
 
         Returns:
             A list of edges as dictionaries.
@@ -629,35 +615,7 @@ class SQLiteAdapter:
             raise DatabaseError("Not connected to database")
 
         try:
-            if rel_type is None:
-                cursor = self.conn.execute(
-                    """
-                    SELECT src, dst, rel, properties
-                    FROM edges
-                    WHERE src = ?
-                    """,
-                    (src_id,),
-                )
-            else:
-                cursor = self.conn.execute(
-                    """
-                    SELECT src, dst, rel, properties
-                    FROM edges
-                    WHERE src = ? AND rel = ?
-                    """,
-                    (src_id, rel_type.value),
-                )
-            edges = []
-            for row in cursor:
-                edges.append(
-                    {
-                        "src": row[0],
-                        "dst": row[1],
-                        "rel": row[2],
-                        "properties": json.loads(row[3]) if row[3] else {},
-                    }
-                )
-            return edges
+            return self._get_edges("src", src_id, rel_type, as_of)
         except Exception as e:
             error_msg = f"Failed to get edges by source: {e}"
             logger.error(error_msg)
@@ -665,17 +623,21 @@ class SQLiteAdapter:
                 f"Failed to get edges by source node '{src_id}': {e}",
                 details={
                     "src_id": src_id,
-                    "rel_type": rel_type.value if rel_type else None,
+                    "rel_type": _rel_value(rel_type) if rel_type else None,
                     "error": str(e),
                 }
             )
 
-    def get_edges_by_dst(self, dst_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+    def get_edges_by_dst(
+        self, dst_id: str, rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get edges by destination node ID.
 
         Args:
             dst_id: The ID of the destination node.
             rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose source node was also valid are returned.
 
         Returns:
             A list of edges as dictionaries.
@@ -687,35 +649,7 @@ class SQLiteAdapter:
             raise DatabaseError("Not connected to database")
 
         try:
-            if rel_type is None:
-                cursor = self.conn.execute(
-                    """
-                    SELECT src, dst, rel, properties
-                    FROM edges
-                    WHERE dst = ?
-                    """,
-                    (dst_id,),
-                )
-            else:
-                cursor = self.conn.execute(
-                    """
-                    SELECT src, dst, rel, properties
-                    FROM edges
-                    WHERE dst = ? AND rel = ?
-                    """,
-                    (dst_id, rel_type.value),
-                )
-            edges = []
-            for row in cursor:
-                edges.append(
-                    {
-                        "src": row[0],
-                        "dst": row[1],
-                        "rel": row[2],
-                        "properties": json.loads(row[3]) if row[3] else {},
-                    }
-                )
-            return edges
+            return self._get_edges("dst", dst_id, rel_type, as_of)
         except Exception as e:
             error_msg = f"Failed to get edges by destination: {e}"
             logger.error(error_msg)
@@ -723,11 +657,241 @@ class SQLiteAdapter:
                 f"Failed to get edges by destination node '{dst_id}': {e}",
                 details={
                     "dst_id": dst_id,
-                    "rel_type": rel_type.value if rel_type else None,
+                    "rel_type": _rel_value(rel_type) if rel_type else None,
                     "error": str(e),
                 }
             )
 
+    def get_edges_by_srcs(
+        self, src_ids: Sequence[str], rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the outgoing edges of many nodes.
+
+        Args:
+            src_ids: The IDs of the source nodes.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose destination node was also valid are returned.
+
+        Returns:
+            A dictionary mapping every source ID to its edges.
+
+        Raises:
+            GraphQueryError: If getting the edges fails.
+        """
+        return self._get_edges_by_many("src", src_ids, rel_type, as_of)
+
+    def get_edges_by_dsts(
+        self, dst_ids: Sequence[str], rel_type: Optional[EdgeRel] = None, as_of: Optional[datetime] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the incoming edges of many nodes.
+
+        Args:
+            dst_ids: The IDs of the destination nodes.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time; if given, only edges valid at that
+                time whose source node was also valid are returned.
+
+        Returns:
+            A dictionary mapping every destination ID to its edges.
+
+        Raises:
+            GraphQueryError: If getting the edges fails.
+        """
+        return self._get_edges_by_many("dst", dst_ids, rel_type, as_of)
+
+    def _get_edges_by_many(
+        self, anchor: str, node_ids: Sequence[str], rel_type: Optional[EdgeRel], as_of: Optional[datetime]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the edges attached to many nodes, one query per 500 nodes."""
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        edges: Dict[str, List[Dict[str, Any]]] = {node_id: [] for node_id in node_ids}
+        ids = list(edges)
+        try:
+            # Stay under SQLite's bound parameter limit
+            for start in range(0, len(ids), 500):
+                for edge in self._get_edges(anchor, ids[start:start + 500], rel_type, as_of):
+                    edges[edge[anchor]].append(edge)
+        except Exception as e:
+            error_msg = f"Failed to get edges by {'source' if anchor == 'src' else 'destination'}: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                error_msg,
+                details={
+                    "node_count": len(ids),
+                    "rel_type": _rel_value(rel_type) if rel_type else None,
+                    "error": str(e),
+                }
+            )
+        return edges
+
+    def _get_edges(
+        self,
+        anchor: str,
+        node_ids: Union[str, Sequence[str]],
+        rel_type: Optional[EdgeRel],
+        as_of: Optional[datetime],
+    ) -> List[Dict[str, Any]]:
+        """Get the edges attached to one or more nodes.
+
+        Args:
+            anchor: "src" to match edges by source, "dst" to match by destination.
+            node_ids: The ID of the anchoring node, or a list of IDs.
+            rel_type: Optional relationship type to filter by.
+            as_of: Optional point in time to filter by validity.
+
+        Returns:
+            A list of edges as dictionaries.
+        """
+        query = """
+            SELECT e.src, e.dst, e.rel, e.properties, e.valid_from, e.valid_until
+            FROM edges e
+            """
+        if isinstance(node_ids, str):
+            conditions = [f"e.{anchor} = ?"]
+            params: List[Any] = [node_ids]
+        else:
+            conditions = [f"e.{anchor} IN ({', '.join('?' for _ in node_ids)})"]
+            params = list(node_ids)
+        if rel_type is not None:
+            conditions.append("e.rel = ?")
+            params.append(_rel_value(rel_type))
+        if as_of is not None:
+            # Edges to nodes that were never ingested are kept, as in the
+            # current-state query
+            key = as_of_key(as_of)
+            other = "dst" if anchor == "src" else "src"
+            query += f" LEFT JOIN nodes n ON n.id = e.{other}"
+            conditions.append(edge_valid_sql("e"))
+            conditions.append(f"(n.id IS NULL OR ({node_valid_sql('n')}))")
+            params.extend((key, key, key, key))
+        query += " WHERE " + " AND ".join(conditions)
+
+        edges = []
+        for row in self.conn.execute(query, params):
+            edge = {
+                "src": row[0],
+                "dst": row[1],
+                "rel": row[2],
+                "properties": json.loads(row[3]) if row[3] else {},
+            }
+            if row[4]:
+                edge["valid_from"] = row[4]
+            if row[5]:
+                edge["valid_until"] = row[5]
+            edges.append(edge)
+        return edges
+
+    def iter_related(
+        self,
+        entity_id: str,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_of: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Get the entities directly related to an entity with a single query.
+
+        Each direction is a join of the edges on the anchor column with the
+        node at the other end; the two are combined with UNION ALL so that,
+        without an ordering, SQLite stops reading as soon as the limit is met.
+
+        Args:
+            entity_id: The ID of the entity.
+            rel_types: Optional relationship types to include.
+            direction: "outgoing", "incoming" or "both".
+            order_by: Optional ordering, "timestamp" or "-timestamp".
+            limit: Optional maximum number of rows.
+            as_of: Optional point in time to filter by validity.
+
+        Returns:
+            An iterator over ``{"node", "edge", "direction"}`` dictionaries,
+            read from the cursor as it is consumed.
+
+        Raises:
+            ValueError: If the direction or ordering is not supported.
+            GraphQueryError: If the query fails.
+        """
+        sort = check_related_query(direction, order_by)
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        rels = [str(getattr(rel, "value", rel)).upper() for rel in rel_types or []]
+        key = as_of_key(as_of) if as_of is not None else None
+
+        branches = []
+        params: List[Any] = []
+        for branch, anchor, other in (("outgoing", "src", "dst"), ("incoming", "dst", "src")):
+            if direction not in (branch, "both"):
+                continue
+            branch_sql = f"""
+                SELECT '{branch}' AS direction, e.src, e.dst, e.rel, e.properties,
+                       e.valid_from, e.valid_until, n.id, n.type, n.title, n.body,
+                       n.timestamp AS timestamp, n.repo_id, n.extra, n.url
+                FROM edges e JOIN nodes n ON n.id = e.{other}
+                WHERE e.{anchor} = ?
+                """
+            params.append(entity_id)
+            if rels:
+                branch_sql += f" AND e.rel IN ({', '.join('?' for _ in rels)})"
+                params.extend(rels)
+            if key is not None:
+                branch_sql += f" AND {edge_valid_sql('e')} AND {node_valid_sql('n')}"
+                params.extend((key, key, key, key))
+            branches.append(branch_sql)
+
+        query = " UNION ALL ".join(branches)
+        if sort:
+            query += f" ORDER BY timestamp {sort}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        try:
+            cursor = self.conn.execute(query, params)
+        except Exception as e:
+            error_msg = f"Failed to get related entities: {e}"
+            logger.error(error_msg)
+            raise GraphQueryError(
+                f"Failed to get entities related to '{entity_id}': {e}",
+                details={
+                    "entity_id": entity_id,
+                    "direction": direction,
+                    "error": str(e),
+                }
+            )
+        return self._related_rows(cursor)
+
+    @staticmethod
+    def _related_rows(cursor: Any) -> Iterator[Dict[str, Any]]:
+        """Convert iter_related rows to node and edge dictionaries lazily."""
+        for row in cursor:
+            edge = {
+                "src": row[1],
+                "dst": row[2],
+                "rel": row[3],
+                "properties": json.loads(row[4]) if row[4] else {},
+            }
+            if row[5]:
+                edge["valid_from"] = row[5]
+            if row[6]:
+                edge["valid_until"] = row[6]
+            node = {
+                "id": row[7],
+                "type": row[8],
+                "title": row[9],
+                "body": row[10],
+                "timestamp": row[11],
+                "repo_id": row[12],
+                "extra": json.loads(row[13]) if row[13] else {},
+            }
+            if row[14]:
+                node["url"] = row[14]
+            yield {"node": node, "edge": edge, "direction": row[0]}
+
     def search_entities(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for entities in the database.
 
@@ -882,86 +1046,146 @@ class SQLiteAdapter:
 
     # Helper methods for node field extraction
 
-    def _set_default_temporal_fields(self, node: Node) -> None:
-        """Set default temporal fields based on timestamp if not already set.
-
-        Args:
-            node: The node to update.
-        """
-        # Set created_at based on ts if not already set
-        if hasattr(node, 'created_at') and node.created_at is None and hasattr(node, 'ts') and node.ts:
-            node.created_at = node.ts
-
-        # Set updated_at based on ts if not already set
-        if hasattr(node, 'updated_at') and node.updated_at is None and hasattr(node, 'ts') and node.ts:
-            node.updated_at = node.ts
-
-    def _get_datetime_field_as_iso(self, node: Node, field_name: str) -> Optional[str]:
-        """Get a datetime field as ISO format string.
+    def _embedding_to_bytes(self, embedding: Optional[List[float]]) -> Optional[bytes]:
+        """Convert an embedding vector to bytes.
 
         Args:
-            node: The node to extract from.
-            field_name: The name of the datetime field.
+            embedding: The embedding vector, or None.
 
         Returns:
-            The field value as ISO format string, or None if not present.
+            The embedding as bytes, or None if there is no embedding.
         """
-        if hasattr(node, field_name) and getattr(node, field_name):
-            return getattr(node, field_name).isoformat()
-        return None
-
-    def _convert_embedding_to_bytes(self, node: Node) -> Optional[bytes]:
-        """Convert embedding to bytes if present.
-
-        Args:
-            node: The node with potential embedding.
-
-        Returns:
-            The embedding as bytes, or None if not present.
-        """
-        if not hasattr(node, 'embedding') or not node.embedding:
+        if not embedding:
             return None
 
         try:
             import numpy as np
-            return np.array(node.embedding, dtype=np.float32).tobytes()
+            return np.array(embedding, dtype=np.float32).tobytes()
         except ImportError:
             logger.warning("NumPy not available, storing embedding as JSON string")
             # Fall back to JSON string if NumPy is not available
-            return json.dumps(node.embedding).encode('utf-8')
+            return json.dumps(embedding).encode('utf-8')
         except Exception as e:
             logger.warning(f"Failed to convert embedding to bytes: {e}")
             return None
 
-    def _get_node_field(self, node: Node, field_name: str) -> Any:
-        """Get a field from a node if it exists.
+    def remove_repository_nodes(
+        self, repo_id: str, delete: bool = True, batch_size: Optional[int] = None
+    ) -> int:
+        """Delete or detach the nodes of a repository in batches.
+
+        Each batch of nodes is found through the repository index, and its
+        edges through the source and destination indexes, and is committed
+        as a short transaction of its own, so removing a large repository
+        never holds the write lock for long. An interrupted removal can be
+        resumed by calling this again. Inside a transaction opened by the
+        caller, all batches become part of that transaction.
 
         Args:
-            node: The node to extract from.
-            field_name: The name of the field.
+            repo_id: The ID of the repository.
+            delete: Whether to delete the nodes and their edges. If False, the
+                nodes are kept and their repo_id is cleared.
+            batch_size: Number of nodes per batch.
 
         Returns:
-            The field value, or None if not present.
+            The number of nodes deleted or detached.
+
+        Raises:
+            GraphBuildError: If removing the nodes fails.
         """
-        if hasattr(node, field_name):
-            return getattr(node, field_name)
-        return None
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        batch_size = batch_size or REPOSITORY_BATCH_SIZE
+        in_transaction = bool(getattr(self.conn, "in_transaction", False))
+        removed = 0
+        try:
+            while True:
+                if not in_transaction:
+                    self.conn.execute("BEGIN TRANSACTION")
+                ids = [
+                    row[0] for row in self.conn.execute(
+                        "SELECT id FROM nodes WHERE repo_id = ? LIMIT ?", (repo_id, batch_size)
+                    )
+                ]
+                if ids:
+                    placeholders = ", ".join("?" for _ in ids)
+                    if delete:
+                        self.conn.execute(f"DELETE FROM edges WHERE src IN ({placeholders})", ids)
+                        self.conn.execute(f"DELETE FROM edges WHERE dst IN ({placeholders})", ids)
+                        self.conn.execute(f"DELETE FROM nodes WHERE id IN ({placeholders})", ids)
+                    else:
+                        self.conn.execute(
+                            f"UPDATE nodes SET repo_id = NULL WHERE id IN ({placeholders})", ids
+                        )
+                    removed += len(ids)
+                if not in_transaction:
+                    self.conn.execute("COMMIT")
+                if len(ids) < batch_size:
+                    break
+        except Exception as e:
+            error_msg = f"Failed to remove nodes of repository {repo_id}: {e}"
+            logger.error(error_msg)
+            if not in_transaction:
+                try:
+                    self.conn.execute("ROLLBACK")
+                except Exception as rollback_error:
+                    logger.error(f"Failed to roll back transaction: {rollback_error}")
+            raise GraphBuildError(
+                error_msg,
+                details={
+                    "db_path": str(self.db_path),
+                    "repo_id": repo_id,
+                    "removed": removed,
+                    "error": str(e),
+                }
+            )
+
+        logger.info(f"{'Deleted' if delete else 'Detached'} {removed} nodes of repository {repo_id}")
+        return removed
 
-    def _get_metadata_json(self, node: Node) -> Optional[str]:
-        """Get metadata as JSON string, falling back to extra if needed.
+    def remove_repository(self, repo_id: str, delete_nodes: bool = False) -> int:
+        """Remove a repository, deleting or detaching its nodes first.
+
+        The nodes are removed in batches (see ``remove_repository_nodes``)
+        before the repository row, so an interrupted removal leaves the
+        repository listed and calling this again resumes it.
 
         Args:
-            node: The node to extract from.
+            repo_id: The ID of the repository.
+            delete_nodes: Whether to delete the nodes and their edges. If
+                False, the nodes are kept and their repo_id is cleared.
 
         Returns:
-            The metadata as JSON string, or None if not present.
+            The number of nodes deleted or detached.
+
+        Raises:
+            GraphBuildError: If removing the repository fails.
         """
-        if hasattr(node, 'metadata') and node.metadata:
-            return json.dumps(node.metadata, cls=DateTimeEncoder)
-        elif hasattr(node, 'extra') and node.extra:
-            # For backward compatibility
-            return json.dumps(node.extra, cls=DateTimeEncoder)
-        return None
+        removed = self.remove_repository_nodes(repo_id, delete=delete_nodes)
+
+        in_transaction = bool(getattr(self.conn, "in_transaction", False))
+        try:
+            self.conn.execute("DELETE FROM repositories WHERE id = ?", (repo_id,))
+            if not in_transaction:
+                self.conn.commit()
+        except Exception as e:
+            error_msg = f"Failed to remove repository {repo_id}: {e}"
+            logger.error(error_msg)
+            if not in_transaction:
+                try:
+                    self.conn.rollback()
+                except Exception as rollback_error:
+                    logger.error(f"Failed to roll back transaction: {rollback_error}")
+            raise GraphBuildError(
+                error_msg,
+                details={
+                    "db_path": str(self.db_path),
+                    "repo_id": repo_id,
+                    "error": str(e),
+                }
+            )
+        return removed
 
     def save_metadata(self, key: str, value: Any) -> None:
         """Save metadata to the database.
@@ -0,0 +1,119 @@
+"""Point-in-time ("as of") views of the knowledge graph.
+
+See arc_memory.sql.temporal for when nodes and edges count as valid.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from arc_memory.errors import DatabaseError
+from arc_memory.schema.models import EdgeRel
+from arc_memory.sql.temporal import as_of_key
+
+
+class AsOfAdapter:
+    """A read-only view of a database adapter at a point in time.
+
+    Node and edge lookups are passed to the wrapped adapter with ``as_of`` set,
+    so SDK functions that take an adapter answer as of that time without
+    changes. The view does not expose server-side traversal, so adapters that
+    support it fall back to per-node lookups, which filter by validity.
+    Calling a method that writes to the graph raises a `DatabaseError`;
+    everything else is delegated to the wrapped adapter.
+
+    Attributes:
+        adapter: The wrapped database adapter.
+        as_of: The point in time, as an ISO 8601 string.
+    """
+
+    def __init__(self, adapter: Any, as_of: Union[datetime, str]):
+        """Initialize the view.
+
+        Args:
+            adapter: The database adapter to wrap.
+            as_of: The point in time to view the graph at.
+        """
+        if isinstance(adapter, AsOfAdapter):
+            adapter = adapter.adapter
+        self.adapter = adapter
+        self.as_of = as_of_key(as_of)
+
+    # Adapter methods that change the database or the connection
+    _WRITE_METHODS = frozenset({
+        "add_nodes_and_edges",
+        "begin_transaction",
+        "commit_transaction",
+        "connect",
+        "init_db",
+        "remove_repository_nodes",
+        "rollback_transaction",
+        "save_metadata",
+        "save_refresh_timestamp",
+    })
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped adapter, except writes."""
+        attr = getattr(self.adapter, name)
+        if name not in self._WRITE_METHODS:
+            return attr
+
+        def read_only(*args: Any, **kwargs: Any) -> Any:
+            raise DatabaseError(
+                f"Cannot call {name} on a read-only view of the graph as of {self.as_of}",
+                details={"method": name, "as_of": self.as_of},
+            )
+
+        return read_only
+
+    def __repr__(self) -> str:
+        """Include the point in time, which also keeps SDK cache keys apart."""
+        return f"AsOfAdapter({self.adapter!r}, as_of={self.as_of!r})"
+
+    def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node by its ID if it was valid at the view's point in time."""
+        return self.adapter.get_node_by_id(node_id, as_of=self.as_of)
+
+    def get_edges_by_src(self, src_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+        """Get the outgoing edges that were valid at the view's point in time."""
+        return self.adapter.get_edges_by_src(src_id, rel_type=rel_type, as_of=self.as_of)
+
+    def get_edges_by_dst(self, dst_id: str, rel_type: Optional[EdgeRel] = None) -> List[Dict[str, Any]]:
+        """Get the incoming edges that were valid at the view's point in time."""
+        return self.adapter.get_edges_by_dst(dst_id, rel_type=rel_type, as_of=self.as_of)
+
+    def get_nodes_by_ids(self, node_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the nodes that were valid at the view's point in time."""
+        return self.adapter.get_nodes_by_ids(node_ids, as_of=self.as_of)
+
+    def get_edges_by_srcs(
+        self, src_ids: Sequence[str], rel_type: Optional[EdgeRel] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the outgoing edges of many nodes that were valid at the view's point in time."""
+        return self.adapter.get_edges_by_srcs(src_ids, rel_type=rel_type, as_of=self.as_of)
+
+    def get_edges_by_dsts(
+        self, dst_ids: Sequence[str], rel_type: Optional[EdgeRel] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the incoming edges of many nodes that were valid at the view's point in time."""
+        return self.adapter.get_edges_by_dsts(dst_ids, rel_type=rel_type, as_of=self.as_of)
+
+    def iter_related(
+        self,
+        entity_id: str,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Get the related entities that were valid at the view's point in time."""
+        return self.adapter.iter_related(
+            entity_id,
+            rel_types=rel_types,
+            direction=direction,
+            order_by=order_by,
+            limit=limit,
+            as_of=self.as_of,
+        )
+
+    def disconnect(self) -> None:
+        """Leave the wrapped adapter connected; the view does not own it."""
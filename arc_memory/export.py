@@ -4,14 +4,17 @@ This module provides functions for exporting a relevant slice of the knowledge g
 as a JSON file for use in GitHub App PR review workflows.
 """
 
+import functools
 import gzip
+import hashlib
+import itertools
 import json
 import os
 import re
 import subprocess
 from datetime import datetime, date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import git
 from git import Repo
@@ -26,9 +29,20 @@ from arc_memory.sql.db import (
     get_edges_by_src,
     get_node_by_id,
 )
+from arc_memory.sql.temporal import as_of_key, edge_valid_sql, node_valid_sql
 
 logger = get_logger(__name__)
 
+# Schema version of the export document (0.3 added causal relationship support)
+EXPORT_SCHEMA_VERSION = "0.3"
+
+# Supported export layouts and compression codecs
+EXPORT_FORMATS = ("json", "jsonl")
+EXPORT_COMPRESSIONS = ("gzip", "zstd")
+
+# Compact separators used for all export output
+_COMPACT_SEPARATORS = (",", ":")
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime and date objects."""
@@ -277,8 +291,9 @@ def get_recent_commits_for_file(
 
 def get_related_nodes(
     conn: Any, node_ids: List[str], max_hops: int = 1, include_adrs: bool = True,
-    include_causal: bool = False
-) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    include_causal: bool = False, as_of: Optional[Union[datetime, str]] = None,
+    ids_only: bool = False,
+) -> Tuple[List[Any], List[Dict[str, Any]]]:
     """Get nodes related to the specified nodes up to max_hops away.
 
     Args:
@@ -287,9 +302,13 @@ def get_related_nodes(
         max_hops: Maximum number of hops to traverse
         include_adrs: Whether to include all ADRs regardless of hop distance
         include_causal: Whether to include all causal nodes (decisions, implications, code changes)
+        as_of: Optional point in time; only nodes and edges valid at that time are included
+        ids_only: Return the IDs of the nodes instead of the nodes, so their
+            bodies aren't kept in memory (see ``iter_nodes_by_ids``)
 
     Returns:
-        Tuple of (nodes, edges) where each is a list of dictionaries
+        Tuple of (nodes, edges) where nodes is a list of dictionaries (or IDs)
+        and edges is a list of dictionaries
     """
     visited_nodes: Set[str] = set()
     visited_edges: Set[Tuple[str, str, str]] = set()
@@ -298,18 +317,28 @@ def get_related_nodes(
     nodes_result = []
     edges_result = []
 
+    # Point-in-time filters for the bulk queries
+    node_filter, edge_filter, as_of_params = "", "", ()
+    temporal: Dict[str, Any] = {}
+    if as_of is not None:
+        key = as_of_key(as_of)
+        node_filter = f" AND {node_valid_sql()}"
+        edge_filter = f" AND {edge_valid_sql()}"
+        as_of_params = (key, key)
+        temporal["as_of"] = key
+
     # If include_adrs is True, get all ADR nodes
     if include_adrs:
         try:
             cursor = conn.execute(
-                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?",
-                (NodeType.ADR.value,)
+                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?" + node_filter,
+                (NodeType.ADR.value,) + as_of_params
             )
             for row in cursor:
                 node_id = row[0]
                 if node_id not in visited_nodes:
                     visited_nodes.add(node_id)
-                    nodes_result.append({
+                    nodes_result.append(node_id if ids_only else {
                         "id": node_id,
                         "type": row[1],
                         "title": row[2],
@@ -325,14 +354,14 @@ def get_related_nodes(
             # Get all decision nodes
             logger.info("Including decision nodes in the export")
             cursor = conn.execute(
-                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?",
-                (NodeType.DECISION.value,)
+                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?" + node_filter,
+                (NodeType.DECISION.value,) + as_of_params
             )
             for row in cursor:
                 node_id = row[0]
                 if node_id not in visited_nodes:
                     visited_nodes.add(node_id)
-                    nodes_result.append({
+                    nodes_result.append(node_id if ids_only else {
                         "id": node_id,
                         "type": row[1],
                         "title": row[2],
@@ -343,14 +372,14 @@ def get_related_nodes(
             # Get all implication nodes
             logger.info("Including implication nodes in the export")
             cursor = conn.execute(
-                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?",
-                (NodeType.IMPLICATION.value,)
+                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?" + node_filter,
+                (NodeType.IMPLICATION.value,) + as_of_params
             )
             for row in cursor:
                 node_id = row[0]
                 if node_id not in visited_nodes:
                     visited_nodes.add(node_id)
-                    nodes_result.append({
+                    nodes_result.append(node_id if ids_only else {
                         "id": node_id,
                         "type": row[1],
                         "title": row[2],
@@ -361,14 +390,14 @@ def get_related_nodes(
             # Get all code change nodes
             logger.info("Including code change nodes in the export")
             cursor = conn.execute(
-                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?",
-                (NodeType.CODE_CHANGE.value,)
+                "SELECT id, type, title, body, extra FROM nodes WHERE type = ?" + node_filter,
+                (NodeType.CODE_CHANGE.value,) + as_of_params
             )
             for row in cursor:
                 node_id = row[0]
                 if node_id not in visited_nodes:
                     visited_nodes.add(node_id)
-                    nodes_result.append({
+                    nodes_result.append(node_id if ids_only else {
                         "id": node_id,
                         "type": row[1],
                         "title": row[2],
@@ -389,8 +418,8 @@ def get_related_nodes(
 
             placeholders = ", ".join(["?" for _ in causal_edge_types])
             cursor = conn.execute(
-                f"SELECT src, dst, rel, properties FROM edges WHERE rel IN ({placeholders})",
-                causal_edge_types
+                f"SELECT src, dst, rel, properties FROM edges WHERE rel IN ({placeholders})" + edge_filter,
+                causal_edge_types + list(as_of_params)
             )
 
             for row in cursor:
@@ -428,13 +457,17 @@ def get_related_nodes(
                 continue
 
             # Get the node
-            node = get_node_by_id(conn, node_id)
+            node = get_node_by_id(conn, node_id, **temporal)
             if node:
                 visited_nodes.add(node_id)
-                nodes_result.append(node)
+                nodes_result.append(node_id if ids_only else node)
+            elif as_of is not None and get_node_by_id(conn, node_id) is not None:
+                # The node exists but was not valid at that time, so don't
+                # reach through it
+                continue
 
             # Get outgoing edges
-            outgoing_edges = get_edges_by_src(conn, node_id)
+            outgoing_edges = get_edges_by_src(conn, node_id, **temporal)
             for edge in outgoing_edges:
                 edge_key = (edge["src"], edge["dst"], edge["rel"])
                 if edge_key not in visited_edges:
@@ -443,7 +476,7 @@ def get_related_nodes(
                     nodes_to_visit.add(edge["dst"])
 
             # Get incoming edges
-            incoming_edges = get_edges_by_dst(conn, node_id)
+            incoming_edges = get_edges_by_dst(conn, node_id, **temporal)
             for edge in incoming_edges:
                 edge_key = (edge["src"], edge["dst"], edge["rel"])
                 if edge_key not in visited_edges:
@@ -454,6 +487,44 @@ def get_related_nodes(
     return nodes_result, edges_result
 
 
+def iter_nodes_by_ids(conn: Any, node_ids: Iterable[str], chunk_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """Read nodes in chunks and yield them in the order of their IDs.
+
+    Only one chunk of nodes is held in memory at a time, so exports can stream
+    the nodes found by ``get_related_nodes(..., ids_only=True)``.
+
+    Args:
+        conn: Database connection
+        node_ids: IDs of the nodes; missing nodes are skipped
+        chunk_size: Number of nodes read per query
+
+    Yields:
+        Nodes in the format of ``get_node_by_id``
+    """
+    ids = list(node_ids)
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        placeholders = ", ".join("?" for _ in chunk)
+        cursor = conn.execute(
+            f"SELECT id, type, title, body, timestamp, extra FROM nodes WHERE id IN ({placeholders})",
+            chunk,
+        )
+        found = {
+            row[0]: {
+                "id": row[0],
+                "type": row[1],
+                "title": row[2],
+                "body": row[3],
+                "timestamp": row[4],
+                "extra": json.loads(row[5]) if row[5] else {},
+            }
+            for row in cursor
+        }
+        for node_id in chunk:
+            if node_id in found:
+                yield found[node_id]
+
+
 def extract_causal_relationships(export_data: Dict[str, Any]) -> Dict[str, Any]:
     """Extract causal relationships from the export data.
 
@@ -956,6 +1027,102 @@ def generate_thought_structures(export_data: Dict[str, Any]) -> List[Dict[str, A
     return thought_structures
 
 
+def format_export_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a single node according to the export schema.
+
+    Args:
+        node: Node dictionary as returned by the database helpers
+
+    Returns:
+        Formatted node dictionary
+    """
+    formatted_node = {
+        "id": node["id"],
+        "type": node["type"],
+        "metadata": {}
+    }
+
+    # Add type-specific fields
+    if node["type"] == NodeType.FILE.value:
+        formatted_node["path"] = node["extra"].get("path", "")
+        if "language" in node["extra"]:
+            formatted_node["metadata"]["language"] = node["extra"]["language"]
+    elif node["type"] == NodeType.COMMIT.value:
+        formatted_node["title"] = node["title"]
+        formatted_node["metadata"]["author"] = node["extra"].get("author", "")
+        formatted_node["metadata"]["sha"] = node["extra"].get("sha", "")
+    elif node["type"] == NodeType.PR.value:
+        formatted_node["title"] = node["title"]
+        formatted_node["metadata"]["number"] = node["extra"].get("number", 0)
+        formatted_node["metadata"]["state"] = node["extra"].get("state", "")
+        formatted_node["metadata"]["url"] = node["extra"].get("url", "")
+    elif node["type"] == NodeType.ISSUE.value:
+        formatted_node["title"] = node["title"]
+        formatted_node["metadata"]["number"] = node["extra"].get("number", 0)
+        formatted_node["metadata"]["state"] = node["extra"].get("state", "")
+        formatted_node["metadata"]["url"] = node["extra"].get("url", "")
+    elif node["type"] == NodeType.ADR.value:
+        formatted_node["title"] = node["title"]
+        formatted_node["path"] = node["extra"].get("path", "")
+        formatted_node["metadata"]["status"] = node["extra"].get("status", "")
+        formatted_node["metadata"]["decision_makers"] = node["extra"].get("decision_makers", [])
+    # Add causal node types
+    elif node["type"] == NodeType.DECISION.value:
+        formatted_node["title"] = node["title"]
+        if "body" in node:
+            formatted_node["body"] = node["body"]
+        formatted_node["metadata"]["decision_type"] = node["extra"].get("decision_type", "unknown")
+        formatted_node["metadata"]["confidence"] = node["extra"].get("confidence", 1.0)
+        if "decision_makers" in node["extra"]:
+            formatted_node["metadata"]["decision_makers"] = node["extra"]["decision_makers"]
+        if "source" in node["extra"]:
+            formatted_node["metadata"]["source"] = node["extra"]["source"]
+    elif node["type"] == NodeType.IMPLICATION.value:
+        formatted_node["title"] = node["title"]
+        if "body" in node:
+            formatted_node["body"] = node["body"]
+        formatted_node["metadata"]["implication_type"] = node["extra"].get("implication_type", "unknown")
+        formatted_node["metadata"]["severity"] = node["extra"].get("severity", "medium")
+        formatted_node["metadata"]["confidence"] = node["extra"].get("confidence", 1.0)
+        if "scope" in node["extra"]:
+            formatted_node["metadata"]["scope"] = node["extra"]["scope"]
+        if "source" in node["extra"]:
+            formatted_node["metadata"]["source"] = node["extra"]["source"]
+    elif node["type"] == NodeType.CODE_CHANGE.value:
+        formatted_node["title"] = node["title"]
+        if "body" in node:
+            formatted_node["body"] = node["body"]
+        formatted_node["metadata"]["change_type"] = node["extra"].get("change_type", "unknown")
+        formatted_node["metadata"]["confidence"] = node["extra"].get("confidence", 1.0)
+        if "files" in node["extra"]:
+            formatted_node["metadata"]["files"] = node["extra"]["files"]
+        if "description" in node["extra"]:
+            formatted_node["metadata"]["description"] = node["extra"]["description"]
+        if "author" in node["extra"]:
+            formatted_node["metadata"]["author"] = node["extra"]["author"]
+        if "commit_sha" in node["extra"]:
+            formatted_node["metadata"]["commit_sha"] = node["extra"]["commit_sha"]
+
+    return formatted_node
+
+
+def format_export_edge(edge: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a single edge according to the export schema.
+
+    Args:
+        edge: Edge dictionary as returned by the database helpers
+
+    Returns:
+        Formatted edge dictionary
+    """
+    return {
+        "src": edge["src"],
+        "dst": edge["dst"],
+        "type": edge["rel"],
+        "metadata": edge["properties"] if edge["properties"] else {}
+    }
+
+
 def format_export_data(
     pr_sha: str,
     nodes: List[Dict[str, Any]],
@@ -975,92 +1142,12 @@ def format_export_data(
     Returns:
         Formatted export data as a dictionary
     """
-    # Format nodes
-    formatted_nodes = []
-    for node in nodes:
-        formatted_node = {
-            "id": node["id"],
-            "type": node["type"],
-            "metadata": {}
-        }
-
-        # Add type-specific fields
-        if node["type"] == NodeType.FILE.value:
-            formatted_node["path"] = node["extra"].get("path", "")
-            if "language" in node["extra"]:
-                formatted_node["metadata"]["language"] = node["extra"]["language"]
-        elif node["type"] == NodeType.COMMIT.value:
-            formatted_node["title"] = node["title"]
-            formatted_node["metadata"]["author"] = node["extra"].get("author", "")
-            formatted_node["metadata"]["sha"] = node["extra"].get("sha", "")
-        elif node["type"] == NodeType.PR.value:
-            formatted_node["title"] = node["title"]
-            formatted_node["metadata"]["number"] = node["extra"].get("number", 0)
-            formatted_node["metadata"]["state"] = node["extra"].get("state", "")
-            formatted_node["metadata"]["url"] = node["extra"].get("url", "")
-        elif node["type"] == NodeType.ISSUE.value:
-            formatted_node["title"] = node["title"]
-            formatted_node["metadata"]["number"] = node["extra"].get("number", 0)
-            formatted_node["metadata"]["state"] = node["extra"].get("state", "")
-            formatted_node["metadata"]["url"] = node["extra"].get("url", "")
-        elif node["type"] == NodeType.ADR.value:
-            formatted_node["title"] = node["title"]
-            formatted_node["path"] = node["extra"].get("path", "")
-            formatted_node["metadata"]["status"] = node["extra"].get("status", "")
-            formatted_node["metadata"]["decision_makers"] = node["extra"].get("decision_makers", [])
-        # Add causal node types
-        elif node["type"] == NodeType.DECISION.value:
-            formatted_node["title"] = node["title"]
-            if "body" in node:
-                formatted_node["body"] = node["body"]
-            formatted_node["metadata"]["decision_type"] = node["extra"].get("decision_type", "unknown")
-            formatted_node["metadata"]["confidence"] = node["extra"].get("confidence", 1.0)
-            if "decision_makers" in node["extra"]:
-                formatted_node["metadata"]["decision_makers"] = node["extra"]["decision_makers"]
-            if "source" in node["extra"]:
-                formatted_node["metadata"]["source"] = node["extra"]["source"]
-        elif node["type"] == NodeType.IMPLICATION.value:
-            formatted_node["title"] = node["title"]
-            if "body" in node:
-                formatted_node["body"] = node["body"]
-            formatted_node["metadata"]["implication_type"] = node["extra"].get("implication_type", "unknown")
-            formatted_node["metadata"]["severity"] = node["extra"].get("severity", "medium")
-            formatted_node["metadata"]["confidence"] = node["extra"].get("confidence", 1.0)
-            if "scope" in node["extra"]:
-                formatted_node["metadata"]["scope"] = node["extra"]["scope"]
-            if "source" in node["extra"]:
-                formatted_node["metadata"]["source"] = node["extra"]["source"]
-        elif node["type"] == NodeType.CODE_CHANGE.value:
-            formatted_node["title"] = node["title"]
-            if "body" in node:
-                formatted_node["body"] = node["body"]
-            formatted_node["metadata"]["change_type"] = node["extra"].get("change_type", "unknown")
-            formatted_node["metadata"]["confidence"] = node["extra"].get("confidence", 1.0)
-            if "files" in node["extra"]:
-                formatted_node["metadata"]["files"] = node["extra"]["files"]
-            if "description" in node["extra"]:
-                formatted_node["metadata"]["description"] = node["extra"]["description"]
-            if "author" in node["extra"]:
-                formatted_node["metadata"]["author"] = node["extra"]["author"]
-            if "commit_sha" in node["extra"]:
-                formatted_node["metadata"]["commit_sha"] = node["extra"]["commit_sha"]
-
-        formatted_nodes.append(formatted_node)
-
-    # Format edges
-    formatted_edges = []
-    for edge in edges:
-        formatted_edge = {
-            "src": edge["src"],
-            "dst": edge["dst"],
-            "type": edge["rel"],
-            "metadata": edge["properties"] if edge["properties"] else {}
-        }
-        formatted_edges.append(formatted_edge)
+    formatted_nodes = [format_export_node(node) for node in nodes]
+    formatted_edges = [format_export_edge(edge) for edge in edges]
 
     # Create the export data
     export_data = {
-        "schema_version": "0.3",  # Updated schema version to reflect causal relationship support
+        "schema_version": EXPORT_SCHEMA_VERSION,
         "generated_at": datetime.now().isoformat(),
         "pr": {
             "sha": pr_sha,
@@ -1077,33 +1164,385 @@ def format_export_data(
     return export_data
 
 
-def sign_file(file_path: Path, key_id: Optional[str] = None) -> Optional[Path]:
-    """Sign a file using GPG.
+def get_export_path(
+    output_path: Path, compress: bool = True, compression: str = "gzip"
+) -> Path:
+    """Get the final path of an export file.
 
     Args:
-        file_path: Path to the file to sign
-        key_id: Optional GPG key ID to use for signing
+        output_path: Requested output path
+        compress: Whether the output is compressed
+        compression: Compression codec ("gzip" or "zstd")
 
     Returns:
-        Path to the signature file, or None if signing failed
+        The output path with the codec suffix appended when compressing
     """
-    sig_path = Path(f"{file_path}.sig")
+    if not compress:
+        return output_path
 
-    try:
-        cmd = ["gpg", "--detach-sign"]
+    suffix = ".gz" if compression == "gzip" else ".zst"
+    if str(output_path).endswith(suffix):
+        return output_path
+    return Path(f"{output_path}{suffix}")
+
+
+def iter_export_records(
+    export_data: Dict[str, Any]
+) -> Iterator[Dict[str, Any]]:
+    """Convert a formatted export document into newline-delimited records.
+
+    The first record is a header with the schema version and PR information,
+    followed by one record per node and per edge. Any additional top-level
+    sections (such as those added by ``optimize_export_for_llm``) are emitted
+    as trailing ``section`` records.
+
+    Args:
+        export_data: Export data as returned by ``format_export_data``
+
+    Yields:
+        Export records
+    """
+    yield {
+        "kind": "header",
+        "schema_version": export_data.get("schema_version", EXPORT_SCHEMA_VERSION),
+        "generated_at": export_data.get("generated_at"),
+        "pr": export_data.get("pr", {}),
+    }
+    for node in export_data.get("nodes", []):
+        yield {"kind": "node", **node}
+    for edge in export_data.get("edges", []):
+        yield {"kind": "edge", **edge}
+    for name, value in export_data.items():
+        if name in ("schema_version", "generated_at", "pr", "nodes", "edges"):
+            continue
+        yield {"kind": "section", "name": name, "data": value}
+
+
+def iter_raw_export_records(
+    pr_sha: str,
+    nodes: Iterable[Dict[str, Any]],
+    edges: Iterable[Dict[str, Any]],
+    changed_files: List[str],
+    sections: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Format and yield export records directly from raw nodes and edges.
+
+    Unlike ``format_export_data`` this never holds a formatted copy of the
+    whole graph in memory, so it is used for streaming newline-delimited
+    exports.
+
+    Args:
+        pr_sha: SHA of the PR head commit
+        nodes: Nodes to include
+        edges: Edges to include
+        changed_files: List of files changed in the PR
+        sections: Optional function returning additional top-level sections
+            (see ``LLMSectionCollector``), called once the edges are written
+
+    Yields:
+        Export records
+    """
+    yield {
+        "kind": "header",
+        "schema_version": EXPORT_SCHEMA_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "pr": {"sha": pr_sha, "changed_files": changed_files},
+    }
+    for node in nodes:
+        yield {"kind": "node", **format_export_node(node)}
+    for edge in edges:
+        yield {"kind": "edge", **format_export_edge(edge)}
+    if sections is not None:
+        for name, value in sections().items():
+            yield {"kind": "section", "name": name, "data": value}
+
+
+# Node types read by the sections added by optimize_export_for_llm
+_LLM_SECTION_NODE_TYPES = frozenset({
+    "concept", "function", "class", "file", "change_pattern",
+    NodeType.DECISION.value, NodeType.IMPLICATION.value, NodeType.CODE_CHANGE.value,
+})
+
+
+class LLMSectionCollector:
+    """Compute the LLM optimization sections of a streamed export.
+
+    ``optimize_export_for_llm`` only reads a few node types, so instead of
+    building the whole document, the nodes are passed through ``observe``
+    while they are written and only those types are kept (plus the type and
+    title of every other node, for decision points). The sections are then
+    computed from them once the nodes and edges have been written.
+
+    Example:
+        collector = LLMSectionCollector()
+        records = iter_raw_export_records(
+            pr_sha, collector.observe(nodes), edges, changed_files,
+            sections=functools.partial(collector.sections, edges),
+        )
+    """
+
+    def __init__(self):
+        """Initialize an empty collector."""
+        self.nodes: List[Dict[str, Any]] = []
+        self._others: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, nodes: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield the nodes unchanged, keeping what the sections need.
+
+        Args:
+            nodes: Raw nodes, as passed to ``format_export_node``
+
+        Yields:
+            The same nodes
+        """
+        for node in nodes:
+            node_type = node.get("type") or ""
+            if node_type in _LLM_SECTION_NODE_TYPES or node_type.startswith("reasoning_"):
+                self.nodes.append(format_export_node(node))
+            else:
+                formatted = format_export_node(node)
+                self._others[node["id"]] = {
+                    key: formatted[key] for key in ("id", "type", "title") if key in formatted
+                }
+            yield node
+
+    def sections(self, edges: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Compute the sections added by ``optimize_export_for_llm``.
+
+        Args:
+            edges: Raw edges of the export
+
+        Returns:
+            The sections, keyed by name
+        """
+        # Decision points referenced by reasoning nodes may be of any type
+        kept = {node["id"] for node in self.nodes}
+        decision_points = {
+            node["metadata"]["decision_point"] for node in self.nodes
+            if node["type"].startswith("reasoning_") and "decision_point" in node["metadata"]
+        }
+        nodes = self.nodes + [
+            self._others[node_id] for node_id in decision_points
+            if node_id not in kept and node_id in self._others
+        ]
+
+        data = optimize_export_for_llm({
+            "nodes": nodes,
+            "edges": [format_export_edge(edge) for edge in edges],
+        })
+        return {name: value for name, value in data.items() if name not in ("nodes", "edges")}
+
+
+class ExportWriter:
+    """Streaming writer for export files.
+
+    Output is encoded as compact JSON, compressed with gzip or zstd, hashed with
+    SHA-256 and, if requested, piped to ``gpg --detach-sign`` in the same pass.
+    The export is never materialized as a single string and the file is never
+    rewritten after signing.
+
+    Example:
+        with ExportWriter(path, compression="zstd", sign=True) as writer:
+            for record in iter_export_records(export_data):
+                writer.write_record(record)
+        print(writer.sha256, writer.signature_path)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compression: Optional[str] = None,
+        sign: bool = False,
+        key_id: Optional[str] = None,
+        buffer_size: int = 1 << 16,
+    ):
+        """Open the export file for writing.
+
+        Args:
+            path: Path of the file to write
+            compression: None, "gzip" or "zstd"
+            sign: Whether to produce a detached GPG signature next to the file
+            key_id: Optional GPG key ID to use for signing
+            buffer_size: Number of encoded characters to buffer before flushing
+
+        Raises:
+            ExportError: If the compression codec is not supported
+        """
+        if compression is not None and compression not in EXPORT_COMPRESSIONS:
+            raise ExportError(
+                f"Unsupported compression '{compression}'. "
+                f"Expected one of: {', '.join(EXPORT_COMPRESSIONS)}"
+            )
+
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self.signature_path: Optional[Path] = None
+        self.bytes_written = 0
+
+        self._hash = hashlib.sha256()
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._encoder = DateTimeEncoder(separators=_COMPACT_SEPARATORS)
+        self._signer: Optional[subprocess.Popen] = None
+        self._sig_path = Path(f"{self.path}.sig")
+        self._file = open(self.path, "wb")
+
+        if sign:
+            self._signer = self._start_signer(key_id)
+
+        if compression == "gzip":
+            self._stream: Any = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self
+            )
+        elif compression == "zstd":
+            import zstandard as zstd
+
+            self._stream = zstd.ZstdCompressor().stream_writer(self, closefd=False)
+        else:
+            self._stream = self
+
+        self._closed = False
+
+    def _start_signer(self, key_id: Optional[str]) -> Optional[subprocess.Popen]:
+        """Start a GPG process that signs everything written to its stdin."""
+        cmd = ["gpg", "--batch", "--yes", "--detach-sign"]
         if key_id:
             cmd.extend(["--local-user", key_id])
-        cmd.extend(["--output", str(sig_path), str(file_path)])
-
-        subprocess.run(cmd, check=True, capture_output=True)
-        logger.info(f"Signed file {file_path} with GPG")
-        return sig_path
-    except subprocess.CalledProcessError as e:
-        logger.error(f"GPG signing failed: {e.stderr.decode() if e.stderr else str(e)}")
-        return None
-    except Exception as e:
-        logger.error(f"Error signing file: {e}")
-        return None
+        cmd.extend(["--output", str(self._sig_path), "-"])
+
+        try:
+            return subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except Exception as e:
+            logger.error(f"Error starting GPG signer: {e}")
+            return None
+
+    def write(self, data: bytes) -> int:
+        """Write already-encoded (and compressed) bytes to the file.
+
+        This is the sink used by the compressors; callers should use
+        ``write_text``, ``write_record`` or ``write_document`` instead.
+        """
+        self._file.write(data)
+        self._hash.update(data)
+        self.bytes_written += len(data)
+
+        if self._signer is not None:
+            try:
+                self._signer.stdin.write(data)
+            except (BrokenPipeError, OSError) as e:
+                logger.error(f"GPG signing failed: {e}")
+                self._abort_signer()
+
+        return len(data)
+
+    def flush(self) -> None:
+        """Flush the underlying file."""
+        self._file.flush()
+
+    def write_text(self, text: str) -> None:
+        """Buffer text and flush it through the compressor when the buffer is full."""
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self._flush_buffer()
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        """Write a single newline-delimited JSON record."""
+        self.write_text(self._encoder.encode(record))
+        self.write_text("\n")
+
+    def write_document(self, data: Any) -> None:
+        """Write a complete JSON document incrementally."""
+        for chunk in self._encoder.iterencode(data):
+            self.write_text(chunk)
+
+    def write_streaming_document(
+        self,
+        data: Dict[str, Any],
+        trailer: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> None:
+        """Write a JSON object whose iterator values are written as arrays.
+
+        Items of an iterator value are encoded one at a time, so the array is
+        never held in memory.
+
+        Args:
+            data: The members of the object
+            trailer: Optional function returning more members, called after
+                the members of ``data`` (and their iterators) are written
+        """
+        def members() -> Iterator[Tuple[str, Any]]:
+            yield from data.items()
+            if trailer is not None:
+                yield from trailer().items()
+
+        self.write_text("{")
+        for i, (key, value) in enumerate(members()):
+            if i:
+                self.write_text(",")
+            self.write_text(self._encoder.encode(key) + ":")
+            if isinstance(value, Iterator):
+                self.write_text("[")
+                for j, item in enumerate(value):
+                    if j:
+                        self.write_text(",")
+                    self.write_document(item)
+                self.write_text("]")
+            else:
+                self.write_document(value)
+        self.write_text("}")
+
+    def _flush_buffer(self) -> None:
+        if self._buffer:
+            self._stream.write("".join(self._buffer).encode("utf-8"))
+            self._buffer = []
+            self._buffered = 0
+
+    def _abort_signer(self) -> None:
+        if self._signer is not None:
+            self._signer.kill()
+            self._signer.wait()
+            self._signer = None
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 digest of the bytes written so far."""
+        return self._hash.hexdigest()
+
+    def close(self) -> None:
+        """Finish compression, close the file and wait for the signature."""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._flush_buffer()
+        if self._stream is not self:
+            self._stream.close()
+        self._file.close()
+
+        if self._signer is not None:
+            _, stderr = self._signer.communicate()
+            if self._signer.returncode == 0:
+                logger.info(f"Signed file {self.path} with GPG")
+                self.signature_path = self._sig_path
+            else:
+                logger.error(
+                    f"GPG signing failed: {stderr.decode() if stderr else self._signer.returncode}"
+                )
+            self._signer = None
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self._abort_signer()
+        self.close()
 
 
 def export_graph(
@@ -1118,6 +1557,8 @@ def export_graph(
     max_hops: int = 3,
     enhance_for_llm: bool = True,
     include_causal: bool = True,
+    format: str = "json",
+    compression: str = "gzip",
 ) -> Path:
     """Export a relevant slice of the knowledge graph for a PR.
 
@@ -1133,6 +1574,9 @@ def export_graph(
         max_hops: Maximum number of hops to traverse in the graph
         enhance_for_llm: Whether to enhance the export data for LLM reasoning
         include_causal: Whether to include causal relationships in the export
+        format: Export layout, "json" for a single document or "jsonl" for
+            newline-delimited header, node and edge records
+        compression: Compression codec used when compress is True ("gzip" or "zstd")
 
     Returns:
         Path to the exported file
@@ -1140,6 +1584,12 @@ def export_graph(
     Raises:
         ExportError: If there's an error exporting the graph
     """
+    if format not in EXPORT_FORMATS:
+        raise ExportError(
+            f"Unsupported export format '{format}'. "
+            f"Expected one of: {', '.join(EXPORT_FORMATS)}"
+        )
+
     try:
         # Get the database connection
         conn = ensure_connection(db_path)
@@ -1224,7 +1674,7 @@ def export_graph(
         # Get related nodes and edges
         logger.info(f"Getting related nodes and edges (max_hops={max_hops})")
 
-        # Include causal relationships if requested
+        # Only node IDs are collected; the nodes are streamed into the file
         if include_causal:
             logger.info("Including causal relationships in the export")
             nodes, edges = get_related_nodes(
@@ -1232,64 +1682,59 @@ def export_graph(
                 file_nodes,
                 max_hops=max_hops,
                 include_adrs=True,
-                include_causal=True
+                include_causal=True,
+                ids_only=True,
             )
         else:
             nodes, edges = get_related_nodes(
                 conn,
                 file_nodes,
                 max_hops=max_hops,
-                include_adrs=True
+                include_adrs=True,
+                ids_only=True,
             )
 
         # Add the recent commits and edges
-        nodes.extend(all_nodes)
         edges.extend(all_edges)
+        logger.info(f"Found {len(nodes) + len(all_nodes)} nodes and {len(edges)} edges")
+        nodes = itertools.chain(iter_nodes_by_ids(conn, nodes), all_nodes)
 
-        logger.info(f"Found {len(nodes)} nodes and {len(edges)} edges")
-
-        # Format the export data
-        export_data = format_export_data(pr_sha, nodes, edges, modified_files)
-
-        # Optimize the export data for LLM reasoning if enabled
+        # The LLM optimization sections are computed from the nodes as they
+        # stream past and written after the edges
+        sections = None
         if enhance_for_llm:
-            export_data = optimize_export_for_llm(export_data)
-
-        # Write the export data to file
-        final_path = output_path
-        if compress:
-            # If compress is True, ensure the output path has .gz extension
-            if not str(output_path).endswith(".gz"):
-                final_path = Path(f"{output_path}.gz")
-
-            logger.info(f"Writing compressed export to {final_path}")
-            with gzip.open(final_path, "wt") as f:
-                json.dump(export_data, f, cls=DateTimeEncoder, indent=2)
-        else:
-            logger.info(f"Writing export to {output_path}")
-            with open(output_path, "w") as f:
-                json.dump(export_data, f, cls=DateTimeEncoder, indent=2)
+            collector = LLMSectionCollector()
+            nodes = collector.observe(nodes)
+            sections = functools.partial(collector.sections, edges)
+
+        # Write the export in a single streaming pass (signing included)
+        final_path = get_export_path(output_path, compress, compression)
+        logger.info(f"Writing {format} export to {final_path}")
+        with ExportWriter(
+            final_path,
+            compression=compression if compress else None,
+            sign=sign,
+            key_id=key_id,
+        ) as writer:
+            if format == "jsonl":
+                for record in iter_raw_export_records(
+                    pr_sha, nodes, edges, modified_files, sections=sections
+                ):
+                    writer.write_record(record)
+            else:
+                writer.write_streaming_document({
+                    "schema_version": EXPORT_SCHEMA_VERSION,
+                    "generated_at": datetime.now().isoformat(),
+                    "pr": {"sha": pr_sha, "changed_files": modified_files},
+                    "nodes": (format_export_node(node) for node in nodes),
+                    "edges": (format_export_edge(edge) for edge in edges),
+                }, trailer=sections)
 
-        # Sign the file if requested
         if sign:
-            logger.info("Signing the export file")
-            sig_path = sign_file(final_path, key_id)
-            if sig_path:
-                # Add signature info to the export data
-                export_data["sign"] = {
-                    "sig_path": str(sig_path)
-                }
-                if key_id:
-                    export_data["sign"]["gpg_fpr"] = key_id
-
-                # Rewrite the file with updated signature information
-                logger.info("Updating export file with signature information")
-                if compress:
-                    with gzip.open(final_path, "wt") as f:
-                        json.dump(export_data, f, cls=DateTimeEncoder, indent=2)
-                else:
-                    with open(final_path, "w") as f:
-                        json.dump(export_data, f, cls=DateTimeEncoder, indent=2)
+            if writer.signature_path:
+                logger.info(f"Signature written to {writer.signature_path}")
+            else:
+                logger.warning("Export file was written but could not be signed")
 
         return final_path
 
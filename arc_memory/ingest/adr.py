@@ -1,6 +1,5 @@
 """ADR ingestion for Arc Memory."""
 
-import glob
 import os
 import re
 from datetime import datetime
@@ -11,6 +10,7 @@ import yaml
 from markdown_it import MarkdownIt
 
 from arc_memory.errors import ADRParseError, IngestError
+from arc_memory.ingest.manifest import list_files
 from arc_memory.logging_conf import get_logger
 from arc_memory.schema.models import ADRNode, Edge, EdgeRel, NodeType
 
@@ -224,35 +224,34 @@ class ADRIngestor:
             logger.info("Performing incremental build")
 
         try:
-            # Find ADR files
-            adr_files = glob.glob(str(repo_path / glob_pattern), recursive=True)
-            logger.info(f"Found {len(adr_files)} ADR files")
-
-            # Filter for incremental builds
-            if last_processed and "files" in last_processed:
-                last_processed_files = last_processed["files"]
-                filtered_files = []
-                for adr_file in adr_files:
-                    rel_path = os.path.relpath(adr_file, repo_path)
-                    if rel_path not in last_processed_files:
-                        # New file
-                        filtered_files.append(adr_file)
-                    else:
-                        # Check if modified
-                        mtime = os.path.getmtime(adr_file)
-                        mtime_iso = datetime.fromtimestamp(mtime).isoformat()
-                        if mtime_iso > last_processed_files[rel_path]:
-                            filtered_files.append(adr_file)
-                logger.info(f"Filtered to {len(filtered_files)} modified ADR files")
-                adr_files = filtered_files
+            # Find ADR files with the git blob IDs of their content
+            manifest = list_files(repo_path, glob_pattern)
+            logger.info(f"Found {len(manifest)} ADR files")
+            adr_files = list(manifest)
+
+            # Only reprocess files whose content changed. Manifests written
+            # by older versions hold mtimes, which never match a blob ID, so
+            # those files are reprocessed once.
+            previous_files: Dict[str, str] = {}
+            if last_processed and isinstance(last_processed.get("files"), dict):
+                previous_files = last_processed["files"]
+                adr_files = [
+                    rel_path for rel_path, sha in manifest.items()
+                    if previous_files.get(rel_path) != sha
+                ]
+                logger.info(f"Filtered to {len(adr_files)} modified ADR files")
 
             # Process ADR files
             nodes = []
             edges = []
-            processed_files = {}
+            # Unchanged files keep their entries; deleted files are dropped
+            processed_files = {
+                rel_path: sha for rel_path, sha in manifest.items()
+                if previous_files.get(rel_path) == sha
+            }
 
-            for adr_file in adr_files:
-                rel_path = os.path.relpath(adr_file, repo_path)
+            for rel_path in adr_files:
+                adr_file = str(repo_path / rel_path)
                 logger.info(f"Processing ADR: {rel_path}")
 
                 try:
@@ -296,9 +295,8 @@ class ADRIngestor:
                     )
                     nodes.append(adr_node)
 
-                    # Store file modification time
-                    mtime = os.path.getmtime(adr_file)
-                    processed_files[rel_path] = datetime.fromtimestamp(mtime).isoformat()
+                    # Store the content hash
+                    processed_files[rel_path] = manifest[rel_path]
 
                     # In a real implementation, we would:
                     # 1. Parse the ADR to find mentioned files and commits
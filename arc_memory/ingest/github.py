@@ -2,9 +2,9 @@
 
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import git
 import requests
@@ -12,6 +12,7 @@ from git import Repo
 
 from arc_memory.auth.github import get_github_token, get_installation_token_for_repo
 from arc_memory.errors import GitHubAuthError, IngestError
+from arc_memory.ingest.github_fetcher import parse_github_time
 from arc_memory.logging_conf import get_logger
 from arc_memory.schema.models import Edge, EdgeRel, IssueNode, NodeType, PRNode
 
@@ -21,6 +22,10 @@ logger = get_logger(__name__)
 GITHUB_API_URL = "https://api.github.com"
 USER_AGENT = "Arc-Memory/0.5.0"
 
+# Number of most recently changed PRs (and, separately, issues) per repository
+# whose node IDs are kept to resolve mentions of items a delta sync skips
+MAX_KNOWN_IDS = 5000
+
 
 def get_repo_info(repo_path: Path) -> Tuple[str, str]:
     """Get the owner and name of a GitHub repository.
@@ -76,9 +81,130 @@ def get_repo_info(repo_path: Path) -> Tuple[str, str]:
         raise IngestError(f"Failed to get repository info: {e}")
 
 
+def _sync_state(last_processed: Optional[Dict[str, Any]], repo_key: str) -> Dict[str, Any]:
+    """Get the delta-sync state of a repository from the last ingest's metadata.
+
+    The state holds ``updated_at`` high-water marks for pull requests, issues
+    and comments, plus the node IDs of the most recently changed PRs and
+    issues so mentions of unchanged items still resolve.
+
+    Args:
+        last_processed: Metadata from the last build or refresh.
+        repo_key: The repository as ``owner/name``.
+
+    Returns:
+        The repository's sync state, empty for a full sync.
+    """
+    if not last_processed:
+        return {}
+    repositories = last_processed.get("repositories")
+    if isinstance(repositories, dict) and repo_key in repositories:
+        return dict(repositories[repo_key])
+
+    # Metadata written before per-repository cursors only has the time of the
+    # last build or refresh, which bounds both PRs and issues.
+    legacy = last_processed.get("timestamp") or last_processed.get("last_refresh")
+    if not legacy:
+        return {}
+    try:
+        datetime.fromisoformat(str(legacy).replace("Z", "+00:00"))
+    except ValueError as e:
+        logger.warning(f"Invalid timestamp in last_processed: {e}")
+        return {}
+    return {"pull_requests": legacy, "issues": legacy}
+
+
+def _advance_cursor(
+    current: Optional[str], processed: Iterable[Optional[str]], failed: Iterable[Optional[str]] = ()
+) -> Optional[str]:
+    """Move a high-water mark to the newest processed timestamp.
+
+    Items that failed hold the mark back to just before their own timestamp
+    so the next sync picks them up again.
+
+    Args:
+        current: The current mark.
+        processed: Timestamps of the items processed in this sync.
+        failed: Timestamps of the items that couldn't be processed.
+
+    Returns:
+        The new mark, or None if nothing has been seen yet.
+    """
+    latest = current
+    for value in processed:
+        if value and (latest is None or parse_github_time(value) > parse_github_time(latest)):
+            latest = value
+    for value in failed:
+        if value and latest is not None and parse_github_time(value) <= parse_github_time(latest):
+            latest = (parse_github_time(value) - timedelta(microseconds=1)).isoformat()
+    return latest
+
+
+def _already_synced(item: Dict[str, Any], cursor: Optional[str], ids: Dict[str, str]) -> bool:
+    """Check if an item is one the last sync processed.
+
+    The fetchers include items updated exactly at the cursor, so changes made
+    in the same second as the last sync aren't missed; the items that set the
+    cursor come back every time and are skipped here.
+    """
+    return bool(
+        cursor
+        and str(item.get("number")) in ids
+        and parse_github_time(item.get("updatedAt")) == parse_github_time(cursor)
+    )
+
+
+def merge_known_ids(ids: Dict[str, str], new_ids: Dict[str, str], limit: int = MAX_KNOWN_IDS) -> Dict[str, str]:
+    """Add newly changed items to a repository's known PR or issue IDs.
+
+    The IDs are kept in the order the items last changed, and only the
+    `limit` most recent ones are kept, so the sync state stays bounded.
+
+    Args:
+        ids: The known IDs by item number, least recently changed first.
+        new_ids: The IDs of the items that changed, least recently changed first.
+        limit: The maximum number of IDs to keep.
+
+    Returns:
+        The merged IDs.
+    """
+    merged = {number: node_id for number, node_id in ids.items() if number not in new_ids}
+    merged.update(new_ids)
+    if len(merged) > limit:
+        merged = dict(list(merged.items())[-limit:])
+    return merged
+
+
+def _changed_ids(items: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map the numbers of fetched items to their IDs, least recently changed first."""
+    # Listings are ordered by UPDATED_AT DESC
+    return {str(item["number"]): item["id"] for item in reversed(items) if "number" in item and "id" in item}
+
+
+def _known_items(ids: Dict[str, str], fetched: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Combine previously seen items with the fetched ones for mention resolution."""
+    known = [{"number": int(number), "id": node_id} for number, node_id in ids.items()]
+    return known + fetched
+
+
+def _comment_time(comment: Dict[str, Any]) -> Optional[str]:
+    """Get the time a comment last changed."""
+    return comment.get("updated_at") or comment.get("created_at")
+
+
 class GitHubIngestor:
     """Ingestor plugin for GitHub repositories."""
 
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Initialize the GitHub ingestor.
+
+        Args:
+            session: HTTP session for REST calls, kept by long-lived callers to
+                reuse connections between ingests. If None, each request opens
+                its own connection.
+        """
+        self.session = session
+
     def get_name(self) -> str:
         """Return the name of this plugin."""
         return "github"
@@ -150,32 +276,66 @@ class GitHubIngestor:
 
             # Initialize the GitHub fetcher
             from arc_memory.ingest.github_fetcher import GitHubFetcher
-            fetcher = GitHubFetcher(github_token)
+            fetcher = GitHubFetcher(github_token, session=self.session)
 
             # Get PRs
             pr_nodes = []
             pr_edges = []
 
-            # Determine if we need to do an incremental build
-            since = None
-            if last_processed and "timestamp" in last_processed:
-                try:
-                    since = datetime.fromisoformat(last_processed["timestamp"])
-                    logger.info(f"Performing incremental build since {since.isoformat()}")
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid timestamp in last_processed: {e}")
+            # Work out what changed since the last sync of this repository
+            repo_key = f"{owner}/{repo}"
+            state = _sync_state(last_processed, repo_key)
+            previous_repositories = dict((last_processed or {}).get("repositories") or {})
+            pr_since = parse_github_time(state["pull_requests"]) if state.get("pull_requests") else None
+            issue_since = parse_github_time(state["issues"]) if state.get("issues") else None
+            comments_since = parse_github_time(state["comments"]) if state.get("comments") else None
+            if pr_since or issue_since:
+                logger.info(
+                    f"Performing incremental build since {(pr_since or issue_since).isoformat()}"
+                )
+
+            # Timestamps that move the cursors forward
+            pr_times, failed_pr_times = [], []
+            issue_times, failed_issue_times = [], []
+            comment_times = []
 
             try:
                 # Fetch PRs
                 logger.info(f"Fetching PRs for {owner}/{repo}")
-                prs = fetcher.fetch_pull_requests_sync(owner, repo, since)
+                prs = fetcher.fetch_pull_requests_sync(owner, repo, pr_since)
                 logger.info(f"Fetched {len(prs)} PRs")
 
                 # Get issues (needed for mention edges)
                 logger.info(f"Fetching issues for {owner}/{repo}")
-                issues = fetcher.fetch_issues_sync(owner, repo, since)
+                issues = fetcher.fetch_issues_sync(owner, repo, issue_since)
                 logger.info(f"Fetched {len(issues)} issues")
 
+                # Mentions can point at items that haven't changed since the last sync
+                known_issues = _known_items(state.get("issue_ids", {}), issues)
+                known_prs = _known_items(state.get("pr_ids", {}), prs)
+                prs = [
+                    pr for pr in prs
+                    if not _already_synced(pr, state.get("pull_requests"), state.get("pr_ids", {}))
+                ]
+                issues = [
+                    issue for issue in issues
+                    if not _already_synced(issue, state.get("issues"), state.get("issue_ids", {}))
+                ]
+
+                def new_comments(comments: Any) -> List[Dict[str, Any]]:
+                    """Get the comments added or edited since the last sync."""
+                    if not isinstance(comments, list):
+                        return []
+                    fresh = []
+                    for comment in comments:
+                        if not (comment and isinstance(comment, dict)):
+                            continue
+                        comment_times.append(_comment_time(comment))
+                        if comments_since and parse_github_time(_comment_time(comment)) < comments_since:
+                            continue
+                        fresh.append(comment)
+                    return fresh
+
                 # Process each PR
                 for pr in prs:
                     try:
@@ -187,17 +347,19 @@ class GitHubIngestor:
                         # Check if pr_details is None before proceeding
                         if pr_details is None:
                             logger.error(f"Failed to fetch details for PR #{pr_number}, skipping")
+                            failed_pr_times.append(pr.get("updatedAt"))
                             continue
 
                         # Create PR node
                         pr_node = fetcher.create_pr_node(pr, pr_details)
                         pr_nodes.append(pr_node)
+                        pr_times.append(pr.get("updatedAt"))
 
                         # Create mention edges from PR body
                         try:
                             if pr.get("body"):
                                 mention_edges = fetcher.create_mention_edges(
-                                    pr_node.id, pr.get("body"), issues, prs
+                                    pr_node.id, pr.get("body"), known_issues, known_prs
                                 )
                                 pr_edges.extend(mention_edges)
                         except Exception as e:
@@ -205,13 +367,14 @@ class GitHubIngestor:
 
                         # Create mention edges from PR comments
                         try:
-                            if pr_details and isinstance(pr_details, dict) and pr_details.get("comments"):
-                                for comment in pr_details["comments"]:
-                                    if comment and isinstance(comment, dict) and comment.get("body"):
+                            if pr_details and isinstance(pr_details, dict):
+                                for comment in new_comments(pr_details.get("comments")):
+                                    if comment.get("body"):
                                         comment_mention_edges = fetcher.create_mention_edges(
-                                            pr_node.id, comment.get("body"), issues, prs
+                                            pr_node.id, comment.get("body"), known_issues, known_prs
                                         )
                                         pr_edges.extend(comment_mention_edges)
+                                new_comments(pr_details.get("review_comments"))
                         except Exception as e:
                             logger.warning(f"Error creating mention edges from PR comments for PR #{pr['number']}: {e}")
 
@@ -230,6 +393,7 @@ class GitHubIngestor:
                             logger.warning(f"Error creating MERGES edge for PR #{pr['number']}: {e}")
                     except Exception as e:
                         logger.error(f"Error processing PR #{pr['number']}: {e}")
+                        failed_pr_times.append(pr.get("updatedAt"))
                         # Continue with the next PR
 
                 # Get issues
@@ -247,17 +411,19 @@ class GitHubIngestor:
                         # Check if issue_details is None before proceeding
                         if issue_details is None:
                             logger.error(f"Failed to fetch details for issue #{issue_number}, skipping")
+                            failed_issue_times.append(issue.get("updatedAt"))
                             continue
 
                         # Create issue node
                         issue_node = fetcher.create_issue_node(issue, issue_details)
                         issue_nodes.append(issue_node)
+                        issue_times.append(issue.get("updatedAt"))
 
                         # Create mention edges from issue body
                         try:
                             if issue.get("body"):
                                 mention_edges = fetcher.create_mention_edges(
-                                    issue_node.id, issue.get("body"), issues, prs
+                                    issue_node.id, issue.get("body"), known_issues, known_prs
                                 )
                                 issue_edges.extend(mention_edges)
                         except Exception as e:
@@ -265,36 +431,51 @@ class GitHubIngestor:
 
                         # Create mention edges from issue comments
                         try:
-                            if issue_details and isinstance(issue_details, dict) and issue_details.get("comments"):
-                                for comment in issue_details["comments"]:
-                                    if comment and isinstance(comment, dict) and comment.get("body"):
+                            if issue_details and isinstance(issue_details, dict):
+                                for comment in new_comments(issue_details.get("comments")):
+                                    if comment.get("body"):
                                         comment_mention_edges = fetcher.create_mention_edges(
-                                            issue_node.id, comment.get("body"), issues, prs
+                                            issue_node.id, comment.get("body"), known_issues, known_prs
                                         )
                                         issue_edges.extend(comment_mention_edges)
                         except Exception as e:
                             logger.warning(f"Error creating mention edges from issue comments for issue #{issue['number']}: {e}")
                     except Exception as e:
                         logger.error(f"Error processing issue #{issue['number']}: {e}")
+                        failed_issue_times.append(issue.get("updatedAt"))
                         # Continue with the next issue
             except Exception as e:
                 logger.error(f"Error fetching GitHub data: {e}")
-                # Return empty results but don't fail the build
-                return [], [], {
+                # Return empty results but don't fail the build, keeping the
+                # cursors so the next sync resumes where the last one ended
+                error_metadata = {
                     "error": f"Error fetching GitHub data: {e}",
                     "timestamp": datetime.now().isoformat(),
                     "message": "GitHub data not fully included due to an error."
                 }
+                if previous_repositories:
+                    error_metadata["repositories"] = previous_repositories
+                return [], [], error_metadata
 
             # Combine nodes and edges
             nodes = pr_nodes + issue_nodes
             edges = pr_edges + issue_edges
 
+            # Advance the cursors past everything processed in this sync
+            previous_repositories[repo_key] = {
+                "pull_requests": _advance_cursor(state.get("pull_requests"), pr_times, failed_pr_times),
+                "issues": _advance_cursor(state.get("issues"), issue_times, failed_issue_times),
+                "comments": _advance_cursor(state.get("comments"), comment_times),
+                "pr_ids": merge_known_ids(state.get("pr_ids", {}), _changed_ids(prs)),
+                "issue_ids": merge_known_ids(state.get("issue_ids", {}), _changed_ids(issues)),
+            }
+
             # Create metadata
             metadata = {
                 "pr_count": len(pr_nodes),
                 "issue_count": len(issue_nodes),
                 "timestamp": datetime.now().isoformat(),
+                "repositories": previous_repositories,
             }
 
             logger.info(f"Processed {len(nodes)} GitHub nodes and {len(edges)} edges")
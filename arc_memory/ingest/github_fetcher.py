@@ -5,6 +5,8 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import requests
+
 from arc_memory.errors import GitHubAuthError, IngestError
 from arc_memory.ingest.github_graphql import (
     GitHubGraphQLClient,
@@ -19,19 +21,43 @@ from arc_memory.schema.models import Edge, EdgeRel, IssueNode, NodeType, PRNode
 
 logger = get_logger(__name__)
 
+# Sorts before every real timestamp, for items without one
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def parse_github_time(value: Optional[str]) -> datetime:
+    """Parse a GitHub API timestamp such as ``2024-05-01T12:00:00Z``.
+
+    Args:
+        value: The timestamp, in ISO 8601 format.
+
+    Returns:
+        A timezone-aware datetime; missing or invalid values parse as the
+        earliest representable time.
+    """
+    if not value:
+        return _EPOCH
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return _EPOCH
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 
 class GitHubFetcher:
     """Fetcher for GitHub data using GraphQL and REST APIs."""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: Optional[requests.Session] = None):
         """Initialize the GitHub fetcher.
 
         Args:
             token: GitHub token to use for API calls.
+            session: HTTP session for REST calls. If None, each request opens
+                its own connection.
         """
         self.token = token
         self.graphql_client = GitHubGraphQLClient(token)
-        self.rest_client = GitHubRESTClient(token)
+        self.rest_client = GitHubRESTClient(token, session=session)
 
     async def fetch_pull_requests(
         self, owner: str, repo: str, since: Optional[datetime] = None
@@ -63,27 +89,20 @@ class GitHubFetcher:
                 query = PULL_REQUESTS_QUERY
                 variables = {"owner": owner, "repo": repo}
 
-            # Execute the paginated query
-            prs = await self.graphql_client.paginate_query(
-                query, variables, ["repository", "pullRequests"]
-            )
-
-            # If we have a since parameter, filter the results manually
+            # Execute the paginated query. Results are ordered by most recently
+            # updated, so an incremental fetch stops at the first older one
             if since:
-                filtered_prs = []
-                for pr in prs:
-                    updated_at = datetime.fromisoformat(pr["updatedAt"].replace("Z", "+00:00"))
-
-                    # Ensure both datetimes are timezone-aware for accurate comparison
-                    if since.tzinfo is None:
-                        # If since is naive, make it timezone-aware with UTC
-                        since_aware = since.replace(tzinfo=timezone.utc)
-                    else:
-                        since_aware = since
-
-                    if updated_at >= since_aware:
-                        filtered_prs.append(pr)
-                prs = filtered_prs
+                since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+                prs = await self.graphql_client.paginate_query(
+                    query,
+                    variables,
+                    ["repository", "pullRequests"],
+                    stop_at=lambda item: parse_github_time(item.get("updatedAt")) < since_aware,
+                )
+            else:
+                prs = await self.graphql_client.paginate_query(
+                    query, variables, ["repository", "pullRequests"]
+                )
 
             logger.info(f"Fetched {len(prs)} pull requests")
             return prs
@@ -124,27 +143,20 @@ class GitHubFetcher:
                 query = ISSUES_QUERY
                 variables = {"owner": owner, "repo": repo}
 
-            # Execute the paginated query
-            issues = await self.graphql_client.paginate_query(
-                query, variables, ["repository", "issues"]
-            )
-
-            # If we have a since parameter, filter the results manually
+            # Execute the paginated query. Results are ordered by most recently
+            # updated, so an incremental fetch stops at the first older one
             if since:
-                filtered_issues = []
-                for issue in issues:
-                    updated_at = datetime.fromisoformat(issue["updatedAt"].replace("Z", "+00:00"))
-
-                    # Ensure both datetimes are timezone-aware for accurate comparison
-                    if since.tzinfo is None:
-                        # If since is naive, make it timezone-aware with UTC
-                        since_aware = since.replace(tzinfo=timezone.utc)
-                    else:
-                        since_aware = since
-
-                    if updated_at >= since_aware:
-                        filtered_issues.append(issue)
-                issues = filtered_issues
+                since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+                issues = await self.graphql_client.paginate_query(
+                    query,
+                    variables,
+                    ["repository", "issues"],
+                    stop_at=lambda item: parse_github_time(item.get("updatedAt")) < since_aware,
+                )
+            else:
+                issues = await self.graphql_client.paginate_query(
+                    query, variables, ["repository", "issues"]
+                )
 
             logger.info(f"Fetched {len(issues)} issues")
             return issues
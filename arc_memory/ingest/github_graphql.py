@@ -8,7 +8,7 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:
     import aiohttp
@@ -33,6 +33,7 @@ except ImportError:
 
 from arc_memory.errors import GitHubAuthError, IngestError
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import HTTP_REQUESTS, count
 
 logger = get_logger(__name__)
 
@@ -80,9 +81,11 @@ class GitHubGraphQLClient:
                 ssl=True,  # Explicitly verify SSL certificates
                 timeout=REQUEST_TIMEOUT,  # Set timeout to avoid GitHub's 10-second limit
             )
+            # The queries are fixed, so skip downloading GitHub's full schema
+            # (a large introspection request) for every new client
             self.client = Client(
                 transport=self.transport,
-                fetch_schema_from_transport=True,
+                fetch_schema_from_transport=False,
             )
         else:
             logger.warning("gql library not available, GraphQL client will not work")
@@ -120,6 +123,7 @@ class GitHubGraphQLClient:
                 query = gql(query_str)
 
                 # Execute the query
+                count(HTTP_REQUESTS)
                 result = await self.client.execute_async(query, variable_values=variables)
 
                 # Check for rate limit info in the result
@@ -242,6 +246,7 @@ class GitHubGraphQLClient:
         variables: Dict[str, Any],
         path: List[str],
         extract_nodes: bool = True,
+        stop_at: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> List[Dict[str, Any]]:
         """Execute a paginated GraphQL query.
 
@@ -250,6 +255,10 @@ class GitHubGraphQLClient:
             variables: Variables for the query.
             path: Path to the paginated field in the result.
             extract_nodes: Whether to extract nodes from the result.
+            stop_at: Optional predicate for queries ordered newest first, such
+                as ``orderBy: {field: UPDATED_AT, direction: DESC}``. Paging
+                stops at the first node it returns True for; that node and the
+                ones after it are not returned.
 
         Returns:
             A list of result items.
@@ -290,6 +299,12 @@ class GitHubGraphQLClient:
             # Extract nodes if requested
             if extract_nodes:
                 nodes = paginated_field.get("nodes", [])
+                if stop_at is not None:
+                    for index, node in enumerate(nodes):
+                        if stop_at(node):
+                            nodes = nodes[:index]
+                            has_next_page = False
+                            break
                 nodes_count = len(nodes)
                 all_items.extend(nodes)
             else:
@@ -337,6 +352,7 @@ class GitHubGraphQLClient:
         variables: Dict[str, Any],
         path: List[str],
         extract_nodes: bool = True,
+        stop_at: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> List[Dict[str, Any]]:
         """Execute a paginated GraphQL query synchronously.
 
@@ -345,6 +361,7 @@ class GitHubGraphQLClient:
             variables: Variables for the query.
             path: Path to the paginated field in the result.
             extract_nodes: Whether to extract nodes from the result.
+            stop_at: Optional predicate that ends paging; see paginate_query.
 
         Returns:
             A list of result items.
@@ -357,7 +374,7 @@ class GitHubGraphQLClient:
         loop = asyncio.new_event_loop()
         try:
             asyncio.set_event_loop(loop)
-            return loop.run_until_complete(self.paginate_query(query_str, variables, path, extract_nodes))
+            return loop.run_until_complete(self.paginate_query(query_str, variables, path, extract_nodes, stop_at))
         finally:
             loop.close()
 
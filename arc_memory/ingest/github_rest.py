@@ -8,6 +8,7 @@ import requests
 
 from arc_memory.errors import GitHubAuthError, IngestError
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import HTTP_REQUESTS, count
 
 logger = get_logger(__name__)
 
@@ -25,13 +26,16 @@ RATE_LIMIT_BUFFER = 100  # Buffer to avoid hitting rate limit
 class GitHubRESTClient:
     """REST client for GitHub API with rate limit handling and backoff strategies."""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: Optional[requests.Session] = None):
         """Initialize the REST client.
 
         Args:
             token: GitHub token to use for API calls.
+            session: HTTP session to send requests with, so connections can be
+                reused across clients. If None, every request opens its own.
         """
         self.token = token
+        self.http = session or requests
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
@@ -49,7 +53,8 @@ class GitHubRESTClient:
         """Update rate limit information from the GitHub API."""
         try:
             url = f"{GITHUB_API_URL}/rate_limit"
-            response = requests.get(url, headers=self.headers)
+            count(HTTP_REQUESTS)
+            response = self.http.get(url, headers=self.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -131,7 +136,8 @@ class GitHubRESTClient:
 
         while attempts <= retry_count:
             try:
-                response = requests.request(
+                count(HTTP_REQUESTS)
+                response = self.http.request(
                     method=method,
                     url=url,
                     headers=self.headers,
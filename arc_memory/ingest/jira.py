@@ -10,6 +10,7 @@ import requests
 from arc_memory.auth.jira import get_jira_token, get_cloud_id_from_env
 from arc_memory.errors import IngestError, JiraAuthError
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import HTTP_REQUESTS, count
 from arc_memory.schema.models import Edge, EdgeRel, IssueNode, Node, NodeType
 
 logger = get_logger(__name__)
@@ -206,6 +207,7 @@ class JiraClient:
         try:
             logger.debug(f"Making {method} request to {url}")
             
+            count(HTTP_REQUESTS)
             response = requests.request(
                 method,
                 url,
@@ -10,6 +10,7 @@ import requests
 from arc_memory.auth.linear import get_linear_token
 from arc_memory.errors import IngestError, LinearAuthError
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import HTTP_REQUESTS, count
 from arc_memory.schema.models import Edge, EdgeRel, IssueNode, Node, NodeType
 
 # Import these at runtime to avoid circular imports
@@ -85,15 +86,20 @@ query {
 class LinearGraphQLClient:
     """GraphQL client for Linear API."""
 
-    def __init__(self, token: str, is_oauth_token: bool = False):
+    def __init__(
+        self, token: str, is_oauth_token: bool = False, session: Optional[requests.Session] = None
+    ):
         """Initialize the GraphQL client.
 
         Args:
             token: Linear token to use for API calls.
             is_oauth_token: Whether the token is an OAuth token (requires "Bearer" prefix).
+            session: HTTP session to send requests with, so connections can be
+                reused across clients. If None, every request opens its own.
         """
         self.token = token
         self.is_oauth_token = is_oauth_token
+        self.http = session or requests
         self._setup_headers()
 
     def _setup_headers(self):
@@ -141,7 +147,8 @@ class LinearGraphQLClient:
 
         try:
             logger.info(f"Executing Linear GraphQL query with variables: {variables}")
-            response = requests.post(
+            count(HTTP_REQUESTS)
+            response = self.http.post(
                 LINEAR_API_URL,
                 headers=self.headers,
                 json={"query": query, "variables": variables},
@@ -227,6 +234,16 @@ class LinearGraphQLClient:
 class LinearIngestor:
     """Ingestor plugin for Linear issues."""
 
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Initialize the Linear ingestor.
+
+        Args:
+            session: HTTP session for API calls, kept by long-lived callers to
+                reuse connections between ingests. If None, each request opens
+                its own connection.
+        """
+        self.session = session
+
     def get_name(self) -> str:
         """Return the name of this plugin."""
         return "linear"
@@ -288,7 +305,7 @@ class LinearIngestor:
             # Initialize Linear client with appropriate token type
             # Avoid logging any part of the token for security
             logger.info(f"Initializing Linear client (OAuth: {is_oauth_token})")
-            client = LinearGraphQLClient(linear_token, is_oauth_token=is_oauth_token)
+            client = LinearGraphQLClient(linear_token, is_oauth_token=is_oauth_token, session=self.session)
 
             # First test connectivity with a simple viewer query
             try:
@@ -314,69 +331,9 @@ class LinearIngestor:
                 # Process issues
                 issues = data["issues"]["nodes"]
                 for issue in issues:
-                    issue_id = f"linear:{issue['id']}"
-                    issue_identifier = issue["identifier"]
-
-                    # Create labels list
-                    labels = []
-                    if issue["labels"] and "nodes" in issue["labels"]:
-                        for label in issue["labels"]["nodes"]:
-                            labels.append(label["name"])
-
-                    # Get state
-                    state = "unknown"
-                    if issue["state"]:
-                        state = issue["state"]["name"]
-
-                    # Parse timestamps
-                    created_at = datetime.fromisoformat(issue["createdAt"].replace("Z", "+00:00"))
-                    closed_at = None
-                    if issue["archivedAt"]:
-                        closed_at = datetime.fromisoformat(issue["archivedAt"].replace("Z", "+00:00"))
-
-                    # Extract numeric part from issue identifier (e.g., "ARC-10" -> 10)
-                    try:
-                        issue_number = int(issue_identifier.split('-')[-1])
-                    except (ValueError, IndexError):
-                        logger.warning(f"Could not parse issue number from identifier: {issue_identifier}, using 0")
-                        issue_number = 0
-
-                    # Create issue node
-                    issue_node = IssueNode(
-                        id=issue_id,
-                        type=NodeType.ISSUE,
-                        title=issue["title"],
-                        body=issue["description"],
-                        ts=created_at,
-                        number=issue_number,  # Use the extracted numeric part
-                        state=state,
-                        closed_at=closed_at,
-                        labels=labels,
-                        url=issue["url"],
-                        extra={
-                            "source": "linear",
-                            "identifier": issue_identifier,  # Store the original identifier
-                            "team": issue["team"]["key"] if issue["team"] else None,
-                            "assignee": issue["assignee"]["name"] if issue["assignee"] else None,
-                            "creator": issue["creator"]["name"] if issue["creator"] else None,
-                        },
-                    )
+                    issue_node, edge = create_linear_issue_node(issue, repo_path.name)
                     nodes.append(issue_node)
                     issue_count += 1
-
-                    # Create edges to commits and PRs based on branch naming or commit messages
-                    # This will be done by scanning Git commits and PRs for references to the issue
-                    # Format: TEAM-123 or team/TEAM-123
-
-                    # For now, we'll just create a placeholder edge to the repo
-                    edge = Edge(
-                        src=issue_id,
-                        dst=f"repo:{repo_path.name}",
-                        rel=EdgeRel.MENTIONS,
-                        properties={
-                            "source": "linear",
-                        },
-                    )
                     edges.append(edge)
 
                 # Check if there are more pages
@@ -400,6 +357,85 @@ class LinearIngestor:
             raise IngestError(f"Failed to ingest Linear issues: {e}")
 
 
+def create_linear_issue_node(issue: Dict[str, Any], repo_name: str) -> Tuple[IssueNode, Edge]:
+    """Create an issue node and its repository edge from Linear issue data.
+
+    Accepts issues from the GraphQL API (labels as a connection) and from
+    webhook payloads (labels as a list).
+
+    Args:
+        issue: The Linear issue data.
+        repo_name: Name of the repository the issue is linked to.
+
+    Returns:
+        A tuple of (issue node, edge to the repository).
+    """
+    issue_id = f"linear:{issue['id']}"
+    issue_identifier = issue["identifier"]
+
+    # Create labels list
+    labels = []
+    label_data = issue.get("labels")
+    if isinstance(label_data, dict):
+        label_data = label_data.get("nodes")
+    for label in label_data or []:
+        labels.append(label["name"])
+
+    # Get state
+    state = "unknown"
+    if issue.get("state"):
+        state = issue["state"]["name"]
+
+    # Parse timestamps
+    created_at = datetime.fromisoformat(issue["createdAt"].replace("Z", "+00:00"))
+    closed_at = None
+    if issue.get("archivedAt"):
+        closed_at = datetime.fromisoformat(issue["archivedAt"].replace("Z", "+00:00"))
+
+    # Extract numeric part from issue identifier (e.g., "ARC-10" -> 10)
+    try:
+        issue_number = int(issue_identifier.split('-')[-1])
+    except (ValueError, IndexError):
+        logger.warning(f"Could not parse issue number from identifier: {issue_identifier}, using 0")
+        issue_number = 0
+
+    # Create issue node
+    issue_node = IssueNode(
+        id=issue_id,
+        type=NodeType.ISSUE,
+        title=issue["title"],
+        body=issue.get("description"),
+        ts=created_at,
+        number=issue_number,  # Use the extracted numeric part
+        state=state,
+        closed_at=closed_at,
+        labels=labels,
+        url=issue["url"],
+        extra={
+            "source": "linear",
+            "identifier": issue_identifier,  # Store the original identifier
+            "team": issue["team"]["key"] if issue.get("team") else None,
+            "assignee": issue["assignee"]["name"] if issue.get("assignee") else None,
+            "creator": issue["creator"]["name"] if issue.get("creator") else None,
+        },
+    )
+
+    # Create edges to commits and PRs based on branch naming or commit messages
+    # This will be done by scanning Git commits and PRs for references to the issue
+    # Format: TEAM-123 or team/TEAM-123
+
+    # For now, we'll just create a placeholder edge to the repo
+    edge = Edge(
+        src=issue_id,
+        dst=f"repo:{repo_name}",
+        rel=EdgeRel.MENTIONS,
+        properties={
+            "source": "linear",
+        },
+    )
+    return issue_node, edge
+
+
 def extract_linear_issue_references(text: str) -> List[str]:
     """Extract Linear issue references from text.
 
@@ -0,0 +1,113 @@
+"""Content-hash manifests for incremental ingestion.
+
+Incremental ingestors remember a hash of every file or document they
+processed and only re-emit the ones whose hash changed. Modification times
+can't be used for this: a fresh checkout (as in CI) touches every file.
+
+Hashes are git blob IDs, so inside a repository they come straight from the
+index and unchanged files are never read. Files that differ from the index,
+untracked files and files outside a repository are hashed the same way.
+"""
+
+import glob
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Union
+
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+
+def blob_id(data: Union[bytes, str]) -> str:
+    """Compute the git blob ID of some content.
+
+    Args:
+        data: The content. Strings are encoded as UTF-8.
+
+    Returns:
+        The hex SHA-1 that `git hash-object` would give the content.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def file_blob_id(path: Union[str, Path]) -> str:
+    """Compute the git blob ID of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The hex SHA-1 of the file's content as a git blob.
+    """
+    with open(path, "rb") as f:
+        return blob_id(f.read())
+
+
+def _git_ls_files(repo_path: Path, pathspec: str, *options: str) -> List[str]:
+    """Run `git ls-files` and split its NUL-terminated output."""
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "ls-files", "-z", *options, "--", pathspec],
+        capture_output=True,
+        check=True,
+    )
+    return [entry for entry in result.stdout.decode("utf-8", "surrogateescape").split("\0") if entry]
+
+
+def _list_git_files(repo_path: Path, glob_pattern: str) -> Dict[str, str]:
+    """List the files matching a glob pattern with git.
+
+    Raises:
+        OSError: If git isn't installed.
+        subprocess.CalledProcessError: If the path isn't in a git work tree.
+    """
+    pathspec = f":(glob){glob_pattern}"
+    files: Dict[str, str] = {}
+
+    # Each staged entry is "<mode> <blob ID> <stage>\t<path>"
+    for entry in _git_ls_files(repo_path, pathspec, "--stage"):
+        info, rel_path = entry.split("\t", 1)
+        files[rel_path] = info.split(" ")[1]
+
+    # Files that differ from the index, and untracked ones, are hashed here
+    dirty = _git_ls_files(repo_path, pathspec, "--modified")
+    dirty += _git_ls_files(repo_path, pathspec, "--others", "--exclude-standard")
+    for rel_path in dirty:
+        try:
+            files[rel_path] = file_blob_id(repo_path / rel_path)
+        except FileNotFoundError:
+            # Deleted from the work tree
+            files.pop(rel_path, None)
+
+    return {os.path.normpath(rel_path): sha for rel_path, sha in files.items()}
+
+
+def list_files(repo_path: Path, glob_pattern: str) -> Dict[str, str]:
+    """List the files matching a glob pattern with their git blob IDs.
+
+    Inside a git work tree, files are found with `git ls-files` (tracked and
+    untracked but not ignored) and unchanged files aren't read. Elsewhere,
+    the pattern is globbed and every file is hashed.
+
+    Args:
+        repo_path: Path to the repository.
+        glob_pattern: Glob pattern relative to the repository, e.g. "**/adr-*.md".
+
+    Returns:
+        A dictionary mapping paths relative to the repository to blob IDs.
+    """
+    repo_path = Path(repo_path)
+    try:
+        return _list_git_files(repo_path, glob_pattern)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.debug(f"Not using git to list {glob_pattern} in {repo_path}: {e}")
+
+    files = {}
+    for path in glob.glob(str(repo_path / glob_pattern), recursive=True):
+        if os.path.isfile(path):
+            files[os.path.relpath(path, repo_path)] = file_blob_id(path)
+    return files
@@ -1,5 +1,6 @@
 """Notion ingestion for Arc Memory."""
 
+import json
 import re
 from datetime import datetime
 from pathlib import Path
@@ -9,7 +10,9 @@ import requests
 
 from arc_memory.auth.notion import get_notion_token
 from arc_memory.errors import IngestError, NotionAuthError
+from arc_memory.ingest.manifest import blob_id
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import HTTP_REQUESTS, count
 from arc_memory.schema.models import DocumentNode, Edge, EdgeRel, Node, NodeType
 
 logger = get_logger(__name__)
@@ -60,6 +63,7 @@ class NotionClient:
         try:
             logger.debug(f"Making {method} request to {url}")
 
+            count(HTTP_REQUESTS)
             response = requests.request(
                 method, url, headers=self.headers, params=params, json=data
             )
@@ -239,23 +243,32 @@ class NotionIngestor:
             if last_processed and "timestamp" in last_processed:
                 try:
                     last_updated = datetime.fromisoformat(last_processed["timestamp"])
+                    # Timestamps are saved in local time; Notion's are in UTC
+                    if last_updated.tzinfo is None:
+                        last_updated = last_updated.astimezone()
                     logger.info(f"Using last updated timestamp: {last_updated}")
                 except (ValueError, TypeError):
                     logger.warning("Invalid timestamp in last_processed, performing full build")
 
+            # Content hashes of the pages and databases already ingested, so
+            # edits that don't change the content don't re-emit nodes
+            content_hashes: Dict[str, str] = {}
+            if last_processed and isinstance(last_processed.get("content_hashes"), dict):
+                content_hashes.update(last_processed["content_hashes"])
+
             # Fetch pages and databases
             page_count, database_count = 0, 0
 
             # Search for pages
             pages = self._fetch_all_pages(client, last_updated)
-            page_nodes, page_edges = self._process_pages(client, pages)
+            page_nodes, page_edges = self._process_pages(client, pages, content_hashes)
             nodes.extend(page_nodes)
             edges.extend(page_edges)
             page_count = len(page_nodes)
 
             # Search for databases
             databases = self._fetch_all_databases(client, last_updated)
-            db_nodes, db_edges = self._process_databases(client, databases)
+            db_nodes, db_edges = self._process_databases(client, databases, content_hashes)
             nodes.extend(db_nodes)
             edges.extend(db_edges)
             database_count = len(db_nodes)
@@ -265,6 +278,7 @@ class NotionIngestor:
                 "page_count": page_count,
                 "database_count": database_count,
                 "timestamp": datetime.now().isoformat(),
+                "content_hashes": content_hashes,
             }
 
             logger.info(f"Processed {page_count} Notion pages and {database_count} databases")
@@ -371,12 +385,20 @@ class NotionIngestor:
 
         return all_databases
 
-    def _process_pages(self, client: NotionClient, pages: List[Dict[str, Any]]) -> Tuple[List[Node], List[Edge]]:
+    def _process_pages(
+        self,
+        client: NotionClient,
+        pages: List[Dict[str, Any]],
+        content_hashes: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[Node], List[Edge]]:
         """Process Notion pages into nodes and edges.
 
         Args:
             client: Notion client.
             pages: List of pages to process.
+            content_hashes: Content hashes by node ID of the pages already
+                ingested. Pages whose hash is unchanged are skipped, and the
+                hashes of the others are updated in place.
 
         Returns:
             Tuple of (nodes, edges).
@@ -404,13 +426,22 @@ class NotionIngestor:
             if last_edited_time:
                 updated_at = datetime.fromisoformat(last_edited_time.replace("Z", "+00:00"))
 
-            # Create page node
+            # Skip pages whose content hasn't changed since the last build
             node_id = f"notion:page:{page_id}"
+            body = self._get_page_content(client, page_id)
+            parent_info = self._get_parent_info(page)
+            if content_hashes is not None:
+                content_hash = self._content_hash(title, body, parent_info)
+                if content_hashes.get(node_id) == content_hash:
+                    continue
+                content_hashes[node_id] = content_hash
+
+            # Create page node
             page_node = DocumentNode(
                 id=node_id,
                 type=NodeType.DOCUMENT,
                 title=title,
-                body=self._get_page_content(client, page_id),
+                body=body,
                 ts=created_at,
                 created_at=created_at,
                 updated_at=updated_at,
@@ -421,13 +452,12 @@ class NotionIngestor:
                     "source": "notion",
                     "notion_id": page_id,
                     "notion_type": "page",
-                    "parent": self._get_parent_info(page),
+                    "parent": parent_info,
                 }
             )
             nodes.append(page_node)
 
             # Create parent-child edge if parent exists
-            parent_info = self._get_parent_info(page)
             if parent_info and "id" in parent_info:
                 parent_id = parent_info["id"]
                 parent_type = parent_info["type"]
@@ -445,12 +475,20 @@ class NotionIngestor:
 
         return nodes, edges
 
-    def _process_databases(self, client: NotionClient, databases: List[Dict[str, Any]]) -> Tuple[List[Node], List[Edge]]:
+    def _process_databases(
+        self,
+        client: NotionClient,
+        databases: List[Dict[str, Any]],
+        content_hashes: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[Node], List[Edge]]:
         """Process Notion databases into nodes and edges.
 
         Args:
             client: Notion client.
             databases: List of databases to process.
+            content_hashes: Content hashes by node ID of the databases already
+                ingested. Databases whose hash is unchanged are skipped, and
+                the hashes of the others are updated in place.
 
         Returns:
             Tuple of (nodes, edges).
@@ -478,8 +516,16 @@ class NotionIngestor:
             if last_edited_time:
                 updated_at = datetime.fromisoformat(last_edited_time.replace("Z", "+00:00"))
 
-            # Create database node
+            # Skip databases whose content hasn't changed since the last build
             node_id = f"notion:database:{db_id}"
+            parent_info = self._get_parent_info(db)
+            if content_hashes is not None:
+                content_hash = self._content_hash(title, db.get("properties", {}), parent_info)
+                if content_hashes.get(node_id) == content_hash:
+                    continue
+                content_hashes[node_id] = content_hash
+
+            # Create database node
             db_node = DocumentNode(
                 id=node_id,
                 type=NodeType.DOCUMENT,
@@ -495,14 +541,13 @@ class NotionIngestor:
                     "source": "notion",
                     "notion_id": db_id,
                     "notion_type": "database",
-                    "parent": self._get_parent_info(db),
+                    "parent": parent_info,
                     "properties": db.get("properties", {}),
                 }
             )
             nodes.append(db_node)
 
             # Create parent-child edge if parent exists
-            parent_info = self._get_parent_info(db)
             if parent_info and "id" in parent_info:
                 parent_id = parent_info["id"]
                 parent_type = parent_info["type"]
@@ -653,6 +698,18 @@ class NotionIngestor:
 
         return None
 
+    @staticmethod
+    def _content_hash(*parts: Any) -> str:
+        """Hash the content of a page or database.
+
+        Args:
+            parts: The JSON-serializable parts of the content.
+
+        Returns:
+            The git blob ID of the parts serialized as JSON.
+        """
+        return blob_id(json.dumps(parts, sort_keys=True, default=str))
+
     def _get_page_content(self, client: NotionClient, page_id: str) -> str:
         """Get the content of a page.
 
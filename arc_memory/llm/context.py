@@ -0,0 +1,152 @@
+"""Compact, token-budgeted context for LLM prompts.
+
+Retrieved graph nodes used to be sent to the LLM as indented JSON with their
+full bodies, so prompts grew without bound as more results were requested.
+`pack_context` instead writes one header line per node plus a truncated body
+excerpt, drops near-duplicate bodies, and stops adding nodes once a token
+budget is reached.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+# Default token budget for the packed nodes
+DEFAULT_CONTEXT_TOKEN_BUDGET = 1500
+
+# Default maximum length of a node body excerpt, in characters
+DEFAULT_MAX_BODY_CHARS = 600
+
+# Maximum length of a node title, in characters
+MAX_TITLE_CHARS = 160
+
+# Node fields shown in the header line, in order
+_HEADER_FIELDS = ("timestamp", "status", "state", "labels", "author")
+
+# Node fields that are never sent to the LLM
+_SKIPPED_FIELDS = {"id", "type", "title", "body", "url", "hash", "relevance", "score"}
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text without a tokenizer.
+
+    Counts punctuation marks as one token and words as one token per four
+    characters, which is close to BPE tokenizers on English text and code.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The estimated number of tokens.
+    """
+    return sum(math.ceil(len(token) / 4) for token in _TOKEN_RE.findall(text))
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Collapse whitespace and cut a text at a word boundary."""
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars)
+    return text[:cut if cut > max_chars // 2 else max_chars].rstrip() + "..."
+
+
+def _fingerprint(body: str) -> str:
+    """Get a key under which near-identical bodies compare equal."""
+    return re.sub(r"[^a-z0-9]+", "", body.lower())[:500]
+
+
+def _rank(nodes: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort nodes by score, keeping the given order for ties and unscored nodes."""
+    def score(node: Dict[str, Any]) -> float:
+        value = node.get("relevance", node.get("score"))
+        return -value if isinstance(value, (int, float)) else 0.0
+
+    return sorted(nodes, key=score)
+
+
+def _header(index: int, node: Dict[str, Any]) -> str:
+    """Format the header line of a node."""
+    parts = [f"[{index}] {node.get('type', 'unknown')} {node.get('id', '')}"]
+    for field in _HEADER_FIELDS:
+        value = node.get(field)
+        if value in (None, "", []):
+            continue
+        if field == "timestamp":
+            value = str(value)[:10]
+        elif isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        parts.append(str(value) if field in ("timestamp", "status", "state") else f"{field}={value}")
+    for field, value in node.items():
+        if field in _SKIPPED_FIELDS or field in _HEADER_FIELDS or isinstance(value, (dict, list)):
+            continue
+        if value not in (None, ""):
+            parts.append(f"{field}={_truncate(str(value), 80)}")
+    title = node.get("title")
+    if title:
+        parts.append(_truncate(str(title), MAX_TITLE_CHARS))
+    return " | ".join(parts)
+
+
+def pack_context(
+    nodes: Sequence[Dict[str, Any]],
+    token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET,
+    max_body_chars: int = DEFAULT_MAX_BODY_CHARS,
+    header: Optional[str] = None,
+) -> str:
+    """Pack retrieved nodes into a compact, line-oriented prompt context.
+
+    Nodes are ranked by their `relevance` (or `score`) and added until the
+    token budget is spent. Each node gets a header line with its type, ID, date,
+    status and title, followed by an indented body excerpt. Bodies that repeat
+    an earlier node's body, such as a merge commit restating its PR, point to
+    that node instead. A node that doesn't fit is added without its body if
+    its header still fits; the number of omitted nodes is noted at the end.
+
+    Args:
+        nodes: The retrieved nodes, as formatted by the search.
+        token_budget: Maximum estimated tokens of the packed context.
+        max_body_chars: Maximum length of a body excerpt, in characters.
+        header: Optional first line; defaults to a description of the format.
+
+    Returns:
+        The packed context.
+    """
+    ranked = _rank(nodes)
+    if header is None:
+        header = (
+            f"{len(ranked)} graph nodes, most relevant first. "
+            "Each is `[n] type id | date | status | fields | title`, then an indented excerpt of its body."
+        )
+    lines = [header]
+    used = estimate_tokens(header)
+    seen_bodies: Dict[str, int] = {}
+    omitted = 0
+
+    for index, node in enumerate(ranked, start=1):
+        node_lines = [_header(index, node)]
+        body = node.get("body")
+        fingerprint = _fingerprint(str(body)) if body else None
+        if fingerprint in seen_bodies:
+            node_lines.append(f"  (body same as [{seen_bodies[fingerprint]}])")
+        elif body:
+            node_lines.append("  " + _truncate(str(body), max_body_chars))
+
+        cost = estimate_tokens("\n".join(node_lines))
+        if used + cost > token_budget:
+            # Fall back to the header line alone
+            node_lines = node_lines[:1]
+            cost = estimate_tokens(node_lines[0])
+            if used + cost > token_budget:
+                omitted += 1
+                continue
+        elif fingerprint and fingerprint not in seen_bodies:
+            seen_bodies[fingerprint] = index
+        lines.extend(node_lines)
+        used += cost
+
+    if omitted:
+        lines.append(f"({omitted} less relevant nodes omitted to fit the context budget)")
+    return "\n".join(lines)
@@ -9,11 +9,12 @@ import os
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import requests
 
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import HTTP_REQUESTS, count, count_llm_usage
 
 logger = get_logger(__name__)
 
@@ -79,11 +80,13 @@ You have access to a knowledge graph with the following schema:
 
         try:
             # Send the request
+            count(HTTP_REQUESTS)
             response = requests.post(url, json=payload, timeout=timeout)
             response.raise_for_status()
 
             # Parse the response
             data = response.json()
+            count_llm_usage(data.get("prompt_eval_count", 0), data.get("eval_count", 0))
             return data.get("response", "")
 
         except requests.exceptions.RequestException as e:
@@ -116,6 +119,38 @@ You have access to a knowledge graph with the following schema:
         Returns:
             The complete generated text from the stream.
         """
+        try:
+            return "".join(self.generate_stream(model, prompt, system, options, timeout))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error calling Ollama API: {e}")
+            return f"Error: {e}"
+        except ValueError as e:
+            logger.error(f"Error parsing Ollama streaming response: {e}")
+            return f"Error parsing response: {e}"
+
+    def generate_stream(
+        self,
+        model: str = "qwen3:4b",
+        prompt: str = "",
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: int = 260,
+    ) -> Iterator[str]:
+        """Generate text using the specified model, yielding it as it arrives.
+
+        Args:
+            model: The model to use.
+            prompt: The prompt to send to the model.
+            system: The system message to use.
+            options: Additional options to pass to the model.
+            timeout: Maximum time in seconds to wait for the model to respond.
+
+        Yields:
+            Chunks of generated text.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
         url = f"{self.host}/api/generate"
 
         # Set default options if not provided
@@ -143,45 +178,35 @@ You have access to a knowledge graph with the following schema:
             "stream": True  # Enable streaming
         }
 
-        try:
-            # Send the request
-            response = requests.post(url, json=payload, stream=True, timeout=timeout)
-            response.raise_for_status()
-
-            # Collect the streamed response
-            full_response = ""
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        # Decode the line
-                        line_text = line.decode('utf-8')
-
-                        # Skip empty lines
-                        if not line_text.strip():
-                            continue
-
-                        # Parse the JSON
-                        line_data = json.loads(line_text)
+        # Send the request
+        count(HTTP_REQUESTS)
+        response = requests.post(url, json=payload, stream=True, timeout=timeout)
+        response.raise_for_status()
 
-                        # Add the response text to the full response
-                        if "response" in line_data:
-                            full_response += line_data["response"]
-
-                        # Check if done
-                        if line_data.get("done", False):
-                            break
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Error parsing streaming response line: {e}")
-                        continue
-
-            return full_response
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Ollama API: {e}")
-            return f"Error: {e}"
-        except ValueError as e:
-            logger.error(f"Error parsing Ollama streaming response: {e}")
-            return f"Error parsing response: {e}"
+        for line in response.iter_lines():
+            if not line:
+                continue
+            try:
+                # Decode the line
+                line_text = line.decode('utf-8')
+
+                # Skip empty lines
+                if not line_text.strip():
+                    continue
+
+                # Parse the JSON
+                line_data = json.loads(line_text)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Error parsing streaming response line: {e}")
+                continue
+
+            if line_data.get("response"):
+                yield line_data["response"]
+
+            # Check if done; the last line carries the token counts
+            if line_data.get("done", False):
+                count_llm_usage(line_data.get("prompt_eval_count", 0), line_data.get("eval_count", 0))
+                break
 
     def generate_with_thinking(
         self,
@@ -13,6 +13,7 @@ import time
 from typing import Any, Dict, List, Optional, Union, Iterator
 
 from arc_memory.logging_conf import get_logger
+from arc_memory.profiling import count_llm_usage
 
 logger = get_logger(__name__)
 
@@ -169,6 +170,8 @@ When returning JSON:
             response = self.client.chat.completions.create(**params)
             elapsed_time = time.time() - start_time
             logger.debug(f"OpenAI API call took {elapsed_time:.2f} seconds")
+            if response.usage is not None:
+                count_llm_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
 
             # Return the response content
             return response.choices[0].message.content or ""
@@ -200,6 +203,42 @@ When returning JSON:
         Returns:
             The complete generated text from the stream.
         """
+        try:
+            start_time = time.time()
+            full_response = "".join(self.generate_stream(model, prompt, system, options, timeout))
+
+            elapsed_time = time.time() - start_time
+            logger.debug(f"OpenAI API streaming call took {elapsed_time:.2f} seconds")
+
+            return full_response
+
+        except Exception as e:
+            logger.error(f"Error calling OpenAI API with streaming: {e}")
+            return f"Error: {e}"
+
+    def generate_stream(
+        self,
+        model: str = None,
+        prompt: str = "",
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: int = 260,
+    ) -> Iterator[str]:
+        """Generate text using the specified model, yielding it as it arrives.
+
+        Args:
+            model: The model to use.
+            prompt: The prompt to send to the model.
+            system: The system message to use.
+            options: Additional options to pass to the model.
+            timeout: Maximum time in seconds to wait for the model to respond.
+
+        Yields:
+            Chunks of generated text.
+
+        Raises:
+            Exception: If the API call fails.
+        """
         # Set default options if not provided
         if options is None:
             options = {}
@@ -274,25 +313,11 @@ Always base your responses on the specific information provided, and avoid makin
         if response_format is not None:
             params["response_format"] = response_format
 
-        try:
-            # Send the request with streaming
-            start_time = time.time()
-            response_stream = self.client.chat.completions.create(**params)
-
-            # Collect the entire response
-            full_response = ""
-            for chunk in response_stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    full_response += chunk.choices[0].delta.content
-
-            elapsed_time = time.time() - start_time
-            logger.debug(f"OpenAI API streaming call took {elapsed_time:.2f} seconds")
-
-            return full_response
-
-        except Exception as e:
-            logger.error(f"Error calling OpenAI API with streaming: {e}")
-            return f"Error: {e}"
+        # Send the request with streaming
+        response_stream = self.client.chat.completions.create(**params)
+        for chunk in response_stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
     def generate_with_thinking(
         self,
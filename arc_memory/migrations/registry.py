@@ -0,0 +1,394 @@
+"""Schema version registry for Arc Memory databases.
+
+The schema version of a database is stored in SQLite's ``PRAGMA user_version``.
+Opening a database that is already at SCHEMA_VERSION costs a single pragma
+read. Otherwise the steps in SCHEMA_STEPS newer than the stored version run in
+order while holding a lock, and the version is stamped after each step, so an
+interrupted upgrade resumes where it stopped.
+
+Every step is idempotent, because databases created before the registry
+existed start at version 0 even though most of their schema is in place.
+"""
+
+import hashlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+
+def _is_file_database(db_path: Optional[Path]) -> bool:
+    """Check whether a database path refers to a file on disk."""
+    return db_path is not None and str(db_path) not in ("", ":memory:")
+
+
+def _create_tables(conn: Any, db_path: Optional[Path]) -> bool:
+    """Create the tables of the current schema if they don't exist."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS repositories (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            url TEXT,
+            local_path TEXT NOT NULL,
+            default_branch TEXT DEFAULT 'main',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            metadata TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS nodes(
+            id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            title TEXT,
+            body TEXT,
+            timestamp TEXT,
+            repo_id TEXT,
+            extra TEXT,
+            created_at TEXT,
+            updated_at TEXT,
+            valid_from TEXT,
+            valid_until TEXT,
+            metadata TEXT,
+            embedding BLOB,
+            url TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS edges(
+            src TEXT NOT NULL,
+            dst TEXT NOT NULL,
+            rel TEXT NOT NULL,
+            properties TEXT,
+            PRIMARY KEY (src, dst, rel)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS metadata(
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS refresh_timestamps(
+            source TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            metadata TEXT
+        )
+        """
+    )
+    return True
+
+
+def _migration(module: str, function: str = "migrate_database") -> Callable[[Any, Optional[Path]], bool]:
+    """Wrap one of the scripts in arc_memory.migrations as a schema step.
+
+    The scripts open their own connection to the database file. An in-memory
+    database is always created by _create_tables with the current layout, so
+    the scripts have nothing to do for it.
+    """
+    def step(conn: Any, db_path: Optional[Path]) -> bool:
+        if not _is_file_database(db_path):
+            return True
+        import importlib
+        migrate = getattr(importlib.import_module(f"arc_memory.migrations.{module}"), function)
+        return bool(migrate(Path(db_path)))
+
+    return step
+
+
+def _create_indexes(conn: Any, db_path: Optional[Path]) -> bool:
+    """Create the node indexes, once every indexed column exists."""
+    for column in ("timestamp", "repo_id", "created_at", "updated_at", "valid_from", "valid_until", "url"):
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_nodes_{column} ON nodes({column})")
+    return True
+
+
+def _add_temporal_indexes(conn: Any, db_path: Optional[Path]) -> bool:
+    """Give edges a validity interval and index both tables for as-of lookups.
+
+    The composite indexes lead with the lookup key, so an as-of query is an
+    index range scan on the same key as the current-state query, with the
+    validity interval checked from the index entry.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(edges)").fetchall()}
+    for column in ("valid_from", "valid_until"):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE edges ADD COLUMN {column} TEXT")
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_validity ON nodes(id, valid_from, valid_until)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_src_validity ON edges(src, valid_from, valid_until)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_dst_validity ON edges(dst, valid_from, valid_until)")
+    return True
+
+
+# Triggers that keep the statistics tables in step with deletes and type
+# changes. Inserts are accounted for by the writers, once per batch (see
+# arc_memory.sql.stats).
+_GRAPH_STATS_TRIGGERS = {
+    "trg_stats_node_delete": """
+        AFTER DELETE ON nodes BEGIN
+            UPDATE node_type_counts SET count = count - 1 WHERE type = OLD.type;
+            DELETE FROM node_type_counts WHERE type = OLD.type AND count <= 0;
+        END
+    """,
+    "trg_stats_node_type": """
+        AFTER UPDATE OF type ON nodes WHEN OLD.type IS NOT NEW.type BEGIN
+            UPDATE node_type_counts SET count = count - 1 WHERE type = OLD.type;
+            INSERT INTO node_type_counts(type, count) VALUES (NEW.type, 1)
+            ON CONFLICT(type) DO UPDATE SET count = count + 1;
+            DELETE FROM node_type_counts WHERE type = OLD.type AND count <= 0;
+        END
+    """,
+    "trg_stats_edge_delete": """
+        AFTER DELETE ON edges BEGIN
+            UPDATE edge_rel_counts SET count = count - 1 WHERE rel = OLD.rel;
+            DELETE FROM edge_rel_counts WHERE rel = OLD.rel AND count <= 0;
+            UPDATE node_degrees SET out_degree = out_degree - 1 WHERE id = OLD.src;
+            UPDATE node_degrees SET in_degree = in_degree - 1 WHERE id = OLD.dst;
+            DELETE FROM node_degrees
+            WHERE id IN (OLD.src, OLD.dst) AND in_degree <= 0 AND out_degree <= 0;
+        END
+    """,
+}
+
+
+def _create_graph_stats(conn: Any, db_path: Optional[Path]) -> bool:
+    """Create the graph statistics tables, fill them and keep them current.
+
+    node_type_counts and edge_rel_counts hold the number of nodes per type and
+    edges per relationship, and node_degrees the in- and out-degree of every
+    node with edges, so statistics and centrality lookups never scan the
+    graph. Existing graphs are counted once here.
+    """
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS node_type_counts("
+        "type TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS edge_rel_counts("
+        "rel TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS node_degrees("
+        "id TEXT PRIMARY KEY, in_degree INTEGER NOT NULL DEFAULT 0, "
+        "out_degree INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID"
+    )
+
+    # Rebuild from the current graph, then let the triggers take over
+    for table in ("node_type_counts", "edge_rel_counts", "node_degrees"):
+        conn.execute(f"DELETE FROM {table}")
+    conn.execute("INSERT INTO node_type_counts(type, count) SELECT type, COUNT(*) FROM nodes GROUP BY type")
+    conn.execute("INSERT INTO edge_rel_counts(rel, count) SELECT rel, COUNT(*) FROM edges GROUP BY rel")
+    conn.execute(
+        """
+        INSERT INTO node_degrees(id, in_degree, out_degree)
+        SELECT id, SUM(incoming), SUM(outgoing) FROM (
+            SELECT dst AS id, 1 AS incoming, 0 AS outgoing FROM edges
+            UNION ALL
+            SELECT src AS id, 0 AS incoming, 1 AS outgoing FROM edges
+        ) GROUP BY id
+        """
+    )
+
+    for name, body in _GRAPH_STATS_TRIGGERS.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    return True
+
+
+def _partition_by_repository(conn: Any, db_path: Optional[Path]) -> bool:
+    """Cluster node lookups by repository.
+
+    With (repo_id, type, timestamp) every per-repository query, whether by
+    type or not, reads a contiguous range of one index, so removing or
+    querying one repository does not touch the rows of the others. The
+    index replaces the single-column repo_id index, which it covers.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_repo_type ON nodes(repo_id, type, timestamp)")
+    conn.execute("DROP INDEX IF EXISTS idx_nodes_repo_id")
+    return True
+
+
+# Triggers that count every write to the graph, so readers can tell whether
+# it changed since they last looked (see arc_memory.query_cache.graph_version)
+_GRAPH_WRITE_TRIGGERS = {
+    f"trg_writes_{table}_{event.lower()}": f"""
+        AFTER {event} ON {table} BEGIN
+            UPDATE graph_writes SET version = version + 1;
+        END
+    """
+    for table in ("nodes", "edges")
+    for event in ("INSERT", "UPDATE", "DELETE")
+}
+
+
+def _create_graph_write_counter(conn: Any, db_path: Optional[Path]) -> bool:
+    """Create the graph write counter and the triggers that advance it.
+
+    graph_writes holds a single row whose version goes up with every insert,
+    update or delete of a node or edge, including updates that leave the row
+    count and rowids as they were.
+    """
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS graph_writes("
+        "id INTEGER PRIMARY KEY CHECK (id = 0), version INTEGER NOT NULL)"
+    )
+    conn.execute("INSERT OR IGNORE INTO graph_writes(id, version) VALUES (0, 0)")
+    for name, body in _GRAPH_WRITE_TRIGGERS.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    return True
+
+
+# Ordered schema steps: (version, description, step). A step takes the open
+# connection and the database path and returns True on success.
+SCHEMA_STEPS: List[Tuple[int, str, Callable[[Any, Optional[Path]], bool]]] = [
+    (1, "create tables", _create_tables),
+    (2, "add timestamp column", _migration("add_timestamp_column")),
+    (3, "add repo_id column", _migration("add_repo_id_column")),
+    (4, "add architecture schema", _migration("add_architecture_schema")),
+    (5, "add enhanced schema", _migration("add_enhanced_schema")),
+    (6, "add refresh metadata column", _migration("add_metadata_column", "run_migration")),
+    (7, "create node indexes", _create_indexes),
+    (8, "add edge validity and temporal indexes", _add_temporal_indexes),
+    (9, "create graph statistics tables", _create_graph_stats),
+    (10, "partition nodes by repository", _partition_by_repository),
+    (11, "create graph write counter", _create_graph_write_counter),
+]
+
+SCHEMA_VERSION = SCHEMA_STEPS[-1][0]
+
+# One lock per database file for threads in this process; other processes
+# are excluded with a lock file in the cache directory
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_file_path(key: str) -> Path:
+    """Get the lock file for a database, named after a hash of its path.
+
+    Lock files live in ``~/.arc/cache/locks`` rather than next to the database,
+    so repositories that keep a graph in their tree don't pick up a stray file.
+    """
+    from arc_memory.sdk.cache import get_cache_dir
+
+    lock_dir = get_cache_dir() / "locks"
+    lock_dir.mkdir(exist_ok=True)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return lock_dir / f"schema-{digest}.lock"
+
+
+@contextmanager
+def schema_lock(db_path: Optional[Path]) -> Iterator[None]:
+    """Hold the schema upgrade lock for a database.
+
+    Args:
+        db_path: Path to the database file.
+    """
+    key = str(Path(db_path).resolve()) if _is_file_database(db_path) else ":memory:"
+    with _locks_guard:
+        lock = _locks.setdefault(key, threading.Lock())
+
+    with lock:
+        if key == ":memory:":
+            yield
+            return
+
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            fcntl = None
+
+        with open(_lock_file_path(key), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def get_schema_version(conn: Any) -> int:
+    """Get the schema version stamped in a database.
+
+    Args:
+        conn: A sqlite3 or apsw connection.
+
+    Returns:
+        The schema version, 0 for databases that were never stamped.
+    """
+    row = conn.execute("PRAGMA user_version").fetchone()
+    return int(row[0]) if row else 0
+
+
+def set_schema_version(conn: Any, version: int) -> None:
+    """Stamp the schema version of a database.
+
+    Args:
+        conn: A sqlite3 or apsw connection.
+        version: The schema version.
+    """
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def ensure_schema(conn: Any, db_path: Optional[Path]) -> bool:
+    """Bring a database up to SCHEMA_VERSION.
+
+    Args:
+        conn: An open sqlite3 or apsw connection to the database.
+        db_path: Path to the database file, used by the migration scripts and
+            for the lock.
+
+    Returns:
+        True if any schema step ran, False if the database was already current.
+
+    Raises:
+        Exception: If creating tables or indexes fails. Migration scripts that
+            fail are logged and retried the next time the database is opened.
+    """
+    # Fast path: a single read, no locks
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return False
+
+    with schema_lock(db_path):
+        version = get_schema_version(conn)
+        if version >= SCHEMA_VERSION:
+            return False
+
+        for step_version, description, step in SCHEMA_STEPS:
+            if step_version <= version:
+                continue
+
+            # Migration scripts use their own connections, so don't hold a
+            # transaction open on this one while they run
+            if getattr(conn, "in_transaction", False):
+                conn.commit()
+
+            logger.info(f"Schema step {step_version} ({description}) for {db_path}")
+            if not step(conn, db_path):
+                logger.warning(
+                    f"Schema step {step_version} ({description}) failed for {db_path}; "
+                    "it will be retried the next time the database is opened"
+                )
+                return True
+
+            set_schema_version(conn, step_version)
+            version = step_version
+
+        if getattr(conn, "in_transaction", False):
+            conn.commit()
+
+    logger.info(f"Database {db_path} is at schema version {SCHEMA_VERSION}")
+    return True
@@ -5,9 +5,12 @@ semantic understanding derived from natural language processing and LLMs.
 """
 
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from arc_memory.config import get_config_value
 from arc_memory.llm.ollama_client import OllamaClient
 from arc_memory.logging_conf import get_logger
 from arc_memory.schema.models import (
@@ -361,44 +364,34 @@ def _extract_json_from_llm_response(response: str) -> Dict[str, Any]:
                     raise ValueError(f"Failed to parse JSON from LLM response: {e}")
 
 
-def extract_key_concepts(
-    nodes: List[Node],
-    edges: List[Edge],
-    ollama_client: OllamaClient,
-    llm_model: Optional[str] = None,
-) -> Tuple[List[Node], List[Edge]]:
-    """Extract key concepts from node content using Ollama.
-
-    Args:
-        nodes: List of nodes to analyze.
-        edges: List of edges between nodes.
-        ollama_client: Ollama client for LLM processing.
-        llm_model: Optional model name to use with Ollama.
-
-    Returns:
-        New concept nodes and edges.
-    """
-    logger.info("Extracting key concepts from node content using Ollama")
-
-    # Collect text content from nodes
-    text_content = []
-    for node in nodes:
-        if node.title:
-            text_content.append(node.title)
-        if node.body:
-            text_content.append(node.body)
-
-    # Skip if no content to analyze
-    if not text_content:
-        return [], []
-
-    # Combine text content (limit to avoid token limits)
-    combined_text = "\n".join(text_content)
-    if len(combined_text) > 10000:
-        combined_text = combined_text[:10000]
-
-    # Create prompt for concept extraction
-    prompt = f"""
+# Concept extraction runs as a map-reduce over the whole graph: a local TF-IDF
+# pass picks candidate terms and groups nodes by their dominant term, the
+# groups are packed into token-bounded chunks that are sent to the LLM in
+# parallel, and the partial concept lists are merged. Large graphs are sampled
+# down to at most CONCEPT_MAX_CHUNKS chunks (the "max_concept_chunks" setting of
+# the "semantic_analysis" config section), spread evenly across the topics.
+CONCEPT_MAX_CHUNKS = 50  # Chunks sent to the LLM per extraction
+CONCEPT_CHUNK_TOKENS = 3000  # Approximate prompt budget per chunk
+CONCEPT_MAX_NODE_CHARS = 2000  # Characters of each node included in a chunk
+CONCEPT_MAX_CANDIDATES = 200  # Candidate terms kept from the TF-IDF pass
+CONCEPT_HINTS_PER_CHUNK = 15  # Candidate terms suggested in each prompt
+CONCEPT_MAX_WORKERS = 4  # Chunks sent to the LLM concurrently
+_CHARS_PER_TOKEN = 4
+
+_TERM_RE = re.compile(r"[a-z][a-z0-9]+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset("""
+    about above added adds after again against also among and any are because been before
+    being below between both but can cannot could did does doing done down during each
+    few fix fixed fixes for from further had has have having her here hers him his how
+    into its itself just may more most must new not now off once only other our ours out
+    over own per same she should some such than that the their theirs them then there
+    these they this those through too under until update updated updates upon use used
+    uses using very via was were what when where which while who whom why will with
+    would you your yours
+""".split())
+
+_CONCEPT_PROMPT = """
     Analyze the following text and extract key domain concepts.
     For each concept, provide:
     1. A name (1-3 words)
@@ -415,38 +408,44 @@ def extract_key_concepts(
             }}
         ]
     }}
-
+{hints}
     Here's the text to analyze:
     ```
-    {combined_text}
+    {text}
     ```
 
     Return ONLY the JSON object, nothing else.
     """
 
-    try:
-        # Generate response from LLM
-        model_to_use = llm_model or "qwen3:4b"
-        response = ollama_client.generate(
-            model=model_to_use,
-            prompt=prompt,
-            options={"temperature": 0.2}
-        )
 
-        # Extract and parse JSON using our robust function
-        try:
-            data = _extract_json_from_llm_response(response)
-        except ValueError:
-            # If parsing fails, create a minimal default structure
-            logger.warning("Falling back to minimal default structure due to JSON parsing error")
-            data = {"concepts": []}
+def extract_key_concepts(
+    nodes: List[Node],
+    edges: List[Edge],
+    ollama_client: OllamaClient,
+    llm_model: Optional[str] = None,
+    max_workers: int = CONCEPT_MAX_WORKERS,
+    chunk_tokens: int = CONCEPT_CHUNK_TOKENS,
+    max_chunks: Optional[int] = None,
+) -> Tuple[List[Node], List[Edge]]:
+    """Extract key concepts from node content using Ollama.
 
-        # Create concept nodes and edges
-        return _create_concept_nodes_and_edges(data, nodes)
+    Args:
+        nodes: List of nodes to analyze.
+        edges: List of edges between nodes.
+        ollama_client: Ollama client for LLM processing.
+        llm_model: Optional model name to use with Ollama.
+        max_workers: Maximum number of chunks sent to the LLM concurrently.
+        chunk_tokens: Approximate number of tokens of node text per chunk.
+        max_chunks: Maximum number of chunks sent to the LLM. If None, uses
+            the configured limit; 0 sends every chunk.
 
-    except Exception as e:
-        logger.error(f"Error extracting concepts with Ollama: {e}")
-        return [], []
+    Returns:
+        New concept nodes and edges.
+    """
+    logger.info("Extracting key concepts from node content using Ollama")
+    return _extract_concepts_map_reduce(
+        nodes, ollama_client, llm_model or "qwen3:4b", "Ollama", max_workers, chunk_tokens, max_chunks
+    )
 
 
 def extract_key_concepts_openai(
@@ -454,6 +453,9 @@ def extract_key_concepts_openai(
     edges: List[Edge],
     openai_client: Any,
     llm_model: Optional[str] = None,
+    max_workers: int = CONCEPT_MAX_WORKERS,
+    chunk_tokens: int = CONCEPT_CHUNK_TOKENS,
+    max_chunks: Optional[int] = None,
 ) -> Tuple[List[Node], List[Edge]]:
     """Extract key concepts from node content using OpenAI.
 
@@ -462,84 +464,295 @@ def extract_key_concepts_openai(
         edges: List of edges between nodes.
         openai_client: OpenAI client for LLM processing.
         llm_model: Optional model name to use with OpenAI.
+        max_workers: Maximum number of chunks sent to the LLM concurrently.
+        chunk_tokens: Approximate number of tokens of node text per chunk.
+        max_chunks: Maximum number of chunks sent to the LLM. If None, uses
+            the configured limit; 0 sends every chunk.
 
     Returns:
         New concept nodes and edges.
     """
     logger.info("Extracting key concepts from node content using OpenAI")
+    return _extract_concepts_map_reduce(
+        nodes, openai_client, llm_model or "gpt-4.1", "OpenAI", max_workers, chunk_tokens, max_chunks
+    )
 
-    # Collect text content from nodes
-    text_content = []
-    for node in nodes:
-        if node.title:
-            text_content.append(node.title)
-        if node.body:
-            text_content.append(node.body)
 
-    # Skip if no content to analyze
-    if not text_content:
+def _extract_concepts_map_reduce(
+    nodes: List[Node],
+    llm_client: Any,
+    model: str,
+    provider_name: str,
+    max_workers: int,
+    chunk_tokens: int,
+    max_chunks: Optional[int] = None,
+) -> Tuple[List[Node], List[Edge]]:
+    """Extract concepts from every node by chunking, mapping and merging.
+
+    Args:
+        nodes: List of nodes to analyze.
+        llm_client: Client with a ``generate(model, prompt, options)`` method.
+        model: The model name to use.
+        provider_name: The provider name, for log messages.
+        max_workers: Maximum number of chunks sent to the LLM concurrently.
+        chunk_tokens: Approximate number of tokens of node text per chunk.
+        max_chunks: Maximum number of chunks sent to the LLM. If None, uses
+            the configured limit; 0 sends every chunk.
+
+    Returns:
+        New concept nodes and edges.
+    """
+    try:
+        chunks = _plan_concept_chunks(nodes, chunk_tokens)
+        if not chunks:
+            return [], []
+
+        if max_chunks is None:
+            max_chunks = _configured_max_chunks()
+        if max_chunks and len(chunks) > max_chunks:
+            logger.info(f"Sampling {max_chunks} of {len(chunks)} concept chunks")
+            chunks = _sample_chunks(chunks, max_chunks)
+
+        logger.info(f"Sending {len(chunks)} concept chunks to {provider_name}")
+
+        def map_chunk(chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
+            hints = ""
+            if chunk["hints"]:
+                hints = (
+                    "\n    Candidate terms that are frequent in this text: "
+                    f"{', '.join(chunk['hints'])}\n"
+                )
+            prompt = _CONCEPT_PROMPT.format(hints=hints, text=chunk["text"])
+            try:
+                response = llm_client.generate(
+                    model=model,
+                    prompt=prompt,
+                    options={"temperature": 0.2}
+                )
+                return _extract_json_from_llm_response(response).get("concepts", [])
+            except ValueError:
+                logger.warning("Skipping concept chunk due to JSON parsing error")
+                return []
+            except Exception as e:
+                logger.error(f"Error extracting concepts with {provider_name}: {e}")
+                return []
+
+        workers = max(1, min(max_workers, len(chunks)))
+        if workers == 1:
+            partials = [map_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arc-concepts") as executor:
+                partials = list(executor.map(map_chunk, chunks))
+
+        concepts = _merge_concepts(partials)
+        return _create_concept_nodes_and_edges({"concepts": concepts}, nodes)
+
+    except Exception as e:
+        logger.error(f"Error extracting concepts with {provider_name}: {e}")
         return [], []
 
-    # Combine text content (limit to avoid token limits)
-    combined_text = "\n".join(text_content)
-    if len(combined_text) > 10000:
-        combined_text = combined_text[:10000]
 
-    # Create prompt for concept extraction
-    prompt = f"""
-    Analyze the following text and extract key domain concepts.
-    For each concept, provide:
-    1. A name (1-3 words)
-    2. A clear definition (1-2 sentences)
-    3. Related terms or concepts
+def _configured_max_chunks() -> int:
+    """Get the configured maximum number of concept chunks."""
+    try:
+        value = get_config_value("semantic_analysis", "max_concept_chunks", CONCEPT_MAX_CHUNKS)
+        return max(0, int(value or 0))
+    except Exception as e:
+        logger.warning(f"Invalid max_concept_chunks setting, using {CONCEPT_MAX_CHUNKS}: {e}")
+        return CONCEPT_MAX_CHUNKS
 
-    Format your response as JSON with the following structure:
-    {{
-        "concepts": [
-            {{
-                "name": "concept_name",
-                "definition": "concept_definition",
-                "related_terms": ["term1", "term2"]
-            }}
-        ]
-    }}
 
-    Here's the text to analyze:
-    ```
-    {combined_text}
-    ```
+def _sample_chunks(chunks: List[Dict[str, Any]], max_chunks: int) -> List[Dict[str, Any]]:
+    """Pick evenly spaced chunks, keeping the first and the last.
 
-    Return ONLY the JSON object, nothing else.
+    Chunks are ordered by topic, so an even spread keeps every part of the
+    graph represented; concept edges are still created for every node.
     """
+    if max_chunks == 1:
+        return chunks[:1]
+    step = (len(chunks) - 1) / (max_chunks - 1)
+    return [chunks[round(i * step)] for i in range(max_chunks)]
 
-    try:
-        # Generate response from OpenAI
-        model_to_use = llm_model or "gpt-4.1"
-        response = openai_client.generate(
-            model=model_to_use,
-            prompt=prompt,
-            options={"temperature": 0.2}
-        )
 
-        # Extract and parse JSON using our robust function
-        try:
-            data = _extract_json_from_llm_response(response)
-        except ValueError:
-            # If parsing fails, create a minimal default structure
-            logger.warning("Falling back to minimal default structure due to JSON parsing error")
-            data = {"concepts": []}
+def _node_text(node: Node) -> str:
+    """Get the title and body of a node as one string."""
+    return "\n".join(part for part in (node.title, node.body) if part)
 
-        # Create concept nodes and edges
-        return _create_concept_nodes_and_edges(data, nodes)
 
-    except Exception as e:
-        logger.error(f"Error extracting concepts with OpenAI: {e}")
-        return [], []
+def _plan_concept_chunks(nodes: List[Node], chunk_tokens: int) -> List[Dict[str, Any]]:
+    """Group nodes into token-bounded chunks of related content.
+
+    Every node is scored with TF-IDF over unigrams and bigrams. The highest
+    scoring terms that occur in more than one node become candidate concepts,
+    each node is assigned the candidate it weighs highest, and nodes are
+    packed into chunks in that order so that nodes about the same topic are
+    sent to the LLM together.
+
+    Args:
+        nodes: The nodes to analyze.
+        chunk_tokens: Approximate number of tokens of node text per chunk.
+
+    Returns:
+        A list of chunks, each a dictionary with the chunk ``text`` and the
+        candidate terms (``hints``) that dominate it.
+    """
+    import numpy as np
+
+    vocabulary: Dict[str, int] = {}
+    doc_nodes: List[Node] = []
+    doc_counts: List[Counter] = []
+    for node in nodes:
+        text = _node_text(node)
+        if not text:
+            continue
+
+        counts: Counter = Counter()
+        previous = None
+        for word in _TERM_RE.findall(text.lower()):
+            if len(word) < 3 or word in _STOPWORDS:
+                previous = None
+                continue
+            counts[vocabulary.setdefault(word, len(vocabulary))] += 1
+            if previous:
+                bigram = f"{previous} {word}"
+                counts[vocabulary.setdefault(bigram, len(vocabulary))] += 1
+            previous = word
+
+        doc_nodes.append(node)
+        doc_counts.append(counts)
+
+    if not doc_nodes:
+        return []
+
+    terms = list(vocabulary)
+    n_docs = len(doc_nodes)
+    nnz = sum(len(counts) for counts in doc_counts)
+
+    # Sparse document-term matrix in coordinate form
+    doc_ids = np.repeat(np.arange(n_docs), [len(counts) for counts in doc_counts])
+    term_ids = np.fromiter(
+        (term for counts in doc_counts for term in counts), dtype=np.int64, count=nnz
+    )
+    tfs = np.fromiter(
+        (tf for counts in doc_counts for tf in counts.values()), dtype=np.float64, count=nnz
+    )
+    del doc_counts
+
+    candidate_rank = np.full(len(terms), -1, dtype=np.int64)
+    dominant = np.full(n_docs, -1, dtype=np.int64)
+    if nnz:
+        df = np.bincount(term_ids, minlength=len(terms))
+        idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+        doc_length = np.bincount(doc_ids, weights=tfs, minlength=n_docs)
+        weights = tfs / doc_length[doc_ids] * idf[term_ids]
+
+        # Candidate concepts: highest total weight among terms shared by nodes
+        scores = np.bincount(term_ids, weights=weights, minlength=len(terms))
+        if n_docs > 1:
+            scores[df < 2] = 0.0
+        order = np.argsort(-scores, kind="stable")[:CONCEPT_MAX_CANDIDATES]
+        order = order[scores[order] > 0]
+        candidate_rank[order] = np.arange(len(order))
+
+        # Each node's dominant candidate is the one it weighs highest
+        mask = candidate_rank[term_ids] >= 0
+        if mask.any():
+            m_docs, m_terms, m_weights = doc_ids[mask], term_ids[mask], weights[mask]
+            by_doc = np.lexsort((-m_weights, m_docs))
+            first_docs, first = np.unique(m_docs[by_doc], return_index=True)
+            dominant[first_docs] = m_terms[by_doc][first]
+
+    # Order nodes by the rank of their dominant candidate; nodes without one go last
+    topic = np.where(dominant >= 0, candidate_rank[np.maximum(dominant, 0)], len(terms))
+    doc_order = np.lexsort((np.arange(n_docs), topic))
+
+    budget = max(1, chunk_tokens) * _CHARS_PER_TOKEN
+    chunks: List[Dict[str, Any]] = []
+    parts: List[str] = []
+    topics: Counter = Counter()
+    size = 0
+
+    def flush() -> None:
+        hints = [terms[term] for term, _ in topics.most_common(CONCEPT_HINTS_PER_CHUNK)]
+        chunks.append({"text": "\n".join(parts), "hints": hints})
+
+    for doc in doc_order:
+        snippet = _node_text(doc_nodes[doc])[:CONCEPT_MAX_NODE_CHARS]
+        if parts and size + len(snippet) > budget:
+            flush()
+            parts, topics, size = [], Counter(), 0
+        parts.append(snippet)
+        size += len(snippet) + 1
+        if dominant[doc] >= 0:
+            topics[int(dominant[doc])] += 1
+    if parts:
+        flush()
+
+    return chunks
+
+
+def _concept_key(name: str) -> str:
+    """Normalize a concept name for deduplication."""
+    return " ".join(_TOKEN_RE.findall(name.lower()))
+
+
+def _merge_concepts(partials: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge and deduplicate the concepts extracted from each chunk.
+
+    Concepts are matched on their normalized name. The longest definition is
+    kept, related terms are combined, and concepts found in more chunks come
+    first.
+
+    Args:
+        partials: The concept lists returned for each chunk.
+
+    Returns:
+        The merged list of concepts.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    support: Counter = Counter()
+    for concepts in partials:
+        for concept in concepts:
+            if not isinstance(concept, dict) or not concept.get("name"):
+                continue
+            key = _concept_key(str(concept["name"]))
+            if not key:
+                continue
+
+            support[key] += 1
+            definition = concept.get("definition") or ""
+            related = [term for term in concept.get("related_terms") or [] if isinstance(term, str)]
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = {
+                    "name": concept["name"],
+                    "definition": definition,
+                    "related_terms": list(dict.fromkeys(related)),
+                }
+                continue
+
+            if len(definition) > len(existing["definition"]):
+                existing["definition"] = definition
+            known = {term.lower() for term in existing["related_terms"]}
+            for term in related:
+                if term.lower() not in known:
+                    known.add(term.lower())
+                    existing["related_terms"].append(term)
+
+    ordered = sorted(merged, key=lambda key: -support[key])
+    return [merged[key] for key in ordered]
 
 
 def _create_concept_nodes_and_edges(data: Dict[str, Any], nodes: List[Node]) -> Tuple[List[Node], List[Edge]]:
     """Create concept nodes and edges from extracted data.
 
+    A node mentions a concept when its title or body contains the concept
+    name, ignoring case (so "API" matches "REST APIs"). Every word of the
+    name then occurs inside a word of the node, so candidate nodes are found
+    through an inverted index of node words and only they are checked. Words
+    containing a concept word are found through an index of the character
+    trigrams (or shorter grams, for short words) of every node word.
+
     Args:
         data: Extracted concept data.
         nodes: List of nodes to analyze.
@@ -549,11 +762,46 @@ def _create_concept_nodes_and_edges(data: Dict[str, Any], nodes: List[Node]) ->
     """
     concept_nodes = []
     concept_edges = []
+    seen_ids = set()
+
+    # Map each word to the nodes whose title or body contains it
+    postings: Dict[str, Set[int]] = {}
+    for index, node in enumerate(nodes):
+        for token in set(_TOKEN_RE.findall(_node_text(node).lower())):
+            postings.setdefault(token, set()).add(index)
+
+    # Map each character gram of up to three characters to the words containing it
+    grams: Dict[str, Set[str]] = {}
+    for word in postings:
+        for size in range(1, min(3, len(word)) + 1):
+            for start in range(len(word) - size + 1):
+                grams.setdefault(word[start:start + size], set()).add(word)
+
+    # Nodes with a word containing a given concept word, e.g. "api" -> "apis"
+    containing: Dict[str, Set[int]] = {}
+
+    def nodes_containing(token: str) -> Set[int]:
+        matches = containing.get(token)
+        if matches is None:
+            size = min(3, len(token))
+            words = sorted(
+                (grams.get(token[start:start + size], set()) for start in range(len(token) - size + 1)),
+                key=len,
+            )
+            matches = set()
+            for word in words[0].intersection(*words[1:]):
+                if token in word:
+                    matches |= postings[word]
+            containing[token] = matches
+        return matches
 
     for concept_data in data.get("concepts", []):
         # Create concept node
         concept_name = concept_data.get("name", "Unknown Concept")
         concept_id = f"concept:{concept_name.lower().replace(' ', '_')}"
+        if concept_id in seen_ids:
+            continue
+        seen_ids.add(concept_id)
 
         concept_node = ConceptNode(
             id=concept_id,
@@ -565,11 +813,22 @@ def _create_concept_nodes_and_edges(data: Dict[str, Any], nodes: List[Node]) ->
         )
         concept_nodes.append(concept_node)
 
+        # Candidate nodes contain every word of the concept name; names
+        # without words (such as "++") are checked against every node
+        tokens = set(_TOKEN_RE.findall(concept_name.lower()))
+        if tokens:
+            matches = sorted((nodes_containing(token) for token in tokens), key=len)
+            candidates = matches[0].intersection(*matches[1:])
+        else:
+            candidates = set(range(len(nodes)))
+
         # Create edges to related nodes
-        for node in nodes:
+        needle = concept_name.lower()
+        for index in sorted(candidates):
+            node = nodes[index]
             # Check if concept is mentioned in node title or body
-            if (node.title and concept_name.lower() in node.title.lower()) or \
-               (node.body and concept_name.lower() in node.body.lower()):
+            if (node.title and needle in node.title.lower()) or \
+               (node.body and needle in node.body.lower()):
                 # Create edge from node to concept
                 edge = Edge(
                     src=node.id,
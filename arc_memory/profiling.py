@@ -0,0 +1,447 @@
+"""Build profiling for Arc Memory.
+
+This module provides lightweight instrumentation for ``arc build`` and
+``arc refresh``: nested timing spans, counters for HTTP requests, git
+subprocesses, SQL statements and LLM tokens, and optional cProfile or
+pyinstrument capture of each top-level stage. A profiling run is exported as
+a Chrome trace (load it in ``chrome://tracing`` or https://ui.perfetto.dev)
+and summarized as a table of stages.
+
+Instrumentation is free when no profiler is active: ``span`` returns a shared
+no-op context manager and ``count`` returns immediately.
+
+Example:
+    profiler = Profiler()
+    with profiler.activate():
+        with span("ingest.git"):
+            ...
+            count(HTTP_REQUESTS)
+    profiler.write_chrome_trace("build-trace.json")
+    print(profiler.format_summary())
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from arc_memory.errors import DependencyError
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+# Counter names used by the instrumented call sites
+HTTP_REQUESTS = "http_requests"
+GIT_SUBPROCESSES = "git_subprocesses"
+SUBPROCESSES = "subprocesses"
+SQL_STATEMENTS = "sql_statements"
+LLM_CALLS = "llm_calls"
+LLM_PROMPT_TOKENS = "llm_prompt_tokens"
+LLM_COMPLETION_TOKENS = "llm_completion_tokens"
+
+# Supported per-stage capture modes
+CAPTURE_MODES = ("cprofile", "pyinstrument")
+
+_NULL_SPAN = nullcontext()
+_active: Optional["Profiler"] = None
+_audit_hook_installed = False
+
+
+@dataclass
+class Span:
+    """A timed section of a profiling run.
+
+    Attributes:
+        name: Name of the span, e.g. "ingest.git".
+        start_ns: Start time from ``time.perf_counter_ns``.
+        end_ns: End time, or 0 while the span is open.
+        thread_id: ID of the thread that opened the span.
+        depth: Nesting depth on that thread; top-level stages have depth 0.
+        args: Attributes passed when the span was opened.
+        counters: Counts recorded while this was the innermost open span.
+    """
+
+    name: str
+    start_ns: int
+    thread_id: int
+    depth: int
+    args: Dict[str, Any] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    end_ns: int = 0
+
+
+class Profiler:
+    """Collects spans and counters for one profiling run.
+
+    Spans nest per thread, so stages run by worker threads appear as their own
+    lanes in the trace. Counters are attributed to the innermost open span of
+    the thread that recorded them and to the run totals.
+    """
+
+    def __init__(self, capture: Optional[str] = None, capture_dir: Optional[Path] = None):
+        """Initialize the profiler.
+
+        Args:
+            capture: Optional per-stage capture mode, "cprofile" or "pyinstrument".
+                Top-level spans of the thread that activated the profiler are
+                captured; cProfile output is written as ``.prof`` files
+                (readable with ``python -m pstats`` or snakeviz) and
+                pyinstrument output as ``.html`` files.
+            capture_dir: Directory for capture files; defaults to the current
+                directory.
+
+        Raises:
+            ValueError: If the capture mode is not supported.
+            DependencyError: If pyinstrument capture is requested but
+                pyinstrument is not installed.
+        """
+        if capture is not None and capture not in CAPTURE_MODES:
+            raise ValueError(f"Invalid capture mode: {capture}. Expected one of {', '.join(CAPTURE_MODES)}")
+        if capture == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                raise DependencyError(
+                    "pyinstrument capture requires pyinstrument. "
+                    "Please install it with: pip install arc-memory[profiling]",
+                    details={"missing_dependency": "pyinstrument"},
+                )
+
+        self.capture = capture
+        self.capture_dir = Path(capture_dir) if capture_dir else Path.cwd()
+        self.captures: List[Path] = []
+        self.spans: List[Span] = []
+        self.counters: Dict[str, int] = {}
+        self.start_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._capture_thread: Optional[int] = None
+        self._previous: Optional[Profiler] = None
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def start(self) -> "Profiler":
+        """Make this the active profiler for the module-level helpers.
+
+        Returns:
+            The profiler.
+        """
+        global _active
+        _install_audit_hook()
+        self._previous, _active = _active, self
+        self._capture_thread = threading.get_ident()
+        return self
+
+    def stop(self) -> None:
+        """Restore the profiler that was active before start was called."""
+        global _active
+        if _active is self:
+            _active = self._previous
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """Make this the active profiler while the context is open.
+
+        Yields:
+            The profiler.
+        """
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        """Time a section of work.
+
+        Args:
+            name: Name of the span.
+            **args: Attributes to record with the span.
+
+        Yields:
+            The open span.
+        """
+        stack = self._stack()
+        thread_id = threading.get_ident()
+        span = Span(name=name, start_ns=time.perf_counter_ns(), thread_id=thread_id, depth=len(stack), args=args)
+        with self._lock:
+            self.spans.append(span)
+        stack.append(span)
+
+        capturing = None
+        if self.capture and span.depth == 0 and thread_id == self._capture_thread:
+            capturing = self._start_capture()
+        try:
+            yield span
+        finally:
+            if capturing is not None:
+                self._stop_capture(capturing, span, len(self.captures))
+            span.end_ns = time.perf_counter_ns()
+            stack.pop()
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter.
+
+        Args:
+            name: Name of the counter.
+            value: Amount to add.
+        """
+        stack = self._stack()
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            if stack:
+                counters = stack[-1].counters
+                counters[name] = counters.get(name, 0) + value
+
+    def trace_connection(self, conn: Any) -> None:
+        """Count the SQL statements executed on a database connection.
+
+        Supports sqlite3 and apsw connections; other objects are ignored.
+
+        Args:
+            conn: The connection to trace.
+        """
+        if hasattr(conn, "set_trace_callback"):
+            conn.set_trace_callback(lambda statement: self.count(SQL_STATEMENTS))
+        elif hasattr(conn, "setexectrace"):
+            def exec_trace(cursor: Any, statement: str, bindings: Any) -> bool:
+                self.count(SQL_STATEMENTS)
+                return True
+            conn.setexectrace(exec_trace)
+
+    def _start_capture(self) -> Any:
+        if self.capture == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+            return profile
+        from pyinstrument import Profiler as PyinstrumentProfiler
+        profile = PyinstrumentProfiler()
+        profile.start()
+        return profile
+
+    def _stop_capture(self, profile: Any, span: Span, index: int) -> None:
+        self.capture_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{index:02d}-{''.join(c if c.isalnum() or c in '-_.' else '_' for c in span.name)}"
+        if self.capture == "cprofile":
+            profile.disable()
+            path = self.capture_dir / f"{stem}.prof"
+            profile.dump_stats(str(path))
+        else:
+            profile.stop()
+            path = self.capture_dir / f"{stem}.html"
+            path.write_text(profile.output_html())
+        span.args["capture"] = str(path)
+        self.captures.append(path)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Export the run in the Chrome trace event format.
+
+        Returns:
+            A trace with one complete ("X") event per span, carrying its
+            attributes and counters, and one counter ("C") event with the
+            run totals.
+        """
+        pid = os.getpid()
+        now_ns = time.perf_counter_ns()
+        events: List[Dict[str, Any]] = []
+        for span in self.spans:
+            end_ns = span.end_ns or now_ns
+            events.append({
+                "name": span.name,
+                "ph": "X",
+                "ts": (span.start_ns - self.start_ns) / 1000,
+                "dur": (end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {**span.args, **span.counters},
+            })
+        if self.counters:
+            events.append({
+                "name": "totals",
+                "ph": "C",
+                "ts": (now_ns - self.start_ns) / 1000,
+                "pid": pid,
+                "tid": threading.get_ident(),
+                "args": dict(self.counters),
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """Write the run as a Chrome trace JSON file.
+
+        Args:
+            path: Output file.
+
+        Returns:
+            The path the trace was written to.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        return path
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Summarize the spans by name.
+
+        Counters of nested spans are included in their parents' rows.
+
+        Returns:
+            One row per span name in order of first appearance, with the
+            number of calls, total and maximum seconds, the self time (total
+            minus time in nested spans on the same thread) and counters.
+        """
+        rows: Dict[str, Dict[str, Any]] = {}
+        now_ns = time.perf_counter_ns()
+        ends = {id(span): span.end_ns or now_ns for span in self.spans}
+        child_ns: Dict[int, int] = {}
+        counters = {id(span): dict(span.counters) for span in self.spans}
+
+        # Walk each thread's spans in start order to find their ancestors
+        for thread_spans in _by_thread(self.spans).values():
+            stack: List[Span] = []
+            for span in sorted(thread_spans, key=lambda s: s.start_ns):
+                while stack and ends[id(stack[-1])] <= span.start_ns:
+                    stack.pop()
+                if stack:
+                    parent = id(stack[-1])
+                    child_ns[parent] = child_ns.get(parent, 0) + ends[id(span)] - span.start_ns
+                for ancestor in stack:
+                    totals = counters[id(ancestor)]
+                    for name, value in span.counters.items():
+                        totals[name] = totals.get(name, 0) + value
+                stack.append(span)
+
+        for span in self.spans:
+            row = rows.setdefault(span.name, {
+                "name": span.name, "depth": span.depth, "calls": 0,
+                "total_s": 0.0, "self_s": 0.0, "max_s": 0.0, "counters": {},
+            })
+            duration_s = (ends[id(span)] - span.start_ns) / 1e9
+            row["calls"] += 1
+            row["total_s"] += duration_s
+            row["self_s"] += duration_s - child_ns.get(id(span), 0) / 1e9
+            row["max_s"] = max(row["max_s"], duration_s)
+            for name, value in counters[id(span)].items():
+                row["counters"][name] = row["counters"].get(name, 0) + value
+        return list(rows.values())
+
+    def format_summary(self) -> str:
+        """Format the summary as a plain-text table.
+
+        Returns:
+            The table, followed by the run's counter totals.
+        """
+        lines = [f"{'stage':<40}{'calls':>7}{'total s':>10}{'self s':>10}{'max s':>10}  counters"]
+        for row in self.summary():
+            name = "  " * row["depth"] + row["name"]
+            counters = ", ".join(f"{k}={v}" for k, v in sorted(row["counters"].items()))
+            lines.append(
+                f"{name:<40}{row['calls']:>7}{row['total_s']:>10.2f}{row['self_s']:>10.2f}"
+                f"{row['max_s']:>10.2f}  {counters}"
+            )
+        if self.counters:
+            totals = ", ".join(f"{k}={v}" for k, v in sorted(self.counters.items()))
+            lines.append(f"totals: {totals}")
+        return "\n".join(lines)
+
+
+def _by_thread(spans: List[Span]) -> Dict[int, List[Span]]:
+    threads: Dict[int, List[Span]] = {}
+    for span in spans:
+        threads.setdefault(span.thread_id, []).append(span)
+    return threads
+
+
+def _audit(event: str, args: tuple) -> None:
+    """Count subprocess spawns while a profiler is active."""
+    profiler = _active
+    if profiler is None or event != "subprocess.Popen":
+        return
+    executable, argv = args[0], args[1]
+    if not executable and argv:
+        executable = argv if isinstance(argv, (str, bytes)) else argv[0]
+    profiler.count(SUBPROCESSES)
+    if os.path.basename(os.fsdecode(executable or "")).split(" ")[0] in ("git", "git.exe"):
+        profiler.count(GIT_SUBPROCESSES)
+
+
+def _install_audit_hook() -> None:
+    # Audit hooks can't be removed, so one hook serves every profiler
+    global _audit_hook_installed
+    if not _audit_hook_installed:
+        sys.addaudithook(_audit)
+        _audit_hook_installed = True
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Get the active profiler.
+
+    Returns:
+        The active profiler, or None if profiling is off.
+    """
+    return _active
+
+
+def span(name: str, **args: Any) -> Any:
+    """Time a section of work on the active profiler.
+
+    Args:
+        name: Name of the span.
+        **args: Attributes to record with the span.
+
+    Returns:
+        A context manager; a no-op when profiling is off.
+    """
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name, **args)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add to a counter on the active profiler, if there is one.
+
+    Args:
+        name: Name of the counter.
+        value: Amount to add.
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.count(name, value)
+
+
+def count_llm_usage(prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+    """Count an LLM call and its tokens on the active profiler, if there is one.
+
+    Args:
+        prompt_tokens: Tokens in the prompt, if the provider reported them.
+        completion_tokens: Tokens in the completion, if the provider reported them.
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.count(LLM_CALLS)
+        profiler.count(LLM_PROMPT_TOKENS, prompt_tokens or 0)
+        profiler.count(LLM_COMPLETION_TOKENS, completion_tokens or 0)
+
+
+def trace_connection(conn: Any) -> None:
+    """Count the SQL statements of a connection on the active profiler, if there is one.
+
+    Args:
+        conn: A sqlite3 or apsw connection.
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.trace_connection(conn)
@@ -0,0 +1,171 @@
+"""In-memory caches for natural language queries.
+
+`process_query` runs an LLM to understand a question and another to answer it.
+Agents tend to ask the same few questions over and over, so both results are
+cached in memory:
+
+- Query intents are keyed on the normalized question text (and today's date,
+  since intents hold absolute dates resolved from phrases like "last week").
+- Answers are keyed on the normalized question plus content hashes of the
+  nodes retrieved for it, so an answer is only reused for the same evidence.
+
+Entries expire after a TTL and are dropped when the graph version changes.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from arc_memory.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+# Default time-to-live of cached intents and answers, in seconds
+INTENT_CACHE_TTL = 24 * 60 * 60
+ANSWER_CACHE_TTL = 60 * 60
+
+# Default maximum number of entries per cache
+MAX_CACHE_ENTRIES = 1024
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a TTL and graph-version invalidation.
+
+    Each entry records the graph version it was computed against; reading it
+    with a different version drops it.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = MAX_CACHE_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid.
+            max_entries: Maximum number of entries; the least recently used
+                entry is evicted first.
+            clock: Monotonic clock (overridable for tests).
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Any = None) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: The cache key.
+            version: The current graph version.
+
+        Returns:
+            The value, or None if it is missing, expired or from another version.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_version, value = entry
+                if expires_at > self.clock() and entry_version == version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, version: Any = None) -> None:
+        """Cache a value.
+
+        Args:
+            key: The cache key.
+            value: The value.
+            version: The graph version the value was computed against.
+        """
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize question text so trivially different phrasings share a key.
+
+    Lowercases, collapses whitespace and drops trailing punctuation.
+    """
+    return re.sub(r"\s+", " ", query.strip().lower()).rstrip(" ?!.")
+
+
+def node_set_hash(nodes: Iterable[Dict[str, Any]]) -> str:
+    """Hash the content of a set of retrieved nodes, independent of their order."""
+    digests = sorted(
+        hashlib.sha256(json.dumps(node, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        for node in nodes
+    )
+    return hashlib.sha256("".join(digests).encode("utf-8")).hexdigest()
+
+
+def graph_version(conn: sqlite3.Connection) -> Optional[Tuple[Any, ...]]:
+    """Get a version that changes whenever the graph is written.
+
+    The version is the write counter kept by triggers on the nodes and edges
+    tables, so every insert, update and delete moves it. Databases built
+    before the counter existed fall back to a fingerprint of the highest
+    rowids and the maintained node and edge counts.
+
+    Args:
+        conn: Connection to the knowledge graph database.
+
+    Returns:
+        The version, or None if it can't be read.
+    """
+    try:
+        row = conn.execute("SELECT version FROM graph_writes").fetchone()
+        if row is not None:
+            return ("writes", row[0])
+    except Exception:
+        # The write counter is missing from databases built before it existed
+        pass
+    try:
+        row = conn.execute(
+            "SELECT (SELECT MAX(rowid) FROM nodes), (SELECT MAX(rowid) FROM edges)"
+        ).fetchone()
+        version = tuple(row)
+    except Exception as e:
+        logger.debug(f"Could not read graph version: {e}")
+        return None
+    try:
+        counts = conn.execute(
+            "SELECT (SELECT SUM(count) FROM node_type_counts), (SELECT SUM(count) FROM edge_rel_counts)"
+        ).fetchone()
+        version += tuple(counts)
+    except sqlite3.Error:
+        # Graph statistics tables are missing from databases built before they existed
+        pass
+    return version
+
+
+# Process-wide caches used by `arc_memory.semantic_search.process_query`
+intent_cache = QueryCache(ttl=INTENT_CACHE_TTL)
+answer_cache = QueryCache(ttl=ANSWER_CACHE_TTL)
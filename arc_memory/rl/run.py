@@ -12,7 +12,6 @@ import sys
 import time
 from typing import Dict, List, Any, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from arc_memory.sdk.core import Arc
@@ -46,6 +45,9 @@ def plot_training_metrics(metrics: Dict[str, Any], save_dir: str):
         metrics: Training metrics
         save_dir: Directory to save plots
     """
+    # matplotlib is slow to import and only needed when plotting
+    import matplotlib.pyplot as plt
+
     os.makedirs(save_dir, exist_ok=True)
     
     # Plot episode rewards
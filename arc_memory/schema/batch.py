@@ -0,0 +1,549 @@
+"""Compact columnar batches of nodes and edges for the ingest pipeline.
+
+A full build can produce millions of nodes and edges. Holding each one as a
+Pydantic model costs several hundred bytes of per-object overhead, so the build
+accumulates them in NodeBatch and EdgeBatch instead. A batch stores one column
+per field, with node types and edge relationships interned as small integer
+codes in arrays and metadata kept as serialized JSON. Pydantic models are only
+created again when a caller iterates or indexes the batch.
+
+Both batches can be passed wherever a list of nodes or edges is accepted by the
+database writers, which read their rows without materializing any models.
+"""
+
+import json
+from array import array
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sql.temporal import utc_iso, utc_text
+
+# Interned codes for node types and edge relationships
+NODE_TYPES: Tuple[NodeType, ...] = tuple(NodeType)
+EDGE_RELS: Tuple[EdgeRel, ...] = tuple(EdgeRel)
+_NODE_TYPE_CODES: Dict[NodeType, int] = {node_type: i for i, node_type in enumerate(NODE_TYPES)}
+_EDGE_REL_CODES: Dict[EdgeRel, int] = {rel: i for i, rel in enumerate(EDGE_RELS)}
+
+# Node model classes seen so far, so materialized nodes keep their subclass
+_NODE_CLASSES: List[Type[Node]] = [Node]
+_NODE_CLASS_CODES: Dict[Type[Node], int] = {Node: 0}
+
+# Fields stored in their own column; anything else a subclass declares is
+# kept as JSON in the per-node "fields" column
+_BASE_FIELDS = frozenset(Node.model_fields)
+_TEMPORAL_FIELDS = ("created_at", "updated_at", "valid_from", "valid_until")
+_SUBCLASS_FIELDS: Dict[Type[Node], frozenset] = {}
+
+# Edge properties are usually empty, so share one serialized value
+_EMPTY_JSON = "{}"
+
+NodeRow = Tuple[
+    str, str, Optional[str], Optional[str], Optional[str], Optional[str], str,
+    Optional[str], Optional[str], Optional[str], Optional[str], Optional[str],
+    Optional[List[float]], Optional[str],
+]
+EdgeRow = Tuple[str, str, str, str, Optional[str], Optional[str]]
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the values json cannot handle by itself."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def _dumps(value: Dict[str, Any]) -> str:
+    """Serialize a dictionary to compact JSON."""
+    return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as an ISO string."""
+    return value.isoformat() if value else None
+
+
+def _class_code(cls: Type[Node]) -> int:
+    """Get the interned code for a node model class."""
+    code = _NODE_CLASS_CODES.get(cls)
+    if code is None:
+        code = len(_NODE_CLASSES)
+        _NODE_CLASSES.append(cls)
+        _NODE_CLASS_CODES[cls] = code
+        _SUBCLASS_FIELDS[cls] = frozenset(cls.model_fields) - _BASE_FIELDS
+    return code
+
+
+class NodeBatch:
+    """A column-oriented batch of nodes.
+
+    Nodes can be appended as Pydantic models with ``append``/``extend`` or as
+    plain values with ``add``, which never creates a model. Iterating or
+    indexing the batch materializes Node objects (of their original subclass)
+    one at a time.
+    """
+
+    __slots__ = (
+        "ids", "type_codes", "class_codes", "titles", "bodies", "timestamps",
+        "repo_ids", "metadata", "urls", "fields", "temporal", "embeddings",
+    )
+
+    def __init__(self, nodes: Optional[Iterable[Node]] = None):
+        """Initialize the batch.
+
+        Args:
+            nodes: Optional nodes to add to the batch.
+        """
+        self.ids: List[str] = []
+        self.type_codes = array("B")
+        self.class_codes = array("H")
+        self.titles: List[Optional[str]] = []
+        self.bodies: List[Optional[str]] = []
+        self.timestamps: List[Optional[str]] = []
+        self.repo_ids: List[Optional[str]] = []
+        self.metadata: List[Optional[str]] = []
+        self.urls: List[Optional[str]] = []
+        self.fields: List[Optional[str]] = []
+        # Rarely set columns are stored sparsely by row index
+        self.temporal: Dict[int, Tuple[Optional[str], ...]] = {}
+        self.embeddings: Dict[int, List[float]] = {}
+        if nodes is not None:
+            self.extend(nodes)
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node]) -> "NodeBatch":
+        """Create a batch from nodes or another batch.
+
+        Args:
+            nodes: The nodes to add.
+
+        Returns:
+            A new NodeBatch.
+        """
+        return cls(nodes)
+
+    def add(
+        self,
+        id: str,
+        type: NodeType,
+        title: Optional[str] = None,
+        body: Optional[str] = None,
+        ts: Optional[datetime] = None,
+        repo_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        url: Optional[str] = None,
+    ) -> None:
+        """Add a node from plain values without creating a model.
+
+        Args:
+            id: The node ID.
+            type: The node type.
+            title: Optional title.
+            body: Optional body.
+            ts: Optional timestamp.
+            repo_id: Optional repository ID.
+            metadata: Optional metadata dictionary.
+            url: Optional URL.
+        """
+        self.ids.append(id)
+        self.type_codes.append(_NODE_TYPE_CODES[NodeType(type)])
+        self.class_codes.append(0)
+        self.titles.append(title)
+        self.bodies.append(body)
+        self.timestamps.append(_iso(ts))
+        self.repo_ids.append(repo_id)
+        self.metadata.append(_dumps(metadata) if metadata else None)
+        self.urls.append(url)
+        self.fields.append(None)
+
+    def append(self, node: Node) -> None:
+        """Add a node model to the batch.
+
+        Args:
+            node: The node to add.
+        """
+        index = len(self.ids)
+        cls_code = _class_code(type(node))
+        subclass_fields = _SUBCLASS_FIELDS.get(type(node))
+
+        self.ids.append(node.id)
+        self.type_codes.append(_NODE_TYPE_CODES[node.type])
+        self.class_codes.append(cls_code)
+        self.titles.append(node.title)
+        self.bodies.append(node.body)
+        self.timestamps.append(_iso(node.ts))
+        self.repo_ids.append(node.repo_id)
+        self.metadata.append(_dumps(node.metadata) if node.metadata else None)
+        self.urls.append(node.url)
+        self.fields.append(
+            node.model_dump_json(include=set(subclass_fields)) if subclass_fields else None
+        )
+
+        temporal = tuple(_iso(getattr(node, name)) for name in _TEMPORAL_FIELDS)
+        if any(temporal):
+            self.temporal[index] = temporal
+        if node.embedding:
+            self.embeddings[index] = list(node.embedding)
+
+    def extend(self, nodes: Union["NodeBatch", Iterable[Node]]) -> None:
+        """Add several nodes, or the contents of another batch.
+
+        Args:
+            nodes: The nodes or batch to add.
+        """
+        if not isinstance(nodes, NodeBatch):
+            for node in nodes:
+                self.append(node)
+            return
+
+        offset = len(self.ids)
+        self.ids.extend(nodes.ids)
+        self.type_codes.extend(nodes.type_codes)
+        self.class_codes.extend(nodes.class_codes)
+        self.titles.extend(nodes.titles)
+        self.bodies.extend(nodes.bodies)
+        self.timestamps.extend(nodes.timestamps)
+        self.repo_ids.extend(nodes.repo_ids)
+        self.metadata.extend(nodes.metadata)
+        self.urls.extend(nodes.urls)
+        self.fields.extend(nodes.fields)
+        for index, temporal in nodes.temporal.items():
+            self.temporal[offset + index] = temporal
+        for index, embedding in nodes.embeddings.items():
+            self.embeddings[offset + index] = embedding
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the batch."""
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Node]:
+        """Materialize the nodes one at a time."""
+        for index in range(len(self.ids)):
+            yield self.get(index)
+
+    def __getitem__(self, index: int) -> Node:
+        """Materialize the node at an index."""
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError("NodeBatch index out of range")
+        return self.get(index)
+
+    def get(self, index: int) -> Node:
+        """Materialize the node at an index as its original model class.
+
+        Args:
+            index: The row index.
+
+        Returns:
+            The node.
+        """
+        data: Dict[str, Any] = {
+            "id": self.ids[index],
+            "type": NODE_TYPES[self.type_codes[index]],
+            "title": self.titles[index],
+            "body": self.bodies[index],
+            "ts": self.timestamps[index],
+            "repo_id": self.repo_ids[index],
+            "metadata": json.loads(self.metadata[index]) if self.metadata[index] else {},
+            "url": self.urls[index],
+        }
+        temporal = self.temporal.get(index)
+        if temporal:
+            data.update(zip(_TEMPORAL_FIELDS, temporal))
+        if index in self.embeddings:
+            data["embedding"] = self.embeddings[index]
+        if self.fields[index]:
+            data.update(json.loads(self.fields[index]))
+        return _NODE_CLASSES[self.class_codes[index]].model_validate(data)
+
+    def to_nodes(self) -> List[Node]:
+        """Materialize every node in the batch.
+
+        Returns:
+            A list of nodes.
+        """
+        return list(self)
+
+    def type_of(self, index: int) -> NodeType:
+        """Get the type of the node at an index without materializing it."""
+        return NODE_TYPES[self.type_codes[index]]
+
+    def rows(self) -> Iterator[NodeRow]:
+        """Get the database row of every node without materializing models.
+
+        Each row is ``(id, type, title, body, timestamp, repo_id, extra,
+        created_at, updated_at, valid_from, valid_until, metadata, embedding,
+        url)``; ``extra`` is the metadata JSON (``"{}"`` when empty) and
+        ``metadata`` is the same JSON or None. As when writing a Node,
+        ``created_at`` and ``updated_at`` default to the node timestamp, and
+        timestamps are converted to UTC.
+
+        Yields:
+            One tuple per node.
+        """
+        no_temporal = (None, None, None, None)
+        for index, node_id in enumerate(self.ids):
+            timestamp = utc_text(self.timestamps[index])
+            created_at, updated_at, valid_from, valid_until = (
+                utc_text(value) for value in self.temporal.get(index, no_temporal)
+            )
+            metadata = self.metadata[index]
+            yield (
+                node_id,
+                NODE_TYPES[self.type_codes[index]].value,
+                self.titles[index],
+                self.bodies[index],
+                timestamp,
+                self.repo_ids[index],
+                metadata or _EMPTY_JSON,
+                created_at or timestamp,
+                updated_at or timestamp,
+                valid_from,
+                valid_until,
+                metadata,
+                self.embeddings.get(index),
+                self.urls[index],
+            )
+
+
+class EdgeBatch:
+    """A column-oriented batch of edges.
+
+    Iterating or indexing the batch materializes Edge objects one at a time.
+    """
+
+    __slots__ = ("srcs", "dsts", "rel_codes", "properties", "validity")
+
+    def __init__(self, edges: Optional[Iterable[Edge]] = None):
+        """Initialize the batch.
+
+        Args:
+            edges: Optional edges to add to the batch.
+        """
+        self.srcs: List[str] = []
+        self.dsts: List[str] = []
+        self.rel_codes = array("B")
+        self.properties: List[str] = []
+        # Sparse: most edges have no validity interval
+        self.validity: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        if edges is not None:
+            self.extend(edges)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge]) -> "EdgeBatch":
+        """Create a batch from edges or another batch.
+
+        Args:
+            edges: The edges to add.
+
+        Returns:
+            A new EdgeBatch.
+        """
+        return cls(edges)
+
+    def add(
+        self,
+        src: str,
+        dst: str,
+        rel: EdgeRel,
+        properties: Optional[Dict[str, Any]] = None,
+        valid_from: Optional[datetime] = None,
+        valid_until: Optional[datetime] = None,
+    ) -> None:
+        """Add an edge from plain values without creating a model.
+
+        Args:
+            src: The source node ID.
+            dst: The destination node ID.
+            rel: The relationship type.
+            properties: Optional edge properties.
+            valid_from: Optional start of the edge's validity interval.
+            valid_until: Optional end of the edge's validity interval.
+        """
+        if valid_from or valid_until:
+            self.validity[len(self.srcs)] = (_iso(valid_from), _iso(valid_until))
+        self.srcs.append(src)
+        self.dsts.append(dst)
+        self.rel_codes.append(_EDGE_REL_CODES[EdgeRel(rel)])
+        self.properties.append(_dumps(properties) if properties else _EMPTY_JSON)
+
+    def append(self, edge: Edge) -> None:
+        """Add an edge model to the batch.
+
+        Args:
+            edge: The edge to add.
+        """
+        self.add(edge.src, edge.dst, edge.rel, edge.properties, edge.valid_from, edge.valid_until)
+
+    def extend(self, edges: Union["EdgeBatch", Iterable[Edge]]) -> None:
+        """Add several edges, or the contents of another batch.
+
+        Args:
+            edges: The edges or batch to add.
+        """
+        if not isinstance(edges, EdgeBatch):
+            for edge in edges:
+                self.append(edge)
+            return
+
+        offset = len(self.srcs)
+        for index, validity in edges.validity.items():
+            self.validity[offset + index] = validity
+        self.srcs.extend(edges.srcs)
+        self.dsts.extend(edges.dsts)
+        self.rel_codes.extend(edges.rel_codes)
+        self.properties.extend(edges.properties)
+
+    def __len__(self) -> int:
+        """Get the number of edges in the batch."""
+        return len(self.srcs)
+
+    def __iter__(self) -> Iterator[Edge]:
+        """Materialize the edges one at a time."""
+        for index in range(len(self.srcs)):
+            yield self.get(index)
+
+    def __getitem__(self, index: int) -> Edge:
+        """Materialize the edge at an index."""
+        if index < 0:
+            index += len(self.srcs)
+        if not 0 <= index < len(self.srcs):
+            raise IndexError("EdgeBatch index out of range")
+        return self.get(index)
+
+    def get(self, index: int) -> Edge:
+        """Materialize the edge at an index.
+
+        Args:
+            index: The row index.
+
+        Returns:
+            The edge.
+        """
+        properties = self.properties[index]
+        valid_from, valid_until = self.validity.get(index, (None, None))
+        return Edge(
+            src=self.srcs[index],
+            dst=self.dsts[index],
+            rel=EDGE_RELS[self.rel_codes[index]],
+            properties=json.loads(properties) if properties != _EMPTY_JSON else {},
+            valid_from=valid_from,
+            valid_until=valid_until,
+        )
+
+    def to_edges(self) -> List[Edge]:
+        """Materialize every edge in the batch.
+
+        Returns:
+            A list of edges.
+        """
+        return list(self)
+
+    def rows(self) -> Iterator[EdgeRow]:
+        """Get the database row of every edge without materializing models.
+
+        Yields:
+            One ``(src, dst, rel, properties, valid_from, valid_until)`` tuple
+            per edge, with the validity bounds in UTC.
+        """
+        no_validity = (None, None)
+        for index, (src, dst, code, properties) in enumerate(
+            zip(self.srcs, self.dsts, self.rel_codes, self.properties)
+        ):
+            valid_from, valid_until = self.validity.get(index, no_validity)
+            yield (src, dst, EDGE_RELS[code].value, properties, utc_text(valid_from), utc_text(valid_until))
+
+
+def _node_row(node: Node) -> NodeRow:
+    """Get the database row of a node model (see NodeBatch.rows)."""
+    timestamp = utc_iso(node.ts)
+    metadata = _dumps(node.metadata) if node.metadata else None
+    return (
+        node.id,
+        node.type.value,
+        node.title,
+        node.body,
+        timestamp,
+        node.repo_id,
+        metadata or _EMPTY_JSON,
+        utc_iso(node.created_at) or timestamp,
+        utc_iso(node.updated_at) or timestamp,
+        utc_iso(node.valid_from),
+        utc_iso(node.valid_until),
+        metadata,
+        node.embedding or None,
+        node.url,
+    )
+
+
+def node_rows(nodes: Union[NodeBatch, Iterable[Node]]) -> Iterator[NodeRow]:
+    """Get the database rows of a batch or of node models.
+
+    Args:
+        nodes: A NodeBatch or an iterable of nodes.
+
+    Yields:
+        One row per node, in the layout of NodeBatch.rows.
+    """
+    if isinstance(nodes, NodeBatch):
+        yield from nodes.rows()
+    else:
+        for node in nodes:
+            yield _node_row(node)
+
+
+def edge_rows(edges: Union[EdgeBatch, Iterable[Edge]]) -> Iterator[EdgeRow]:
+    """Get the database rows of a batch or of edge models.
+
+    Args:
+        edges: An EdgeBatch or an iterable of edges.
+
+    Yields:
+        One row per edge, in the layout of EdgeBatch.rows.
+    """
+    if isinstance(edges, EdgeBatch):
+        yield from edges.rows()
+    else:
+        for edge in edges:
+            properties = _dumps(edge.properties) if edge.properties else _EMPTY_JSON
+            yield (
+                edge.src, edge.dst, edge.rel.value, properties,
+                utc_iso(edge.valid_from), utc_iso(edge.valid_until),
+            )
+
+
+def node_keys(nodes: Union[NodeBatch, Iterable[Node]]) -> Iterator[Tuple[str, str]]:
+    """Get the ``(id, type)`` of every node in a batch or list of node models.
+
+    Args:
+        nodes: A NodeBatch or an iterable of nodes.
+
+    Yields:
+        One tuple per node.
+    """
+    if isinstance(nodes, NodeBatch):
+        for node_id, code in zip(nodes.ids, nodes.type_codes):
+            yield node_id, NODE_TYPES[code].value
+    else:
+        for node in nodes:
+            yield node.id, node.type.value
+
+
+def edge_keys(edges: Union[EdgeBatch, Iterable[Edge]]) -> Iterator[Tuple[str, str, str]]:
+    """Get the ``(src, dst, rel)`` of every edge in a batch or list of edge models.
+
+    Args:
+        edges: An EdgeBatch or an iterable of edges.
+
+    Yields:
+        One tuple per edge.
+    """
+    if isinstance(edges, EdgeBatch):
+        for src, dst, code in zip(edges.srcs, edges.dsts, edges.rel_codes):
+            yield src, dst, EDGE_RELS[code].value
+    else:
+        for edge in edges:
+            yield edge.src, edge.dst, edge.rel.value
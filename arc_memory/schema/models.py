@@ -196,6 +196,9 @@ class Edge(BaseModel):
     dst: str
     rel: EdgeRel
     properties: Dict[str, Any] = Field(default_factory=dict)
+    # Validity interval of the relationship; None means unbounded
+    valid_from: Optional[datetime] = None
+    valid_until: Optional[datetime] = None
 
 
 class BuildManifest(BaseModel):
@@ -22,12 +22,14 @@ Example:
     # Query the knowledge graph
     result = arc.query("Who implemented the authentication feature?")
     ```
+
+Async agents can use `AsyncArc`, which runs the same calls on worker threads
+without blocking the event loop.
 """
 
+from arc_memory.sdk.async_arc import AsyncArc
 from arc_memory.sdk.core import Arc
-from arc_memory.sdk.adapters import discover_adapters
 
-# Discover and register framework adapters
-discover_adapters()
+# Framework adapters are discovered on first use (see sdk.adapters.registry)
 
-__all__ = ["Arc"]
+__all__ = ["Arc", "AsyncArc"]
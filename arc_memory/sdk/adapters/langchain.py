@@ -4,6 +4,7 @@ This module provides an adapter for integrating Arc Memory with LangChain,
 allowing Arc Memory functions to be used as LangChain tools.
 """
 
+import inspect
 from typing import Any, Callable, Iterator, List
 
 from arc_memory.logging_conf import get_logger
@@ -76,12 +77,20 @@ class LangChainAdapter(FrameworkAdapter):
                 name = func.__name__
                 description = func.__doc__ or f"Call the {name} function"
 
-                # Create a LangChain tool
-                tool = Tool(
-                    name=name,
-                    func=func,
-                    description=description
-                )
+                # Create a LangChain tool; async functions (from AsyncArc) run as coroutines
+                if inspect.iscoroutinefunction(func):
+                    tool = Tool(
+                        name=name,
+                        func=None,
+                        coroutine=func,
+                        description=description
+                    )
+                else:
+                    tool = Tool(
+                        name=name,
+                        func=func,
+                        description=description
+                    )
                 tools.append(tool)
 
             return tools
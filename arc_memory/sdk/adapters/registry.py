@@ -99,6 +99,15 @@ class AdapterRegistry:
 # Global registry instance
 _registry = AdapterRegistry()
 
+# Entry points are only scanned the first time an adapter is looked up
+_discovered = False
+
+
+def _ensure_discovered() -> None:
+    """Discover adapters from entry points if that has not happened yet."""
+    if not _discovered:
+        discover_adapters()
+
 
 def register_adapter(adapter: FrameworkAdapter) -> None:
     """Register a framework adapter.
@@ -124,6 +133,7 @@ def get_adapter(name: str) -> FrameworkAdapter:
     Raises:
         AdapterError: If the adapter is not found.
     """
+    _ensure_discovered()
     adapter = _registry.get(name)
     if adapter is None:
         raise AdapterError(f"Adapter '{name}' not found")
@@ -136,6 +146,7 @@ def get_all_adapters() -> List[FrameworkAdapter]:
     Returns:
         A list of all registered adapter instances.
     """
+    _ensure_discovered()
     return _registry.get_all()
 
 
@@ -145,6 +156,7 @@ def get_adapter_names() -> List[str]:
     Returns:
         A list of adapter names.
     """
+    _ensure_discovered()
     return _registry.get_names()
 
 
@@ -157,6 +169,9 @@ def discover_adapters() -> List[FrameworkAdapter]:
     Returns:
         A list of discovered adapter instances.
     """
+    global _discovered
+    _discovered = True
+
     # Discover adapters using the AdapterRegistry.discover method
     discovered_registry = AdapterRegistry.discover()
 
@@ -0,0 +1,641 @@
+"""Asynchronous facade for the Arc Memory SDK.
+
+`Arc` is synchronous and holds a single SQLite connection, so an async agent
+calling several tools at once either blocks its event loop or runs them one
+after another. `AsyncArc` runs the same methods on worker threads instead:
+
+- Reads run on a bounded pool of reader threads, each with its own `Arc` and
+  connection, so independent tool calls run concurrently.
+- Natural language queries and exports, which wait on LLMs and Git, run on a
+  separate pool so they can't starve the readers.
+- Writes run on a single writer thread.
+
+Identical calls that are in flight at the same time share one execution, and
+read results are cached in memory until the graph changes. Results are only
+cached on SQLite databases, whose version can be read cheaply.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from arc_memory.logging_conf import get_logger
+from arc_memory.query_cache import QueryCache, graph_version
+from arc_memory.schema.models import Edge, Node
+from arc_memory.sdk.core import Arc
+from arc_memory.sdk.errors import SDKError
+from arc_memory.sdk.models import (
+    DecisionTrailEntry, EntityDetails, ExportResult, HistoryEntry, ImpactResult, QueryEvent, QueryResult,
+    RelatedEntity
+)
+from arc_memory.sql.db import get_db_path
+
+logger = get_logger(__name__)
+
+# Default number of reader threads
+DEFAULT_READERS = min(4, os.cpu_count() or 1)
+
+# Default number of threads for queries and exports
+DEFAULT_QUERY_WORKERS = 4
+
+# Default time-to-live of cached read results, in seconds
+DEFAULT_RESULT_CACHE_TTL = 300
+
+# Methods that only read the graph, and the pool they run on
+_READ_METHODS = {
+    "get_node_by_id": "reader",
+    "get_edges_by_src": "reader",
+    "get_edges_by_dst": "reader",
+    "get_node_count": "reader",
+    "get_edge_count": "reader",
+    "get_graph_statistics": "reader",
+    "list_repositories": "reader",
+    "get_active_repositories": "reader",
+    "get_decision_trail": "reader",
+    "trace_lines": "reader",
+    "get_related_entities": "reader",
+    "get_related_entities_many": "reader",
+    "get_entity_details": "reader",
+    "get_entities": "reader",
+    "get_architecture_components": "reader",
+    "analyze_component_impact": "reader",
+    "analyze_impact_many": "reader",
+    "get_entity_history": "reader",
+    "query": "query",
+}
+
+# Reads whose results also depend on the Git working tree, so they are never cached
+_UNCACHED_METHODS = {"trace_lines"}
+
+# A tool call for `AsyncArc.gather`: a method name and its keyword arguments
+ToolCall = Tuple[str, Dict[str, Any]]
+
+
+class AsyncArc:
+    """Asynchronous interface to the Arc Memory knowledge graph.
+
+    Offers async versions of the `Arc` methods agents use as tools, plus
+    `gather` to run many tool calls concurrently. Progress callbacks aren't
+    supported, since the work runs on other threads.
+
+    Example:
+        ```python
+        async with AsyncArc(repo_path="./") as arc:
+            related, history, impact = await arc.gather([
+                ("get_related_entities", {"entity_id": "file:src/auth.py"}),
+                ("get_entity_history", {"entity_id": "file:src/auth.py"}),
+                ("analyze_component_impact", {"component_id": "file:src/auth.py"}),
+            ])
+        ```
+
+    Attributes:
+        repo_path: Path to the Git repository.
+        active_repos: Repository IDs that queries are limited to.
+        current_repo_id: ID of the current repository, once ensured.
+    """
+
+    def __init__(
+        self,
+        repo_path: Union[str, Path],
+        adapter_type: Optional[str] = None,
+        connection_params: Optional[Dict[str, Any]] = None,
+        readers: int = DEFAULT_READERS,
+        query_workers: int = DEFAULT_QUERY_WORKERS,
+        cache_ttl: float = DEFAULT_RESULT_CACHE_TTL,
+    ):
+        """Initialize the async SDK.
+
+        Connects on the writer thread (which also initializes the database
+        schema) before returning; readers connect on first use.
+
+        Args:
+            repo_path: Path to the Git repository.
+            adapter_type: Type of database adapter to use. If None, uses the configured adapter.
+            connection_params: Parameters for connecting to the database.
+                If None, uses default parameters.
+            readers: Maximum number of concurrent reads.
+            query_workers: Maximum number of concurrent queries and exports.
+            cache_ttl: Seconds to keep read results for identical calls.
+
+        Raises:
+            SDKError: If initialization fails.
+            AdapterError: If the adapter cannot be initialized.
+        """
+        self.repo_path = Path(repo_path)
+        self.adapter_type = adapter_type
+        self.connection_params = dict(connection_params or {"db_path": str(get_db_path())})
+        # Connections are closed from the thread that closes this instance
+        self.connection_params["check_same_thread"] = False
+        self.active_repos: List[str] = []
+        self.current_repo_id: Optional[str] = None
+
+        self._results = QueryCache(ttl=cache_ttl)
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._local = threading.local()
+        self._arcs: List[Arc] = []
+        self._arcs_lock = threading.Lock()
+        self._closed = False
+        self._pools = {
+            "reader": ThreadPoolExecutor(max_workers=readers, thread_name_prefix="arc-reader"),
+            "query": ThreadPoolExecutor(max_workers=query_workers, thread_name_prefix="arc-query"),
+            "writer": ThreadPoolExecutor(max_workers=1, thread_name_prefix="arc-writer"),
+        }
+
+        try:
+            self._pools["writer"].submit(self._thread_arc).result()
+        except Exception:
+            self._shutdown_pools()
+            raise
+
+    def _thread_arc(self) -> Arc:
+        """Get the current worker thread's Arc instance, connecting if needed."""
+        arc = getattr(self._local, "arc", None)
+        if arc is None:
+            arc = Arc(self.repo_path, adapter_type=self.adapter_type, connection_params=self.connection_params)
+            self._local.arc = arc
+            with self._arcs_lock:
+                self._arcs.append(arc)
+        arc.active_repos = list(self.active_repos)
+        arc.current_repo_id = self.current_repo_id
+        return arc
+
+    def _run(self, method: str, kwargs: Dict[str, Any], cache_key: Optional[str]) -> Any:
+        """Run an Arc method on the current worker thread."""
+        arc = self._thread_arc()
+        version = None
+        if cache_key is not None:
+            conn = getattr(arc.adapter, "conn", None)
+            version = graph_version(conn) if conn is not None else None
+            if version is None:
+                # Without a version, a cached result could outlive a write
+                return getattr(arc, method)(**kwargs)
+            cached = self._results.get(cache_key, version)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        result = getattr(arc, method)(**kwargs)
+
+        if cache_key is not None:
+            self._results.set(cache_key, copy.deepcopy(result), version)
+        return result
+
+    def _run_write(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        """Run an Arc method on the writer thread and keep its repository state."""
+        arc = self._thread_arc()
+        result = getattr(arc, method)(**kwargs)
+        self.active_repos = list(arc.active_repos)
+        self.current_repo_id = arc.current_repo_id
+        return result
+
+    async def _read(self, method: str, **kwargs: Any) -> Any:
+        """Run a read on its pool, sharing the work of identical calls."""
+        if self._closed:
+            raise SDKError("AsyncArc is closed")
+
+        use_cache = kwargs.get("cache", True)
+        key = json.dumps(
+            [method, kwargs, self.active_repos, self.current_repo_id], sort_keys=True, default=str
+        )
+
+        loop = asyncio.get_running_loop()
+        if use_cache:
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                return copy.deepcopy(await asyncio.shield(in_flight))
+
+        cache_key = key if use_cache and method not in _UNCACHED_METHODS else None
+        future = loop.run_in_executor(self._pools[_READ_METHODS[method]], self._run, method, kwargs, cache_key)
+        if use_cache:
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _write(self, method: str, **kwargs: Any) -> Any:
+        """Run a write on the writer thread."""
+        if self._closed:
+            raise SDKError("AsyncArc is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pools["writer"], self._run_write, method, kwargs)
+
+    async def gather(
+        self,
+        calls: Iterable[ToolCall],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run many read-only tool calls concurrently.
+
+        Each call is a ``(method_name, kwargs)`` pair naming one of the read
+        methods of this class (e.g. ``get_related_entities`` or ``query``).
+        Identical calls run once.
+
+        Args:
+            calls: The calls to run.
+            return_exceptions: Whether to return exceptions in place of the
+                results of failed calls instead of raising the first one.
+
+        Returns:
+            The results, in the order of the calls.
+
+        Raises:
+            SDKError: If a call names a method that isn't a read method.
+        """
+        calls = list(calls)
+        for method, _ in calls:
+            if method not in _READ_METHODS:
+                raise SDKError(
+                    f"Unsupported method for gather: {method}",
+                    details={"supported": sorted(_READ_METHODS)},
+                )
+        return await asyncio.gather(
+            *(self._read(method, **(kwargs or {})) for method, kwargs in calls),
+            return_exceptions=return_exceptions,
+        )
+
+    # Graph API methods
+
+    async def get_node_by_id(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node by its ID (see `Arc.get_node_by_id`)."""
+        return await self._read("get_node_by_id", node_id=node_id)
+
+    async def get_edges_by_src(self, src_id: str) -> List[Dict[str, Any]]:
+        """Get the edges from a node (see `Arc.get_edges_by_src`)."""
+        return await self._read("get_edges_by_src", src_id=src_id)
+
+    async def get_edges_by_dst(self, dst_id: str) -> List[Dict[str, Any]]:
+        """Get the edges to a node (see `Arc.get_edges_by_dst`)."""
+        return await self._read("get_edges_by_dst", dst_id=dst_id)
+
+    async def get_node_count(self) -> int:
+        """Get the number of nodes in the knowledge graph."""
+        return await self._read("get_node_count")
+
+    async def get_edge_count(self) -> int:
+        """Get the number of edges in the knowledge graph."""
+        return await self._read("get_edge_count")
+
+    async def get_graph_statistics(self) -> Dict[str, Any]:
+        """Get statistics about the knowledge graph (see `Arc.get_graph_statistics`)."""
+        return await self._read("get_graph_statistics")
+
+    async def add_nodes_and_edges(self, nodes: List[Node], edges: List[Edge]) -> None:
+        """Add nodes and edges to the knowledge graph on the writer thread."""
+        await self._write("add_nodes_and_edges", nodes=nodes, edges=edges)
+
+    # Repository API methods
+
+    async def ensure_repository(self, name: Optional[str] = None) -> str:
+        """Ensure the current repository exists in the graph (see `Arc.ensure_repository`)."""
+        return await self._write("ensure_repository", name=name)
+
+    async def add_repository(self, repo_path: Union[str, Path], name: Optional[str] = None) -> str:
+        """Add a repository to the graph (see `Arc.add_repository`)."""
+        return await self._write("add_repository", repo_path=repo_path, name=name)
+
+    async def set_active_repositories(self, repo_ids: List[str]) -> None:
+        """Limit queries to the given repositories (see `Arc.set_active_repositories`)."""
+        await self._write("set_active_repositories", repo_ids=repo_ids)
+
+    async def list_repositories(self) -> List[Dict[str, Any]]:
+        """List the repositories in the graph."""
+        return await self._read("list_repositories")
+
+    async def get_active_repositories(self) -> List[Dict[str, Any]]:
+        """Get the active repositories."""
+        return await self._read("get_active_repositories")
+
+    # Query API methods
+
+    async def query(
+        self,
+        question: str,
+        max_results: int = 5,
+        max_hops: int = 3,
+        include_causal: bool = True,
+        cache: bool = True,
+        timeout: int = 60,
+        repo_ids: Optional[List[str]] = None
+    ) -> QueryResult:
+        """Query the knowledge graph using natural language (see `Arc.query`).
+
+        Args:
+            question: The natural language question to ask.
+            max_results: Maximum number of results to return.
+            max_hops: Maximum number of hops in the graph traversal.
+            include_causal: Whether to prioritize causal relationships.
+            cache: Whether to use cached results if available.
+            timeout: Maximum time in seconds to wait for Ollama response.
+            repo_ids: Optional list of repository IDs to filter by. If None, uses active repositories.
+
+        Returns:
+            A QueryResult containing the answer and supporting evidence.
+        """
+        await self._ensure_active_repositories(repo_ids)
+        return await self._read(
+            "query",
+            question=question,
+            max_results=max_results,
+            max_hops=max_hops,
+            include_causal=include_causal,
+            cache=cache,
+            timeout=timeout,
+            repo_ids=repo_ids,
+        )
+
+    async def query_stream(
+        self,
+        question: str,
+        max_results: int = 5,
+        max_hops: int = 3,
+        cache: bool = True,
+        timeout: int = 60,
+        repo_ids: Optional[List[str]] = None
+    ) -> AsyncIterator[QueryEvent]:
+        """Query the knowledge graph, streaming the answer (see `Arc.query_stream`).
+
+        Args:
+            question: The natural language question to ask.
+            max_results: Maximum number of results to return.
+            max_hops: Maximum number of hops in the graph traversal.
+            cache: Whether to use cached query intents and answers.
+            timeout: Maximum time in seconds to wait for Ollama response.
+            repo_ids: Optional list of repository IDs to filter by. If None, uses active repositories.
+
+        Yields:
+            QueryEvent objects, ending with a "final" event.
+        """
+        if self._closed:
+            raise SDKError("AsyncArc is closed")
+        await self._ensure_active_repositories(repo_ids)
+
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Tuple[str, Any]]" = asyncio.Queue()
+        stopped = threading.Event()
+        kwargs = dict(
+            question=question, max_results=max_results, max_hops=max_hops,
+            cache=cache, timeout=timeout, repo_ids=repo_ids,
+        )
+
+        def produce() -> None:
+            try:
+                events = self._thread_arc().query_stream(**kwargs)
+                for event in events:
+                    if stopped.is_set():
+                        events.close()
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, ("event", event))
+                loop.call_soon_threadsafe(queue.put_nowait, ("done", None))
+            except BaseException as e:
+                loop.call_soon_threadsafe(queue.put_nowait, ("error", e))
+
+        producer = loop.run_in_executor(self._pools["query"], produce)
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "event":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    break
+        finally:
+            stopped.set()
+            await asyncio.shield(producer)
+
+    async def _ensure_active_repositories(self, repo_ids: Optional[List[str]]) -> None:
+        """Ensure the current repository on the writer before a query needs it."""
+        if repo_ids is None and not self.active_repos:
+            await self.ensure_repository()
+
+    # Decision trail, relationship, impact and history API methods
+
+    async def get_decision_trail(
+        self,
+        file_path: str,
+        line_number: int,
+        max_results: int = 5,
+        max_hops: int = 3,
+        include_rationale: bool = True,
+        cache: bool = True
+    ) -> List[DecisionTrailEntry]:
+        """Get the decision trail for a line in a file (see `Arc.get_decision_trail`)."""
+        return await self._read(
+            "get_decision_trail",
+            file_path=file_path,
+            line_number=line_number,
+            max_results=max_results,
+            max_hops=max_hops,
+            include_rationale=include_rationale,
+            cache=cache,
+        )
+
+    async def trace_lines(
+        self,
+        file_path: str,
+        line_numbers: List[int],
+        max_results: int = 5,
+        max_hops: int = 3,
+        include_rationale: bool = True
+    ) -> Dict[int, List[DecisionTrailEntry]]:
+        """Get the decision trails for several lines of a file (see `Arc.trace_lines`)."""
+        return await self._read(
+            "trace_lines",
+            file_path=file_path,
+            line_numbers=line_numbers,
+            max_results=max_results,
+            max_hops=max_hops,
+            include_rationale=include_rationale,
+        )
+
+    async def get_related_entities(
+        self,
+        entity_id: str,
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "both",
+        max_results: int = 10,
+        include_properties: bool = True,
+        order_by: Optional[str] = None,
+        cache: bool = True
+    ) -> List[RelatedEntity]:
+        """Get the entities related to an entity (see `Arc.get_related_entities`)."""
+        return await self._read(
+            "get_related_entities",
+            entity_id=entity_id,
+            relationship_types=relationship_types,
+            direction=direction,
+            max_results=max_results,
+            include_properties=include_properties,
+            order_by=order_by,
+            cache=cache,
+        )
+
+    async def get_entity_details(
+        self,
+        entity_id: str,
+        include_related: bool = True,
+        cache: bool = True
+    ) -> EntityDetails:
+        """Get the details of an entity (see `Arc.get_entity_details`)."""
+        return await self._read(
+            "get_entity_details", entity_id=entity_id, include_related=include_related, cache=cache
+        )
+
+    async def get_related_entities_many(
+        self,
+        entity_ids: List[str],
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "both",
+        max_results: int = 10,
+        include_properties: bool = True,
+        order_by: Optional[str] = None
+    ) -> Dict[str, List[RelatedEntity]]:
+        """Get the entities related to many entities (see `Arc.get_related_entities_many`)."""
+        return await self._read(
+            "get_related_entities_many",
+            entity_ids=entity_ids,
+            relationship_types=relationship_types,
+            direction=direction,
+            max_results=max_results,
+            include_properties=include_properties,
+            order_by=order_by,
+        )
+
+    async def get_entities(
+        self,
+        entity_ids: List[str],
+        include_related: bool = True
+    ) -> Dict[str, Optional[EntityDetails]]:
+        """Get the details of many entities (see `Arc.get_entities`)."""
+        return await self._read("get_entities", entity_ids=entity_ids, include_related=include_related)
+
+    async def get_architecture_components(
+        self,
+        component_type: Optional[str] = None,
+        parent_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get architecture components (see `Arc.get_architecture_components`)."""
+        return await self._read(
+            "get_architecture_components", component_type=component_type, parent_id=parent_id
+        )
+
+    async def analyze_component_impact(
+        self,
+        component_id: str,
+        impact_types: Optional[List[str]] = None,
+        max_depth: int = 3,
+        cache: bool = True
+    ) -> List[ImpactResult]:
+        """Analyze the impact of changes to a component (see `Arc.analyze_component_impact`)."""
+        return await self._read(
+            "analyze_component_impact",
+            component_id=component_id,
+            impact_types=impact_types,
+            max_depth=max_depth,
+            cache=cache,
+        )
+
+    async def analyze_impact_many(
+        self,
+        component_ids: List[str],
+        impact_types: Optional[List[str]] = None,
+        max_depth: int = 3
+    ) -> Dict[str, List[ImpactResult]]:
+        """Analyze the impact of changes to many components (see `Arc.analyze_impact_many`)."""
+        return await self._read(
+            "analyze_impact_many", component_ids=component_ids, impact_types=impact_types, max_depth=max_depth
+        )
+
+    async def get_entity_history(
+        self,
+        entity_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        include_related: bool = False,
+        cache: bool = True
+    ) -> List[HistoryEntry]:
+        """Get the history of an entity (see `Arc.get_entity_history`)."""
+        return await self._read(
+            "get_entity_history",
+            entity_id=entity_id,
+            start_date=start_date,
+            end_date=end_date,
+            include_related=include_related,
+            cache=cache,
+        )
+
+    async def export_graph(self, pr_sha: str, output_path: Union[str, Path], **kwargs: Any) -> ExportResult:
+        """Export the graph for a PR on the query pool (see `Arc.export_graph`)."""
+        if self._closed:
+            raise SDKError("AsyncArc is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pools["query"],
+            lambda: self._thread_arc().export_graph(pr_sha=pr_sha, output_path=output_path, **kwargs),
+        )
+
+    # Framework Adapter API methods
+
+    def get_tools(self, framework: str) -> Any:
+        """Get the async tool methods as tools for a specific framework.
+
+        Args:
+            framework: The name of the framework to adapt to.
+
+        Returns:
+            Framework-specific tools whose calls don't block the event loop.
+
+        Raises:
+            FrameworkError: If the adapter cannot be found or initialized.
+        """
+        from arc_memory.sdk.adapters import get_adapter
+
+        functions = [
+            self.query,
+            self.get_decision_trail,
+            self.get_related_entities,
+            self.get_entity_details,
+            self.analyze_component_impact,
+            self.get_entity_history
+        ]
+        return get_adapter(framework).adapt_functions(functions)
+
+    # Lifecycle
+
+    def _shutdown_pools(self) -> None:
+        """Stop the worker threads and close their connections."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=True)
+        with self._arcs_lock:
+            arcs, self._arcs = self._arcs, []
+        for arc in arcs:
+            try:
+                arc.close()
+            except Exception as e:
+                logger.warning(f"Failed to close worker connection: {e}")
+
+    async def aclose(self) -> None:
+        """Wait for running calls to finish and close all connections."""
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(None, self._shutdown_pools)
+
+    def close(self) -> None:
+        """Close all connections, blocking until running calls finish."""
+        if self._closed:
+            return
+        self._closed = True
+        self._shutdown_pools()
+
+    async def __aenter__(self) -> "AsyncArc":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager."""
+        await self.aclose()
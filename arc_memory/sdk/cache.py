@@ -5,6 +5,7 @@ allowing for efficient reuse of query results.
 """
 
 import hashlib
+import inspect
 import json
 import os
 from datetime import datetime, timedelta
@@ -76,6 +77,10 @@ def cache_key(func_name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
 def cached(ttl: timedelta = timedelta(hours=1)) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator for caching function results.
 
+    The `cache` keyword argument turns caching off for a call. Functions that
+    declare a `cache` parameter themselves also receive it, so they can bypass
+    their own caches.
+
     Args:
         ttl: Time-to-live for cached results.
 
@@ -83,12 +88,18 @@ def cached(ttl: timedelta = timedelta(hours=1)) -> Callable[[Callable[..., T]],
         A decorator function.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        accepts_cache = "cache" in inspect.signature(func).parameters
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             # Check if caching is enabled
             cache_enabled = kwargs.pop("cache", True) if "cache" in kwargs else True
+            if accepts_cache:
+                call_kwargs = {**kwargs, "cache": cache_enabled}
+            else:
+                call_kwargs = kwargs
             if not cache_enabled:
-                return func(*args, **kwargs)
+                return func(*args, **call_kwargs)
 
             # Generate cache key
             key = cache_key(func.__name__, args, kwargs)
@@ -109,7 +120,7 @@ def cached(ttl: timedelta = timedelta(hours=1)) -> Callable[[Callable[..., T]],
                     logger.warning(f"Error reading cache: {e}")
 
             # Call the function
-            result = func(*args, **kwargs)
+            result = func(*args, **call_kwargs)
 
             # Save to cache
             try:
@@ -3,20 +3,21 @@
 This module provides the `Arc` class, which is the main entry point for the SDK.
 """
 
+import copy
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 from arc_memory.db import get_adapter as get_db_adapter
-from arc_memory.db.base import DatabaseAdapter
+from arc_memory.db.base import DatabaseAdapter, supports_graph_stats
 from arc_memory.errors import ArcError, DatabaseError
 from arc_memory.schema.models import Edge, Node
 from arc_memory.sql.db import ensure_arc_dir, get_db_path
 
-from arc_memory.sdk.adapters import FrameworkAdapter, get_adapter, discover_adapters
+from arc_memory.sdk.adapters import FrameworkAdapter, get_adapter
 from arc_memory.sdk.errors import SDKError, AdapterError, QueryError, BuildError, FrameworkError
 from arc_memory.sdk.models import (
-    DecisionTrailEntry, EntityDetails, HistoryEntry, ImpactResult, QueryResult, RelatedEntity,
+    DecisionTrailEntry, EntityDetails, HistoryEntry, ImpactResult, QueryEvent, QueryResult, RelatedEntity,
     ExportResult
 )
 from arc_memory.sdk.progress import ProgressCallback
@@ -80,8 +81,7 @@ class Arc:
             # Initialize active repositories list (for multi-repo support)
             self.active_repos = []
 
-            # Discover and register framework adapters
-            discover_adapters()
+            # Framework adapters are discovered lazily by get_adapter()
 
         except DatabaseError as e:
             # Convert database errors to SDK errors
@@ -152,27 +152,35 @@ class Arc:
                 "last_updated": None
             }
 
-            # Get total node count
-            cursor = self.adapter.conn.execute("SELECT COUNT(*) FROM nodes")
-            stats["total_nodes"] = cursor.fetchone()[0]
+            if supports_graph_stats(self.adapter):
+                # Counts are maintained as the graph is written, so reading
+                # them does not depend on the size of the graph
+                stats["node_types"] = self.adapter.get_type_counts()
+                stats["edge_relationships"] = self.adapter.get_relationship_counts()
+                stats["total_nodes"] = sum(stats["node_types"].values())
+                stats["total_edges"] = sum(stats["edge_relationships"].values())
+            else:
+                # Get total node count
+                cursor = self.adapter.conn.execute("SELECT COUNT(*) FROM nodes")
+                stats["total_nodes"] = cursor.fetchone()[0]
 
-            # Get node type distribution
-            cursor = self.adapter.conn.execute(
-                "SELECT type, COUNT(*) FROM nodes GROUP BY type"
-            )
-            for row in cursor.fetchall():
-                stats["node_types"][row[0]] = row[1]
+                # Get node type distribution
+                cursor = self.adapter.conn.execute(
+                    "SELECT type, COUNT(*) FROM nodes GROUP BY type"
+                )
+                for row in cursor.fetchall():
+                    stats["node_types"][row[0]] = row[1]
 
-            # Get total edge count
-            cursor = self.adapter.conn.execute("SELECT COUNT(*) FROM edges")
-            stats["total_edges"] = cursor.fetchone()[0]
+                # Get total edge count
+                cursor = self.adapter.conn.execute("SELECT COUNT(*) FROM edges")
+                stats["total_edges"] = cursor.fetchone()[0]
 
-            # Get edge relationship distribution
-            cursor = self.adapter.conn.execute(
-                "SELECT rel, COUNT(*) FROM edges GROUP BY rel"
-            )
-            for row in cursor.fetchall():
-                stats["edge_relationships"][row[0]] = row[1]
+                # Get edge relationship distribution
+                cursor = self.adapter.conn.execute(
+                    "SELECT rel, COUNT(*) FROM edges GROUP BY rel"
+                )
+                for row in cursor.fetchall():
+                    stats["edge_relationships"][row[0]] = row[1]
 
             # Get repository information
             repos = self.list_repositories()
@@ -669,51 +677,17 @@ class Arc:
             raise QueryError(f"Repository with ID '{repo_id}' does not exist")
 
         try:
-            # Start a transaction
-            self.adapter.conn.execute("BEGIN TRANSACTION")
+            # The adapter deletes or detaches the nodes in short batches that
+            # each hold the write lock briefly, then removes the repository;
+            # if this is interrupted, removing it again resumes
+            self.adapter.remove_repository(repo_id, delete_nodes=delete_nodes)
 
             # Remove from active repositories
             if repo_id in self.active_repos:
                 self.active_repos.remove(repo_id)
-
-            # Remove from repositories table
-            self.adapter.conn.execute(
-                "DELETE FROM repositories WHERE id = ?",
-                (repo_id,)
-            )
-
-            if delete_nodes:
-                # Delete all nodes from this repository
-                self.adapter.conn.execute(
-                    "DELETE FROM nodes WHERE repo_id = ?",
-                    (repo_id,)
-                )
-
-                # Find and delete orphaned edges
-                # This is a bit complex as we need to find edges where either src or dst
-                # was in the deleted repository and has been deleted
-                self.adapter.conn.execute("""
-                    DELETE FROM edges
-                    WHERE src IN (
-                        SELECT id FROM nodes WHERE repo_id = ?
-                    ) OR dst IN (
-                        SELECT id FROM nodes WHERE repo_id = ?
-                    )
-                """, (repo_id, repo_id))
-            else:
-                # Update nodes to remove repo_id
-                self.adapter.conn.execute(
-                    "UPDATE nodes SET repo_id = NULL WHERE repo_id = ?",
-                    (repo_id,)
-                )
-
-            # Commit transaction
-            self.adapter.conn.commit()
             return True
 
         except Exception as e:
-            # Rollback transaction
-            self.adapter.conn.rollback()
             raise QueryError(
                 f"Failed to remove repository: {e}",
                 details={
@@ -1166,6 +1140,62 @@ class Arc:
             repo_ids=repo_ids
         )
 
+    def query_stream(
+        self,
+        question: str,
+        max_results: int = 5,
+        max_hops: int = 3,
+        cache: bool = True,
+        timeout: int = 60,
+        repo_ids: Optional[List[str]] = None
+    ) -> Iterator[QueryEvent]:
+        """Query the knowledge graph using natural language, streaming the answer.
+
+        Like `query`, but yields results as they become available: first a
+        "results" event with the supporting evidence, then "token" events with
+        pieces of the answer while the LLM generates it, and finally a "final"
+        event whose `result` is the complete QueryResult.
+
+        Example:
+            ```python
+            for event in arc.query_stream("Why did we switch to SQLite?"):
+                if event.type == "token":
+                    print(event.text, end="", flush=True)
+            ```
+
+        Args:
+            question: The natural language question to ask.
+            max_results: Maximum number of results to return.
+            max_hops: Maximum number of hops in the graph traversal.
+            cache: Whether to use cached query intents and answers.
+            timeout: Maximum time in seconds to wait for Ollama response.
+            repo_ids: Optional list of repository IDs to filter by. If None, uses active repositories.
+
+        Yields:
+            QueryEvent objects, ending with a "final" event.
+
+        Raises:
+            QueryError: If the query fails.
+        """
+        from arc_memory.sdk.query import stream_query_knowledge_graph
+
+        # If no repo_ids provided, use active repositories
+        if repo_ids is None:
+            # If no active repositories, ensure current repository
+            if not self.active_repos:
+                self.ensure_repository()
+            repo_ids = self.active_repos
+
+        yield from stream_query_knowledge_graph(
+            adapter=self.adapter,
+            question=question,
+            max_results=max_results,
+            max_hops=max_hops,
+            timeout=timeout,
+            repo_ids=repo_ids,
+            cache=cache
+        )
+
     # Decision Trail API methods
 
     def get_decision_trail(
@@ -1213,6 +1243,46 @@ class Arc:
             callback=callback
         )
 
+    def trace_lines(
+        self,
+        file_path: str,
+        line_numbers: List[int],
+        max_results: int = 5,
+        max_hops: int = 3,
+        include_rationale: bool = True,
+        callback: Optional[ProgressCallback] = None
+    ) -> Dict[int, List[DecisionTrailEntry]]:
+        """Get the decision trails for several lines in a file at once.
+
+        The file is blamed once and the blame is cached until the file or HEAD
+        changes, so tracing every line of a diff hunk costs a single git call.
+
+        Args:
+            file_path: Path to the file, relative to the repository root.
+            line_numbers: Line numbers to trace (1-based).
+            max_results: Maximum number of results to return per line.
+            max_hops: Maximum number of hops in the graph traversal.
+            include_rationale: Whether to extract decision rationales.
+            callback: Optional callback for progress reporting.
+
+        Returns:
+            A mapping of line number to the DecisionTrailEntry objects for that line.
+
+        Raises:
+            QueryError: If getting the decision trails fails.
+        """
+        from arc_memory.sdk.decision_trail import get_decision_trails
+        return get_decision_trails(
+            adapter=self.adapter,
+            file_path=file_path,
+            line_numbers=line_numbers,
+            max_results=max_results,
+            max_hops=max_hops,
+            include_rationale=include_rationale,
+            repo_path=self.repo_path,
+            callback=callback
+        )
+
     # Entity Relationship API methods
 
     def get_related_entities(
@@ -1222,6 +1292,7 @@ class Arc:
         direction: str = "both",
         max_results: int = 10,
         include_properties: bool = True,
+        order_by: Optional[str] = None,
         cache: bool = True,
         callback: Optional[ProgressCallback] = None
     ) -> List[RelatedEntity]:
@@ -1236,6 +1307,8 @@ class Arc:
             direction: Direction of relationships to include ("outgoing", "incoming", or "both").
             max_results: Maximum number of results to return.
             include_properties: Whether to include edge properties in the results.
+            order_by: Optional ordering by the related entity's timestamp, "timestamp"
+                (oldest first) or "-timestamp" (newest first).
             cache: Whether to use cached results if available. When True (default),
                 results are cached and retrieved from cache if a matching query exists.
                 Set to False to force a fresh query execution.
@@ -1255,6 +1328,7 @@ class Arc:
             direction=direction,
             max_results=max_results,
             include_properties=include_properties,
+            order_by=order_by,
             cache=cache,
             callback=callback
         )
@@ -1294,6 +1368,80 @@ class Arc:
             callback=callback
         )
 
+    def get_related_entities_many(
+        self,
+        entity_ids: List[str],
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "both",
+        max_results: int = 10,
+        include_properties: bool = True,
+        order_by: Optional[str] = None,
+        callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, List[RelatedEntity]]:
+        """Get the entities related to each of many entities.
+
+        Like calling `get_related_entities` for every ID, but the edges and
+        related nodes of all the entities are read together.
+
+        Args:
+            entity_ids: The IDs of the entities.
+            relationship_types: Optional list of relationship types to filter by.
+            direction: Direction of relationships to include ("outgoing", "incoming", or "both").
+            max_results: Maximum number of results per entity.
+            include_properties: Whether to include edge properties in the results.
+            order_by: Optional ordering by the related entity's timestamp, "timestamp"
+                (oldest first) or "-timestamp" (newest first).
+            callback: Optional callback for progress reporting.
+
+        Returns:
+            A dictionary mapping each entity ID to its related entities.
+
+        Raises:
+            QueryError: If getting related entities fails.
+        """
+        from arc_memory.sdk.relationships import get_related_entities_many
+        return get_related_entities_many(
+            adapter=self.adapter,
+            entity_ids=entity_ids,
+            relationship_types=relationship_types,
+            direction=direction,
+            max_results=max_results,
+            include_properties=include_properties,
+            order_by=order_by,
+            callback=callback
+        )
+
+    def get_entities(
+        self,
+        entity_ids: List[str],
+        include_related: bool = True,
+        callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Optional[EntityDetails]]:
+        """Get detailed information about many entities.
+
+        Like calling `get_entity_details` for every ID, but the entities and
+        their relationships are read in bulk.
+
+        Args:
+            entity_ids: The IDs of the entities.
+            include_related: Whether to include related entities.
+            callback: Optional callback for progress reporting.
+
+        Returns:
+            A dictionary mapping each entity ID to its EntityDetails, or to None
+            if the entity doesn't exist.
+
+        Raises:
+            QueryError: If getting the entities fails.
+        """
+        from arc_memory.sdk.relationships import get_entities
+        return get_entities(
+            adapter=self.adapter,
+            entity_ids=entity_ids,
+            include_related=include_related,
+            callback=callback
+        )
+
     # Architecture API methods
 
     def get_architecture_components(
@@ -1438,6 +1586,49 @@ class Arc:
             callback=callback
         )
 
+    def analyze_impact_many(
+        self,
+        component_ids: List[str],
+        impact_types: Optional[List[str]] = None,
+        max_depth: int = 3,
+        callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, List[ImpactResult]]:
+        """Analyze the potential impact of changes to many components at once.
+
+        Like calling `analyze_component_impact` for every component, but the
+        components share their node, edge and co-change lookups, which makes
+        analyzing all the files of a pull request much cheaper.
+
+        Args:
+            component_ids: The IDs of the components to analyze.
+            impact_types: Types of impact to include ("direct", "indirect", "potential").
+                If None, all impact types will be included.
+            max_depth: Maximum depth of indirect dependency analysis.
+            callback: Optional callback for progress reporting.
+
+        Returns:
+            A dictionary mapping each component ID to its ImpactResult list;
+            components that aren't in the graph map to an empty list.
+
+        Raises:
+            QueryError: If the impact analysis fails.
+
+        Example:
+            ```python
+            changed = ["file:src/auth/login.py", "file:src/auth/session.py"]
+            for component_id, results in arc.analyze_impact_many(changed).items():
+                high_impact = [r for r in results if r.impact_score > 0.7]
+            ```
+        """
+        from arc_memory.sdk.impact import analyze_impact_many
+        return analyze_impact_many(
+            adapter=self.adapter,
+            component_ids=component_ids,
+            impact_types=impact_types,
+            max_depth=max_depth,
+            callback=callback
+        )
+
     # Temporal Analysis API methods
 
     def get_entity_history(
@@ -1481,6 +1672,46 @@ class Arc:
             callback=callback
         )
 
+    def as_of(self, timestamp: Union[datetime, str]) -> "Arc":
+        """Get a view of the knowledge graph as it was at a point in time.
+
+        The view shares this instance's database connection. Related entities,
+        entity details, component impact, entity history and graph export on the
+        view only see nodes and edges that were valid at ``timestamp``: nodes
+        whose ``valid_from`` (or timestamp) is not after it and whose
+        ``valid_until`` is after it, and edges whose validity interval contains
+        it and whose endpoints were valid. Lookups use the composite validity
+        indexes, so they cost about the same as current-state lookups.
+
+        Args:
+            timestamp: The point in time, as a datetime or an ISO 8601 string.
+
+        Returns:
+            An Arc instance bound to that point in time. Closing it leaves this
+            instance's connection open.
+
+        Raises:
+            SDKError: If the timestamp is not a valid point in time.
+
+        Example:
+            ```python
+            arc = Arc(repo_path="./")
+            before_incident = arc.as_of("2024-03-01T12:00:00")
+            related = before_incident.get_related_entities("file:src/auth/login.py")
+            ```
+        """
+        from arc_memory.db.temporal import AsOfAdapter
+
+        try:
+            view_adapter = AsOfAdapter(self.adapter, timestamp)
+        except (AttributeError, TypeError, ValueError) as e:
+            raise SDKError(f"Invalid as-of timestamp {timestamp!r}: {e}") from e
+
+        view = copy.copy(self)
+        view.adapter = view_adapter
+        view.active_repos = list(self.active_repos)
+        return view
+
     # Framework Adapter API methods
 
     def get_adapter(self, framework: str) -> FrameworkAdapter:
@@ -1561,6 +1792,8 @@ class Arc:
         pr_sha: str,
         output_path: Union[str, Path],
         compress: bool = True,
+        compression: str = "gzip",
+        format: str = "json",
         sign: bool = False,
         key_id: Optional[str] = None,
         base_branch: str = "main",
@@ -1579,7 +1812,11 @@ class Arc:
             pr_sha: SHA of the PR head commit.
             output_path: Path to save the export file.
             compress: Whether to compress the output file.
-            sign: Whether to sign the output file with GPG.
+            compression: Compression codec used when compress is True ("gzip" or "zstd").
+            format: Export format, "json" for a single compact document or "jsonl" for
+                newline-delimited records that can be processed incrementally.
+            sign: Whether to sign the output file with GPG. The signature is computed
+                while the file is being written.
             key_id: GPG key ID to use for signing.
             base_branch: Base branch to compare against.
             max_hops: Maximum number of hops to traverse in the graph.
@@ -1608,7 +1845,9 @@ class Arc:
                 repo_path=self.repo_path,
                 pr_sha=pr_sha,
                 output_path=output_path,
+                format=format,
                 compress=compress,
+                compression=compression,
                 sign=sign,
                 key_id=key_id,
                 base_branch=base_branch,
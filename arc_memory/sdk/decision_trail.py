@@ -5,7 +5,7 @@ and extracting decision rationales.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from arc_memory.db.base import DatabaseAdapter
 from arc_memory.logging_conf import get_logger
@@ -13,7 +13,7 @@ from arc_memory.sdk.cache import cached
 from arc_memory.sdk.errors import QueryError
 from arc_memory.sdk.models import DecisionTrailEntry, EntityDetails
 from arc_memory.sdk.progress import ProgressCallback, ProgressStage
-from arc_memory.trace import trace_history_for_file_line
+from arc_memory.trace import trace_history_for_file_line, trace_history_for_file_lines
 
 logger = get_logger(__name__)
 
@@ -89,25 +89,7 @@ def get_decision_trail(
             )
 
         # Convert to DecisionTrailEntry models
-        entities = []
-        for i, result in enumerate(results):
-            # Extract basic properties
-            entity = DecisionTrailEntry(
-                id=result["id"],
-                type=result["type"],
-                title=result.get("title", ""),
-                body=result.get("body", ""),
-                timestamp=result.get("timestamp"),
-                properties={
-                    k: v for k, v in result.items()
-                    if k not in ["id", "type", "title", "body", "timestamp"]
-                },
-                related_entities=[],
-                rationale=_extract_rationale(result) if include_rationale else None,
-                importance=_calculate_importance(result),
-                trail_position=i
-            )
-            entities.append(entity)
+        entities = _to_trail_entries(results, include_rationale)
 
         # Report progress
         if callback:
@@ -124,6 +106,126 @@ def get_decision_trail(
         raise QueryError(f"Failed to get decision trail: {e}")
 
 
+def get_decision_trails(
+    adapter: DatabaseAdapter,
+    file_path: str,
+    line_numbers: Iterable[int],
+    max_results: int = 5,
+    max_hops: int = 3,
+    include_rationale: bool = True,
+    repo_path: Optional[Path] = None,
+    callback: Optional[ProgressCallback] = None
+) -> Dict[int, List[DecisionTrailEntry]]:
+    """Get the decision trails for several lines in a file.
+
+    The file is blamed once and lines last modified by the same commit share
+    one graph traversal, which makes this much cheaper than calling
+    get_decision_trail once per line.
+
+    Args:
+        adapter: The database adapter to use.
+        file_path: Path to the file, relative to the repository root.
+        line_numbers: Line numbers to trace (1-based).
+        max_results: Maximum number of results to return per line.
+        max_hops: Maximum number of hops in the graph traversal.
+        include_rationale: Whether to extract decision rationales.
+        repo_path: Path to the Git repository (defaults to the current directory).
+        callback: Optional callback for progress reporting.
+
+    Returns:
+        A mapping of line number to the DecisionTrailEntry objects for that line.
+
+    Raises:
+        QueryError: If getting the decision trails fails.
+    """
+    try:
+        if callback:
+            callback(
+                ProgressStage.INITIALIZING,
+                "Initializing decision trail analysis",
+                0.0
+            )
+
+        db_path = Path(adapter.db_path) if hasattr(adapter, "db_path") else None
+        if not db_path:
+            raise QueryError("Database path not available")
+
+        if callback:
+            callback(
+                ProgressStage.QUERYING,
+                "Tracing file line history",
+                0.2
+            )
+
+        results = trace_history_for_file_lines(
+            db_path=db_path,
+            file_path=file_path,
+            line_numbers=line_numbers,
+            max_results=max_results,
+            max_hops=max_hops,
+            repo_path=repo_path
+        )
+
+        if callback:
+            callback(
+                ProgressStage.PROCESSING,
+                "Processing decision trail results",
+                0.6
+            )
+
+        trails = {
+            line: _to_trail_entries(line_results, include_rationale)
+            for line, line_results in results.items()
+        }
+
+        if callback:
+            callback(
+                ProgressStage.COMPLETING,
+                "Decision trail analysis complete",
+                1.0
+            )
+
+        return trails
+
+    except Exception as e:
+        logger.exception(f"Error in get_decision_trails: {e}")
+        raise QueryError(f"Failed to get decision trails: {e}")
+
+
+def _to_trail_entries(
+    results: List[Dict[str, Any]], include_rationale: bool
+) -> List[DecisionTrailEntry]:
+    """Convert formatted trace results to DecisionTrailEntry models.
+
+    Args:
+        results: The formatted trace results, newest first.
+        include_rationale: Whether to extract decision rationales.
+
+    Returns:
+        A list of DecisionTrailEntry objects.
+    """
+    entities = []
+    for i, result in enumerate(results):
+        # Extract basic properties
+        entity = DecisionTrailEntry(
+            id=result["id"],
+            type=result["type"],
+            title=result.get("title", ""),
+            body=result.get("body", ""),
+            timestamp=result.get("timestamp"),
+            properties={
+                k: v for k, v in result.items()
+                if k not in ["id", "type", "title", "body", "timestamp"]
+            },
+            related_entities=[],
+            rationale=_extract_rationale(result) if include_rationale else None,
+            importance=_calculate_importance(result),
+            trail_position=i
+        )
+        entities.append(entity)
+    return entities
+
+
 def _extract_rationale(node: Dict[str, Any]) -> Optional[str]:
     """Extract a decision rationale from a node.
 
@@ -4,23 +4,27 @@ This module provides methods for exporting the knowledge graph to various format
 with support for filtering, compression, and signing.
 """
 
-import gzip
-import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
 
 from arc_memory.db.base import DatabaseAdapter
+from arc_memory.db.temporal import AsOfAdapter
 from arc_memory.errors import ExportError, GitError
 from arc_memory.export import (
-    DateTimeEncoder,
-    extract_causal_relationships,
-    format_export_data,
+    EXPORT_COMPRESSIONS,
+    EXPORT_FORMATS,
+    EXPORT_SCHEMA_VERSION,
+    ExportWriter,
+    LLMSectionCollector,
+    format_export_edge,
+    format_export_node,
+    get_export_path,
     get_pr_modified_files,
     get_related_nodes,
-    optimize_export_for_llm,
-    sign_file,
+    iter_nodes_by_ids,
+    iter_raw_export_records,
 )
 from arc_memory.logging_conf import get_logger
 from arc_memory.sdk.cache import cached
@@ -43,6 +47,7 @@ def export_knowledge_graph(
     end_date: Optional[datetime] = None,
     format: str = "json",
     compress: bool = False,
+    compression: str = "gzip",
     sign: bool = False,
     key_id: Optional[str] = None,
     base_branch: str = "main",
@@ -57,15 +62,18 @@ def export_knowledge_graph(
     It supports exporting in various formats, with options for compression and signing.
 
     Args:
-        adapter: The database adapter to use.
+        adapter: The database adapter to use. If it is an AsOfAdapter, only the
+            nodes and edges valid at its point in time are exported.
         repo_path: Path to the Git repository.
         output_path: Path to save the export file.
         pr_sha: Optional SHA of a PR head commit to filter by.
         entity_types: Optional list of entity types to include.
         start_date: Optional start date for filtering entities.
         end_date: Optional end date for filtering entities.
-        format: Export format (currently only "json" is supported).
+        format: Export format, "json" for a single compact document or "jsonl"
+            for newline-delimited header, node and edge records.
         compress: Whether to compress the output file.
+        compression: Compression codec used when compress is True ("gzip" or "zstd").
         sign: Whether to sign the output file with GPG.
         key_id: GPG key ID to use for signing.
         base_branch: Base branch to compare against when using pr_sha.
@@ -83,6 +91,17 @@ def export_knowledge_graph(
     try:
         start_time = datetime.now()
 
+        if format not in EXPORT_FORMATS:
+            raise ExportSDKError(
+                f"Unsupported export format '{format}'. "
+                f"Expected one of: {', '.join(EXPORT_FORMATS)}"
+            )
+        if compress and compression not in EXPORT_COMPRESSIONS:
+            raise ExportSDKError(
+                f"Unsupported compression '{compression}'. "
+                f"Expected one of: {', '.join(EXPORT_COMPRESSIONS)}"
+            )
+
         # Report progress
         if callback:
             callback(
@@ -108,9 +127,9 @@ def export_knowledge_graph(
                 0.1
             )
 
-        # Initialize variables for nodes and edges
-        nodes = []
-        edges = []
+        # Initialize variables for node IDs and edges
+        node_ids: List[str] = []
+        edges: List[Dict[str, Any]] = []
         modified_files = []
 
         # If PR SHA is provided, get modified files and related nodes
@@ -143,115 +162,85 @@ def export_knowledge_graph(
                         0.3
                     )
 
-                nodes, edges = get_related_nodes(
+                # Only node IDs are collected; the nodes are streamed into the file
+                node_ids, edges = get_related_nodes(
                     conn,
                     file_nodes,
                     max_hops=max_hops,
                     include_adrs=True,
-                    include_causal=include_causal
+                    include_causal=include_causal,
+                    as_of=adapter.as_of if isinstance(adapter, AsOfAdapter) else None,
+                    ids_only=True,
                 )
             except GitError as e:
                 raise ExportSDKError(f"Git error: {e}")
 
-        # Filter by entity types if provided
-        if entity_types and nodes:
-            nodes = [n for n in nodes if n.get("type") in entity_types]
-
-            # Filter edges to only include those connecting the filtered nodes
-            node_ids = {n["id"] for n in nodes}
-            edges = [e for e in edges if e["src"] in node_ids and e["dst"] in node_ids]
-
-        # Filter by date if provided
-        if (start_date or end_date) and nodes:
-            filtered_nodes = []
-            for node in nodes:
-                # Check if the node has a timestamp
-                timestamp = None
-                if "extra" in node and "timestamp" in node["extra"]:
-                    timestamp_str = node["extra"]["timestamp"]
-                    try:
-                        timestamp = datetime.fromisoformat(timestamp_str)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Apply date filters
-                if timestamp:
-                    if start_date and timestamp < start_date:
-                        continue
-                    if end_date and timestamp > end_date:
-                        continue
-
-                filtered_nodes.append(node)
-
-            # Update nodes list
-            nodes = filtered_nodes
-
-            # Filter edges to only include those connecting the filtered nodes
-            node_ids = {n["id"] for n in nodes}
-            edges = [e for e in edges if e["src"] in node_ids and e["dst"] in node_ids]
-
-        # Report progress
-        if callback:
-            callback(
-                ProgressStage.PROCESSING,
-                f"Formatting export data with {len(nodes)} nodes and {len(edges)} edges",
-                0.6
-            )
-
-        # Format the export data
-        export_data = format_export_data(
-            pr_sha=pr_sha or "export",
-            nodes=nodes,
-            edges=edges,
-            changed_files=modified_files
-        )
-
-        # Optimize the export data for LLM reasoning if enabled
+        # Nodes are filtered as they are read; edges are kept when both of
+        # their nodes were, which is known once the nodes have been written
+        filtered = bool(entity_types or start_date or end_date)
+        exported_ids: Set[str] = set()
+
+        def selected_nodes() -> Iterator[Dict[str, Any]]:
+            for node in iter_nodes_by_ids(conn, node_ids):
+                if entity_types and node.get("type") not in entity_types:
+                    continue
+                if not _in_date_range(node, start_date, end_date):
+                    continue
+                exported_ids.add(node["id"])
+                yield node
+
+        def selected_edges() -> Iterator[Dict[str, Any]]:
+            for edge in edges:
+                if not filtered or (edge["src"] in exported_ids and edge["dst"] in exported_ids):
+                    yield edge
+
+        nodes: Iterator[Dict[str, Any]] = selected_nodes()
+        sections = None
         if optimize_for_llm:
-            if callback:
-                callback(
-                    ProgressStage.PROCESSING,
-                    "Optimizing export data for LLM reasoning",
-                    0.7
-                )
-            export_data = optimize_export_for_llm(export_data)
+            # The LLM optimization sections are computed from the nodes as
+            # they stream past and written after the edges
+            collector = LLMSectionCollector()
+            nodes = collector.observe(nodes)
+
+            def sections() -> Dict[str, Any]:
+                return collector.sections(selected_edges())
 
         # Report progress
         if callback:
             callback(
                 ProgressStage.FINALIZING,
-                "Writing export data to file",
+                f"Writing up to {len(node_ids)} nodes and {len(edges)} edges to file"
+                + (" and signing it" if sign else ""),
                 0.8
             )
 
-        # Write the export data to file
-        final_path = output_path
-        if compress:
-            # If compress is True, ensure the output path has .gz extension
-            if not str(output_path).endswith(".gz"):
-                final_path = Path(f"{output_path}.gz")
-
-            logger.info(f"Writing compressed export to {final_path}")
-            with gzip.open(final_path, "wt") as f:
-                json.dump(export_data, f, cls=DateTimeEncoder, indent=2)
-        else:
-            logger.info(f"Writing export to {output_path}")
-            with open(output_path, "w") as f:
-                json.dump(export_data, f, cls=DateTimeEncoder, indent=2)
-
-        # Sign the file if requested
-        signature_path = None
-        if sign:
-            if callback:
-                callback(
-                    ProgressStage.FINALIZING,
-                    "Signing the export file",
-                    0.9
-                )
+        # Format, write (and sign) the export data in a single streaming pass
+        final_path = get_export_path(output_path, compress, compression)
+        logger.info(f"Writing {format} export to {final_path}")
+        with ExportWriter(
+            final_path,
+            compression=compression if compress else None,
+            sign=sign,
+            key_id=key_id,
+        ) as writer:
+            if format == "jsonl":
+                for record in iter_raw_export_records(
+                    pr_sha or "export", nodes, selected_edges(), modified_files,
+                    sections=sections,
+                ):
+                    writer.write_record(record)
+            else:
+                writer.write_streaming_document({
+                    "schema_version": EXPORT_SCHEMA_VERSION,
+                    "generated_at": datetime.now().isoformat(),
+                    "pr": {"sha": pr_sha or "export", "changed_files": modified_files},
+                    "nodes": (format_export_node(node) for node in nodes),
+                    "edges": (format_export_edge(edge) for edge in selected_edges()),
+                }, trailer=sections)
 
-            sig_path = sign_file(final_path, key_id)
-            if sig_path:
-                signature_path = str(sig_path)
+        signature_path = None
+        if writer.signature_path:
+            signature_path = str(writer.signature_path)
 
         # Calculate execution time
         execution_time = (datetime.now() - start_time).total_seconds()
@@ -268,11 +257,13 @@ def export_knowledge_graph(
         return ExportResult(
             output_path=str(final_path),
             format=format,
-            entity_count=len(nodes),
-            relationship_count=len(edges),
+            entity_count=len(exported_ids),
+            relationship_count=sum(1 for _ in selected_edges()),
             compressed=compress,
             signed=sign,
             signature_path=signature_path,
+            sha256=writer.sha256,
+            size_bytes=writer.bytes_written,
             execution_time=execution_time
         )
 
@@ -282,3 +273,28 @@ def export_knowledge_graph(
     except Exception as e:
         # Convert other exceptions to export SDK errors
         raise ExportSDKError(f"Error exporting knowledge graph: {e}")
+
+
+def _in_date_range(
+    node: Dict[str, Any], start_date: Optional[datetime], end_date: Optional[datetime]
+) -> bool:
+    """Check whether a node's timestamp is within the date range.
+
+    Nodes without a readable timestamp are always in range.
+    """
+    if not (start_date or end_date):
+        return True
+
+    timestamp = None
+    if "extra" in node and "timestamp" in node["extra"]:
+        try:
+            timestamp = datetime.fromisoformat(node["extra"]["timestamp"])
+        except (ValueError, TypeError):
+            pass
+
+    if timestamp:
+        if start_date and timestamp < start_date:
+            return False
+        if end_date and timestamp > end_date:
+            return False
+    return True
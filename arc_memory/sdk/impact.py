@@ -9,8 +9,10 @@ from datetime import datetime
 import math
 from typing import Any, Dict, List, Optional, Set
 
-from arc_memory.db.base import DatabaseAdapter
+from arc_memory.db.base import DatabaseAdapter, supports_graph_stats, supports_traversal
+from arc_memory.db.prefetch import PrefetchingAdapter
 from arc_memory.logging_conf import get_logger
+from arc_memory.schema.models import EdgeRel
 from arc_memory.sdk.cache import cached
 from arc_memory.sdk.errors import QueryError
 from arc_memory.sdk.models import ImpactResult
@@ -18,6 +20,13 @@ from arc_memory.sdk.progress import ProgressCallback, ProgressStage
 
 logger = get_logger(__name__)
 
+# Relationship types followed when looking for indirect dependencies
+_DEPENDENCY_RELS = [
+    "DEPENDS_ON", "IMPORTS", "USES", "CALLS", "REFERENCES",
+    "INHERITS_FROM", "IMPLEMENTS", "PART_OF", "COMMUNICATES_WITH",
+    "CONSUMES",
+]
+
 
 @cached()
 def analyze_component_impact(
@@ -195,6 +204,152 @@ def analyze_component_impact(
         )
 
 
+def analyze_impact_many(
+    adapter: DatabaseAdapter,
+    component_ids: List[str],
+    impact_types: Optional[List[str]] = None,
+    max_depth: int = 3,
+    callback: Optional[ProgressCallback] = None
+) -> Dict[str, List[ImpactResult]]:
+    """Analyze the potential impact of changes to many components at once.
+
+    Gives the same results as calling `analyze_component_impact` for every
+    component, but the components share their lookups: their nodes, their
+    dependency edges and the nodes and degrees at the other ends are read in
+    bulk up front, the co-change scan reads the commits of all the files
+    together, and anything read while analyzing one component (including
+    indirect dependency chains) is reused for the others. This suits pull
+    requests that touch many related files.
+
+    Args:
+        adapter: The database adapter to use for querying the knowledge graph.
+        component_ids: The IDs of the components to analyze. Duplicates are
+            analyzed once.
+        impact_types: Types of impact to include in the analysis ("direct",
+            "indirect", "potential"). If None, all impact types will be included.
+        max_depth: Maximum depth of indirect dependency analysis.
+        callback: Optional callback function for progress reporting.
+
+    Returns:
+        A dictionary mapping each component ID to its ImpactResult list.
+        Components that aren't in the knowledge graph map to an empty list
+        instead of failing the whole batch.
+
+    Raises:
+        QueryError: If the impact analysis fails.
+
+    Example:
+        ```python
+        impacts = analyze_impact_many(
+            adapter=db_adapter,
+            component_ids=["file:src/auth/login.py", "file:src/auth/session.py"],
+        )
+        for component_id, results in impacts.items():
+            print(component_id, len(results))
+        ```
+    """
+    try:
+        if callback:
+            callback(
+                ProgressStage.INITIALIZING,
+                "Initializing impact analysis",
+                0.0
+            )
+
+        if impact_types is None:
+            impact_types = ["direct", "indirect", "potential"]
+
+        lookup = PrefetchingAdapter(adapter)
+        ids = list(dict.fromkeys(component_ids))
+
+        if callback:
+            callback(
+                ProgressStage.QUERYING,
+                "Reading components and their dependencies",
+                0.2
+            )
+
+        _prefetch_impact_lookups(lookup, ids, impact_types)
+
+        results: Dict[str, List[ImpactResult]] = {}
+        for index, component_id in enumerate(ids):
+            if callback:
+                callback(
+                    ProgressStage.ANALYZING,
+                    f"Analyzing {component_id}",
+                    0.3 + 0.7 * index / len(ids)
+                )
+
+            if not lookup.get_node_by_id(component_id):
+                logger.warning(f"Component with ID '{component_id}' not found")
+                results[component_id] = []
+                continue
+
+            impacts: List[ImpactResult] = []
+            if "direct" in impact_types or "indirect" in impact_types:
+                direct_impacts = _analyze_direct_dependencies(lookup, component_id)
+                if "direct" in impact_types:
+                    impacts.extend(direct_impacts)
+                if "indirect" in impact_types:
+                    impacts.extend(
+                        _analyze_indirect_dependencies(lookup, component_id, direct_impacts, max_depth)
+                    )
+            if "potential" in impact_types:
+                impacts.extend(_analyze_cochange_patterns(lookup, component_id))
+            results[component_id] = impacts
+
+        if callback:
+            callback(
+                ProgressStage.COMPLETING,
+                "Impact analysis complete",
+                1.0
+            )
+
+        return results
+
+    except QueryError:
+        raise
+    except Exception as e:
+        logger.exception(f"Error in analyze_impact_many: {e}")
+        raise QueryError.from_exception(
+            exception=e,
+            what_happened="Failed to analyze component impact",
+            how_to_fix_it="Check the component IDs and ensure your knowledge graph is properly built. If the issue persists, try with a smaller max_depth value",
+            details={"component_count": len(component_ids), "max_depth": max_depth}
+        )
+
+
+def _prefetch_impact_lookups(
+    lookup: PrefetchingAdapter, component_ids: List[str], impact_types: List[str]
+) -> None:
+    """Read what the impact analysis of many components needs in a few bulk lookups.
+
+    Args:
+        lookup: The shared lookup cache.
+        component_ids: The IDs of the components to analyze.
+        impact_types: The requested impact types.
+    """
+    lookup.prefetch_nodes(component_ids)
+
+    if "direct" in impact_types or "indirect" in impact_types:
+        edges = lookup.prefetch_edges(component_ids, "both")
+        components = set(component_ids)
+        neighbors = {
+            edge["dst"] if edge["src"] in components else edge["src"]
+            for edge in edges if edge["rel"] in _DEPENDENCY_RELS
+        }
+        lookup.prefetch_nodes(neighbors)
+        if supports_graph_stats(lookup):
+            lookup.get_degrees(sorted(neighbors))
+
+    if "potential" in impact_types:
+        file_ids = [component_id for component_id in component_ids if component_id.startswith("file:")]
+        commit_ids = {edge["src"] for edge in lookup.prefetch_edges(file_ids, "incoming", EdgeRel.MODIFIES)}
+        lookup.prefetch_nodes(commit_ids)
+        cochanged = {edge["dst"] for edge in lookup.prefetch_edges(commit_ids, "outgoing", EdgeRel.MODIFIES)}
+        lookup.prefetch_edges(cochanged, "incoming", EdgeRel.MODIFIES)
+
+
 def _analyze_direct_dependencies(
     adapter: DatabaseAdapter, component_id: str
 ) -> List[ImpactResult]:
@@ -226,9 +381,7 @@ def _analyze_direct_dependencies(
     outgoing_edges = adapter.get_edges_by_src(component_id)
     for edge in outgoing_edges:
         # Consider all relationship types, but filter out non-dependency relationships
-        if edge["rel"] in ["DEPENDS_ON", "IMPORTS", "USES", "CALLS", "REFERENCES",
-                          "INHERITS_FROM", "IMPLEMENTS", "PART_OF", "COMMUNICATES_WITH",
-                          "CONSUMES"]:
+        if edge["rel"] in _DEPENDENCY_RELS:
             target = adapter.get_node_by_id(edge["dst"])
             if target:
                 # Calculate relationship strength
@@ -265,9 +418,7 @@ def _analyze_direct_dependencies(
     # Get incoming edges (components that depend on this component)
     incoming_edges = adapter.get_edges_by_dst(component_id)
     for edge in incoming_edges:
-        if edge["rel"] in ["DEPENDS_ON", "IMPORTS", "USES", "CALLS", "REFERENCES",
-                          "INHERITS_FROM", "IMPLEMENTS", "PART_OF", "COMMUNICATES_WITH",
-                          "CONSUMES"]:
+        if edge["rel"] in _DEPENDENCY_RELS:
             source = adapter.get_node_by_id(edge["src"])
             if source:
                 # Calculate relationship strength (slightly lower for incoming dependencies)
@@ -338,6 +489,12 @@ def _analyze_indirect_dependencies(
     for impact in direct_impacts:
         visited.add(impact.id)
 
+    # Adapters with server-side traversal walk every chain in a single query
+    if supports_traversal(adapter):
+        return _traverse_indirect_dependencies(
+            adapter, component_id, direct_impacts, visited, max_depth
+        )
+
     # Process each direct impact to find indirect impacts
     for impact in direct_impacts:
         # Recursively find dependencies up to max_depth
@@ -349,6 +506,79 @@ def _analyze_indirect_dependencies(
     return results
 
 
+def _traverse_indirect_dependencies(
+    adapter: DatabaseAdapter,
+    component_id: str,
+    direct_impacts: List[ImpactResult],
+    visited: Set[str],
+    max_depth: int
+) -> List[ImpactResult]:
+    """Find indirect dependencies with a server-side variable-length traversal.
+
+    This follows the same dependency relationships as
+    ``_find_indirect_dependencies``, starting from the direct impacts, but
+    reaches each component through its shortest chain in one query.
+
+    Args:
+        adapter: A database adapter that supports traversal.
+        component_id: The ID of the component to analyze.
+        direct_impacts: List of direct impacts already identified.
+        visited: Component IDs to leave out of the results.
+        max_depth: Maximum depth of indirect dependency analysis.
+
+    Returns:
+        A list of ImpactResult objects representing indirectly affected components.
+    """
+    if max_depth <= 1 or not direct_impacts:
+        return []
+
+    rows = adapter.traverse(
+        [impact.id for impact in direct_impacts],
+        max_depth=max_depth - 1,
+        rel_types=_DEPENDENCY_RELS,
+        direction="outgoing",
+        exclude_ids=sorted(visited),
+    )
+
+    results = []
+    for row in rows:
+        target = row["node"]
+        if target["id"] in visited:
+            continue
+        visited.add(target["id"])
+
+        new_path = [component_id] + row["path"]
+        rel_strength = _calculate_relationship_strength(row["edge"], row["source"], target)
+        target_importance = _evaluate_component_importance(target, adapter)
+        arch_context = _evaluate_architectural_context(target, new_path, adapter)
+
+        # Same decay as the recursive walk, based on the length of the parent path
+        decay_factor = max(0.3, 1.0 - (0.2 * (len(new_path) - 2)))
+        base_score = rel_strength * (1.0 + target_importance * 0.2 + arch_context)
+        impact_score = min(1.0, base_score * decay_factor)
+
+        results.append(
+            ImpactResult(
+                id=target["id"],
+                type=target["type"],
+                title=target.get("title"),
+                body=target.get("body"),
+                properties={
+                    "relationship_strength": rel_strength,
+                    "component_importance": target_importance,
+                    "architectural_context": arch_context,
+                    "decay_factor": decay_factor
+                },
+                related_entities=[],
+                impact_type="indirect",
+                impact_score=impact_score,
+                impact_path=new_path
+            )
+        )
+
+    return results
+
+
 def _find_indirect_dependencies(
     adapter: DatabaseAdapter,
     component_id: str,
@@ -390,9 +620,7 @@ def _find_indirect_dependencies(
     outgoing_edges = adapter.get_edges_by_src(component_id)
     for edge in outgoing_edges:
         # Consider all relationship types, but filter out non-dependency relationships
-        if edge["rel"] in ["DEPENDS_ON", "IMPORTS", "USES", "CALLS", "REFERENCES",
-                          "INHERITS_FROM", "IMPLEMENTS", "PART_OF", "COMMUNICATES_WITH",
-                          "CONSUMES"]:
+        if edge["rel"] in _DEPENDENCY_RELS:
             target_id = edge["dst"]
             if target_id not in visited:
                 visited.add(target_id)
@@ -566,11 +794,16 @@ def _evaluate_component_importance(node: Dict[str, Any], adapter: DatabaseAdapte
     base_score = node_type_scores.get(node["type"], 0.7)
 
     # Calculate centrality (number of connections)
-    incoming_edges = adapter.get_edges_by_dst(node["id"])
-    outgoing_edges = adapter.get_edges_by_src(node["id"])
+    if supports_graph_stats(adapter):
+        # Degrees are maintained at write time, so no edges are fetched
+        in_degree, out_degree = adapter.get_degrees([node["id"]])[node["id"]]
+        total_connections = in_degree + out_degree
+    else:
+        incoming_edges = adapter.get_edges_by_dst(node["id"])
+        outgoing_edges = adapter.get_edges_by_src(node["id"])
+        total_connections = len(incoming_edges) + len(outgoing_edges)
 
     # Calculate centrality score (normalized by log scale to avoid extreme values)
-    total_connections = len(incoming_edges) + len(outgoing_edges)
     centrality_score = 0.0
     if total_connections > 0:
         # Log scale to dampen effect of very high connection counts
@@ -41,6 +41,30 @@ class QueryResult(BaseModel):
     """Time taken to execute the query in seconds."""
 
 
+class QueryEvent(BaseModel):
+    """An event from a streaming natural language query.
+
+    A streaming query yields one "results" event with the retrieved evidence,
+    then "token" events with pieces of the answer as it is generated, and
+    finally one "final" event with the complete result.
+    """
+
+    type: str
+    """The event type: "results", "token" or "final"."""
+
+    text: str = ""
+    """The next piece of the answer, for "token" events."""
+
+    evidence: List[Dict[str, Any]] = Field(default_factory=list)
+    """The retrieved evidence, for the "results" event."""
+
+    query_understanding: Optional[str] = None
+    """How the system interpreted the query, for the "results" event."""
+
+    result: Optional[QueryResult] = None
+    """The complete result, for the "final" event."""
+
+
 class RelatedEntity(BaseModel):
     """A related entity in the knowledge graph.
 
@@ -195,5 +219,11 @@ class ExportResult(BaseModel):
     signature_path: Optional[str] = None
     """Path to the signature file, if signed."""
 
+    sha256: Optional[str] = None
+    """SHA-256 digest of the written file."""
+
+    size_bytes: Optional[int] = None
+    """Size of the written file in bytes."""
+
     execution_time: float = 0.0
     """Time taken to execute the export in seconds."""
@@ -4,21 +4,20 @@ This module provides methods for querying the knowledge graph using natural lang
 """
 
 import json
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from arc_memory.db.base import DatabaseAdapter
 from arc_memory.logging_conf import get_logger
-from arc_memory.sdk.cache import cached
 from arc_memory.sdk.errors import QueryError
-from arc_memory.sdk.models import QueryResult
+from arc_memory.sdk.models import QueryEvent, QueryResult
 from arc_memory.sdk.progress import ProgressCallback, ProgressStage
-from arc_memory.semantic_search import process_query
+from arc_memory.semantic_search import process_query, stream_query
 
 logger = get_logger(__name__)
 
 
-@cached()
 def query_knowledge_graph(
     adapter: DatabaseAdapter,
     question: str,
@@ -27,7 +26,8 @@ def query_knowledge_graph(
     include_causal: bool = True,
     callback: Optional[ProgressCallback] = None,
     timeout: int = 60,
-    repo_ids: Optional[List[str]] = None
+    repo_ids: Optional[List[str]] = None,
+    cache: bool = True
 ) -> QueryResult:
     """Query the knowledge graph using natural language.
 
@@ -44,6 +44,7 @@ def query_knowledge_graph(
         callback: Optional callback for progress reporting.
         timeout: Maximum time in seconds to wait for Ollama response.
         repo_ids: Optional list of repository IDs to filter by.
+        cache: Whether to use cached query intents and answers.
 
     Returns:
         A QueryResult containing the answer and supporting evidence.
@@ -84,7 +85,8 @@ def query_knowledge_graph(
             max_results=max_results,
             max_hops=max_hops,
             timeout=timeout,
-            repo_ids=repo_ids
+            repo_ids=repo_ids,
+            use_cache=cache
         )
 
         # Report progress
@@ -99,47 +101,134 @@ def query_knowledge_graph(
         if "error" in result:
             raise QueryError(result["error"])
 
-        # Convert to QueryResult model
-        # Normalize confidence score from 1-10 scale to 0.0-1.0 scale
-        confidence = result.get("confidence", 0.0)
-        if isinstance(confidence, (int, float)) and confidence > 0:
-            normalized_confidence = min(confidence / 10.0, 1.0)
-        else:
-            normalized_confidence = 0.0
+        return _to_query_result(question, result)
 
-        return QueryResult(
+    except Exception as e:
+        logger.exception(f"Error in query_knowledge_graph: {e}")
+        raise _query_error(e)
+
+
+def stream_query_knowledge_graph(
+    adapter: DatabaseAdapter,
+    question: str,
+    max_results: int = 5,
+    max_hops: int = 3,
+    timeout: int = 60,
+    repo_ids: Optional[List[str]] = None,
+    cache: bool = True
+) -> Iterator[QueryEvent]:
+    """Query the knowledge graph using natural language, streaming the answer.
+
+    Yields the retrieved evidence as soon as the graph search is done, then
+    the answer text as the LLM generates it, and finally the complete result.
+
+    Args:
+        adapter: The database adapter to use.
+        question: The natural language question to ask.
+        max_results: Maximum number of results to return.
+        max_hops: Maximum number of hops in the graph traversal.
+        timeout: Maximum time in seconds to wait for Ollama response.
+        repo_ids: Optional list of repository IDs to filter by.
+        cache: Whether to use cached query intents and answers.
+
+    Yields:
+        QueryEvent objects, ending with a "final" event.
+
+    Raises:
+        QueryError: If the query fails.
+    """
+    try:
+        db_path = Path(adapter.db_path) if hasattr(adapter, "db_path") else None
+        if not db_path:
+            raise QueryError("Database path not available")
+
+        start_time = time.time()
+        for event in stream_query(
+            db_path=db_path,
             query=question,
-            answer=result.get("answer", ""),
-            confidence=normalized_confidence,  # Normalized to 0.0-1.0 scale
-            evidence=result.get("results", []),
-            query_understanding=result.get("understanding", ""),
-            reasoning=result.get("reasoning", ""),
-            execution_time=result.get("execution_time", 0.0)
-        )
+            max_results=max_results,
+            max_hops=max_hops,
+            timeout=timeout,
+            repo_ids=repo_ids,
+            use_cache=cache
+        ):
+            if event["type"] == "results":
+                yield QueryEvent(
+                    type="results",
+                    evidence=event["results"],
+                    query_understanding=event["understanding"]
+                )
+            elif event["type"] == "token":
+                yield QueryEvent(type="token", text=event["text"])
+            else:
+                result = event["response"]
+                if "error" in result:
+                    raise QueryError(result["error"])
+                result.setdefault("execution_time", time.time() - start_time)
+                yield QueryEvent(type="final", result=_to_query_result(question, result))
 
     except Exception as e:
-        logger.exception(f"Error in query_knowledge_graph: {e}")
+        logger.exception(f"Error in stream_query_knowledge_graph: {e}")
+        raise _query_error(e)
 
-        # Provide more specific error messages based on the type of exception
-        if "No LLM provider available" in str(e):
-            raise QueryError(
-                "No LLM provider available for query processing. "
-                "To use OpenAI, set the OPENAI_API_KEY environment variable. "
-                "To use Ollama, install it from https://ollama.ai/download and start it with 'ollama serve'. "
-                "Then run 'ollama pull qwen3:4b' to download the default model."
-            )
-        elif "Database path not available" in str(e):
-            raise QueryError(
-                "Database path not available. Make sure the knowledge graph has been built "
-                "using the 'build' method before querying. You can check if the graph is valid "
-                "using the 'is_graph_valid()' method."
-            )
-        elif "No seed nodes found" in str(e) or "No relevant nodes found" in str(e):
-            raise QueryError(
-                "No relevant information found in the knowledge graph for this query. "
-                "This could be because the information doesn't exist in the graph, or "
-                "because the query terms don't match the available content. Try rephrasing "
-                "your query or building a more comprehensive knowledge graph."
-            )
-        else:
-            raise QueryError(f"Failed to query knowledge graph: {e}")
+
+def _to_query_result(question: str, result: Dict[str, Any]) -> QueryResult:
+    """Convert a query response into a QueryResult.
+
+    Args:
+        question: The natural language question.
+        result: The response from the semantic search.
+
+    Returns:
+        The QueryResult.
+    """
+    # Normalize confidence score from 1-10 scale to 0.0-1.0 scale
+    confidence = result.get("confidence", 0.0)
+    if isinstance(confidence, (int, float)) and confidence > 0:
+        normalized_confidence = min(confidence / 10.0, 1.0)
+    else:
+        normalized_confidence = 0.0
+
+    return QueryResult(
+        query=question,
+        answer=result.get("answer", ""),
+        confidence=normalized_confidence,  # Normalized to 0.0-1.0 scale
+        evidence=result.get("results", []),
+        query_understanding=result.get("understanding", ""),
+        reasoning=result.get("reasoning", ""),
+        execution_time=result.get("execution_time", 0.0)
+    )
+
+
+def _query_error(e: Exception) -> QueryError:
+    """Convert an exception raised while querying into a descriptive QueryError.
+
+    Args:
+        e: The exception.
+
+    Returns:
+        The QueryError to raise.
+    """
+    # Provide more specific error messages based on the type of exception
+    if "No LLM provider available" in str(e):
+        return QueryError(
+            "No LLM provider available for query processing. "
+            "To use OpenAI, set the OPENAI_API_KEY environment variable. "
+            "To use Ollama, install it from https://ollama.ai/download and start it with 'ollama serve'. "
+            "Then run 'ollama pull qwen3:4b' to download the default model."
+        )
+    elif "Database path not available" in str(e):
+        return QueryError(
+            "Database path not available. Make sure the knowledge graph has been built "
+            "using the 'build' method before querying. You can check if the graph is valid "
+            "using the 'is_graph_valid()' method."
+        )
+    elif "No seed nodes found" in str(e) or "No relevant nodes found" in str(e):
+        return QueryError(
+            "No relevant information found in the knowledge graph for this query. "
+            "This could be because the information doesn't exist in the graph, or "
+            "because the query terms don't match the available content. Try rephrasing "
+            "your query or building a more comprehensive knowledge graph."
+        )
+    else:
+        return QueryError(f"Failed to query knowledge graph: {e}")
@@ -4,9 +4,15 @@ This module provides methods for exploring relationships between entities
 in the knowledge graph.
 """
 
-from typing import Any, Dict, List, Optional, Union
-
-from arc_memory.db.base import DatabaseAdapter
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from arc_memory.db.base import (
+    DatabaseAdapter,
+    check_related_query,
+    supports_related_query,
+)
+from arc_memory.db.prefetch import PrefetchingAdapter
 from arc_memory.logging_conf import get_logger
 from arc_memory.schema.models import EdgeRel, NodeType
 from arc_memory.sdk.cache import cached
@@ -25,6 +31,7 @@ def get_related_entities(
     direction: str = "both",
     max_results: int = 10,
     include_properties: bool = True,
+    order_by: Optional[str] = None,
     callback: Optional[ProgressCallback] = None
 ) -> List[RelatedEntity]:
     """Get entities related to a specific entity.
@@ -32,6 +39,10 @@ def get_related_entities(
     This method retrieves entities that are directly connected to the specified entity
     in the knowledge graph. It supports filtering by relationship type and direction.
 
+    On adapters that support it, the relationship filter, direction, ordering and
+    limit are pushed into a single joined edge and node query, and only the rows
+    that are returned are read, so hub entities with many edges stay cheap.
+
     Args:
         adapter: The database adapter to use.
         entity_id: The ID of the entity.
@@ -39,6 +50,9 @@ def get_related_entities(
         direction: Direction of relationships to include ("outgoing", "incoming", or "both").
         max_results: Maximum number of results to return.
         include_properties: Whether to include edge properties in the results.
+        order_by: Optional ordering by the related entity's timestamp, "timestamp"
+            (oldest first) or "-timestamp" (newest first). By default outgoing
+            relationships come before incoming ones.
         callback: Optional callback for progress reporting.
 
     Returns:
@@ -56,9 +70,8 @@ def get_related_entities(
                 0.0
             )
 
-        # Validate direction
-        if direction not in ["outgoing", "incoming", "both"]:
-            raise ValueError(f"Invalid direction: {direction}")
+        # Validate direction and ordering
+        check_related_query(direction, order_by)
 
         # Report progress
         if callback:
@@ -68,68 +81,24 @@ def get_related_entities(
                 0.2
             )
 
-        # Get outgoing edges if needed
-        outgoing_edges = []
-        if direction in ["outgoing", "both"]:
-            outgoing_edges = adapter.get_edges_by_src(entity_id)
-
-        # Get incoming edges if needed
-        incoming_edges = []
-        if direction in ["incoming", "both"]:
-            incoming_edges = adapter.get_edges_by_dst(entity_id)
-
-        # Report progress
-        if callback:
-            callback(
-                ProgressStage.PROCESSING,
-                "Processing relationship results",
-                0.6
-            )
-
-        # Filter by relationship type if specified
-        if relationship_types:
-            rel_types = [r.upper() for r in relationship_types]
-            outgoing_edges = [e for e in outgoing_edges if e["rel"] in rel_types]
-            incoming_edges = [e for e in incoming_edges if e["rel"] in rel_types]
-
-        # Convert to RelatedEntity models
-        related_entities = []
-
-        # Process outgoing edges
-        for edge in outgoing_edges:
-            # Get the target node
-            target_node = adapter.get_node_by_id(edge["dst"])
-            if not target_node:
-                continue
-
-            # Create RelatedEntity
-            related_entity = RelatedEntity(
-                id=target_node["id"],
-                type=target_node["type"],
-                title=target_node.get("title"),
-                relationship=edge["rel"],
-                direction="outgoing",
-                properties=edge.get("properties", {}) if include_properties else {}
+        if supports_related_query(adapter):
+            # One joined query with filters, ordering and limit in the database
+            rows = adapter.iter_related(
+                entity_id,
+                rel_types=relationship_types,
+                direction=direction,
+                order_by=order_by,
+                limit=max_results,
             )
-            related_entities.append(related_entity)
-
-        # Process incoming edges
-        for edge in incoming_edges:
-            # Get the source node
-            source_node = adapter.get_node_by_id(edge["src"])
-            if not source_node:
-                continue
-
-            # Create RelatedEntity
-            related_entity = RelatedEntity(
-                id=source_node["id"],
-                type=source_node["type"],
-                title=source_node.get("title"),
-                relationship=edge["rel"],
-                direction="incoming",
-                properties=edge.get("properties", {}) if include_properties else {}
+            related_entities = [
+                _to_related_entity(row["node"], row["edge"], row["direction"], include_properties)
+                for row in islice(rows, max_results)
+            ]
+        else:
+            related_entities = _get_related_entities_by_lookup(
+                adapter, entity_id, relationship_types, direction, max_results,
+                include_properties, order_by, callback
             )
-            related_entities.append(related_entity)
 
         # Report progress
         if callback:
@@ -139,14 +108,101 @@ def get_related_entities(
                 1.0
             )
 
-        # Limit results
-        return related_entities[:max_results]
+        return related_entities
 
     except Exception as e:
         logger.exception(f"Error in get_related_entities: {e}")
         raise QueryError(f"Failed to get related entities: {e}")
 
 
+def _to_related_entity(
+    node: Dict[str, Any], edge: Dict[str, Any], direction: str, include_properties: bool
+) -> RelatedEntity:
+    """Create a RelatedEntity from a node and the edge that reaches it."""
+    return RelatedEntity(
+        id=node["id"],
+        type=node["type"],
+        title=node.get("title"),
+        relationship=edge["rel"],
+        direction=direction,
+        properties=edge.get("properties", {}) if include_properties else {}
+    )
+
+
+def _get_related_entities_by_lookup(
+    adapter: DatabaseAdapter,
+    entity_id: str,
+    relationship_types: Optional[List[str]],
+    direction: str,
+    max_results: int,
+    include_properties: bool,
+    order_by: Optional[str],
+    callback: Optional[ProgressCallback],
+) -> List[RelatedEntity]:
+    """Get directly related entities with per-edge node lookups.
+
+    Used for adapters without iter_related. Nodes are looked up lazily, so
+    without an ordering no more than max_results lookups succeed.
+
+    Args:
+        adapter: The database adapter to use.
+        entity_id: The ID of the entity.
+        relationship_types: Optional list of relationship types to filter by.
+        direction: Direction of relationships to include.
+        max_results: Maximum number of results to return.
+        include_properties: Whether to include edge properties in the results.
+        order_by: Optional ordering by the related entity's timestamp.
+        callback: Optional callback for progress reporting.
+
+    Returns:
+        A list of RelatedEntity objects.
+    """
+    # Get outgoing edges if needed
+    outgoing_edges = []
+    if direction in ["outgoing", "both"]:
+        outgoing_edges = adapter.get_edges_by_src(entity_id)
+
+    # Get incoming edges if needed
+    incoming_edges = []
+    if direction in ["incoming", "both"]:
+        incoming_edges = adapter.get_edges_by_dst(entity_id)
+
+    # Report progress
+    if callback:
+        callback(
+            ProgressStage.PROCESSING,
+            "Processing relationship results",
+            0.6
+        )
+
+    # Filter by relationship type if specified
+    if relationship_types:
+        rel_types = [r.upper() for r in relationship_types]
+        outgoing_edges = [e for e in outgoing_edges if e["rel"] in rel_types]
+        incoming_edges = [e for e in incoming_edges if e["rel"] in rel_types]
+
+    def related() -> Iterator[Tuple[Dict[str, Any], RelatedEntity]]:
+        for edges, other, edge_direction in (
+            (outgoing_edges, "dst", "outgoing"),
+            (incoming_edges, "src", "incoming"),
+        ):
+            for edge in edges:
+                node = adapter.get_node_by_id(edge[other])
+                if node:
+                    yield node, _to_related_entity(node, edge, edge_direction, include_properties)
+
+    if order_by:
+        # Every node is needed to sort by timestamp
+        pairs = sorted(
+            related(),
+            key=lambda pair: pair[0].get("timestamp") or "",
+            reverse=order_by.startswith("-"),
+        )
+        return [entity for _, entity in pairs[:max_results]]
+
+    return [entity for _, entity in islice(related(), max_results)]
+
+
 @cached()
 def get_entity_details(
     adapter: DatabaseAdapter,
@@ -211,17 +267,185 @@ def get_entity_details(
                 1.0
             )
 
-        # Create EntityDetails
-        return EntityDetails(
-            id=entity["id"],
-            type=entity["type"],
-            title=entity.get("title"),
-            body=entity.get("body"),
-            timestamp=entity.get("timestamp"),
-            properties=entity.get("extra", {}),
-            related_entities=related_entities
-        )
+        return _to_entity_details(entity, related_entities)
 
     except Exception as e:
         logger.exception(f"Error in get_entity_details: {e}")
         raise QueryError(f"Failed to get entity details: {e}")
+
+
+def _to_entity_details(entity: Dict[str, Any], related_entities: List[RelatedEntity]) -> EntityDetails:
+    """Create EntityDetails from a node and its related entities."""
+    return EntityDetails(
+        id=entity["id"],
+        type=entity["type"],
+        title=entity.get("title"),
+        body=entity.get("body"),
+        timestamp=entity.get("timestamp"),
+        properties=entity.get("extra", {}),
+        related_entities=related_entities
+    )
+
+
+def get_related_entities_many(
+    adapter: DatabaseAdapter,
+    entity_ids: List[str],
+    relationship_types: Optional[List[str]] = None,
+    direction: str = "both",
+    max_results: int = 10,
+    include_properties: bool = True,
+    order_by: Optional[str] = None,
+    callback: Optional[ProgressCallback] = None
+) -> Dict[str, List[RelatedEntity]]:
+    """Get the entities related to each of many entities.
+
+    Gives the same results as calling `get_related_entities` for every ID,
+    but reads the edges of all the entities together and then the related
+    nodes in one pass, so entities that share neighbors don't read them
+    again. On adapters with bulk lookups this takes a handful of queries
+    regardless of the number of entities.
+
+    Args:
+        adapter: The database adapter to use.
+        entity_ids: The IDs of the entities. Duplicates are looked up once.
+        relationship_types: Optional list of relationship types to filter by.
+        direction: Direction of relationships to include ("outgoing", "incoming", or "both").
+        max_results: Maximum number of results per entity.
+        include_properties: Whether to include edge properties in the results.
+        order_by: Optional ordering by the related entity's timestamp, "timestamp"
+            (oldest first) or "-timestamp" (newest first).
+        callback: Optional callback for progress reporting.
+
+    Returns:
+        A dictionary mapping each entity ID to its related entities.
+
+    Raises:
+        QueryError: If getting related entities fails.
+    """
+    try:
+        check_related_query(direction, order_by)
+
+        if callback:
+            callback(
+                ProgressStage.QUERYING,
+                "Querying related entities",
+                0.2
+            )
+
+        lookup = PrefetchingAdapter(adapter)
+        ids = list(dict.fromkeys(entity_ids))
+        related = _get_related_entities_with_lookup(
+            lookup, ids, relationship_types, direction, max_results, include_properties, order_by
+        )
+
+        if callback:
+            callback(
+                ProgressStage.COMPLETING,
+                "Relationship query complete",
+                1.0
+            )
+
+        return related
+
+    except Exception as e:
+        logger.exception(f"Error in get_related_entities_many: {e}")
+        raise QueryError(f"Failed to get related entities: {e}")
+
+
+def get_entities(
+    adapter: DatabaseAdapter,
+    entity_ids: List[str],
+    include_related: bool = True,
+    callback: Optional[ProgressCallback] = None
+) -> Dict[str, Optional[EntityDetails]]:
+    """Get detailed information about many entities.
+
+    Gives the same details as calling `get_entity_details` for every ID, but
+    reads the entities, their edges and their related nodes in bulk.
+
+    Args:
+        adapter: The database adapter to use.
+        entity_ids: The IDs of the entities. Duplicates are looked up once.
+        include_related: Whether to include related entities.
+        callback: Optional callback for progress reporting.
+
+    Returns:
+        A dictionary mapping each entity ID to its EntityDetails, or to None
+        if the entity doesn't exist.
+
+    Raises:
+        QueryError: If getting the entities fails.
+    """
+    try:
+        if callback:
+            callback(
+                ProgressStage.QUERYING,
+                "Querying entities",
+                0.2
+            )
+
+        lookup = PrefetchingAdapter(adapter)
+        ids = list(dict.fromkeys(entity_ids))
+        lookup.prefetch_nodes(ids)
+        found = [entity_id for entity_id in ids if lookup.get_node_by_id(entity_id)]
+
+        related: Dict[str, List[RelatedEntity]] = {}
+        if include_related:
+            # Same limit as get_entity_details
+            related = _get_related_entities_with_lookup(lookup, found, None, "both", 20, True, None)
+
+        if callback:
+            callback(
+                ProgressStage.COMPLETING,
+                "Entity query complete",
+                1.0
+            )
+
+        return {
+            entity_id: (
+                _to_entity_details(lookup.get_node_by_id(entity_id), related.get(entity_id, []))
+                if entity_id in found else None
+            )
+            for entity_id in ids
+        }
+
+    except Exception as e:
+        logger.exception(f"Error in get_entities: {e}")
+        raise QueryError(f"Failed to get entities: {e}")
+
+
+def _get_related_entities_with_lookup(
+    lookup: PrefetchingAdapter,
+    entity_ids: List[str],
+    relationship_types: Optional[List[str]],
+    direction: str,
+    max_results: int,
+    include_properties: bool,
+    order_by: Optional[str],
+) -> Dict[str, List[RelatedEntity]]:
+    """Prefetch the edges and related nodes of many entities, then collect them.
+
+    Only the related nodes that can make it into the results are read: all of
+    them when ordering by timestamp, otherwise the first max_results per
+    entity (any that turn out to be missing are looked up individually).
+    """
+    rel_types = {r.upper() for r in relationship_types} if relationship_types else None
+    lookup.prefetch_edges(entity_ids, direction)
+
+    wanted: List[str] = []
+    for entity_id in entity_ids:
+        others = []
+        if direction in ["outgoing", "both"]:
+            others += [e["dst"] for e in lookup.get_edges_by_src(entity_id) if not rel_types or e["rel"] in rel_types]
+        if direction in ["incoming", "both"]:
+            others += [e["src"] for e in lookup.get_edges_by_dst(entity_id) if not rel_types or e["rel"] in rel_types]
+        wanted += others if order_by else others[:max_results]
+    lookup.prefetch_nodes(wanted)
+
+    return {
+        entity_id: _get_related_entities_by_lookup(
+            lookup, entity_id, relationship_types, direction, max_results,
+            include_properties, order_by, None
+        )
+        for entity_id in entity_ids
+    }
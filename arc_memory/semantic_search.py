@@ -5,16 +5,27 @@ the knowledge graph, leveraging LLMs to understand the query intent and
 extract relevant information from the graph.
 """
 
+import copy
 import json
 import sqlite3
 import re
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, Callable
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import os
 
+from arc_memory.llm.context import DEFAULT_CONTEXT_TOKEN_BUDGET, pack_context
 from arc_memory.llm.ollama_client import OllamaClient, ensure_ollama_available
 from arc_memory.logging_conf import get_logger
+from arc_memory.query_cache import (
+    answer_cache,
+    graph_version,
+    intent_cache,
+    node_set_hash,
+    normalize_query,
+)
 from arc_memory.schema.models import Node, NodeType
 from arc_memory.sql.db import get_connection
 from arc_memory.trace import (
@@ -301,6 +312,198 @@ IMPORTANT: Do NOT include any comments in the JSON. The JSON must be valid and p
 Only include fields that are relevant to the query. If information is not specified or implied in the user's question, do not include it in the JSON response.
 """
 
+# Seconds to trust a successful LLM availability check before checking again
+LLM_AVAILABILITY_TTL = 300
+
+_llm_provider: Optional[str] = None
+_llm_checked_at: Optional[float] = None
+_llm_lock = threading.Lock()
+
+# Questions longer than this are left to the LLM, since they rarely fit a simple shape
+RULE_MAX_WORDS = 16
+
+_RULE_QUESTION_RE = re.compile(r"^(who|when|why)\b")
+
+_RULE_ENTITY_RE = re.compile(
+    r"\b(?:(?P<pr>pull requests?|merge requests?|prs?)"
+    r"|(?P<commit>commits?)"
+    r"|(?P<issue>issues?|tickets?|bugs?)"
+    r"|(?P<adr>adrs?|decisions?)"
+    r"|(?P<file>files?))\b"
+)
+
+_RULE_UNIT_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+_RULE_STOPWORDS = frozenset(
+    "who when why what which how did does do was were is are be been has have had "
+    "the a an and or of to in on for by with from about into that this these those "
+    "it its we our us you your they their them me my i any all some most latest recent "
+    "recently first last ever made make makes making change changed changes changing "
+    "add added adds adding create created creates open opened close closed merge merged "
+    "write wrote written work worked introduce introduced decide decided happen happened".split()
+)
+
+
+def _parse_time_window(text: str, now: datetime) -> Tuple[Dict[str, str], str]:
+    """Extract a time window from normalized query text.
+
+    Args:
+        text: The normalized query text
+        now: The current time
+
+    Returns:
+        The temporal constraints, and the text with the time window removed
+    """
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    constraints: Dict[str, str] = {}
+
+    def date(value: datetime) -> str:
+        return value.strftime("%Y-%m-%d")
+
+    match = re.search(r"\b(?:in the )?(?:last|past) (\d+) (day|week|month|year)s?\b", text)
+    if match:
+        days = int(match.group(1)) * _RULE_UNIT_DAYS[match.group(2)]
+        constraints["after"] = date(now - timedelta(days=days))
+    else:
+        match = re.search(r"\b(?:in the )?(?:last|past) (day|week|month|year)\b", text)
+        if match:
+            constraints["after"] = date(now - timedelta(days=_RULE_UNIT_DAYS[match.group(1)]))
+    if not match:
+        match = re.search(r"\bthis (week|month|year)\b", text)
+        if match:
+            start = {
+                "week": today - timedelta(days=today.weekday()),
+                "month": today.replace(day=1),
+                "year": today.replace(month=1, day=1),
+            }[match.group(1)]
+            constraints["after"] = date(start)
+    if not match:
+        match = re.search(r"\byesterday\b", text)
+        if match:
+            constraints["after"] = date(today - timedelta(days=1))
+            constraints["before"] = date(today)
+    if not match:
+        match = re.search(r"\btoday\b", text)
+        if match:
+            constraints["after"] = date(today)
+    if not match:
+        match = re.search(r"\bin (\d{4})\b", text)
+        if match:
+            constraints["after"] = f"{match.group(1)}-01-01"
+            constraints["before"] = f"{int(match.group(1)) + 1}-01-01"
+
+    if match:
+        text = text[:match.start()] + " " + text[match.end():]
+
+    # Explicit dates can be combined with each other
+    for keyword, bound in (("since|after", "after"), ("before|until", "before")):
+        date_match = re.search(rf"\b(?:{keyword}) (\d{{4}}-\d{{2}}-\d{{2}})\b", text)
+        if date_match:
+            constraints[bound] = date_match.group(1)
+            text = text[:date_match.start()] + " " + text[date_match.end():]
+
+    return constraints, text
+
+
+def _parse_query_with_rules(query: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """Parse common query shapes without an LLM.
+
+    Handles short who/when/why questions that name an entity type, with an
+    optional time window, e.g. "Who merged the auth PRs in the last 2 weeks?".
+
+    Args:
+        query: The natural language query
+        now: The current time (defaults to now)
+
+    Returns:
+        A query intent in the same format as `_process_query_intent`, or None
+        if the query doesn't fit a known shape
+    """
+    text = normalize_query(query)
+    question = _RULE_QUESTION_RE.match(text)
+    if not question or len(text.split()) > RULE_MAX_WORDS:
+        return None
+
+    entity_types: List[str] = []
+    for match in _RULE_ENTITY_RE.finditer(text):
+        if match.lastgroup not in entity_types:
+            entity_types.append(match.lastgroup)
+    if not entity_types:
+        return None
+
+    temporal_constraints, remaining = _parse_time_window(text, now or datetime.now())
+    remaining = _RULE_ENTITY_RE.sub(" ", remaining)
+    keywords = [
+        word.strip(".-/")
+        for word in re.findall(r"[a-z0-9_][a-z0-9_.\-/]*", remaining)
+        if word.strip(".-/") not in _RULE_STOPWORDS and len(word.strip(".-/")) > 2
+    ]
+
+    understanding = f"{question.group(1).capitalize()} question about {', '.join(entity_types)} nodes"
+    if keywords:
+        understanding += f" matching {', '.join(keywords)}"
+    if "after" in temporal_constraints:
+        understanding += f" after {temporal_constraints['after']}"
+    if "before" in temporal_constraints:
+        understanding += f" before {temporal_constraints['before']}"
+
+    query_intent: Dict[str, Any] = {
+        "understanding": understanding,
+        "entity_types": entity_types,
+        "parser": "rules",
+    }
+    if temporal_constraints:
+        query_intent["temporal_constraints"] = temporal_constraints
+    if keywords:
+        query_intent["attributes"] = {"title_keywords": keywords}
+    return query_intent
+
+
+def _get_llm_client(timeout: int = 60) -> Optional[Tuple[str, Any]]:
+    """Get a client for the available LLM provider.
+
+    A successful availability check is remembered for `LLM_AVAILABILITY_TTL`
+    seconds, so repeated queries don't probe the provider every time.
+
+    Args:
+        timeout: Maximum time in seconds to wait for Ollama to become available
+
+    Returns:
+        A ("openai" or "ollama", client) tuple, or None if no provider is available
+    """
+    global _llm_provider, _llm_checked_at
+
+    with _llm_lock:
+        fresh = _llm_checked_at is not None and time.monotonic() - _llm_checked_at < LLM_AVAILABILITY_TTL
+        if not fresh:
+            # Check for OpenAI availability first (preferred), then fall back to Ollama
+            if OPENAI_AVAILABLE and ensure_openai_available():
+                _llm_provider = "openai"
+            elif ensure_ollama_available(timeout=timeout):
+                _llm_provider = "ollama"
+            else:
+                _llm_provider = None
+            _llm_checked_at = time.monotonic() if _llm_provider else None
+        provider = _llm_provider
+
+    if provider == "openai":
+        return provider, OpenAIClient()
+    if provider == "ollama":
+        return provider, OllamaClient()
+    return None
+
+
+def clear_query_caches() -> None:
+    """Clear the cached query intents, answers and LLM availability."""
+    global _llm_provider, _llm_checked_at
+
+    intent_cache.clear()
+    answer_cache.clear()
+    with _llm_lock:
+        _llm_provider = None
+        _llm_checked_at = None
+
+
 @debug_function
 def process_query(
     db_path: Path,
@@ -308,15 +511,22 @@ def process_query(
     max_results: int = 5,
     max_hops: int = 3,
     timeout: int = 60,
-    repo_ids: Optional[List[str]] = None
+    repo_ids: Optional[List[str]] = None,
+    use_cache: bool = True,
+    context_token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
 ) -> Dict[str, Any]:
     """Process a natural language query against the knowledge graph.
 
     This function implements a multi-stage approach:
-    1. Query Understanding: Uses an LLM to understand the query intent
+    1. Query Understanding: Parses common query shapes with rules, and uses an
+       LLM to understand the query intent otherwise
     2. Knowledge Graph Search: Converts the intent into appropriate graph queries
     3. Response Generation: Synthesizes the information into a natural language response
 
+    LLM-derived intents and generated answers are cached in memory (see
+    `arc_memory.query_cache`); answers are reused only while the retrieved nodes
+    and the graph are unchanged.
+
     Args:
         db_path: Path to the knowledge graph database
         query: Natural language query text
@@ -324,6 +534,9 @@ def process_query(
         max_hops: Maximum number of hops in the graph traversal
         timeout: Maximum time in seconds to wait for Ollama response
         repo_ids: Optional list of repository IDs to filter by
+        use_cache: Whether to use the intent and answer caches
+        context_token_budget: Token budget for the retrieved nodes in the
+            answer prompt (see `arc_memory.llm.context.pack_context`)
 
     Returns:
         A dictionary containing the query results with these keys:
@@ -333,67 +546,43 @@ def process_query(
         - results: List of relevant nodes with metadata
         - confidence: Confidence score (1-10)
     """
+    conn = None
     try:
-        # Check for OpenAI availability first (preferred)
-        openai_available = False
-        if OPENAI_AVAILABLE:
-            openai_available = ensure_openai_available()
-
-        # Fall back to Ollama if OpenAI is not available
-        if not openai_available and not ensure_ollama_available(timeout=timeout):
-            return {
-                "error": "No LLM provider available",
-                "understanding": "Natural language queries require either OpenAI API access or Ollama to be installed and running. "
-                                "To use OpenAI, set the OPENAI_API_KEY environment variable. "
-                                "To use Ollama, install it from https://ollama.ai/download and start it with 'ollama serve'. "
-                                "Then run 'ollama pull qwen3:4b' to download the default model (only ~4GB in size)."
-            }
-
         # Connect to the database
         conn = get_connection(db_path)
+        version = graph_version(conn) if use_cache else None
 
         logger.info(f"Processing query: {query}")
         logger.info(f"Using max_results={max_results}, max_hops={max_hops}")
 
-        # Stage 1: Process the query using LLM to understand intent
-        logger.info("Stage 1: Understanding query intent")
-        query_intent = _process_query_intent(query)
-
-        if not query_intent:
-            logger.error("Failed to process query intent")
-            return {
-                "error": "Failed to process query intent",
-                "understanding": "I couldn't understand your question. Please try rephrasing it."
-            }
-
-        logger.info(f"Query understanding: {query_intent.get('understanding', 'No understanding available')}")
-
-        # Stage 2: Search for relevant nodes based on the query intent
-        logger.info("Stage 2: Searching knowledge graph")
-        relevant_nodes = _search_knowledge_graph(
-            conn,
-            query_intent,
-            max_results=max_results,
-            max_hops=max_hops,
-            repo_ids=repo_ids
+        early_response, query_intent, relevant_nodes, llm = _understand_and_search(
+            conn, query, max_results, max_hops, timeout, repo_ids, use_cache
         )
+        if early_response is not None:
+            return early_response
 
-        if not relevant_nodes:
-            logger.warning("No relevant nodes found")
-            return {
-                "understanding": query_intent.get("understanding", "Query understood, but no results found"),
-                "summary": "No relevant information found",
-                "results": []
-            }
-
-        logger.info(f"Found {len(relevant_nodes)} relevant nodes")
+        # Reuse the answer to the same question over the same evidence
+        answer_key = _answer_cache_key(
+            db_path, query, repo_ids, max_results, max_hops, context_token_budget, relevant_nodes
+        )
+        if use_cache:
+            cached_response = answer_cache.get(answer_key, version)
+            if cached_response:
+                logger.info("Answer found in cache")
+                return copy.deepcopy(cached_response)
 
         # Stage 3: Generate a response using the LLM with the relevant nodes
         logger.info("Stage 3: Generating response")
-        response = _generate_response(query, query_intent, relevant_nodes)
+        if llm is None:
+            llm = _get_llm_client(timeout=timeout)
+            if not llm:
+                return _no_llm_provider_response()
+        response = _generate_response(
+            query, query_intent, relevant_nodes, llm=llm, context_token_budget=context_token_budget
+        )
 
-        # Close the database connection
-        conn.close()
+        if use_cache:
+            _cache_answer(answer_key, response, version)
 
         # Return the complete response
         logger.info(f"Query processing complete. Confidence: {response.get('confidence', 'N/A')}")
@@ -406,28 +595,369 @@ def process_query(
             "understanding": "An error occurred while processing your query"
         }
 
+    finally:
+        # Close the database connection
+        if conn is not None:
+            conn.close()
+
+
+def stream_query(
+    db_path: Path,
+    query: str,
+    max_results: int = 5,
+    max_hops: int = 3,
+    timeout: int = 60,
+    repo_ids: Optional[List[str]] = None,
+    use_cache: bool = True,
+    context_token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
+) -> Iterator[Dict[str, Any]]:
+    """Process a natural language query, yielding results as they become available.
+
+    Runs the same stages as `process_query`, but yields events so callers can
+    show the evidence before the answer is generated and the answer while it
+    is being generated:
+
+    - ``{"type": "results", "understanding": ..., "results": [...]}`` once the
+      graph search is done
+    - ``{"type": "token", "text": ...}`` for each piece of the detailed answer
+    - ``{"type": "final", "response": {...}}`` last, with the same dictionary
+      `process_query` returns (including its "error" key on failure)
+
+    Args:
+        db_path: Path to the knowledge graph database
+        query: Natural language query text
+        max_results: Maximum number of results to return
+        max_hops: Maximum number of hops in the graph traversal
+        timeout: Maximum time in seconds to wait for Ollama response
+        repo_ids: Optional list of repository IDs to filter by
+        use_cache: Whether to use the intent and answer caches
+        context_token_budget: Token budget for the retrieved nodes in the
+            answer prompt
+
+    Yields:
+        Query events, ending with a "final" event
+    """
+    conn = None
+    try:
+        conn = get_connection(db_path)
+        version = graph_version(conn) if use_cache else None
+
+        logger.info(f"Streaming query: {query}")
+
+        early_response, query_intent, relevant_nodes, llm = _understand_and_search(
+            conn, query, max_results, max_hops, timeout, repo_ids, use_cache
+        )
+        if early_response is not None:
+            yield {"type": "final", "response": early_response}
+            return
+
+        yield {
+            "type": "results",
+            "understanding": query_intent.get("understanding", "Not available"),
+            "results": relevant_nodes,
+        }
+
+        answer_key = _answer_cache_key(
+            db_path, query, repo_ids, max_results, max_hops, context_token_budget, relevant_nodes
+        )
+        if use_cache:
+            cached_response = answer_cache.get(answer_key, version)
+            if cached_response:
+                logger.info("Answer found in cache")
+                yield {"type": "token", "text": cached_response.get("answer", "")}
+                yield {"type": "final", "response": copy.deepcopy(cached_response)}
+                return
+
+        if llm is None:
+            llm = _get_llm_client(timeout=timeout)
+            if not llm:
+                yield {"type": "final", "response": _no_llm_provider_response()}
+                return
+
+        logger.info("Stage 3: Streaming response")
+        llm_prompt = _build_response_prompt(query, query_intent, relevant_nodes, context_token_budget)
+        provider, client = llm
+        if provider == "openai":
+            chunks = client.generate_stream(
+                model=os.environ.get("OPENAI_MODEL", "gpt-4.1"),
+                prompt=llm_prompt,
+                system=RESPONSE_GENERATION_PROMPT,
+                options={"temperature": 0.2}
+            )
+        else:
+            chunks = client.generate_stream(
+                model="qwen3:4b",
+                prompt=llm_prompt,
+                system=RESPONSE_GENERATION_PROMPT
+            )
+
+        answer_reader = _JsonStringFieldReader("answer")
+        parts = []
+        streamed = False
+        for chunk in chunks:
+            parts.append(chunk)
+            text = answer_reader.feed(chunk)
+            if text:
+                streamed = True
+                yield {"type": "token", "text": text}
+
+        response = _parse_generated_response("".join(parts), query_intent, relevant_nodes)
+        if not streamed and response.get("answer"):
+            # The answer wasn't found while streaming (e.g. the model didn't
+            # answer in JSON), so send it in one piece
+            yield {"type": "token", "text": response["answer"]}
+
+        if use_cache:
+            _cache_answer(answer_key, response, version)
+
+        yield {"type": "final", "response": response}
+
+    except Exception as e:
+        logger.exception(f"Error streaming query: {e}")
+        yield {
+            "type": "final",
+            "response": {
+                "error": str(e),
+                "understanding": "An error occurred while processing your query"
+            },
+        }
+
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def _understand_and_search(
+    conn: sqlite3.Connection,
+    query: str,
+    max_results: int,
+    max_hops: int,
+    timeout: int,
+    repo_ids: Optional[List[str]],
+    use_cache: bool
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], List[Dict[str, Any]], Optional[Tuple[str, Any]]]:
+    """Run the query understanding and graph search stages.
+
+    Args:
+        conn: Database connection
+        query: Natural language query text
+        max_results: Maximum number of results to return
+        max_hops: Maximum number of hops in the graph traversal
+        timeout: Maximum time in seconds to wait for Ollama response
+        repo_ids: Optional list of repository IDs to filter by
+        use_cache: Whether to use the intent cache
+
+    Returns:
+        A tuple of (response to return instead of answering, if any; query
+        intent; relevant nodes; LLM client if one was needed)
+    """
+    llm = None
+
+    # Stage 1: Understand the query intent, without an LLM where possible
+    logger.info("Stage 1: Understanding query intent")
+    intent_key = (normalize_query(query), datetime.now().strftime("%Y-%m-%d"))
+    query_intent = _parse_query_with_rules(query)
+    if query_intent:
+        logger.info("Query intent parsed with rules")
+    elif use_cache:
+        query_intent = intent_cache.get(intent_key)
+        if query_intent:
+            logger.info("Query intent found in cache")
+
+    if not query_intent:
+        llm = _get_llm_client(timeout=timeout)
+        if not llm:
+            return _no_llm_provider_response(), None, [], None
+
+        query_intent = _process_query_intent(query, llm=llm)
+
+        if not query_intent:
+            logger.error("Failed to process query intent")
+            return {
+                "error": "Failed to process query intent",
+                "understanding": "I couldn't understand your question. Please try rephrasing it."
+            }, None, [], llm
+        if use_cache:
+            intent_cache.set(intent_key, query_intent)
+
+    logger.info(f"Query understanding: {query_intent.get('understanding', 'No understanding available')}")
+
+    # Stage 2: Search for relevant nodes based on the query intent
+    logger.info("Stage 2: Searching knowledge graph")
+    relevant_nodes = _search_knowledge_graph(
+        conn,
+        query_intent,
+        max_results=max_results,
+        max_hops=max_hops,
+        repo_ids=repo_ids
+    )
+
+    if not relevant_nodes:
+        logger.warning("No relevant nodes found")
+        return {
+            "understanding": query_intent.get("understanding", "Query understood, but no results found"),
+            "summary": "No relevant information found",
+            "results": []
+        }, query_intent, [], llm
+
+    logger.info(f"Found {len(relevant_nodes)} relevant nodes")
+    return None, query_intent, relevant_nodes, llm
+
+
+def _answer_cache_key(
+    db_path: Path,
+    query: str,
+    repo_ids: Optional[List[str]],
+    max_results: int,
+    max_hops: int,
+    context_token_budget: int,
+    relevant_nodes: List[Dict[str, Any]]
+) -> Tuple[Any, ...]:
+    """Get the answer cache key for a question over a set of retrieved nodes."""
+    return (
+        str(db_path),
+        normalize_query(query),
+        tuple(repo_ids or ()),
+        max_results,
+        max_hops,
+        context_token_budget,
+        node_set_hash(relevant_nodes),
+    )
+
+
+def _cache_answer(key: Tuple[Any, ...], response: Dict[str, Any], version: Any) -> None:
+    """Cache a generated answer, unless it is the fallback of a failed generation."""
+    # Fallback responses of failed generations have confidence 1
+    confidence = response.get("confidence")
+    if isinstance(confidence, (int, float)) and confidence > 1:
+        answer_cache.set(key, copy.deepcopy(response), version)
+
+
+class _JsonStringFieldReader:
+    """Incrementally read one string field of a JSON object as it streams in.
+
+    Text inside a leading ``<think>`` block is ignored, since reasoning models
+    may quote the expected JSON while thinking.
+    """
+
+    _ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+    def __init__(self, field: str):
+        """Initialize the reader.
+
+        Args:
+            field: Name of the string field to read.
+        """
+        self._pattern = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._position: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add streamed text and get the newly decoded part of the field.
+
+        Args:
+            chunk: The next piece of streamed text.
+
+        Returns:
+            The decoded characters of the field value that became available.
+        """
+        self._buffer += chunk
+        if self._done:
+            return ""
+
+        if self._position is None:
+            search_from = 0
+            if "<think>" in self._buffer:
+                end_of_thinking = self._buffer.find("</think>")
+                if end_of_thinking < 0:
+                    return ""
+                search_from = end_of_thinking + len("</think>")
+            match = self._pattern.search(self._buffer, search_from)
+            if not match:
+                return ""
+            self._position = match.end()
+
+        decoded = []
+        buffer = self._buffer
+        index = self._position
+        while index < len(buffer):
+            char = buffer[index]
+            if char == '"':
+                self._done = True
+                index += 1
+                break
+            if char != "\\":
+                decoded.append(char)
+                index += 1
+                continue
+            # Wait for the rest of an escape sequence
+            if index + 1 >= len(buffer):
+                break
+            escaped = buffer[index + 1]
+            if escaped == "u":
+                if index + 6 > len(buffer):
+                    break
+                try:
+                    decoded.append(chr(int(buffer[index + 2:index + 6], 16)))
+                except ValueError:
+                    decoded.append(buffer[index:index + 6])
+                index += 6
+                continue
+            decoded.append(self._ESCAPES.get(escaped, escaped))
+            index += 2
+
+        self._position = index
+        return "".join(decoded)
+
+
+def _no_llm_provider_response() -> Dict[str, Any]:
+    """Get the response for queries that need an LLM when none is available."""
+    return {
+        "error": "No LLM provider available",
+        "understanding": "Natural language queries require either OpenAI API access or Ollama to be installed and running. "
+                        "To use OpenAI, set the OPENAI_API_KEY environment variable. "
+                        "To use Ollama, install it from https://ollama.ai/download and start it with 'ollama serve'. "
+                        "Then run 'ollama pull qwen3:4b' to download the default model (only ~4GB in size)."
+    }
+
+
+def _select_llm_clients(llm: Optional[Tuple[str, Any]]) -> Tuple[Any, Any]:
+    """Get the (OpenAI client, Ollama client) pair to use, one of which is None.
+
+    Args:
+        llm: Optional (provider, client) tuple from `_get_llm_client`
+
+    Returns:
+        The OpenAI client, or the Ollama client if OpenAI isn't used
+    """
+    if llm is not None:
+        provider, client = llm
+        logger.debug(f"Using {provider} LLM client")
+        return (client, None) if provider == "openai" else (None, client)
+
+    # Check if OpenAI is available (preferred)
+    if OPENAI_AVAILABLE and ensure_openai_available():
+        logger.debug("Using OpenAI LLM client")
+        return OpenAIClient(), None
+    logger.debug("Using Ollama LLM client")
+    return None, OllamaClient()
+
 
 @debug_function
-def _process_query_intent(query: str) -> Optional[Dict[str, Any]]:
+def _process_query_intent(query: str, llm: Optional[Tuple[str, Any]] = None) -> Optional[Dict[str, Any]]:
     """Process the query intent using an LLM.
 
     Args:
         query: The natural language query
+        llm: Optional (provider, client) tuple from `_get_llm_client`; the
+            provider is detected if not given
 
     Returns:
         A dictionary with the parsed query intent, or None if processing failed
     """
     try:
-        # Check if OpenAI is available (preferred)
-        openai_client = None
-        ollama_client = None
-
-        if OPENAI_AVAILABLE and ensure_openai_available():
-            logger.debug("Using OpenAI for query intent processing")
-            openai_client = OpenAIClient()
-        else:
-            logger.debug("Using Ollama for query intent processing")
-            ollama_client = OllamaClient()
+        openai_client, ollama_client = _select_llm_clients(llm)
 
         # Stage 1: Generate response with thinking for understanding the query
         logger.debug("Stage 1: Understanding query intent")
@@ -1402,11 +1932,88 @@ def _score_nodes(nodes: List[Node], query_intent: Dict[str, Any]) -> List[Node]:
         logger.exception(f"Error scoring nodes: {e}")
         return nodes  # Return unsorted nodes on error
 
+def _build_response_prompt(
+    query: str,
+    query_intent: Dict[str, Any],
+    relevant_nodes: List[Dict[str, Any]],
+    context_token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
+) -> str:
+    """Build the prompt for answering a query from the relevant nodes.
+
+    Args:
+        query: The original natural language query
+        query_intent: The parsed query intent
+        relevant_nodes: List of relevant nodes with metadata
+        context_token_budget: Token budget for the nodes in the prompt
+
+    Returns:
+        The prompt
+    """
+    # Prepare a compact context from the relevant nodes
+    context_str = pack_context(relevant_nodes, token_budget=context_token_budget)
+
+    return f"""User's question: {query}
+
+Query understanding: {query_intent.get('understanding', 'Not available')}
+
+Relevant information from the knowledge graph:
+{context_str}
+
+Based on this information, please answer the user's question."""
+
+
+def _parse_generated_response(
+    llm_response: str,
+    query_intent: Dict[str, Any],
+    relevant_nodes: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Turn the LLM's answer into the query response.
+
+    Args:
+        llm_response: The raw LLM response
+        query_intent: The parsed query intent
+        relevant_nodes: List of relevant nodes with metadata
+
+    Returns:
+        A dictionary with the response including summary, answer, and results
+    """
+    # Extract JSON from the response
+    response_json = _extract_json_from_llm_response(llm_response)
+
+    if not response_json:
+        # Fallback for parsing errors
+        return {
+            "understanding": query_intent.get("understanding", "Query understood, but response processing failed"),
+            "summary": "Unable to generate a structured response",
+            "answer": "I encountered an error while processing the information from the knowledge graph.",
+            "results": relevant_nodes,
+            "confidence": 1
+        }
+
+    # Combine the response with the original query understanding and relevant nodes
+    final_response = {
+        "understanding": query_intent.get("understanding", "Not available"),
+        "summary": response_json.get("summary", "No summary available"),
+        "answer": response_json.get("answer", "No detailed answer available"),
+        "results": relevant_nodes,
+        "confidence": response_json.get("confidence", 5)
+    }
+
+    # Add reasoning to each result if available
+    if "reasoning" in response_json:
+        # Add overall reasoning to the response
+        final_response["reasoning"] = response_json["reasoning"]
+
+    return final_response
+
+
 @debug_function
 def _generate_response(
     query: str,
     query_intent: Dict[str, Any],
-    relevant_nodes: List[Dict[str, Any]]
+    relevant_nodes: List[Dict[str, Any]],
+    llm: Optional[Tuple[str, Any]] = None,
+    context_token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET
 ) -> Dict[str, Any]:
     """Generate a natural language response to the query.
 
@@ -1414,37 +2021,21 @@ def _generate_response(
         query: The original natural language query
         query_intent: The parsed query intent
         relevant_nodes: List of relevant nodes with metadata
+        llm: Optional (provider, client) tuple from `_get_llm_client`; the
+            provider is detected if not given
+        context_token_budget: Token budget for the nodes in the prompt
 
     Returns:
         A dictionary with the response including summary, answer, and results
     """
     try:
-        # Check if OpenAI is available (preferred)
-        openai_client = None
-        ollama_client = None
-
-        if OPENAI_AVAILABLE and ensure_openai_available():
-            logger.debug("Using OpenAI for response generation")
-            openai_client = OpenAIClient()
-        else:
-            logger.debug("Using Ollama for response generation")
-            ollama_client = OllamaClient()
-
-        # Prepare context from relevant nodes
-        context_str = json.dumps(relevant_nodes, indent=2)
+        openai_client, ollama_client = _select_llm_clients(llm)
 
         # Define the system prompt for response generation - now using the dedicated prompt
         system_prompt = RESPONSE_GENERATION_PROMPT
 
         # Generate the response with the LLM
-        llm_prompt = f"""User's question: {query}
-
-Query understanding: {query_intent.get('understanding', 'Not available')}
-
-Relevant information from the knowledge graph:
-{context_str}
-
-Based on this information, please answer the user's question."""
+        llm_prompt = _build_response_prompt(query, query_intent, relevant_nodes, context_token_budget)
 
         # Generate response with thinking for better reasoning
         if openai_client:
@@ -1477,34 +2068,7 @@ Based on this information, please answer the user's question."""
                 outputs={"llm_response": llm_response}
             )
 
-        # Extract JSON from the response
-        response_json = _extract_json_from_llm_response(llm_response)
-
-        if not response_json:
-            # Fallback for parsing errors
-            return {
-                "understanding": query_intent.get("understanding", "Query understood, but response processing failed"),
-                "summary": "Unable to generate a structured response",
-                "answer": "I encountered an error while processing the information from the knowledge graph.",
-                "results": relevant_nodes,
-                "confidence": 1
-            }
-
-        # Combine the response with the original query understanding and relevant nodes
-        final_response = {
-            "understanding": query_intent.get("understanding", "Not available"),
-            "summary": response_json.get("summary", "No summary available"),
-            "answer": response_json.get("answer", "No detailed answer available"),
-            "results": relevant_nodes,
-            "confidence": response_json.get("confidence", 5)
-        }
-
-        # Add reasoning to each result if available
-        if "reasoning" in response_json:
-            # Add overall reasoning to the response
-            final_response["reasoning"] = response_json["reasoning"]
-
-        return final_response
+        return _parse_generated_response(llm_response, query_intent, relevant_nodes)
 
     except Exception as e:
         logger.exception(f"Error generating response: {e}")
@@ -4,7 +4,7 @@ import json
 import sqlite3
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # These imports are handled dynamically to support graceful degradation
 # when dependencies are missing
@@ -14,6 +14,9 @@ from typing import Any, Dict, List, Optional, Union
 
 from arc_memory.errors import GraphBuildError, GraphQueryError
 from arc_memory.logging_conf import get_logger
+from arc_memory.migrations.registry import ensure_schema
+from arc_memory.profiling import span
+from arc_memory.schema.batch import EdgeBatch, NodeBatch, edge_keys, edge_rows, node_keys, node_rows
 from arc_memory.schema.models import (
     BuildManifest,
     Edge,
@@ -22,6 +25,8 @@ from arc_memory.schema.models import (
     NodeType,
     SearchResult,
 )
+from arc_memory.sql.stats import apply_write_stats, has_graph_stats
+from arc_memory.sql.temporal import as_of_key, edge_valid_sql, node_valid_sql
 
 logger = get_logger(__name__)
 
@@ -235,47 +240,9 @@ def init_db(db_path: Optional[Path] = None, test_mode: bool = False) -> Any:
             }
         )
 
-    # Enable WAL mode for better concurrency
+    # Bring the schema up to date; a current database costs a single read
     try:
-        conn.execute("PRAGMA journal_mode=WAL")
-    except Exception as e:
-        error_msg = f"Failed to enable WAL mode: {e}"
-        logger.error(error_msg)
-        # This is not critical, so we'll continue
-
-    # Create tables if they don't exist
-    try:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS nodes(
-                id TEXT PRIMARY KEY,
-                type TEXT NOT NULL,
-                title TEXT,
-                body TEXT,
-                timestamp TEXT,
-                extra TEXT
-            )
-            """
-        )
-
-        # Create index on timestamp column
-        conn.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_nodes_timestamp ON nodes(timestamp)
-            """
-        )
-
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS edges(
-                src TEXT NOT NULL,
-                dst TEXT NOT NULL,
-                rel TEXT NOT NULL,
-                properties TEXT,
-                PRIMARY KEY (src, dst, rel)
-            )
-            """
-        )
+        ensure_schema(conn, db_path)
     except Exception as e:
         error_msg = f"Failed to create tables: {e}"
         logger.error(error_msg)
@@ -287,17 +254,32 @@ def init_db(db_path: Optional[Path] = None, test_mode: bool = False) -> Any:
             }
         )
 
-    # Create FTS5 index if it doesn't exist
+    # WAL mode and the FTS5 index are set up on every open rather than with
+    # the schema, since databases stamped by SQLiteAdapter.init_db have
+    # neither. Both are no-ops once in place.
     try:
-        conn.execute(
-            """
-            CREATE VIRTUAL TABLE IF NOT EXISTS fts_nodes USING fts5(
-                body,
-                content='nodes',
-                content_rowid='id'
+        conn.execute("PRAGMA journal_mode=WAL")
+    except Exception as e:
+        error_msg = f"Failed to enable WAL mode: {e}"
+        logger.error(error_msg)
+        # This is not critical, so we'll continue
+
+    try:
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'fts_nodes'"
+        ).fetchone()
+        if not has_fts:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS fts_nodes USING fts5(
+                    body,
+                    content='nodes',
+                    content_rowid='id'
+                )
+                """
             )
-            """
-        )
+            # Index the nodes already in the database
+            conn.execute("INSERT INTO fts_nodes(fts_nodes) VALUES('rebuild')")
     except Exception as e:
         error_msg = f"Failed to create FTS5 index: {e}"
         logger.error(error_msg)
@@ -309,9 +291,8 @@ def init_db(db_path: Optional[Path] = None, test_mode: bool = False) -> Any:
 
     # Verify the database is working
     try:
-        cursor = conn.execute("SELECT COUNT(*) FROM nodes")
-        node_count = cursor.fetchone()[0]
-        logger.debug(f"Database initialized with {node_count} nodes")
+        conn.execute("SELECT 1 FROM nodes LIMIT 1").fetchone()
+        logger.debug(f"Database initialized: {db_path}")
     except Exception as e:
         error_msg = f"Failed to query database: {e}"
         logger.error(error_msg)
@@ -605,14 +586,14 @@ def ensure_connection(conn_or_path: Union[Any, Path, str]) -> sqlite3.Connection
 
 
 def add_nodes_and_edges(
-    conn: Any, nodes: List[Node], edges: List[Edge]
+    conn: Any, nodes: Union[List[Node], NodeBatch], edges: Union[List[Edge], EdgeBatch]
 ) -> None:
     """Add nodes and edges to the database.
 
     Args:
         conn: A connection to the database (real or mock).
-        nodes: The nodes to add.
-        edges: The edges to add.
+        nodes: The nodes to add, as a list or a NodeBatch.
+        edges: The edges to add, as a list or an EdgeBatch.
 
     Raises:
         GraphBuildError: If adding nodes and edges fails.
@@ -630,46 +611,35 @@ def add_nodes_and_edges(
     try:
         # Begin transaction
         with conn:
-            # Add nodes
-            for node in nodes:
-                # Extract timestamp from node
-                timestamp_str = None
-                if hasattr(node, 'ts') and node.ts:
-                    timestamp_str = node.ts.isoformat()
-
-                conn.execute(
+            # Account for the batch in the statistics tables before replacing rows
+            if has_graph_stats(conn):
+                with span("db.graph_stats"):
+                    apply_write_stats(conn, node_keys(nodes), edge_keys(edges))
+
+            # Add nodes, reading rows straight from batches without building models
+            with span("db.insert_nodes"):
+                conn.executemany(
                     """
                     INSERT OR REPLACE INTO nodes(id, type, title, body, timestamp, extra)
                     VALUES(?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        node.id,
-                        node.type.value,
-                        node.title,
-                        node.body,
-                        timestamp_str,
-                        json.dumps(node.extra, cls=DateTimeEncoder),
-                    ),
+                    (row[:5] + (row[6],) for row in node_rows(nodes)),
                 )
 
             # Add edges
-            for edge in edges:
-                conn.execute(
+            with span("db.insert_edges"):
+                conn.executemany(
                     """
-                    INSERT OR REPLACE INTO edges(src, dst, rel, properties)
-                    VALUES(?, ?, ?, ?)
+                    INSERT OR REPLACE INTO edges(src, dst, rel, properties, valid_from, valid_until)
+                    VALUES(?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        edge.src,
-                        edge.dst,
-                        edge.rel.value,
-                        json.dumps(edge.properties, cls=DateTimeEncoder),
-                    ),
+                    edge_rows(edges),
                 )
 
             # Rebuild FTS index
             try:
-                conn.execute("INSERT INTO fts_nodes(fts_nodes) VALUES('rebuild')")
+                with span("db.fts_rebuild"):
+                    conn.execute("INSERT INTO fts_nodes(fts_nodes) VALUES('rebuild')")
             except Exception as e:
                 # FTS index is optional, so we'll continue but log the error
                 logger.warning(f"Failed to rebuild FTS index: {e}")
@@ -831,12 +801,16 @@ def search_entities(
         )
 
 
-def get_node_by_id(conn_or_path: Union[Any, Path, str], node_id: str) -> Optional[Dict[str, Any]]:
+def get_node_by_id(
+    conn_or_path: Union[Any, Path, str], node_id: str, as_of: Optional[datetime] = None
+) -> Optional[Dict[str, Any]]:
     """Get a node by its ID.
 
     Args:
         conn_or_path: Either a database connection object or a path to a database file.
         node_id: The ID of the node.
+        as_of: Optional point in time; if given, the node is only returned if
+            it was valid at that time.
 
     Returns:
         The node, or None if it doesn't exist.
@@ -857,14 +831,17 @@ def get_node_by_id(conn_or_path: Union[Any, Path, str], node_id: str) -> Optiona
             raise GraphQueryError(f"Failed to get node by ID in test mode: {e}")
 
     try:
-        cursor = conn.execute(
-            """
+        query = """
             SELECT id, type, title, body, timestamp, extra
             FROM nodes
             WHERE id = ?
-            """,
-            (node_id,),
-        )
+            """
+        params: Tuple[Any, ...] = (node_id,)
+        if as_of is not None:
+            key = as_of_key(as_of)
+            query += f" AND {node_valid_sql()}"
+            params += (key, key)
+        cursor = conn.execute(query, params)
         row = cursor.fetchone()
         if row is None:
             return None
@@ -889,7 +866,10 @@ def get_node_by_id(conn_or_path: Union[Any, Path, str], node_id: str) -> Optiona
 
 
 def get_edges_by_src(
-    conn_or_path: Union[Any, Path, str], src_id: str, rel_type: Optional[EdgeRel] = None
+    conn_or_path: Union[Any, Path, str],
+    src_id: str,
+    rel_type: Optional[EdgeRel] = None,
+    as_of: Optional[datetime] = None,
 ) -> List[Dict[str, Any]]:
     """Get edges by source node ID.
 
@@ -897,6 +877,8 @@ def get_edges_by_src(
         conn_or_path: Either a database connection object or a path to a database file.
         src_id: The ID of the source node.
         rel_type: Optional relationship type to filter by.
+        as_of: Optional point in time; if given, only edges valid at that time
+            whose destination node was also valid are returned.
 
     Returns:
         A list of edges.
@@ -917,7 +899,9 @@ def get_edges_by_src(
             raise GraphQueryError(f"Failed to get edges by source in test mode: {e}")
 
     try:
-        if rel_type is None:
+        if as_of is not None:
+            cursor = _query_edges_as_of(conn, "src", src_id, rel_type, as_of)
+        elif rel_type is None:
             cursor = conn.execute(
                 """
                 SELECT src, dst, rel, properties
@@ -960,7 +944,10 @@ def get_edges_by_src(
 
 
 def get_edges_by_dst(
-    conn_or_path: Union[Any, Path, str], dst_id: str, rel_type: Optional[EdgeRel] = None
+    conn_or_path: Union[Any, Path, str],
+    dst_id: str,
+    rel_type: Optional[EdgeRel] = None,
+    as_of: Optional[datetime] = None,
 ) -> List[Dict[str, Any]]:
     """Get edges by destination node ID.
 
@@ -968,6 +955,8 @@ def get_edges_by_dst(
         conn_or_path: Either a database connection object or a path to a database file.
         dst_id: The ID of the destination node.
         rel_type: Optional relationship type to filter by.
+        as_of: Optional point in time; if given, only edges valid at that time
+            whose source node was also valid are returned.
 
     Returns:
         A list of edges.
@@ -988,7 +977,9 @@ def get_edges_by_dst(
             raise GraphQueryError(f"Failed to get edges by destination in test mode: {e}")
 
     try:
-        if rel_type is None:
+        if as_of is not None:
+            cursor = _query_edges_as_of(conn, "dst", dst_id, rel_type, as_of)
+        elif rel_type is None:
             cursor = conn.execute(
                 """
                 SELECT src, dst, rel, properties
@@ -1030,6 +1021,36 @@ def get_edges_by_dst(
         )
 
 
+def _query_edges_as_of(
+    conn: Any, anchor: str, node_id: str, rel_type: Optional[EdgeRel], as_of: datetime
+) -> Any:
+    """Query the edges attached to a node that were valid at a point in time.
+
+    Args:
+        conn: A connection to the database.
+        anchor: "src" to match edges by source, "dst" to match by destination.
+        node_id: The ID of the anchoring node.
+        rel_type: Optional relationship type to filter by.
+        as_of: The point in time.
+
+    Returns:
+        A cursor over ``(src, dst, rel, properties)`` rows.
+    """
+    key = as_of_key(as_of)
+    other = "dst" if anchor == "src" else "src"
+    query = f"""
+        SELECT e.src, e.dst, e.rel, e.properties
+        FROM edges e LEFT JOIN nodes n ON n.id = e.{other}
+        WHERE e.{anchor} = ? AND {edge_valid_sql("e")}
+          AND (n.id IS NULL OR ({node_valid_sql("n")}))
+        """
+    params: List[Any] = [node_id, key, key, key, key]
+    if rel_type is not None:
+        query += " AND e.rel = ?"
+        params.append(rel_type.value)
+    return conn.execute(query, params)
+
+
 def build_networkx_graph(conn: Any) -> Any:
     """Build a NetworkX directed graph from the database.
 
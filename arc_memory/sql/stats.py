@@ -0,0 +1,114 @@
+"""Write-time maintenance of the graph statistics tables.
+
+node_type_counts, edge_rel_counts and node_degrees (created by schema step 9
+in arc_memory.migrations.registry) hold the number of nodes per type, edges
+per relationship and the in- and out-degree of every node with edges.
+Deletes and type changes are handled by triggers. Inserts are accounted for
+by the writers, once per batch, with apply_write_stats: a per-row trigger
+would do several upserts for every edge written and make builds several
+times slower.
+"""
+
+from typing import Any, Iterable, Tuple
+
+# Statements run against per-connection temp tables holding the keys of the
+# batch being written
+_CREATE_STAGING = (
+    "CREATE TEMP TABLE IF NOT EXISTS stats_nodes("
+    "id TEXT PRIMARY KEY, type TEXT NOT NULL) WITHOUT ROWID",
+    "CREATE TEMP TABLE IF NOT EXISTS stats_edges("
+    "src TEXT NOT NULL, dst TEXT NOT NULL, rel TEXT NOT NULL, "
+    "PRIMARY KEY (src, dst, rel)) WITHOUT ROWID",
+)
+
+_ADD_TYPE_COUNTS = """
+    INSERT INTO main.node_type_counts(type, count)
+    {select}
+    ON CONFLICT(type) DO UPDATE SET count = count + excluded.count
+"""
+
+
+def has_graph_stats(conn: Any) -> bool:
+    """Check whether a database has the statistics tables.
+
+    Args:
+        conn: A sqlite3 or apsw connection.
+
+    Returns:
+        True if the tables exist.
+    """
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'node_degrees'"
+    ).fetchone()
+    return row is not None
+
+
+def apply_write_stats(
+    conn: Any,
+    node_keys: Iterable[Tuple[str, str]],
+    edge_keys: Iterable[Tuple[str, str, str]],
+) -> None:
+    """Account for a batch of node and edge writes in the statistics tables.
+
+    Must run in the writer's transaction before the rows are inserted with
+    INSERT OR REPLACE. A node that already exists moves from its old type to
+    its new one; an edge that already exists has the same key and changes no
+    count.
+
+    Args:
+        conn: A sqlite3 or apsw connection with the statistics tables.
+        node_keys: ``(id, type)`` of every node to be written; when an ID
+            repeats, the last type wins, as it does in the nodes table.
+        edge_keys: ``(src, dst, rel)`` of every edge to be written.
+    """
+    for statement in _CREATE_STAGING:
+        conn.execute(statement)
+    conn.execute("DELETE FROM temp.stats_nodes")
+    conn.execute("DELETE FROM temp.stats_edges")
+
+    conn.executemany("INSERT OR REPLACE INTO temp.stats_nodes(id, type) VALUES(?, ?)", node_keys)
+    # Replaced nodes leave their old type
+    conn.execute(_ADD_TYPE_COUNTS.format(select="""
+        SELECT n.type, -COUNT(*) FROM temp.stats_nodes b
+        JOIN main.nodes n ON n.id = b.id
+        WHERE true GROUP BY n.type
+    """))
+    conn.execute(_ADD_TYPE_COUNTS.format(select="""
+        SELECT type, COUNT(*) FROM temp.stats_nodes WHERE true GROUP BY type
+    """))
+    conn.execute("DELETE FROM main.node_type_counts WHERE count <= 0")
+
+    # Only edges that don't exist yet add to the counts
+    conn.executemany("INSERT OR IGNORE INTO temp.stats_edges(src, dst, rel) VALUES(?, ?, ?)", edge_keys)
+    conn.execute(
+        """
+        DELETE FROM temp.stats_edges
+        WHERE EXISTS (
+            SELECT 1 FROM main.edges e
+            WHERE e.src = stats_edges.src AND e.dst = stats_edges.dst AND e.rel = stats_edges.rel
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO main.edge_rel_counts(rel, count)
+        SELECT rel, COUNT(*) FROM temp.stats_edges WHERE true GROUP BY rel
+        ON CONFLICT(rel) DO UPDATE SET count = count + excluded.count
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO main.node_degrees(id, in_degree, out_degree)
+        SELECT id, SUM(incoming), SUM(outgoing) FROM (
+            SELECT dst AS id, 1 AS incoming, 0 AS outgoing FROM temp.stats_edges
+            UNION ALL
+            SELECT src AS id, 0 AS incoming, 1 AS outgoing FROM temp.stats_edges
+        ) WHERE true GROUP BY id
+        ON CONFLICT(id) DO UPDATE SET
+            in_degree = in_degree + excluded.in_degree,
+            out_degree = out_degree + excluded.out_degree
+        """
+    )
+
+    conn.execute("DELETE FROM temp.stats_nodes")
+    conn.execute("DELETE FROM temp.stats_edges")
@@ -0,0 +1,131 @@
+"""SQL predicates for point-in-time ("as of") queries.
+
+A node is valid at time T if it had started by T and had not ended by T. Its
+start is ``valid_from``, or the node timestamp when no explicit start was
+recorded. An edge is valid at T if its own ``valid_from``/``valid_until``
+interval contains T and the node at its other end is valid at T. Missing
+bounds are open, so nodes and edges without temporal data are always valid.
+
+Timestamps are stored as ISO 8601 strings in UTC (see `utc_iso`), which
+compare chronologically as text, so the predicates below run directly on the
+stored columns and can use the composite ``(key, valid_from, valid_until)``
+indexes. Naive datetimes, such as the git ingestor's commit times, are taken
+as local time and converted.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+# Sorts after every ISO timestamp, standing in for an open end
+_OPEN_END = "9999"
+
+
+def utc_iso(value: Optional[datetime]) -> Optional[str]:
+    """Format a datetime as an ISO 8601 string in UTC.
+
+    Args:
+        value: The datetime. Naive datetimes are taken as local time.
+
+    Returns:
+        The ISO string with a ``+00:00`` offset, or None if `value` is None.
+    """
+    if value is None:
+        return None
+    try:
+        value = value.astimezone(timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        # Outside the range the platform's local time conversion supports
+        value = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+    return value.isoformat()
+
+
+def utc_text(value: Optional[str]) -> Optional[str]:
+    """Normalize an ISO 8601 string to UTC (see `utc_iso`).
+
+    Args:
+        value: The ISO string. Strings without an offset are taken as local time.
+
+    Returns:
+        The string in UTC, or the value unchanged if it is empty, already in
+        UTC or not a valid timestamp.
+    """
+    if not value or value.endswith("+00:00"):
+        return value
+    try:
+        return utc_iso(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return value
+
+
+def as_of_key(as_of: Union[datetime, str]) -> str:
+    """Normalize a point in time to the stored ISO string form.
+
+    Args:
+        as_of: A datetime or an ISO 8601 string. Naive values are taken as
+            local time.
+
+    Returns:
+        The point in time as an ISO 8601 string in UTC.
+
+    Raises:
+        ValueError: If a string is not a valid ISO 8601 timestamp.
+    """
+    if isinstance(as_of, str):
+        as_of = datetime.fromisoformat(as_of.replace("Z", "+00:00"))
+    return utc_iso(as_of)
+
+
+def node_valid_sql(alias: str = "") -> str:
+    """Get the SQL predicate for a node being valid at a point in time.
+
+    The predicate takes two parameters, both the as-of key.
+
+    Args:
+        alias: Optional table alias of the nodes table.
+
+    Returns:
+        The SQL predicate.
+    """
+    prefix = f"{alias}." if alias else ""
+    return (
+        f"COALESCE({prefix}valid_from, {prefix}timestamp, '') <= ? "
+        f"AND COALESCE({prefix}valid_until, '{_OPEN_END}') > ?"
+    )
+
+
+def edge_valid_sql(alias: str = "") -> str:
+    """Get the SQL predicate for an edge interval containing a point in time.
+
+    The predicate takes two parameters, both the as-of key.
+
+    Args:
+        alias: Optional table alias of the edges table.
+
+    Returns:
+        The SQL predicate.
+    """
+    prefix = f"{alias}." if alias else ""
+    return (
+        f"COALESCE({prefix}valid_from, '') <= ? "
+        f"AND COALESCE({prefix}valid_until, '{_OPEN_END}') > ?"
+    )
+
+
+def is_valid_at(record: Dict[str, Any], as_of: Union[datetime, str]) -> bool:
+    """Check whether a node or edge dictionary is valid at a point in time.
+
+    Args:
+        record: A node or edge as returned by a database adapter.
+        as_of: The point in time.
+
+    Returns:
+        True if the record is valid at that time.
+    """
+    key = as_of_key(as_of)
+    start = record.get("valid_from") or record.get("timestamp") or ""
+    end = record.get("valid_until") or _OPEN_END
+    if isinstance(start, datetime):
+        start = utc_iso(start)
+    if isinstance(end, datetime):
+        end = utc_iso(end)
+    return start <= key < end
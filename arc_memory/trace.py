@@ -4,14 +4,17 @@ This module provides functions to trace the history of a specific line in a file
 following the decision trail through commits, PRs, issues, and ADRs.
 """
 
+import hashlib
 import json
 import os
 import sqlite3
 import subprocess
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, deque
 from datetime import datetime
-from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from arc_memory.logging_conf import get_logger
 from arc_memory.schema.models import Node, NodeType
@@ -19,67 +22,293 @@ from arc_memory.sql.db import get_connection
 
 logger = get_logger(__name__)
 
-# Cache size for git blame results
+# Number of files whose blame results are kept in memory
 BLAME_CACHE_SIZE = 100
 
 
-@lru_cache(maxsize=BLAME_CACHE_SIZE)
-def get_commit_for_line(repo_path: Path, file_path: str, line_number: int) -> Optional[str]:
+class BlameCache:
+    """Whole-file blame results, answered per line with a binary search.
+
+    One ``git blame --incremental`` run per file produces the line ranges each
+    commit owns. The ranges are stored as sorted run starts, so any line is
+    answered in O(log n) without another subprocess. An entry is keyed by the
+    working-tree blob SHA of the file and a fingerprint of HEAD; editing the
+    file or moving HEAD (commit, checkout, reset) re-runs the blame.
     """
-    Use git blame to find the commit that last modified a specific line.
+
+    def __init__(self, max_files: int = BLAME_CACHE_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_files: Maximum number of files to keep blame results for.
+        """
+        self.max_files = max_files
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_commits(
+        self, repo_path: Path, file_path: str, line_numbers: Iterable[int]
+    ) -> Dict[int, Optional[str]]:
+        """Get the commit that last modified each of the given lines.
+
+        Args:
+            repo_path: Path to the Git repository
+            file_path: Path to the file, relative to the repository root
+            line_numbers: Line numbers to check (1-based)
+
+        Returns:
+            A mapping of line number to commit hash (None if not found)
+        """
+        line_numbers = list(line_numbers)
+        entry = self._get_entry(Path(repo_path), file_path)
+        if entry is None:
+            return {line: None for line in line_numbers}
+
+        starts, ends, commits = entry["starts"], entry["ends"], entry["commits"]
+        result: Dict[int, Optional[str]] = {}
+        for line in line_numbers:
+            index = bisect_right(starts, line) - 1
+            if index >= 0 and line <= ends[index]:
+                result[line] = commits[index]
+            else:
+                result[line] = None
+        return result
+
+    def invalidate(self, repo_path: Optional[Path] = None, file_path: Optional[str] = None) -> None:
+        """Drop cached blame results.
+
+        Args:
+            repo_path: Only drop results for this repository. Drops all if None.
+            file_path: Only drop results for this file in the repository.
+        """
+        with self._lock:
+            if repo_path is None:
+                self._entries.clear()
+                return
+            repo_key = str(Path(repo_path).resolve())
+            for key in list(self._entries):
+                if key[0] == repo_key and (file_path is None or key[1] == file_path):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached blame results."""
+        self.invalidate()
+
+    def _get_entry(self, repo_path: Path, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get a valid cache entry for a file, running blame if needed."""
+        repo_path = repo_path.resolve()
+        abs_path = repo_path / file_path
+        try:
+            stat = abs_path.stat()
+        except OSError:
+            logger.warning(f"File {file_path} not found in {repo_path}")
+            return None
+
+        key = (str(repo_path), file_path)
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        head = _head_fingerprint(repo_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["head"] == head:
+                if entry["stat"] == file_stat:
+                    self._entries.move_to_end(key)
+                    return entry
+                # The file was touched; only re-blame if its content changed
+                blob_sha = _blob_sha(abs_path)
+                if blob_sha == entry["blob_sha"]:
+                    entry["stat"] = file_stat
+                    self._entries.move_to_end(key)
+                    return entry
+
+        blob_sha = _blob_sha(abs_path)
+        runs = _run_incremental_blame(repo_path, file_path)
+        if runs is None:
+            return None
+
+        entry = {
+            "head": head,
+            "stat": file_stat,
+            "blob_sha": blob_sha,
+            "starts": [run[0] for run in runs],
+            "ends": [run[1] for run in runs],
+            "commits": [run[2] for run in runs],
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+        return entry
+
+
+def _blob_sha(path: Path) -> Optional[str]:
+    """Compute the Git blob SHA of a file in the working tree.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The blob SHA, or None if the file cannot be read
+    """
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content).hexdigest()
+
+
+def _head_fingerprint(repo_path: Path) -> Tuple[int, int]:
+    """Take a cheap fingerprint of HEAD without running git.
+
+    The HEAD reflog grows on every commit, checkout, reset and merge, so its
+    size and modification time change whenever blame results may move.
+
+    Args:
+        repo_path: Path to the Git repository
+
+    Returns:
+        A tuple of (modification time in nanoseconds, size) of the HEAD reflog,
+        falling back to the HEAD file itself
+    """
+    git_dir = repo_path / ".git"
+    if git_dir.is_file():
+        # Worktrees and submodules point at their Git directory
+        content = git_dir.read_text().strip()
+        if content.startswith("gitdir:"):
+            git_dir = Path(content[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = repo_path / git_dir
+
+    for path in (git_dir / "logs" / "HEAD", git_dir / "HEAD"):
+        try:
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            continue
+    return (0, 0)
+
+
+def _run_incremental_blame(repo_path: Path, file_path: str) -> Optional[List[Tuple[int, int, str]]]:
+    """Blame a whole file and collapse the result into line-range runs.
 
     Args:
         repo_path: Path to the Git repository
         file_path: Path to the file, relative to the repository root
-        line_number: Line number to check (1-based)
 
     Returns:
-        The commit hash, or None if not found
+        A sorted list of (first line, last line, commit hash) runs, or None if
+        blame failed
     """
-    try:
-        # Ensure the file path is relative to the repository root
-        if os.path.isabs(file_path):
-            try:
-                file_path = os.path.relpath(file_path, repo_path)
-            except ValueError:
-                logger.error(f"File {file_path} is not within repository {repo_path}")
-                return None
-
-        # Run git blame to get the commit hash for the specified line
-        cmd = [
-            "git", "-C", str(repo_path), "blame",
-            "-L", f"{line_number},{line_number}",
-            "--porcelain",
-            file_path
-        ]
+    cmd = [
+        "git", "-C", str(repo_path), "blame",
+        "--incremental",
+        "--", file_path
+    ]
 
+    try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             check=True
         )
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Git blame failed: {e.stderr}")
+        return None
+    except Exception as e:
+        logger.error(f"Error running git blame: {e}")
+        return None
+
+    # Each group starts with "<sha> <source line> <result line> <num lines>",
+    # followed by header lines that never start with a 40-character hash
+    groups = []
+    for line in result.stdout.splitlines():
+        parts = line.split(" ")
+        if len(parts) == 4 and len(parts[0]) == 40 and parts[3].isdigit():
+            start = int(parts[2])
+            groups.append((start, start + int(parts[3]) - 1, parts[0]))
+
+    groups.sort()
+    runs: List[Tuple[int, int, str]] = []
+    for start, end, commit in groups:
+        if runs and runs[-1][2] == commit and runs[-1][1] + 1 == start:
+            runs[-1] = (runs[-1][0], end, commit)
+        else:
+            runs.append((start, end, commit))
+    return runs
 
-        # Parse the output to extract the commit hash
-        # The first line of git blame --porcelain output starts with the commit hash
-        lines = result.stdout.strip().split('\n')
-        if not lines:
-            logger.warning(f"No blame information for {file_path}:{line_number}")
+
+# Process-wide blame cache shared by trace and the SDK decision trail
+blame_cache = BlameCache()
+
+
+def _relative_file_path(repo_path: Path, file_path: str) -> Optional[str]:
+    """Make a file path relative to the repository root.
+
+    Args:
+        repo_path: Path to the Git repository
+        file_path: Absolute or repository-relative file path
+
+    Returns:
+        The repository-relative path, or None if it is outside the repository
+    """
+    if os.path.isabs(file_path):
+        try:
+            return os.path.relpath(file_path, repo_path)
+        except ValueError:
+            logger.error(f"File {file_path} is not within repository {repo_path}")
             return None
+    return file_path
 
-        # Extract the commit hash from the first line
-        # Format: <hash> <original line> <line number> <line count>
-        commit_hash = lines[0].split(' ')[0]
 
-        logger.debug(f"Found commit {commit_hash} for {file_path}:{line_number}")
-        return commit_hash
+def get_commits_for_lines(
+    repo_path: Path, file_path: str, line_numbers: Iterable[int]
+) -> Dict[int, Optional[str]]:
+    """
+    Find the commits that last modified several lines of a file.
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Git blame failed: {e.stderr}")
-        return None
+    All lines are answered from a single cached whole-file blame.
+
+    Args:
+        repo_path: Path to the Git repository
+        file_path: Path to the file, relative to the repository root
+        line_numbers: Line numbers to check (1-based)
+
+    Returns:
+        A mapping of line number to commit hash (None if not found)
+    """
+    line_numbers = list(line_numbers)
+    try:
+        relative_path = _relative_file_path(repo_path, file_path)
+        if relative_path is None:
+            return {line: None for line in line_numbers}
+
+        return blame_cache.get_commits(repo_path, relative_path, line_numbers)
     except Exception as e:
-        logger.error(f"Error in get_commit_for_line: {e}")
-        return None
+        logger.error(f"Error in get_commits_for_lines: {e}")
+        return {line: None for line in line_numbers}
+
+
+def get_commit_for_line(repo_path: Path, file_path: str, line_number: int) -> Optional[str]:
+    """
+    Use git blame to find the commit that last modified a specific line.
+
+    Args:
+        repo_path: Path to the Git repository
+        file_path: Path to the file, relative to the repository root
+        line_number: Line number to check (1-based)
+
+    Returns:
+        The commit hash, or None if not found
+    """
+    commit_hash = get_commits_for_lines(repo_path, file_path, [line_number])[line_number]
+    if commit_hash is None:
+        logger.warning(f"No blame information for {file_path}:{line_number}")
+    else:
+        logger.debug(f"Found commit {commit_hash} for {file_path}:{line_number}")
+    return commit_hash
 
 
 def trace_history(
@@ -109,51 +338,68 @@ def trace_history(
             logger.warning(f"No commit found for {file_path}:{line_number}")
             return []
 
-        # Start with the commit node
-        start_node_id = f"commit:{commit_id}"
+        return _trace_from_commit(conn, commit_id, max_nodes, max_hops)
 
-        # Initialize BFS
-        from collections import deque
-        visited = set()
-        queue = deque([(start_node_id, 0)])  # (node_id, hop_count)
-        result_nodes = []
+    except Exception as e:
+        logger.error(f"Error in trace_history: {e}")
+        return []
 
-        # Perform BFS
-        while queue and len(result_nodes) < max_nodes:
-            node_id, hop_count = queue.popleft()
 
-            # Skip if already visited or max hops reached
-            if node_id in visited or hop_count > max_hops:
-                continue
+def _trace_from_commit(
+    conn: sqlite3.Connection, commit_id: str, max_nodes: int, max_hops: int
+) -> List[Dict[str, Any]]:
+    """
+    Walk the graph from a commit node using a BFS algorithm.
 
-            visited.add(node_id)
+    Args:
+        conn: SQLite connection
+        commit_id: The commit hash to start from
+        max_nodes: Maximum number of nodes to return
+        max_hops: Maximum number of hops in the graph traversal
 
-            # Get the node from the database
-            node = get_node_by_id(conn, node_id)
-            if node:
-                result_nodes.append(node)
+    Returns:
+        A list of nodes representing the history trail, sorted by timestamp (newest first)
+    """
+    # Start with the commit node
+    start_node_id = f"commit:{commit_id}"
 
-            # If we've reached max hops, don't explore further
-            if hop_count >= max_hops:
-                continue
+    # Initialize BFS
+    visited = set()
+    queue = deque([(start_node_id, 0)])  # (node_id, hop_count)
+    result_nodes = []
 
-            # Get connected nodes based on the current node type
-            connected_nodes = get_connected_nodes(conn, node_id, hop_count)
+    # Perform BFS
+    while queue and len(result_nodes) < max_nodes:
+        node_id, hop_count = queue.popleft()
 
-            # Add connected nodes to the queue
-            for connected_id in connected_nodes:
-                if connected_id not in visited:
-                    queue.append((connected_id, hop_count + 1))
+        # Skip if already visited or max hops reached
+        if node_id in visited or hop_count > max_hops:
+            continue
 
-        # Format the results
-        formatted_results = format_trace_results(result_nodes)
+        visited.add(node_id)
 
-        # Return the results (limited to max_nodes)
-        return formatted_results[:max_nodes]
+        # Get the node from the database
+        node = get_node_by_id(conn, node_id)
+        if node:
+            result_nodes.append(node)
 
-    except Exception as e:
-        logger.error(f"Error in trace_history: {e}")
-        return []
+        # If we've reached max hops, don't explore further
+        if hop_count >= max_hops:
+            continue
+
+        # Get connected nodes based on the current node type
+        connected_nodes = get_connected_nodes(conn, node_id, hop_count)
+
+        # Add connected nodes to the queue
+        for connected_id in connected_nodes:
+            if connected_id not in visited:
+                queue.append((connected_id, hop_count + 1))
+
+    # Format the results
+    formatted_results = format_trace_results(result_nodes)
+
+    # Return the results (limited to max_nodes)
+    return formatted_results[:max_nodes]
 
 
 def get_node_by_id(conn: sqlite3.Connection, node_id: str) -> Optional[Node]:
@@ -409,3 +655,59 @@ def trace_history_for_file_line(
     except Exception as e:
         logger.error(f"Error in trace_history_for_file_line: {e}")
         return []
+
+
+def trace_history_for_file_lines(
+    db_path: Path,
+    file_path: str,
+    line_numbers: Iterable[int],
+    max_results: int = 3,
+    max_hops: int = 2,
+    repo_path: Optional[Path] = None
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Trace the history of several lines in a file at once.
+
+    The file is blamed once and the graph is walked once per distinct commit,
+    so tracing every line of a hunk costs about the same as tracing one line.
+
+    Args:
+        db_path: Path to the SQLite database
+        file_path: Path to the file, relative to the repository root
+        line_numbers: Line numbers to check (1-based)
+        max_results: Maximum number of results to return per line
+        max_hops: Maximum number of hops in the graph traversal
+        repo_path: Path to the Git repository (defaults to the current directory)
+
+    Returns:
+        A mapping of line number to formatted results as specified in the API docs
+    """
+    line_numbers = list(line_numbers)
+    results: Dict[int, List[Dict[str, Any]]] = {line: [] for line in line_numbers}
+    try:
+        if repo_path is None:
+            repo_path = Path(os.getcwd())
+
+        commits = get_commits_for_lines(repo_path, file_path, line_numbers)
+        if not any(commits.values()):
+            logger.warning(f"No commits found for lines of {file_path}")
+            return results
+
+        conn = get_connection(db_path)
+        try:
+            trails: Dict[str, List[Dict[str, Any]]] = {}
+            for line, commit_id in commits.items():
+                if not commit_id:
+                    continue
+                if commit_id not in trails:
+                    trails[commit_id] = _trace_from_commit(conn, commit_id, max_results, max_hops)
+                # Each line gets its own list so callers can modify it safely
+                results[line] = [dict(entry) for entry in trails[commit_id]]
+        finally:
+            conn.close()
+
+        return results
+
+    except Exception as e:
+        logger.error(f"Error in trace_history_for_file_lines: {e}")
+        return results
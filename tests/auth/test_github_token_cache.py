@@ -0,0 +1,148 @@
+"""Tests for the GitHub App installation token cache."""
+
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from arc_memory.auth import github
+from arc_memory.auth.token_cache import InstallationTokenCache
+
+
+class TestInstallationTokenCache(unittest.TestCase):
+    """Tests for InstallationTokenCache."""
+
+    def setUp(self):
+        """Set up a cache file in a temporary directory and a fake clock."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "tokens.enc"
+        self.now = 1_000_000.0
+        self.calls = []
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _cache(self, **kwargs):
+        kwargs.setdefault("background", False)
+        return InstallationTokenCache(path=self.path, clock=lambda: self.now, **kwargs)
+
+    def _fetch(self, installation_id):
+        self.calls.append(installation_id)
+        expires_at = datetime.fromtimestamp(self.now + 3600, tz=timezone.utc)
+        return f"token-{len(self.calls)}", expires_at, "42"
+
+    def test_tokens_are_reused(self):
+        """Test that tokens are fetched once and shared through the cache file."""
+        cache = self._cache()
+        self.assertEqual(cache.get_token("app:owner/repo", self._fetch), "token-1")
+        self.assertEqual(cache.get_token("app:owner/repo", self._fetch), "token-1")
+
+        # Another process reads the token from disk
+        self.assertEqual(self._cache().get_token("app:owner/repo", self._fetch), "token-1")
+        self.assertEqual(self.calls, [None])
+
+        # The file is encrypted
+        self.assertNotIn(b"token-1", self.path.read_bytes())
+
+    def test_expired_tokens_are_refreshed_with_the_cached_installation_id(self):
+        """Test that a refresh skips the installation lookup."""
+        cache = self._cache()
+        cache.get_token("app:owner/repo", self._fetch)
+
+        self.now += 3600 - 30
+        self.assertEqual(cache.get_token("app:owner/repo", self._fetch), "token-2")
+        self.assertEqual(self.calls, [None, "42"])
+
+    def test_stale_installation_ids_are_looked_up_again(self):
+        """Test that a failing refresh retries with a fresh installation lookup."""
+        cache = self._cache()
+        cache.get_token("app:owner/repo", self._fetch)
+        self.now += 3600
+
+        def fetch(installation_id):
+            if installation_id is not None:
+                raise RuntimeError("Not Found")
+            return self._fetch(installation_id)
+
+        self.assertEqual(cache.get_token("app:owner/repo", fetch), "token-2")
+        self.assertEqual(self.calls, [None, None])
+
+    def test_tokens_without_expiry_are_not_cached(self):
+        """Test that tokens are only cached when their expiry is known."""
+        cache = self._cache()
+        fetch = MagicMock(return_value=("token", None, "42"))
+        cache.get_token("app:owner/repo", fetch)
+        cache.get_token("app:owner/repo", fetch)
+        self.assertEqual(fetch.call_count, 2)
+        self.assertFalse(self.path.exists())
+
+    def test_tokens_are_refreshed_in_the_background_before_expiry(self):
+        """Test that a token close to expiry is handed out while a new one is fetched."""
+        cache = self._cache(background=True, refresh_margin=300)
+        cache.get_token("app:owner/repo", self._fetch)
+
+        # Signal once the background refresh has stored the new token
+        refreshed = threading.Event()
+        refresh_in_background = cache._refresh_in_background
+
+        def refresh_and_signal(key, fetch):
+            refresh_in_background(key, fetch)
+            refreshed.set()
+
+        cache._refresh_in_background = refresh_and_signal
+
+        self.now += 3600 - 200
+        self.assertEqual(cache.get_token("app:owner/repo", self._fetch), "token-1")
+
+        self.assertTrue(refreshed.wait(5))
+        self.assertEqual(self.calls, [None, "42"])
+        self.assertEqual(cache.get_token("app:owner/repo", self._fetch), "token-2")
+        cache.clear()
+
+    def test_idle_tokens_are_not_refreshed(self):
+        """Test that background refreshes stop once a token isn't used."""
+        cache = self._cache(background=True, refresh_margin=300)
+        cache.get_token("app:owner/repo", self._fetch)
+        cache.get_token("app:other/repo", self._fetch)
+        self.assertEqual(len(cache._timers), 2)
+
+        # Only the first token is used before the refreshes are due
+        self.now += 600
+        cache.get_token("app:owner/repo", self._fetch)
+        self.now += 3600 - 600 - 200
+        for key in ("app:owner/repo", "app:other/repo"):
+            cache._timers.pop(key).cancel()
+            cache._refresh_in_background(key, self._fetch)
+
+        self.assertEqual(self.calls, [None, None, "42"])
+        self.assertEqual(cache._timers, {})
+
+        # The idle token expires and is fetched again on its next use
+        self.now += 300
+        self.assertEqual(cache.get_token("app:other/repo", self._fetch), "token-4")
+        cache.clear()
+
+
+class TestKeyringMemoization(unittest.TestCase):
+    """Tests for memoized keyring lookups."""
+
+    @patch("arc_memory.auth.github.keyring")
+    def test_keyring_is_read_once(self, mock_keyring):
+        """Test that repeated lookups don't go back to the keyring."""
+        mock_keyring.get_password.return_value = "keyring-token"
+
+        self.assertEqual(github.get_token_from_keyring(), "keyring-token")
+        self.assertEqual(github.get_token_from_keyring(), "keyring-token")
+        mock_keyring.get_password.assert_called_once()
+
+        # Storing a token updates the remembered value
+        github.store_token_in_keyring("new-token")
+        self.assertEqual(github.get_token_from_keyring(), "new-token")
+        mock_keyring.get_password.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
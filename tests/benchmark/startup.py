@@ -0,0 +1,154 @@
+"""Startup benchmark for the Arc Memory CLI.
+
+Measures the import cost of the CLI entry points with ``python -X importtime``
+and fails if a command exceeds its startup budget or imports a module that
+belongs behind another command (plotting, Git, GraphQL and HTTP clients).
+
+Usage:
+    python -m tests.benchmark.startup
+    python -m tests.benchmark.startup --runs 10 --output startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# Import budget in milliseconds for each CLI entry module
+STARTUP_BUDGETS_MS: Dict[str, float] = {
+    "arc_memory.cli": 250.0,
+    "arc_memory.cli.trace": 400.0,
+}
+
+# Modules that must not be imported just to start these commands
+FORBIDDEN_MODULES: Dict[str, List[str]] = {
+    "arc_memory.cli": [
+        "arc_memory.sdk",
+        "arc_memory.cli.rl",
+        "git",
+        "gql",
+        "aiohttp",
+        "matplotlib",
+        "numpy",
+    ],
+    "arc_memory.cli.trace": [
+        "arc_memory.sdk",
+        "arc_memory.cli.build",
+        "git",
+        "gql",
+        "aiohttp",
+        "matplotlib",
+        "numpy",
+    ],
+}
+
+
+def measure_import(module: str) -> Dict[str, object]:
+    """Import a module in a fresh interpreter and record its import cost.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        A dictionary with the cumulative import time of the module in
+        milliseconds and the set of modules that were imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported: Set[str] = set()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            total_us = int(cumulative)
+
+    return {"total_ms": total_us / 1000.0, "modules": imported}
+
+
+def loaded_forbidden_modules(module: str, imported: Iterable[str]) -> List[str]:
+    """Get the forbidden modules (or their submodules) that were imported.
+
+    Args:
+        module: The CLI entry module that was measured.
+        imported: The names of the modules imported while loading it.
+
+    Returns:
+        A sorted list of forbidden module names that were imported.
+    """
+    forbidden = FORBIDDEN_MODULES.get(module, [])
+    return sorted({
+        name for name in forbidden
+        for loaded in imported
+        if loaded == name or loaded.startswith(name + ".")
+    })
+
+
+def run_startup_benchmark(runs: int = 5, output_file: Optional[Path] = None) -> bool:
+    """Measure every CLI entry module and check it against its budget.
+
+    Args:
+        runs: Number of fresh interpreters to measure per module.
+        output_file: Optional path to write the results as JSON.
+
+    Returns:
+        True if every module is within budget and imports no forbidden modules.
+    """
+    results = []
+    ok = True
+    for module, budget_ms in STARTUP_BUDGETS_MS.items():
+        measurements = [measure_import(module) for _ in range(runs)]
+        median_ms = statistics.median(m["total_ms"] for m in measurements)
+        forbidden = loaded_forbidden_modules(module, measurements[0]["modules"])
+        passed = median_ms <= budget_ms and not forbidden
+        ok = ok and passed
+
+        results.append({
+            "module": module,
+            "median_ms": round(median_ms, 1),
+            "budget_ms": budget_ms,
+            "forbidden_imports": forbidden,
+            "passed": passed,
+        })
+        status = "OK  " if passed else "FAIL"
+        print(f"{status} {module}: {median_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+        for name in forbidden:
+            print(f"     imports {name}")
+
+    if output_file:
+        with open(output_file, "w") as f:
+            json.dump({"runs": runs, "results": results}, f, indent=2)
+        print(f"Results saved to {output_file}")
+
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Arc Memory CLI startup time.")
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of measurements per module (default: 5)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Output file for benchmark results (JSON)",
+    )
+    args = parser.parse_args()
+
+    sys.exit(0 if run_startup_benchmark(args.runs, args.output) else 1)
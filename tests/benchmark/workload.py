@@ -0,0 +1,531 @@
+"""Recorded-workload benchmark for the Arc Memory query APIs.
+
+Generates a synthetic knowledge graph with configurable node count, edge count
+and degree distribution, replays a script of API calls against it and reports
+p50/p95/p99 latency, throughput and peak RSS per workload. Every workload runs
+in a fresh process, so its peak RSS is its own rather than the high-water mark
+of the graph generator and the workloads before it. Results can be
+saved as a baseline and later runs compared against it, failing when a metric
+regresses by more than its threshold.
+
+The script is generated from a seed, so two runs with the same options replay
+the same calls; it can also be recorded to a file and replayed later.
+Workloads that normally involve an external service replay their recorded
+part: ``query`` runs the graph search stage with recorded query intents (the
+LLM stages are not timed), ``export`` runs the export graph walk and writes
+newline-delimited records for seed files instead of a Git diff, and
+``refresh`` writes the delta batch an incremental refresh produces.
+
+Usage:
+    python -m tests.benchmark.workload
+    python -m tests.benchmark.workload --edges 10000000 --nodes 1000000 --output results.json
+    python -m tests.benchmark.workload --save-baseline benchmarks/workload_baseline.json
+    python -m tests.benchmark.workload --baseline benchmarks/workload_baseline.json --threshold p95_ms=0.5
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from arc_memory.export import get_related_nodes, iter_raw_export_records
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
+from arc_memory.schema.models import EdgeRel, NodeType
+from arc_memory.sdk import Arc
+from arc_memory.semantic_search import _search_knowledge_graph
+from arc_memory.sql.db import get_connection
+
+# Share of each node type in the synthetic graph
+DEFAULT_TYPE_MIX: Dict[str, float] = {
+    "file": 0.35,
+    "commit": 0.40,
+    "pr": 0.08,
+    "issue": 0.08,
+    "adr": 0.02,
+    "component": 0.07,
+}
+
+# Edge rules: (source type, relationship, destination type, share of edges)
+EDGE_RULES: List[Tuple[str, EdgeRel, str, float]] = [
+    ("commit", EdgeRel.MODIFIES, "file", 0.45),
+    ("pr", EdgeRel.MERGES, "commit", 0.10),
+    ("pr", EdgeRel.MENTIONS, "issue", 0.05),
+    ("file", EdgeRel.DEPENDS_ON, "file", 0.20),
+    ("adr", EdgeRel.DECIDES, "file", 0.03),
+    ("component", EdgeRel.CONTAINS, "file", 0.12),
+    ("component", EdgeRel.DEPENDS_ON, "component", 0.05),
+]
+
+# Words used in node titles and recorded query keywords
+VOCABULARY = [
+    "auth", "cache", "login", "parser", "export", "schema", "index", "retry",
+    "queue", "config", "token", "session", "upload", "search", "billing", "metrics",
+]
+
+# Workloads and the node type their calls start from
+WORKLOAD_TARGETS: Dict[str, str] = {
+    "query": "",
+    "analyze_component_impact": "component",
+    "get_related_entities": "file",
+    "get_entity_history": "file",
+    "export_graph": "file",
+    "refresh": "",
+}
+
+# Allowed relative regression per metric before the comparison fails
+DEFAULT_THRESHOLDS: Dict[str, float] = {
+    "p50_ms": 0.25,
+    "p95_ms": 0.30,
+    "p99_ms": 0.50,
+    "throughput": 0.20,
+    "peak_rss_mb": 0.20,
+}
+
+# Metrics where a larger value is a regression; for the others a smaller one is
+HIGHER_IS_WORSE = {"p50_ms", "p95_ms", "p99_ms", "peak_rss_mb"}
+
+# Rows per write when generating the graph, which bounds generator memory
+WRITE_CHUNK = 200_000
+
+_EPOCH = datetime(2023, 1, 1)
+
+
+@dataclass
+class GraphSpec:
+    """Shape of a synthetic graph.
+
+    Attributes:
+        nodes: Number of nodes.
+        edges: Number of edges to generate; repeated (src, dst, rel) keys
+            collapse, so the stored count can be slightly lower.
+        distribution: "uniform" or "powerlaw" choice of edge destinations.
+        skew: Power-law exponent; larger values concentrate more edges on
+            fewer hub nodes.
+        seed: Random seed.
+        type_mix: Share of each node type.
+    """
+
+    nodes: int = 10_000
+    edges: int = 50_000
+    distribution: str = "powerlaw"
+    skew: float = 2.5
+    seed: int = 0
+    type_mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TYPE_MIX))
+
+
+def type_counts(spec: GraphSpec) -> Dict[str, int]:
+    """Get the number of nodes of each type for a spec (at least one each)."""
+    total = sum(spec.type_mix.values())
+    return {
+        node_type: max(1, int(spec.nodes * share / total))
+        for node_type, share in spec.type_mix.items()
+    }
+
+
+def _pick(rng: random.Random, count: int, spec: GraphSpec) -> int:
+    """Pick a node index, skewed towards low indices for power-law graphs."""
+    if spec.distribution == "powerlaw":
+        return min(count - 1, int(count * rng.random() ** spec.skew))
+    return rng.randrange(count)
+
+
+def generate_graph(arc: Arc, spec: GraphSpec) -> Dict[str, int]:
+    """Write a synthetic graph through the SDK's batch writer.
+
+    Args:
+        arc: An Arc instance connected to an empty database.
+        spec: The shape of the graph.
+
+    Returns:
+        The number of nodes and edges stored.
+
+    Raises:
+        ValueError: If the distribution is not supported.
+    """
+    if spec.distribution not in ("uniform", "powerlaw"):
+        raise ValueError(f"Invalid distribution: {spec.distribution}")
+
+    rng = random.Random(spec.seed)
+    counts = type_counts(spec)
+
+    nodes = NodeBatch()
+    for node_type, count in counts.items():
+        for i in range(count):
+            words = " ".join(rng.sample(VOCABULARY, 2))
+            nodes.add(
+                f"{node_type}:{i}",
+                NodeType(node_type),
+                title=f"{node_type} {i} {words}",
+                ts=_EPOCH + timedelta(minutes=i),
+            )
+            if len(nodes) >= WRITE_CHUNK:
+                arc.add_nodes_and_edges(nodes, EdgeBatch())
+                nodes = NodeBatch()
+    arc.add_nodes_and_edges(nodes, EdgeBatch())
+
+    rules = [rule for rule in EDGE_RULES if rule[0] in counts and rule[2] in counts]
+    weights = [rule[3] for rule in rules]
+    edges = EdgeBatch()
+    for _ in range(spec.edges):
+        src_type, rel, dst_type, _ = rng.choices(rules, weights)[0]
+        edges.add(
+            f"{src_type}:{rng.randrange(counts[src_type])}",
+            f"{dst_type}:{_pick(rng, counts[dst_type], spec)}",
+            rel,
+        )
+        if len(edges) >= WRITE_CHUNK:
+            arc.add_nodes_and_edges(NodeBatch(), edges)
+            edges = EdgeBatch()
+    arc.add_nodes_and_edges(NodeBatch(), edges)
+
+    return {"nodes": arc.get_node_count(), "edges": arc.adapter.get_edge_count()}
+
+
+def build_script(spec: GraphSpec, iterations: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Generate the calls of every workload.
+
+    Args:
+        spec: The shape of the graph the script runs against.
+        iterations: Number of calls per workload.
+        seed: Random seed for choosing call arguments.
+
+    Returns:
+        A list of ``{"workload", "args"}`` calls.
+    """
+    rng = random.Random(seed)
+    counts = type_counts(spec)
+    script = []
+    for workload, target_type in WORKLOAD_TARGETS.items():
+        for i in range(iterations):
+            if workload == "query":
+                args = {"intent": {
+                    "entity_types": rng.sample(["commit", "pr", "issue", "adr", "file"], 2),
+                    "attributes": {"title_keywords": [rng.choice(VOCABULARY)]},
+                    "search_metadata": {"max_nodes_per_type": 5},
+                }}
+            elif workload == "refresh":
+                args = {"batch": i, "commits": 20, "files": [
+                    f"file:{rng.randrange(counts['file'])}" for _ in range(20)
+                ]}
+            else:
+                args = {"entity_id": f"{target_type}:{_pick(rng, counts[target_type], spec)}"}
+            script.append({"workload": workload, "args": args})
+    return script
+
+
+def _query(arc: Arc, args: Dict[str, Any], context: Dict[str, Any]) -> None:
+    _search_knowledge_graph(context["conn"], args["intent"], max_results=5, max_hops=2)
+
+
+def _impact(arc: Arc, args: Dict[str, Any], context: Dict[str, Any]) -> None:
+    arc.analyze_component_impact(args["entity_id"], cache=False)
+
+
+def _related(arc: Arc, args: Dict[str, Any], context: Dict[str, Any]) -> None:
+    arc.get_related_entities(args["entity_id"], max_results=20, cache=False)
+
+
+def _history(arc: Arc, args: Dict[str, Any], context: Dict[str, Any]) -> None:
+    arc.get_entity_history(args["entity_id"], cache=False)
+
+
+def _export(arc: Arc, args: Dict[str, Any], context: Dict[str, Any]) -> None:
+    nodes, edges = get_related_nodes(arc.adapter.conn, [args["entity_id"]], max_hops=2, include_adrs=False)
+    with open(context["export_path"], "w") as f:
+        for record in iter_raw_export_records("benchmark", nodes, edges, [args["entity_id"]]):
+            f.write(json.dumps(record, default=str) + "\n")
+
+
+def _refresh(arc: Arc, args: Dict[str, Any], context: Dict[str, Any]) -> None:
+    nodes = NodeBatch()
+    edges = EdgeBatch()
+    for i in range(args["commits"]):
+        commit_id = f"commit:refresh-{context['run']}-{args['batch']}-{i}"
+        nodes.add(commit_id, NodeType.COMMIT, title=f"refresh {i}", ts=datetime.now())
+        for file_id in args["files"][i % len(args["files"]):][:3]:
+            edges.add(commit_id, file_id, EdgeRel.MODIFIES)
+    arc.add_nodes_and_edges(nodes, edges)
+
+
+WORKLOADS: Dict[str, Callable[[Arc, Dict[str, Any], Dict[str, Any]], None]] = {
+    "query": _query,
+    "analyze_component_impact": _impact,
+    "get_related_entities": _related,
+    "get_entity_history": _history,
+    "export_graph": _export,
+    "refresh": _refresh,
+}
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of this process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize(latencies_ms: List[float], elapsed_s: float) -> Dict[str, float]:
+    """Summarize the latencies of one workload.
+
+    Args:
+        latencies_ms: Latency of every call in milliseconds.
+        elapsed_s: Wall-clock time of all calls in seconds.
+
+    Returns:
+        Call count, p50/p95/p99 latency, throughput in calls per second and
+        the process's peak RSS so far.
+    """
+    if len(latencies_ms) > 1:
+        cuts = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies_ms[0] if latencies_ms else 0.0
+    return {
+        "ops": len(latencies_ms),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+        "throughput": round(len(latencies_ms) / elapsed_s, 2) if elapsed_s else 0.0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def _measure_workload(
+    db_path: str, workload: str, calls: List[Dict[str, Any]], warmup: int, run_id: str
+) -> Dict[str, float]:
+    """Replay the calls of one workload and summarize them.
+
+    Runs in a process of its own (see run_workloads), so the peak RSS in the
+    summary covers this workload only.
+    """
+    arc = Arc(
+        repo_path=str(Path(db_path).parent),
+        adapter_type="sqlite",
+        connection_params={"db_path": db_path, "check_exists": False},
+    )
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            context = {
+                "conn": get_connection(Path(db_path), check_exists=False),
+                "export_path": Path(temp_dir) / "export.jsonl",
+                "run": run_id,
+            }
+            try:
+                run = WORKLOADS[workload]
+                for args in calls[:warmup]:
+                    run(arc, args, {**context, "run": f"{run_id}-warmup"})
+
+                latencies = []
+                started = time.perf_counter()
+                for args in calls:
+                    call_started = time.perf_counter()
+                    run(arc, args, context)
+                    latencies.append((time.perf_counter() - call_started) * 1000)
+                return summarize(latencies, time.perf_counter() - started)
+            finally:
+                context["conn"].close()
+    finally:
+        arc.close()
+
+
+def run_workloads(
+    arc: Arc, script: List[Dict[str, Any]], warmup: int = 3, run_id: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """Replay a script and measure every workload in it.
+
+    Each workload runs in a freshly spawned process with its own connections,
+    so neither its peak RSS nor its caches carry over from the graph
+    generator or the workloads before it.
+
+    Args:
+        arc: An Arc instance connected to the benchmark graph.
+        script: The calls to replay, as returned by build_script.
+        warmup: Number of untimed calls per workload before measuring.
+        run_id: Unique suffix for the nodes written by refresh calls.
+
+    Returns:
+        A dictionary mapping workload names to their summaries.
+    """
+    by_workload: Dict[str, List[Dict[str, Any]]] = {}
+    for call in script:
+        by_workload.setdefault(call["workload"], []).append(call["args"])
+
+    db_path = str(arc.adapter.db_path)
+    run_id = run_id or str(time.time_ns())
+    spawn = multiprocessing.get_context("spawn")
+    results = {}
+    for workload, calls in by_workload.items():
+        with spawn.Pool(processes=1) as pool:
+            results[workload] = pool.apply(_measure_workload, (db_path, workload, calls, warmup, run_id))
+    return results
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    """Compare benchmark results against a baseline.
+
+    Args:
+        results: Results of this run, as returned by run_benchmark.
+        baseline: Results of the baseline run.
+        thresholds: Allowed relative regression per metric; metrics without a
+            threshold are not compared.
+
+    Returns:
+        A description of every regression beyond its threshold.
+    """
+    thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+    regressions = []
+    for workload, current in results.get("workloads", {}).items():
+        previous = baseline.get("workloads", {}).get(workload)
+        if not previous:
+            continue
+        for metric, allowed in thresholds.items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if metric not in HIGHER_IS_WORSE:
+                change = -change
+            if change > allowed:
+                regressions.append(
+                    f"{workload} {metric}: {old} -> {new} "
+                    f"({change:+.0%} worse, threshold {allowed:.0%})"
+                )
+    return regressions
+
+
+def run_benchmark(
+    spec: GraphSpec,
+    iterations: int = 50,
+    warmup: int = 3,
+    script: Optional[List[Dict[str, Any]]] = None,
+    db_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Generate a graph, replay a script against it and collect the results.
+
+    Args:
+        spec: The shape of the graph.
+        iterations: Number of calls per workload when generating the script.
+        warmup: Number of untimed calls per workload.
+        script: Optional recorded script to replay instead.
+        db_path: Optional database path; a temporary one is used by default.
+
+    Returns:
+        The graph spec, stored counts, generation time, workload summaries
+        and the peak RSS of the generating process.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = db_path or Path(temp_dir) / "benchmark.db"
+        arc = Arc(
+            repo_path=temp_dir,
+            adapter_type="sqlite",
+            connection_params={"db_path": str(path), "check_exists": False},
+        )
+        try:
+            started = time.perf_counter()
+            counts = generate_graph(arc, spec)
+            generate_s = time.perf_counter() - started
+
+            script = script or build_script(spec, iterations, seed=spec.seed)
+            workloads = run_workloads(arc, script, warmup=warmup)
+        finally:
+            arc.close()
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python_version": sys.version.split()[0],
+        "graph": {**asdict(spec), **counts, "generate_s": round(generate_s, 2)},
+        "workloads": workloads,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def _parse_thresholds(values: List[str]) -> Dict[str, float]:
+    """Parse ``metric=fraction`` overrides on top of the default thresholds."""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for value in values:
+        metric, _, fraction = value.partition("=")
+        if metric not in DEFAULT_THRESHOLDS or not fraction:
+            raise argparse.ArgumentTypeError(f"Invalid threshold: {value}")
+        thresholds[metric] = float(fraction)
+    return thresholds
+
+
+def _print_results(results: Dict[str, Any]) -> None:
+    graph = results["graph"]
+    print(
+        f"Graph: {graph['nodes']} nodes, {graph['edges']} edges "
+        f"({graph['distribution']}), generated in {graph['generate_s']} s"
+    )
+    print(f"{'workload':<26}{'ops':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'RSS MB':>9}")
+    for name, summary in results["workloads"].items():
+        print(
+            f"{name:<26}{summary['ops']:>6}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}"
+            f"{summary['p99_ms']:>10.2f}{summary['throughput']:>10.1f}{summary['peak_rss_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Arc Memory query APIs on a synthetic graph.")
+    parser.add_argument("--nodes", type=int, default=GraphSpec.nodes, help="Number of nodes")
+    parser.add_argument("--edges", type=int, default=GraphSpec.edges, help="Number of edges")
+    parser.add_argument(
+        "--distribution",
+        choices=["uniform", "powerlaw"],
+        default=GraphSpec.distribution,
+        help="Degree distribution of edge destinations",
+    )
+    parser.add_argument("--skew", type=float, default=GraphSpec.skew, help="Power-law exponent")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the graph and script")
+    parser.add_argument("--iterations", type=int, default=50, help="Calls per workload")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per workload")
+    parser.add_argument("--script", type=Path, help="Replay a recorded script (JSON)")
+    parser.add_argument("--record", type=Path, help="Save the script that was run (JSON)")
+    parser.add_argument("--db", type=Path, help="Keep the generated graph at this path")
+    parser.add_argument("--output", type=Path, help="Output file for benchmark results (JSON)")
+    parser.add_argument("--baseline", type=Path, help="Compare against these baseline results")
+    parser.add_argument("--save-baseline", type=Path, help="Save the results as a baseline")
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="Allowed relative regression, e.g. p95_ms=0.3 (repeatable)",
+    )
+    args = parser.parse_args()
+
+    spec = GraphSpec(
+        nodes=args.nodes, edges=args.edges, distribution=args.distribution,
+        skew=args.skew, seed=args.seed,
+    )
+    script = json.loads(args.script.read_text()) if args.script else build_script(spec, args.iterations, args.seed)
+    if args.record:
+        args.record.write_text(json.dumps(script))
+
+    results = run_benchmark(spec, warmup=args.warmup, script=script, db_path=args.db)
+    _print_results(results)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(results, indent=2))
+            print(f"Results saved to {path}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(
+            results, json.loads(args.baseline.read_text()), _parse_thresholds(args.threshold)
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
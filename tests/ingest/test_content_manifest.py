@@ -0,0 +1,124 @@
+"""Tests for content-hash based incremental ADR and Notion ingestion."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from arc_memory.ingest.adr import ADRIngestor
+from arc_memory.ingest.manifest import blob_id, list_files
+from arc_memory.ingest.notion import NotionIngestor
+
+ADR = """---
+status: Accepted
+date: 2024-01-01
+---
+# {title}
+"""
+
+
+def _git(repo_path, *args):
+    subprocess.run(["git", "-C", str(repo_path), *args], check=True, capture_output=True)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class TestADRManifest(unittest.TestCase):
+    """Tests for incremental ADR ingestion."""
+
+    def setUp(self):
+        """Create a git repository with two committed ADRs."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo_path = Path(self.temp_dir.name)
+        (self.repo_path / "docs" / "adr").mkdir(parents=True)
+        for name in ("adr-001.md", "adr-002.md"):
+            (self.repo_path / "docs" / "adr" / name).write_text(ADR.format(title=name))
+        _git(self.repo_path, "init", "-q")
+        _git(self.repo_path, "add", ".")
+        _git(self.repo_path, "-c", "user.name=Test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "ADRs")
+
+    def tearDown(self):
+        """Remove the repository."""
+        self.temp_dir.cleanup()
+
+    def test_list_files_uses_git_blob_ids(self):
+        """Test that git and the glob fallback agree on the blob IDs."""
+        files = list_files(self.repo_path, "**/adr-*.md")
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_path), "hash-object", "docs/adr/adr-001.md"],
+            capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(files[os.path.join("docs", "adr", "adr-001.md")], result.stdout.strip())
+
+        shutil.rmtree(self.repo_path / ".git")
+        self.assertEqual(list_files(self.repo_path, "**/adr-*.md"), files)
+
+    def test_unchanged_content_is_skipped(self):
+        """Test that only ADRs whose content changed are re-emitted."""
+        ingestor = ADRIngestor()
+        nodes, _, metadata = ingestor.ingest(self.repo_path)
+        self.assertEqual(len(nodes), 2)
+
+        # A new mtime without new content (as after a fresh checkout)
+        adr_1 = self.repo_path / "docs" / "adr" / "adr-001.md"
+        os.utime(adr_1, (0, 2_000_000_000))
+        nodes, _, metadata = ingestor.ingest(self.repo_path, last_processed=metadata)
+        self.assertEqual(nodes, [])
+        self.assertEqual(len(metadata["files"]), 2)
+
+        # Uncommitted edits and untracked files are picked up
+        adr_1.write_text(ADR.format(title="Changed"))
+        (self.repo_path / "docs" / "adr" / "adr-003.md").write_text(ADR.format(title="New"))
+        nodes, _, metadata = ingestor.ingest(self.repo_path, last_processed=metadata)
+        self.assertEqual(sorted(node.title for node in nodes), ["Changed", "New"])
+        self.assertEqual(len(metadata["files"]), 3)
+
+    def test_mtime_manifests_are_replaced(self):
+        """Test that manifests of older versions cause one full reprocess."""
+        rel_path = os.path.join("docs", "adr", "adr-001.md")
+        nodes, _, metadata = ADRIngestor().ingest(
+            self.repo_path, last_processed={"files": {rel_path: "2024-01-01T00:00:00"}}
+        )
+        self.assertEqual(len(nodes), 2)
+        self.assertEqual(metadata["files"][rel_path], blob_id((self.repo_path / rel_path).read_bytes()))
+
+
+class TestNotionContentHashes(unittest.TestCase):
+    """Tests for content-hash based incremental Notion ingestion."""
+
+    @patch("arc_memory.ingest.notion.NotionClient")
+    @patch("arc_memory.ingest.notion.get_notion_token", return_value="token")
+    def test_unchanged_pages_are_skipped(self, mock_token, mock_client_class):
+        """Test that pages edited without content changes aren't re-emitted."""
+        page = {
+            "id": "page-1",
+            "object": "page",
+            "last_edited_time": "2099-01-01T00:00:00Z",
+            "parent": {"workspace": True},
+            "properties": {"title": {"title": [{"plain_text": "Design"}]}},
+        }
+        client = MagicMock()
+        client.search.side_effect = lambda *args, **kwargs: (
+            {"results": [page]} if kwargs["filter"]["value"] == "page" else {"results": []}
+        )
+        mock_client_class.return_value = client
+        ingestor = NotionIngestor()
+
+        with patch.object(NotionIngestor, "_get_page_content", return_value="Body"):
+            nodes, _, metadata = ingestor.ingest()
+            self.assertEqual([node.id for node in nodes], ["notion:page:page-1"])
+
+            metadata["timestamp"] = "2000-01-01T00:00:00"
+            nodes, _, metadata = ingestor.ingest(last_processed=metadata)
+            self.assertEqual(nodes, [])
+            self.assertIn("notion:page:page-1", metadata["content_hashes"])
+
+        with patch.object(NotionIngestor, "_get_page_content", return_value="New body"):
+            nodes, _, _ = ingestor.ingest(last_processed=metadata)
+            self.assertEqual([node.body for node in nodes], ["New body"])
+
+
+if __name__ == "__main__":
+    unittest.main()
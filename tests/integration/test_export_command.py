@@ -8,7 +8,7 @@ from unittest import mock
 
 import pytest
 
-from arc_memory.export import format_export_data
+from arc_memory.export import ExportWriter, format_export_data
 from arc_memory.schema.models import NodeType
 
 
@@ -78,8 +78,7 @@ def test_format_export_data():
     assert edge["metadata"]["lines_removed"] == 5
 
 
-@mock.patch("arc_memory.export.sign_file")
-def test_export_compression_and_signing(mock_sign_file):
+def test_export_compression_and_signing():
     """Test export compression and signing functionality."""
     # Create a temporary directory for the output
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -116,12 +115,16 @@ def test_export_compression_and_signing(mock_sign_file):
             assert data["schema_version"] == "0.2"
             assert data["pr"]["sha"] == "abc123"
 
-        # Test signing
-        mock_sign_file.return_value = Path(f"{compressed_path}.sig")
-
-        # Call the mock sign function
-        sig_path = mock_sign_file(compressed_path, "ABCD1234")
-
-        # Verify the mock was called correctly
-        mock_sign_file.assert_called_once_with(compressed_path, "ABCD1234")
-        assert sig_path == Path(f"{compressed_path}.sig")
+        # Test signing: the compressed bytes are piped to GPG as they are written
+        signer = mock.MagicMock()
+        signer.returncode = 0
+        signer.communicate.return_value = (b"", b"")
+        signed_path = Path(temp_dir) / "arc-graph-signed.json.gz"
+        with mock.patch("subprocess.Popen", return_value=signer) as mock_popen:
+            with ExportWriter(signed_path, compression="gzip", sign=True, key_id="ABCD1234") as writer:
+                writer.write_document(export_data)
+
+        assert "ABCD1234" in mock_popen.call_args[0][0]
+        assert writer.signature_path == Path(f"{signed_path}.sig")
+        with gzip.open(signed_path, "rt") as f:
+            assert json.load(f) == export_data
@@ -0,0 +1,171 @@
+"""Integration tests for the Neo4j adapter against a real server.
+
+The tests run against the server given by ARC_TEST_NEO4J_URI (with
+ARC_TEST_NEO4J_USER and ARC_TEST_NEO4J_PASSWORD), or against a throwaway
+container when ``testcontainers`` and Docker are available. They are skipped
+otherwise. Only nodes with the test's ID prefix are written and removed, so an
+existing database is left as it was.
+"""
+
+import os
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from arc_memory.db.neo4j_adapter import Neo4jAdapter
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
+from arc_memory.schema.models import Edge, EdgeRel, NodeType
+from arc_memory.sql.temporal import utc_iso
+
+try:
+    import neo4j  # noqa: F401
+    NEO4J_AVAILABLE = True
+except ImportError:
+    NEO4J_AVAILABLE = False
+
+# Neo4j image used when no server is configured
+NEO4J_IMAGE = "neo4j:5"
+
+
+def _start_container():
+    """Start a Neo4j container, returning it and its connection parameters."""
+    try:
+        from testcontainers.neo4j import Neo4jContainer
+    except ImportError:
+        raise unittest.SkipTest("Set ARC_TEST_NEO4J_URI or install testcontainers to run Neo4j tests")
+
+    container = Neo4jContainer(NEO4J_IMAGE)
+    try:
+        container.start()
+    except Exception as e:
+        raise unittest.SkipTest(f"Could not start a Neo4j container: {e}")
+    params = {
+        "uri": container.get_connection_url(),
+        "auth": (container.username, container.password),
+    }
+    return container, params
+
+
+@unittest.skipUnless(NEO4J_AVAILABLE, "neo4j driver not installed")
+class TestNeo4jAdapterIntegration(unittest.TestCase):
+    """Round trips through batched UNWIND writes and reads on a Neo4j server."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Connect to the configured server or start a container."""
+        cls.container = None
+        uri = os.environ.get("ARC_TEST_NEO4J_URI")
+        if uri:
+            params = {
+                "uri": uri,
+                "auth": (
+                    os.environ.get("ARC_TEST_NEO4J_USER", "neo4j"),
+                    os.environ.get("ARC_TEST_NEO4J_PASSWORD", "password"),
+                ),
+            }
+        else:
+            cls.container, params = _start_container()
+
+        cls.adapter = Neo4jAdapter()
+        try:
+            # A small batch size makes every write span several UNWIND statements
+            cls.adapter.connect({**params, "batch_size": 2})
+            cls.adapter.init_db()
+        except Exception:
+            if cls.container is not None:
+                cls.container.stop()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """Disconnect and stop the container, if one was started."""
+        cls.adapter.disconnect()
+        if cls.container is not None:
+            cls.container.stop()
+
+    def setUp(self):
+        """Pick an ID prefix unique to the test."""
+        self.prefix = f"test-{uuid.uuid4().hex[:8]}"
+
+    def tearDown(self):
+        """Remove the nodes written by the test."""
+        self.adapter._write(
+            "MATCH (n:Node) WHERE n.id STARTS WITH $prefix DETACH DELETE n",
+            prefix=self.prefix,
+        )
+
+    def _id(self, name):
+        return f"{self.prefix}:{name}"
+
+    def test_batched_writes_read_back(self):
+        """Test that nodes and edges written in several batches are read back intact."""
+        ts = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        nodes = NodeBatch()
+        for i in range(5):
+            nodes.add(
+                self._id(f"commit{i}"), NodeType.COMMIT,
+                title=f"Commit {i}", body=f"Body {i}", ts=ts, metadata={"index": i},
+            )
+        nodes.add(self._id("file"), NodeType.FILE, title="app.py", metadata={"path": "app.py"})
+        edges = EdgeBatch()
+        for i in range(5):
+            edges.add(self._id(f"commit{i}"), self._id("file"), EdgeRel.MODIFIES, properties={"lines": i})
+        edges.add(self._id("commit1"), self._id("commit0"), EdgeRel.DEPENDS_ON)
+
+        nodes_before = self.adapter.get_node_count()
+        edges_before = self.adapter.get_edge_count()
+        self.adapter.add_nodes_and_edges(nodes, edges)
+
+        self.assertEqual(self.adapter.get_node_count() - nodes_before, 6)
+        self.assertEqual(self.adapter.get_edge_count() - edges_before, 6)
+
+        node = self.adapter.get_node_by_id(self._id("commit3"))
+        self.assertEqual(node["type"], NodeType.COMMIT.value)
+        self.assertEqual(node["title"], "Commit 3")
+        self.assertEqual(node["body"], "Body 3")
+        self.assertEqual(node["extra"], {"index": 3})
+        self.assertEqual(node["timestamp"], utc_iso(ts))
+
+        incoming = self.adapter.get_edges_by_dst(self._id("file"), EdgeRel.MODIFIES)
+        self.assertEqual(
+            sorted((edge["src"], edge["properties"]["lines"]) for edge in incoming),
+            [(self._id(f"commit{i}"), i) for i in range(5)],
+        )
+        self.assertEqual(
+            [edge["dst"] for edge in self.adapter.get_edges_by_src(self._id("commit1"), EdgeRel.DEPENDS_ON)],
+            [self._id("commit0")],
+        )
+
+        # Writing the same batches again merges instead of duplicating
+        self.adapter.add_nodes_and_edges(nodes, edges)
+        self.assertEqual(self.adapter.get_node_count() - nodes_before, 6)
+        self.assertEqual(self.adapter.get_edge_count() - edges_before, 6)
+
+    def test_traverse_and_validity(self):
+        """Test server-side traversal and point-in-time reads of written edges."""
+        nodes = NodeBatch()
+        for name in ("a", "b", "c"):
+            nodes.add(self._id(name), NodeType.FILE, title=name)
+        self.adapter.add_nodes_and_edges(nodes, [
+            Edge(src=self._id("a"), dst=self._id("b"), rel=EdgeRel.DEPENDS_ON),
+            Edge(
+                src=self._id("b"), dst=self._id("c"), rel=EdgeRel.DEPENDS_ON,
+                valid_from=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                valid_until=datetime(2024, 6, 1, tzinfo=timezone.utc),
+            ),
+        ])
+
+        reached = self.adapter.traverse(self._id("a"), max_depth=2, direction="outgoing")
+        self.assertEqual(
+            [(result["node"]["id"], result["depth"]) for result in reached],
+            [(self._id("b"), 1), (self._id("c"), 2)],
+        )
+
+        during = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        after = datetime(2024, 7, 1, tzinfo=timezone.utc)
+        self.assertEqual(len(self.adapter.get_edges_by_src(self._id("b"), as_of=during)), 1)
+        self.assertEqual(self.adapter.get_edges_by_src(self._id("b"), as_of=after), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
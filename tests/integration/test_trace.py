@@ -10,13 +10,31 @@ from unittest.mock import patch, MagicMock
 from arc_memory.schema.models import Node, NodeType
 from arc_memory.sql.db import get_connection
 from arc_memory.trace import (
+    blame_cache,
     get_commit_for_line,
+    get_commits_for_lines,
     trace_history,
     get_node_by_id,
     get_connected_nodes,
     get_nodes_by_edge,
     format_trace_results,
     trace_history_for_file_line,
+    trace_history_for_file_lines,
+)
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+# `git blame --incremental` output: lines 1-2 and 4 from A, line 3 from B
+INCREMENTAL_BLAME = (
+    f"{SHA_A} 1 1 2\n"
+    "author John Doe\n"
+    "filename test_file.py\n"
+    f"{SHA_B} 3 3 1\n"
+    "author Jane Doe\n"
+    "filename test_file.py\n"
+    f"{SHA_A} 4 4 1\n"
+    "filename test_file.py\n"
 )
 
 
@@ -56,8 +74,14 @@ class TestTraceHistory(unittest.TestCase):
         # Insert test data
         self.insert_test_data()
 
+        # Create the file to blame and start from an empty blame cache
+        self.test_file = self.repo_path / "test_file.py"
+        self.test_file.write_text("a = 1\nb = 2\nc = 3\nd = 4\n")
+        blame_cache.clear()
+
     def tearDown(self):
         """Tear down test fixtures."""
+        blame_cache.clear()
         self.repo_dir.cleanup()
         os.close(self.db_fd)
         os.unlink(self.db_path)
@@ -96,23 +120,62 @@ class TestTraceHistory(unittest.TestCase):
         """Test getting a commit for a specific line."""
         # Mock the subprocess.run call
         mock_process = MagicMock()
-        mock_process.stdout = "abc123 original_line 1 1\nauthor John Doe\n"
+        mock_process.stdout = INCREMENTAL_BLAME
         mock_process.returncode = 0
         mock_run.return_value = mock_process
 
         # Call the function
-        commit_id = get_commit_for_line(self.repo_path, "test_file.py", 10)
+        commit_id = get_commit_for_line(self.repo_path, "test_file.py", 3)
 
         # Check the result
-        self.assertEqual(commit_id, "abc123")
+        self.assertEqual(commit_id, SHA_B)
 
-        # Verify the subprocess call
+        # Verify the subprocess call blames the whole file incrementally
         mock_run.assert_called_once()
         args, kwargs = mock_run.call_args
         self.assertEqual(kwargs["check"], True)
         self.assertEqual(args[0][0], "git")
         self.assertEqual(args[0][1], "-C")
         self.assertEqual(args[0][3], "blame")
+        self.assertIn("--incremental", args[0])
+        self.assertNotIn("-L", args[0])
+
+    @patch("subprocess.run")
+    def test_get_commits_for_lines_uses_one_blame(self, mock_run):
+        """Test that every line of a file is answered from one cached blame."""
+        mock_run.return_value = MagicMock(stdout=INCREMENTAL_BLAME, returncode=0)
+
+        commits = get_commits_for_lines(self.repo_path, "test_file.py", [1, 2, 3, 4, 5])
+        self.assertEqual(commits, {1: SHA_A, 2: SHA_A, 3: SHA_B, 4: SHA_A, 5: None})
+
+        # Later lookups are served from the cache
+        self.assertEqual(get_commit_for_line(self.repo_path, "test_file.py", 4), SHA_A)
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_blame_cache_invalidated_on_content_change(self, mock_run):
+        """Test that editing the file re-runs blame but touching it does not."""
+        mock_run.return_value = MagicMock(stdout=INCREMENTAL_BLAME, returncode=0)
+        get_commit_for_line(self.repo_path, "test_file.py", 1)
+
+        # Rewriting the same content keeps the blob SHA, so the cache is reused
+        content = self.test_file.read_bytes()
+        self.test_file.write_bytes(content)
+        stat = self.test_file.stat()
+        os.utime(self.test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        get_commit_for_line(self.repo_path, "test_file.py", 1)
+        self.assertEqual(mock_run.call_count, 1)
+
+        # Changing the content invalidates the cached blame
+        self.test_file.write_text("a = 10\nb = 2\nc = 3\nd = 4\n")
+        get_commit_for_line(self.repo_path, "test_file.py", 1)
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("subprocess.run")
+    def test_get_commit_for_line_missing_file(self, mock_run):
+        """Test that a missing file returns None without running blame."""
+        self.assertIsNone(get_commit_for_line(self.repo_path, "missing.py", 1))
+        mock_run.assert_not_called()
 
     def test_get_node_by_id(self):
         """Test getting a node by ID."""
@@ -191,6 +254,27 @@ class TestTraceHistory(unittest.TestCase):
         self.assertIsNotNone(get_node_by_id(self.conn, "pr:42"))
         self.assertIsNotNone(get_node_by_id(self.conn, "issue:123"))
 
+    @patch("arc_memory.trace.get_commits_for_lines")
+    def test_trace_history_for_file_lines(self, mock_commits):
+        """Test tracing several lines with one traversal per distinct commit."""
+        mock_commits.return_value = {1: "abc123", 2: "abc123", 3: None}
+
+        with patch("arc_memory.trace.get_node_by_id", wraps=get_node_by_id) as mock_get_node:
+            results = trace_history_for_file_lines(
+                Path(self.db_path), "test_file.py", [1, 2, 3], max_results=3, max_hops=2
+            )
+
+        self.assertEqual(set(results), {1, 2, 3})
+        self.assertEqual(results[3], [])
+        ids = {entry["id"] for entry in results[1]}
+        self.assertEqual(ids, {"commit:abc123", "pr:42", "issue:123"})
+        self.assertEqual(results[1], results[2])
+        self.assertIsNot(results[1][0], results[2][0])
+
+        # Lines 1 and 2 share a commit, so the graph is walked only once
+        visited = [call.args[1] for call in mock_get_node.call_args_list]
+        self.assertEqual(visited.count("commit:abc123"), 1)
+
     def test_trace_history(self):
         """Test the trace_history function."""
         # For this test, we'll use a simplified approach
@@ -12,7 +12,9 @@ from pathlib import Path
 from arc_memory.schema.models import Node, Edge, NodeType
 from arc_memory.sql.db import get_connection
 from arc_memory.trace import (
+    blame_cache,
     get_commit_for_line,
+    get_commits_for_lines,
     trace_history,
     trace_history_for_file_line,
 )
@@ -143,6 +145,30 @@ class TestTraceHistoryIntegration(unittest.TestCase):
         # Check the result
         self.assertEqual(commit_id, self.commit_hash)
 
+    def test_get_commits_for_lines_after_new_commit(self):
+        """Test that the blame cache picks up lines from a new commit."""
+        blame_cache.clear()
+        commits = get_commits_for_lines(self.repo_path, "test_file.py", [1, 2, 3])
+        self.assertEqual(set(commits.values()), {self.commit_hash})
+
+        # Append a line in a new commit, then restore the original history
+        original = self.test_file.read_text()
+        try:
+            with open(self.test_file, "a") as f:
+                f.write("# Added later\n")
+            subprocess.run(["git", "commit", "-am", "Add line"], cwd=self.repo_path, check=True)
+            new_commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=self.repo_path, check=True, capture_output=True, text=True
+            ).stdout.strip()
+
+            commits = get_commits_for_lines(self.repo_path, "test_file.py", [2, 4])
+            self.assertEqual(commits, {2: self.commit_hash, 4: new_commit})
+        finally:
+            subprocess.run(["git", "reset", "--hard", self.commit_hash], cwd=self.repo_path, check=True)
+            self.assertEqual(self.test_file.read_text(), original)
+            blame_cache.clear()
+
     def test_trace_history_real(self):
         """Test tracing history using a real database."""
         # This test is simplified to avoid issues with the test environment
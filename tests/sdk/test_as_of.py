@@ -0,0 +1,175 @@
+"""Tests for point-in-time views of the knowledge graph."""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from arc_memory.errors import DatabaseError
+from arc_memory.export import get_related_nodes
+from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sdk import Arc
+from arc_memory.sdk.errors import SDKError
+
+
+class TestAsOf(unittest.TestCase):
+    """Tests for Arc.as_of."""
+
+    def setUp(self):
+        """Build a small graph whose shape changes over time."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db_path = Path(self.temp_dir.name) / "graph.db"
+        self.arc = Arc(
+            repo_path=self.temp_dir.name,
+            adapter_type="sqlite",
+            connection_params={"db_path": str(db_path), "check_exists": False},
+        )
+
+        nodes = [
+            Node(id="commit:old", type=NodeType.COMMIT, title="Old", ts=datetime(2024, 1, 1)),
+            Node(id="commit:new", type=NodeType.COMMIT, title="New", ts=datetime(2024, 6, 1)),
+            Node(id="file:a.py", type=NodeType.FILE, title="a.py"),
+            Node(
+                id="file:b.py", type=NodeType.FILE, title="b.py",
+                valid_from=datetime(2024, 3, 1), valid_until=datetime(2024, 9, 1),
+            ),
+            Node(id="file:c.py", type=NodeType.FILE, title="c.py"),
+        ]
+        edges = [
+            Edge(src="commit:old", dst="file:a.py", rel=EdgeRel.MODIFIES),
+            Edge(src="commit:new", dst="file:a.py", rel=EdgeRel.MODIFIES),
+            Edge(src="file:a.py", dst="file:b.py", rel=EdgeRel.DEPENDS_ON),
+            Edge(
+                src="file:a.py", dst="file:c.py", rel=EdgeRel.DEPENDS_ON,
+                valid_until=datetime(2024, 2, 1),
+            ),
+        ]
+        self.arc.add_nodes_and_edges(nodes, edges)
+
+    def tearDown(self):
+        """Close the database and remove it."""
+        self.arc.close()
+        self.temp_dir.cleanup()
+
+    def _related_ids(self, arc):
+        related = arc.get_related_entities("file:a.py", max_results=20, cache=False)
+        return {entity.id for entity in related}
+
+    def test_current_state_is_unchanged(self):
+        """Test that the live graph still sees every node and edge."""
+        self.assertEqual(
+            self._related_ids(self.arc),
+            {"commit:old", "commit:new", "file:b.py", "file:c.py"},
+        )
+
+    def test_related_entities_as_of(self):
+        """Test that nodes and edges outside their validity are hidden."""
+        self.assertEqual(
+            self._related_ids(self.arc.as_of(datetime(2024, 1, 15))),
+            {"commit:old", "file:c.py"},
+        )
+        self.assertEqual(
+            self._related_ids(self.arc.as_of("2024-07-01T00:00:00")),
+            {"commit:old", "commit:new", "file:b.py"},
+        )
+        # b.py was removed again by the end of the year
+        self.assertEqual(
+            self._related_ids(self.arc.as_of("2024-12-31")),
+            {"commit:old", "commit:new"},
+        )
+
+    def test_node_lookup_and_history_as_of(self):
+        """Test that node lookups and entity history respect the view."""
+        view = self.arc.as_of("2024-02-01")
+        self.assertIsNone(view.get_node_by_id("file:b.py"))
+        self.assertIsNotNone(view.get_node_by_id("file:a.py"))
+
+        history = view.get_entity_history("file:a.py", cache=False)
+        self.assertEqual({entry.id for entry in history}, {"commit:old"})
+
+    def test_export_walk_as_of(self):
+        """Test that the export traversal only follows valid nodes and edges."""
+        nodes, edges = get_related_nodes(
+            self.arc.adapter.conn, ["file:a.py"], max_hops=2,
+            include_adrs=False, as_of="2024-01-15T00:00:00",
+        )
+
+        self.assertEqual({node["id"] for node in nodes}, {"file:a.py", "commit:old", "file:c.py"})
+        self.assertEqual(len(edges), 2)
+
+    def test_view_shares_connection(self):
+        """Test that closing a view leaves the original instance usable."""
+        view = self.arc.as_of("2024-02-01")
+        view.close()
+
+        self.assertTrue(self.arc.adapter.is_connected())
+        self.assertEqual(self.arc.get_node_count(), 5)
+
+    def test_view_is_read_only(self):
+        """Test that a view refuses writes and leaves the graph unchanged."""
+        view = self.arc.as_of("2024-02-01")
+        with self.assertRaises(DatabaseError):
+            view.adapter.add_nodes_and_edges([Node(id="file:d.py", type=NodeType.FILE, title="d.py")], [])
+        with self.assertRaises(DatabaseError):
+            view.adapter.save_metadata("key", "value")
+
+        self.assertTrue(view.adapter.is_connected())
+        self.assertEqual(self.arc.get_node_count(), 5)
+
+    def test_invalid_timestamp(self):
+        """Test that an unparseable timestamp raises an SDK error."""
+        with self.assertRaises(SDKError):
+            self.arc.as_of("last tuesday")
+
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "time.tzset is not available")
+class TestMixedTimezones(unittest.TestCase):
+    """Tests for as-of queries on graphs mixing naive and UTC timestamps."""
+
+    def setUp(self):
+        """Run in a timezone five hours behind UTC."""
+        self.env = patch.dict(os.environ, {"TZ": "EST+05"})
+        self.env.start()
+        time.tzset()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.arc = Arc(
+            repo_path=self.temp_dir.name,
+            adapter_type="sqlite",
+            connection_params={"db_path": str(Path(self.temp_dir.name) / "graph.db"), "check_exists": False},
+        )
+
+    def tearDown(self):
+        """Restore the timezone and remove the database."""
+        self.arc.close()
+        self.temp_dir.cleanup()
+        self.env.stop()
+        time.tzset()
+
+    def test_naive_git_and_aware_github_timestamps(self):
+        """Test that local commit times and UTC GitHub times compare as instants."""
+        self.arc.add_nodes_and_edges(
+            [
+                # The git ingestor stores naive local times: 15:00 UTC
+                Node(id="commit:1", type=NodeType.COMMIT, title="Commit", ts=datetime(2024, 1, 1, 10)),
+                Node(
+                    id="pr:1", type=NodeType.PR, title="PR",
+                    ts=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+                ),
+            ],
+            [],
+        )
+
+        view = self.arc.as_of(datetime(2024, 1, 1, 13, tzinfo=timezone.utc))
+        self.assertIsNotNone(view.get_node_by_id("pr:1"))
+        self.assertIsNone(view.get_node_by_id("commit:1"))
+
+        # Naive and "Z" arguments are converted the same way
+        self.assertIsNotNone(self.arc.as_of("2024-01-01T10:30:00").get_node_by_id("commit:1"))
+        self.assertIsNone(self.arc.as_of("2024-01-01T14:59:00Z").get_node_by_id("commit:1"))
+
+if __name__ == "__main__":
+    unittest.main()
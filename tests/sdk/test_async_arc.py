@@ -0,0 +1,153 @@
+"""Tests for the async SDK facade."""
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sdk import AsyncArc
+from arc_memory.sdk.core import Arc
+from arc_memory.sdk.errors import SDKError
+from arc_memory.sdk.models import QueryEvent, QueryResult
+from arc_memory.sql.db import init_db
+
+
+class TestAsyncArc(unittest.IsolatedAsyncioTestCase):
+    """Tests for AsyncArc."""
+
+    async def asyncSetUp(self):
+        """Set up an AsyncArc on a temporary database."""
+        self.temp_dir = tempfile.mkdtemp()
+        db_path = Path(self.temp_dir) / "graph.db"
+        init_db(db_path).close()
+        self.arc = AsyncArc(
+            repo_path=self.temp_dir,
+            adapter_type="sqlite",
+            connection_params={"db_path": str(db_path)},
+            readers=3,
+        )
+        await self.arc.add_nodes_and_edges(
+            [
+                Node(id="commit:1", type=NodeType.COMMIT, title="Add auth", ts=datetime(2024, 1, 1)),
+                Node(id="pr:1", type=NodeType.PR, title="Auth PR", ts=datetime(2024, 1, 2)),
+            ],
+            [Edge(src="pr:1", dst="commit:1", rel=EdgeRel.MERGES)],
+        )
+
+    async def asyncTearDown(self):
+        """Close the AsyncArc and remove the temporary database."""
+        await self.arc.aclose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    async def test_reads(self):
+        """Test that reads see the writer's changes."""
+        self.assertEqual(await self.arc.get_node_count(), 2)
+        node = await self.arc.get_node_by_id("commit:1")
+        self.assertEqual(node["title"], "Add auth")
+        edges = await self.arc.get_edges_by_src("pr:1")
+        self.assertEqual([edge["dst"] for edge in edges], ["commit:1"])
+
+    async def test_gather_runs_on_reader_threads(self):
+        """Test that gathered calls run concurrently on the reader pool."""
+        threads = set()
+        barrier = threading.Barrier(3, timeout=5)
+        original = Arc.get_node_by_id
+
+        def get_node_by_id(arc, node_id):
+            threads.add(threading.current_thread().name)
+            barrier.wait()
+            return original(arc, node_id)
+
+        with patch.object(Arc, "get_node_by_id", get_node_by_id):
+            results = await self.arc.gather([
+                ("get_node_by_id", {"node_id": "commit:1"}),
+                ("get_node_by_id", {"node_id": "pr:1"}),
+                ("get_node_by_id", {"node_id": "missing"}),
+            ])
+
+        self.assertEqual(results[0]["id"], "commit:1")
+        self.assertEqual(results[1]["id"], "pr:1")
+        self.assertIsNone(results[2])
+        self.assertEqual(len(threads), 3)
+        self.assertTrue(all(name.startswith("arc-reader") for name in threads))
+
+    async def test_gather_rejects_unknown_methods(self):
+        """Test that gather only runs read methods."""
+        with self.assertRaises(SDKError):
+            await self.arc.gather([("add_nodes_and_edges", {"nodes": [], "edges": []})])
+
+    async def test_identical_calls_run_once(self):
+        """Test that identical concurrent calls share one execution."""
+        calls = []
+        original = Arc.get_node_count
+
+        def get_node_count(arc):
+            calls.append(1)
+            time.sleep(0.1)
+            return original(arc)
+
+        with patch.object(Arc, "get_node_count", get_node_count):
+            counts = await asyncio.gather(*(self.arc.get_node_count() for _ in range(5)))
+            self.assertEqual(counts, [2] * 5)
+            self.assertEqual(len(calls), 1)
+
+            # Later calls are served from the cache until the graph changes
+            self.assertEqual(await self.arc.get_node_count(), 2)
+            self.assertEqual(len(calls), 1)
+
+            await self.arc.add_nodes_and_edges(
+                [Node(id="commit:2", type=NodeType.COMMIT, title="Fix auth")], []
+            )
+            self.assertEqual(await self.arc.get_node_count(), 3)
+            self.assertEqual(len(calls), 2)
+
+    async def test_uncacheable_reads(self):
+        """Test that reads without a graph version or on the work tree aren't cached."""
+        calls = []
+        original = Arc.get_node_count
+
+        def get_node_count(arc):
+            calls.append(1)
+            return original(arc)
+
+        with patch.object(Arc, "get_node_count", get_node_count), \
+                patch("arc_memory.sdk.async_arc.graph_version", return_value=None):
+            await self.arc.get_node_count()
+            await self.arc.get_node_count()
+        self.assertEqual(len(calls), 2)
+
+        with patch.object(Arc, "trace_lines", return_value={}) as trace_lines:
+            await self.arc.trace_lines("auth.py", [1])
+            await self.arc.trace_lines("auth.py", [1])
+        self.assertEqual(trace_lines.call_count, 2)
+
+    async def test_query_stream(self):
+        """Test that streamed query events reach the event loop."""
+        result = QueryResult(query="Why?", answer="Because", confidence=0.8)
+        events = [
+            QueryEvent(type="results", evidence=[], query_understanding="why"),
+            QueryEvent(type="token", text="Because"),
+            QueryEvent(type="final", result=result),
+        ]
+
+        with patch("arc_memory.sdk.query.stream_query_knowledge_graph", return_value=iter(events)):
+            received = [event async for event in self.arc.query_stream("Why?", repo_ids=["repo:1"])]
+
+        self.assertEqual([event.type for event in received], ["results", "token", "final"])
+        self.assertEqual(received[-1].result.answer, "Because")
+
+    async def test_closed(self):
+        """Test that a closed AsyncArc refuses calls."""
+        await self.arc.aclose()
+        with self.assertRaises(SDKError):
+            await self.arc.get_node_count()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Tests for the multi-entity batch APIs."""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from arc_memory.db.base import supports_batch_lookup
+from arc_memory.db.prefetch import PrefetchingAdapter
+from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sdk import Arc
+
+
+class TestBatchAPIs(unittest.TestCase):
+    """Tests for get_entities, get_related_entities_many and analyze_impact_many."""
+
+    def setUp(self):
+        """Build a graph of files that import each other and change together."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db_path = Path(self.temp_dir.name) / "graph.db"
+        self.arc = Arc(
+            repo_path=self.temp_dir.name,
+            adapter_type="sqlite",
+            connection_params={"db_path": str(db_path), "check_exists": False},
+        )
+
+        files = [f"file:src/{name}.py" for name in ("a", "b", "c", "d", "e")]
+        nodes = [Node(id=file_id, type=NodeType.FILE, title=file_id[5:]) for file_id in files]
+        edges = [
+            Edge(src=files[0], dst=files[1], rel=EdgeRel.IMPORTS),
+            Edge(src=files[1], dst=files[2], rel=EdgeRel.IMPORTS),
+            Edge(src=files[2], dst=files[3], rel=EdgeRel.DEPENDS_ON),
+            Edge(src=files[4], dst=files[0], rel=EdgeRel.IMPORTS),
+        ]
+        for i in range(4):
+            commit_id = f"commit:{i}"
+            nodes.append(Node(id=commit_id, type=NodeType.COMMIT, title=f"Commit {i}", ts=datetime(2024, 1, i + 1)))
+            # a, b and c change together in every commit
+            for file_id in files[:3]:
+                edges.append(Edge(src=commit_id, dst=file_id, rel=EdgeRel.MODIFIES))
+        self.arc.add_nodes_and_edges(nodes, edges)
+        self.files = files
+
+        self.statements = []
+        self.arc.adapter.conn.set_trace_callback(self.statements.append)
+
+    def tearDown(self):
+        """Close the database and remove it."""
+        self.arc.close()
+        self.temp_dir.cleanup()
+
+    def test_sqlite_supports_batch_lookup(self):
+        """Test the bulk node and edge lookups of the SQLite adapter."""
+        adapter = self.arc.adapter
+        self.assertTrue(supports_batch_lookup(adapter))
+        self.assertTrue(supports_batch_lookup(self.arc.as_of("2024-06-01").adapter))
+
+        nodes = adapter.get_nodes_by_ids([self.files[0], "file:missing", self.files[1]])
+        self.assertEqual(set(nodes), {self.files[0], self.files[1]})
+        self.assertEqual(nodes[self.files[0]], adapter.get_node_by_id(self.files[0]))
+
+        edges = adapter.get_edges_by_dsts(self.files[:2], rel_type=EdgeRel.MODIFIES)
+        self.assertEqual(edges[self.files[0]], adapter.get_edges_by_dst(self.files[0], rel_type=EdgeRel.MODIFIES))
+        self.assertEqual(len(edges[self.files[1]]), 4)
+        self.assertEqual(adapter.get_edges_by_srcs(["file:missing"]), {"file:missing": []})
+
+    def test_prefetching_adapter_reads_once(self):
+        """Test that the lookup cache answers repeated lookups from memory."""
+        lookup = PrefetchingAdapter(self.arc.adapter)
+        lookup.prefetch_nodes(self.files)
+        lookup.prefetch_edges(self.files, "both")
+        self.statements.clear()
+
+        for file_id in self.files:
+            lookup.get_node_by_id(file_id)
+            lookup.get_edges_by_src(file_id)
+            # Filtered lookups are answered from the unfiltered edges
+            lookup.get_edges_by_dst(file_id, rel_type="MODIFIES")
+        self.assertEqual(self.statements, [])
+
+    def test_get_related_entities_many_matches_single_calls(self):
+        """Test that the batch gives the same results as one call per entity."""
+        batch = self.arc.get_related_entities_many(self.files + [self.files[0]], max_results=3)
+
+        self.assertEqual(list(batch), self.files)
+        for file_id in self.files:
+            single = self.arc.get_related_entities(file_id, max_results=3, cache=False)
+            self.assertEqual(
+                [(e.id, e.relationship, e.direction) for e in batch[file_id]],
+                [(e.id, e.relationship, e.direction) for e in single],
+            )
+
+    def test_get_entities(self):
+        """Test that entities are returned with their relationships, and missing ones as None."""
+        entities = self.arc.get_entities([self.files[0], "file:missing"])
+
+        self.assertIsNone(entities["file:missing"])
+        single = self.arc.get_entity_details(self.files[0], cache=False)
+        self.assertEqual(entities[self.files[0]].title, single.title)
+        self.assertEqual(
+            sorted(e.id for e in entities[self.files[0]].related_entities),
+            sorted(e.id for e in single.related_entities),
+        )
+
+    def test_analyze_impact_many_matches_single_calls(self):
+        """Test that batch impact analysis gives the same results with fewer queries."""
+        self.statements.clear()
+        batch = self.arc.analyze_impact_many(self.files + ["file:missing"])
+        batch_statements = len(self.statements)
+
+        self.assertEqual(batch["file:missing"], [])
+
+        self.statements.clear()
+        for file_id in self.files:
+            single = self.arc.analyze_component_impact(file_id, cache=False)
+            self.assertEqual(
+                [(r.id, r.impact_type, round(r.impact_score, 6)) for r in batch[file_id]],
+                [(r.id, r.impact_type, round(r.impact_score, 6)) for r in single],
+            )
+        self.assertLess(batch_statements, len(self.statements) / 2)
+
+        # Co-changing files are found through the shared commits
+        potential = {r.id for r in batch[self.files[0]] if r.impact_type == "potential"}
+        self.assertEqual(potential, {self.files[1], self.files[2]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from arc_memory.sdk.decision_trail import get_decision_trail
+from arc_memory.sdk.decision_trail import get_decision_trail, get_decision_trails
 from arc_memory.sdk.models import DecisionTrailEntry
 
 
@@ -86,6 +86,38 @@ class TestDecisionTrail(unittest.TestCase):
         self.assertEqual(kwargs["max_hops"], 3)
         self.assertTrue(isinstance(kwargs["db_path"], Path))
 
+    @patch("arc_memory.sdk.decision_trail.trace_history_for_file_lines")
+    def test_get_decision_trails(self, mock_trace_history):
+        """Test the get_decision_trails function."""
+        commit = {
+            "id": "commit:123",
+            "type": "commit",
+            "title": "Fix bug in login",
+            "timestamp": "2023-01-01T12:00:00",
+            "sha": "abc123"
+        }
+        mock_trace_history.return_value = {10: [commit], 11: [dict(commit)], 12: []}
+
+        mock_adapter = MagicMock()
+        mock_adapter.db_path = "/path/to/db"
+
+        result = get_decision_trails(
+            adapter=mock_adapter,
+            file_path="src/login.py",
+            line_numbers=[10, 11, 12],
+            repo_path=Path("/path/to/repo")
+        )
+
+        self.assertEqual(set(result), {10, 11, 12})
+        self.assertEqual(result[10][0].id, "commit:123")
+        self.assertEqual(result[11][0].properties["sha"], "abc123")
+        self.assertEqual(result[12], [])
+
+        mock_trace_history.assert_called_once()
+        _, kwargs = mock_trace_history.call_args
+        self.assertEqual(kwargs["line_numbers"], [10, 11, 12])
+        self.assertEqual(kwargs["repo_path"], Path("/path/to/repo"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,50 +30,33 @@ def mock_repo_path():
         yield Path(temp_dir)
 
 
-@pytest.fixture
-def mock_export_data():
-    """Create mock export data."""
-    return {
-        "pr": "test-pr",
-        "nodes": [
-            {"id": "file:test.py", "type": "file", "name": "test.py"},
-            {"id": "commit:123", "type": "commit", "name": "Initial commit"},
-        ],
-        "edges": [
-            {"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES"},
-        ],
-        "changed_files": ["test.py"],
-    }
-
-
 class TestExportSDK:
     """Tests for the export SDK functionality."""
 
-    @patch("arc_memory.sdk.export.format_export_data")
+    @patch("arc_memory.sdk.export.iter_nodes_by_ids")
     @patch("arc_memory.sdk.export.get_pr_modified_files")
     @patch("arc_memory.sdk.export.get_related_nodes")
     def test_export_knowledge_graph(
         self,
         mock_get_related_nodes,
         mock_get_pr_modified_files,
-        mock_format_export_data,
+        mock_iter_nodes_by_ids,
         mock_adapter,
         mock_repo_path,
-        mock_export_data,
     ):
         """Test exporting the knowledge graph."""
         # Set up mocks
         mock_get_pr_modified_files.return_value = ["test.py"]
         mock_get_related_nodes.return_value = (
+            ["file:test.py", "commit:123"],
             [
-                {"id": "file:test.py", "type": "file", "name": "test.py"},
-                {"id": "commit:123", "type": "commit", "name": "Initial commit"},
-            ],
-            [
-                {"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES"},
+                {"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES", "properties": {}},
             ],
         )
-        mock_format_export_data.return_value = mock_export_data
+        mock_iter_nodes_by_ids.return_value = iter([
+            {"id": "file:test.py", "type": "file", "title": None, "extra": {"path": "test.py"}},
+            {"id": "commit:123", "type": "commit", "title": "Initial commit", "extra": {"sha": "123"}},
+        ])
 
         # Create a temporary output file
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as temp_file:
@@ -103,54 +86,52 @@ class TestExportSDK:
             assert os.path.exists(output_path)
             with open(output_path, "r") as f:
                 data = json.load(f)
-                assert data == mock_export_data
+            assert data["pr"] == {"sha": "test-pr", "changed_files": ["test.py"]}
+            assert data["nodes"] == [
+                {"id": "file:test.py", "type": "file", "metadata": {}, "path": "test.py"},
+                {"id": "commit:123", "type": "commit", "metadata": {"author": "", "sha": "123"},
+                 "title": "Initial commit"},
+            ]
+            assert data["edges"] == [
+                {"src": "commit:123", "dst": "file:test.py", "type": "MODIFIES", "metadata": {}},
+            ]
 
             # Check that the mocks were called correctly
             mock_get_pr_modified_files.assert_called_once_with(
                 mock_repo_path, "test-pr", "main"
             )
-            mock_get_related_nodes.assert_called_once()
-            mock_format_export_data.assert_called_once_with(
-                pr_sha="test-pr",
-                nodes=[
-                    {"id": "file:test.py", "type": "file", "name": "test.py"},
-                    {"id": "commit:123", "type": "commit", "name": "Initial commit"},
-                ],
-                edges=[
-                    {"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES"},
-                ],
-                changed_files=["test.py"],
-            )
+            # Only node IDs are collected; the nodes are streamed
+            assert mock_get_related_nodes.call_args.kwargs["ids_only"] is True
+            mock_iter_nodes_by_ids.assert_called_once_with(mock_adapter.conn, ["file:test.py", "commit:123"])
         finally:
             # Clean up
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
-    @patch("arc_memory.sdk.export.format_export_data")
+    @patch("arc_memory.sdk.export.iter_nodes_by_ids")
     @patch("arc_memory.sdk.export.get_pr_modified_files")
     @patch("arc_memory.sdk.export.get_related_nodes")
     def test_export_knowledge_graph_with_compression(
         self,
         mock_get_related_nodes,
         mock_get_pr_modified_files,
-        mock_format_export_data,
+        mock_iter_nodes_by_ids,
         mock_adapter,
         mock_repo_path,
-        mock_export_data,
     ):
         """Test exporting the knowledge graph with compression."""
         # Set up mocks
         mock_get_pr_modified_files.return_value = ["test.py"]
         mock_get_related_nodes.return_value = (
+            ["file:test.py", "commit:123"],
             [
-                {"id": "file:test.py", "type": "file", "name": "test.py"},
-                {"id": "commit:123", "type": "commit", "name": "Initial commit"},
-            ],
-            [
-                {"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES"},
+                {"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES", "properties": {}},
             ],
         )
-        mock_format_export_data.return_value = mock_export_data
+        mock_iter_nodes_by_ids.return_value = iter([
+            {"id": "file:test.py", "type": "file", "title": None, "extra": {"path": "test.py"}},
+            {"id": "commit:123", "type": "commit", "title": "Initial commit", "extra": {"sha": "123"}},
+        ])
 
         # Create a temporary output file
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as temp_file:
@@ -189,6 +170,51 @@ class TestExportSDK:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
+    @patch("arc_memory.sdk.export.iter_nodes_by_ids")
+    @patch("arc_memory.sdk.export.get_pr_modified_files")
+    @patch("arc_memory.sdk.export.get_related_nodes")
+    def test_export_knowledge_graph_filters_streamed_nodes(
+        self,
+        mock_get_related_nodes,
+        mock_get_pr_modified_files,
+        mock_iter_nodes_by_ids,
+        mock_adapter,
+        mock_repo_path,
+    ):
+        """Test filtering and LLM optimization of a streamed newline-delimited export."""
+        mock_get_pr_modified_files.return_value = ["test.py"]
+        mock_get_related_nodes.return_value = (
+            ["file:test.py", "commit:123"],
+            [{"src": "commit:123", "dst": "file:test.py", "rel": "MODIFIES", "properties": {}}],
+        )
+        mock_iter_nodes_by_ids.return_value = iter([
+            {"id": "file:test.py", "type": "file", "title": None, "extra": {"path": "test.py"}},
+            {"id": "commit:123", "type": "commit", "title": "Initial commit", "extra": {}},
+        ])
+
+        output_path = mock_repo_path / "export.jsonl"
+        result = export_knowledge_graph(
+            adapter=mock_adapter,
+            repo_path=mock_repo_path,
+            output_path=output_path,
+            pr_sha="test-pr",
+            entity_types=["file"],
+            format="jsonl",
+            optimize_for_llm=True,
+        )
+
+        records = [json.loads(line) for line in output_path.read_text().splitlines()]
+        assert [r["id"] for r in records if r["kind"] == "node"] == ["file:test.py"]
+        # The edge to the filtered-out commit is dropped
+        assert [r for r in records if r["kind"] == "edge"] == []
+        sections = [r["name"] for r in records if r["kind"] == "section"]
+        assert sections == [
+            "reasoning_paths", "semantic_context", "temporal_patterns",
+            "thought_structures", "causal_relationships",
+        ]
+        assert result.entity_count == 1
+        assert result.relationship_count == 0
+
     @patch("arc_memory.sdk.export.get_pr_modified_files")
     def test_export_knowledge_graph_git_error(
         self,
@@ -3,9 +3,11 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from arc_memory.db.neo4j_adapter import Neo4jAdapter
 from arc_memory.sdk.impact import (
     analyze_component_impact,
     _analyze_direct_dependencies,
+    _analyze_indirect_dependencies,
     _analyze_cochange_patterns,
     _calculate_relationship_strength,
     _evaluate_component_importance,
@@ -211,6 +213,49 @@ class TestImpact(unittest.TestCase):
             self.assertEqual(result_with_critical[0].impact_score, 1.0)
 
 
+    def test_analyze_indirect_dependencies_with_traversal(self):
+        """Test that indirect dependencies use a single server-side traversal."""
+        adapter = Neo4jAdapter()
+        adapter.traverse = MagicMock(return_value=[
+            {
+                "node": {"id": "component:999", "type": "component", "title": "Storage"},
+                "source": {"id": "component:456", "type": "component"},
+                "edge": {"src": "component:456", "dst": "component:999", "rel": "DEPENDS_ON", "properties": {}},
+                "path": ["component:456", "component:999"],
+                "depth": 1,
+            }
+        ])
+        adapter.get_edges_by_src = MagicMock(return_value=[])
+        adapter.get_edges_by_dst = MagicMock(return_value=[])
+        adapter.get_node_by_id = MagicMock(return_value=None)
+        adapter.get_degrees = MagicMock(side_effect=lambda ids: {node_id: (0, 0) for node_id in ids})
+
+        direct_impacts = [
+            ImpactResult(
+                id="component:456",
+                type="component",
+                title="Database",
+                impact_type="direct",
+                impact_score=0.9,
+                impact_path=["component:123", "component:456"],
+            )
+        ]
+
+        result = _analyze_indirect_dependencies(adapter, "component:123", direct_impacts, 3)
+
+        adapter.traverse.assert_called_once()
+        args, kwargs = adapter.traverse.call_args
+        self.assertEqual(args[0], ["component:456"])
+        self.assertEqual(kwargs["max_depth"], 2)
+        self.assertEqual(kwargs["direction"], "outgoing")
+        self.assertIn("DEPENDS_ON", kwargs["rel_types"])
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].id, "component:999")
+        self.assertEqual(result[0].impact_type, "indirect")
+        self.assertEqual(result[0].impact_path, ["component:123", "component:456", "component:999"])
+        self.assertEqual(result[0].properties["decay_factor"], 0.8)
+
     def test_calculate_relationship_strength(self):
         """Test the _calculate_relationship_strength function."""
         # Test with different relationship types
@@ -4,8 +4,9 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from arc_memory.sdk.errors import QueryError
 from arc_memory.sdk.models import QueryResult
-from arc_memory.sdk.query import query_knowledge_graph
+from arc_memory.sdk.query import query_knowledge_graph, stream_query_knowledge_graph
 
 
 class TestQuery(unittest.TestCase):
@@ -81,5 +82,36 @@ class TestQuery(unittest.TestCase):
         self.assertEqual(str(context.exception), "Failed to query knowledge graph: Something went wrong")
 
 
+    @patch("arc_memory.sdk.query.stream_query")
+    def test_stream_query_knowledge_graph(self, mock_stream_query):
+        """Test that streamed events are converted to QueryEvents."""
+        mock_stream_query.return_value = iter([
+            {"type": "results", "understanding": "Auth", "results": [{"id": "1", "type": "pr"}]},
+            {"type": "token", "text": "Alice "},
+            {"type": "token", "text": "did it."},
+            {"type": "final", "response": {"answer": "Alice did it.", "confidence": 8, "results": [{"id": "1", "type": "pr"}]}},
+        ])
+        mock_adapter = MagicMock()
+        mock_adapter.db_path = "/path/to/db"
+
+        events = list(stream_query_knowledge_graph(mock_adapter, "Who did it?"))
+
+        self.assertEqual([event.type for event in events], ["results", "token", "token", "final"])
+        self.assertEqual(events[0].evidence, [{"id": "1", "type": "pr"}])
+        self.assertEqual("".join(event.text for event in events), "Alice did it.")
+        self.assertIsInstance(events[-1].result, QueryResult)
+        self.assertEqual(events[-1].result.confidence, 0.8)
+
+    @patch("arc_memory.sdk.query.stream_query")
+    def test_stream_query_knowledge_graph_error(self, mock_stream_query):
+        """Test that an error response raises a QueryError."""
+        mock_stream_query.return_value = iter([{"type": "final", "response": {"error": "No LLM provider available"}}])
+        mock_adapter = MagicMock()
+        mock_adapter.db_path = "/path/to/db"
+
+        with self.assertRaises(QueryError) as context:
+            list(stream_query_knowledge_graph(mock_adapter, "Who did it?"))
+        self.assertIn("OPENAI_API_KEY", str(context.exception))
+
 if __name__ == "__main__":
     unittest.main()
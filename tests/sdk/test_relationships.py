@@ -3,6 +3,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from arc_memory.db.neo4j_adapter import Neo4jAdapter
 from arc_memory.sdk.models import EntityDetails, RelatedEntity
 from arc_memory.sdk.relationships import get_related_entities, get_entity_details
 
@@ -100,6 +101,70 @@ class TestRelationships(unittest.TestCase):
         self.assertEqual(result[0].direction, "outgoing")
         self.assertEqual(result[0].properties, {"lines_added": 10})
 
+    def test_get_related_entities_with_related_query(self):
+        """Test that adapters with iter_related answer in one query."""
+        adapter = Neo4jAdapter()
+        adapter.get_node_by_id = MagicMock()
+        adapter.iter_related = MagicMock(return_value=iter([
+            {
+                "node": {"id": "file:456", "type": "file", "title": "login.py"},
+                "edge": {"src": "commit:321", "dst": "file:456", "rel": "MODIFIES", "properties": {"lines_added": 10}},
+                "direction": "outgoing",
+            },
+            {
+                "node": {"id": "pr:789", "type": "pr", "title": "Fix login bug"},
+                "edge": {"src": "pr:789", "dst": "commit:321", "rel": "MERGES", "properties": {}},
+                "direction": "incoming",
+            },
+        ]))
+
+        result = get_related_entities(
+            adapter=adapter,
+            entity_id="commit:321",
+            relationship_types=["MODIFIES", "MERGES"],
+            direction="both",
+            max_results=5,
+            include_properties=True,
+            order_by="-timestamp",
+            cache=False
+        )
+
+        adapter.iter_related.assert_called_once_with(
+            "commit:321",
+            rel_types=["MODIFIES", "MERGES"],
+            direction="both",
+            order_by="-timestamp",
+            limit=5,
+        )
+        adapter.get_node_by_id.assert_not_called()
+        self.assertEqual([entity.id for entity in result], ["file:456", "pr:789"])
+        self.assertEqual(result[0].direction, "outgoing")
+        self.assertEqual(result[0].properties, {"lines_added": 10})
+        self.assertEqual(result[1].direction, "incoming")
+
+    def test_get_related_entities_fallback_stops_at_limit(self):
+        """Test that adapters without iter_related stop looking up nodes at the limit."""
+        mock_adapter = MagicMock()
+        mock_adapter.get_edges_by_src.return_value = [
+            {"src": "file:hub", "dst": f"file:{i}", "rel": "IMPORTS", "properties": {}}
+            for i in range(50)
+        ]
+        mock_adapter.get_node_by_id.side_effect = lambda node_id: {
+            "id": node_id, "type": "file", "title": node_id
+        }
+
+        result = get_related_entities(
+            adapter=mock_adapter,
+            entity_id="file:hub",
+            direction="outgoing",
+            max_results=3,
+            cache=False
+        )
+
+        self.assertEqual([entity.id for entity in result], ["file:0", "file:1", "file:2"])
+        self.assertEqual(mock_adapter.get_node_by_id.call_count, 3)
+        mock_adapter.get_edges_by_dst.assert_not_called()
+
     def test_get_entity_details(self):
         """Test the get_entity_details function."""
         # Create a mock adapter
@@ -8,7 +8,7 @@ import hashlib
 import shutil
 
 from arc_memory.sdk.core import Arc
-from arc_memory.schema.models import Node, NodeType
+from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
 
 
 class TestMultiRepositorySupport(unittest.TestCase):
@@ -383,6 +383,35 @@ class TestMultiRepositorySupport(unittest.TestCase):
         active_repos = self.arc.get_active_repositories()
         self.assertEqual(len(active_repos), 1)  # Should have one repository (the current one)
 
+    def test_remove_repository_in_batches(self):
+        """Test that deleting a repository's nodes also deletes their edges, batch by batch."""
+        repo1_id = self.arc.ensure_repository(name="Repo 1")
+        repo2_id = self.arc.add_repository(self.repo2_path, name="Repo 2")
+
+        nodes = [
+            Node(id=f"file:{i}", type=NodeType.FILE, title=f"{i}.py", repo_id=repo2_id)
+            for i in range(5)
+        ]
+        nodes.append(Node(id="file:kept", type=NodeType.FILE, title="kept.py", repo_id=repo1_id))
+        edges = [
+            Edge(src=f"file:{i}", dst=f"file:{i + 1}", rel=EdgeRel.DEPENDS_ON)
+            for i in range(4)
+        ]
+        edges.append(Edge(src="file:kept", dst="file:0", rel=EdgeRel.DEPENDS_ON))
+        self.arc.add_nodes_and_edges(nodes, edges)
+
+        removed = self.arc.adapter.remove_repository_nodes(repo2_id, batch_size=2)
+        self.assertEqual(removed, 5)
+        self.assertIsNone(self.arc.get_node_by_id("file:0"))
+        self.assertIsNone(self.arc.get_node_by_id("file:4"))
+        self.assertEqual(self.arc.adapter.get_edge_count(), 0)
+        self.assertEqual(self.arc.adapter.get_degrees(["file:kept"])["file:kept"], (0, 0))
+
+        # The repository is still listed until remove_repository finishes
+        self.assertTrue(self.arc.remove_repository(repo2_id, delete_nodes=True))
+        self.assertEqual([repo["id"] for repo in self.arc.list_repositories()], [repo1_id])
+        self.assertIsNotNone(self.arc.get_node_by_id("file:kept"))
+
     def test_update_repository(self):
         """Test updating a repository."""
         # Clear any existing repositories from previous tests
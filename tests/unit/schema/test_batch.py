@@ -0,0 +1,175 @@
+"""Tests for the columnar node and edge batches."""
+
+import json
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from arc_memory.db.sqlite_adapter import SQLiteAdapter
+from arc_memory.schema.batch import EdgeBatch, NodeBatch, edge_rows, node_rows
+from arc_memory.schema.models import (
+    CommitNode,
+    Edge,
+    EdgeRel,
+    FileNode,
+    Node,
+    NodeType,
+)
+from arc_memory.sql.temporal import utc_iso
+
+
+class TestNodeBatch(unittest.TestCase):
+    """Tests for NodeBatch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.ts = datetime(2024, 1, 2, 3, 4, 5)
+        self.commit = CommitNode(
+            id="commit:abc",
+            title="Fix login",
+            body="Because sessions expired",
+            ts=self.ts,
+            author="dev",
+            files=["src/login.py"],
+            sha="abc",
+            metadata={"branch": "main"},
+        )
+        self.file = FileNode(id="file:src/login.py", title="login.py", path="src/login.py")
+
+    def test_round_trip_keeps_subclass_fields(self):
+        """Test that materialized nodes keep their class and fields."""
+        batch = NodeBatch([self.commit, self.file])
+
+        self.assertEqual(len(batch), 2)
+        commit = batch[0]
+        self.assertIsInstance(commit, CommitNode)
+        self.assertEqual(commit.sha, "abc")
+        self.assertEqual(commit.files, ["src/login.py"])
+        self.assertEqual(commit.ts, self.ts)
+        self.assertEqual(commit.metadata, {"branch": "main"})
+        self.assertIsInstance(batch[-1], FileNode)
+        self.assertEqual(batch[-1].path, "src/login.py")
+        self.assertEqual([node.id for node in batch], ["commit:abc", "file:src/login.py"])
+
+    def test_add_plain_values(self):
+        """Test adding a node without creating a model."""
+        batch = NodeBatch()
+        batch.add("concept:auth", NodeType.CONCEPT, title="Auth", metadata={"score": 1})
+
+        self.assertEqual(batch.type_of(0), NodeType.CONCEPT)
+        node = batch[0]
+        self.assertIs(type(node), Node)
+        self.assertEqual(node.metadata, {"score": 1})
+
+    def test_extend_with_batch(self):
+        """Test concatenating batches, including sparse columns."""
+        first = NodeBatch([self.file])
+        second = NodeBatch([Node(id="doc:1", type=NodeType.DOCUMENT, embedding=[0.5, 1.0],
+                                 valid_from=self.ts)])
+        first.extend(second)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(first[1].embedding, [0.5, 1.0])
+        self.assertEqual(first[1].valid_from, self.ts)
+        self.assertIsNone(first[0].embedding)
+
+    def test_rows_match_models(self):
+        """Test that batch rows match the rows written for node models."""
+        nodes = [self.commit, self.file]
+        self.assertEqual(list(NodeBatch(nodes).rows()), list(node_rows(nodes)))
+
+        row = next(node_rows(nodes))
+        self.assertEqual(row[1], "commit")
+        self.assertEqual(json.loads(row[6]), {"branch": "main"})
+        # created_at and updated_at default to the node timestamp
+        self.assertEqual(row[7], utc_iso(self.ts))
+        self.assertEqual(row[8], utc_iso(self.ts))
+
+    def test_index_out_of_range(self):
+        """Test that indexing past the end raises IndexError."""
+        with self.assertRaises(IndexError):
+            NodeBatch()[0]
+
+
+class TestEdgeBatch(unittest.TestCase):
+    """Tests for EdgeBatch."""
+
+    def test_round_trip(self):
+        """Test that edges survive a round trip through the batch."""
+        edges = [
+            Edge(src="commit:abc", dst="file:a.py", rel=EdgeRel.MODIFIES),
+            Edge(src="pr:1", dst="commit:abc", rel=EdgeRel.MERGES, properties={"weight": 2}),
+        ]
+        batch = EdgeBatch(edges)
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.to_edges(), edges)
+        self.assertEqual(
+            list(edge_rows(batch)),
+            [
+                ("commit:abc", "file:a.py", "MODIFIES", "{}", None, None),
+                ("pr:1", "commit:abc", "MERGES", '{"weight":2}', None, None),
+            ],
+        )
+
+    def test_validity_round_trip(self):
+        """Test that edge validity intervals survive batching and concatenation."""
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 6, 1)
+        batch = EdgeBatch([Edge(src="a", dst="b", rel=EdgeRel.DEPENDS_ON)])
+        batch.extend(EdgeBatch([
+            Edge(src="b", dst="c", rel=EdgeRel.DEPENDS_ON, valid_from=start, valid_until=end)
+        ]))
+
+        self.assertIsNone(batch[0].valid_from)
+        self.assertEqual(batch[1].valid_from, start)
+        self.assertEqual(batch[1].valid_until, end)
+        self.assertEqual(list(batch.rows())[1][4:], (utc_iso(start), utc_iso(end)))
+
+
+class TestBatchWriters(unittest.TestCase):
+    """Tests for writing batches to the database."""
+
+    def setUp(self):
+        """Set up a temporary database."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "graph.db"
+        self.adapter = SQLiteAdapter()
+        self.adapter.connect({"db_path": str(self.db_path), "check_exists": False})
+        self.adapter.init_db()
+
+    def tearDown(self):
+        """Clean up the temporary database."""
+        self.adapter.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_adapter_writes_batches(self):
+        """Test that the SQLite adapter writes batches like lists."""
+        nodes = NodeBatch()
+        nodes.add("file:a.py", NodeType.FILE, title="a.py", metadata={"size": 10})
+        nodes.add("commit:abc", NodeType.COMMIT, title="Add a.py", ts=datetime(2024, 1, 1))
+        edges = EdgeBatch()
+        edges.add("commit:abc", "file:a.py", EdgeRel.MODIFIES)
+
+        self.adapter.add_nodes_and_edges(nodes, edges)
+
+        self.assertEqual(self.adapter.get_node_count(), 2)
+        self.assertEqual(self.adapter.get_edge_count(), 1)
+        node = self.adapter.get_node_by_id("file:a.py")
+        self.assertEqual(node["title"], "a.py")
+        self.assertEqual(node["extra"], {"size": 10})
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            created_at = conn.execute(
+                "SELECT created_at FROM nodes WHERE id = 'commit:abc'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(created_at, utc_iso(datetime(2024, 1, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
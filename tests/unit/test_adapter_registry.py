@@ -0,0 +1,131 @@
+"""Tests for the process-wide database adapter registry."""
+
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from arc_memory.auto_refresh.core import get_ingestor_metadata, save_ingestor_metadata
+from arc_memory.db.metadata import get_refresh_timestamp, save_refresh_timestamp
+from arc_memory.db.registry import AdapterRegistry
+from arc_memory.db.sqlite_adapter import SQLiteAdapter
+from arc_memory.errors import DatabaseError
+
+
+class TestAdapterRegistry(unittest.TestCase):
+    """Tests for AdapterRegistry and SharedAdapter."""
+
+    def setUp(self):
+        """Set up a registry and count the connections it opens."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "graph.db"
+        self.registry = AdapterRegistry()
+        self.connects = []
+        original = SQLiteAdapter.connect
+
+        def connect(adapter, params):
+            self.connects.append(params)
+            return original(adapter, params)
+
+        self.connect_patcher = patch.object(SQLiteAdapter, "connect", connect)
+        self.connect_patcher.start()
+
+    def tearDown(self):
+        """Close the registry and remove the database."""
+        self.connect_patcher.stop()
+        self.registry.close()
+        self.temp_dir.cleanup()
+
+    def _acquire(self):
+        return self.registry.acquire("sqlite", self.db_path, {"check_exists": False})
+
+    def test_adapter_is_shared(self):
+        """Test that every handle to a database uses one connection."""
+        with self._acquire() as first, self._acquire() as second:
+            first.save_refresh_timestamp("github", datetime(2024, 1, 1))
+            self.assertEqual(second.get_refresh_timestamp("github"), datetime(2024, 1, 1))
+            with first.locked() as first_adapter, second.locked() as second_adapter:
+                self.assertIs(first_adapter.conn, second_adapter.conn)
+
+            # The connection is only reachable while holding the lock
+            with self.assertRaises(AttributeError):
+                first.conn
+            self.assertFalse(hasattr(second, "conn"))
+            self.assertEqual(first.db_path, second.db_path)
+
+        with self._acquire() as third:
+            self.assertIsNotNone(third.get_refresh_timestamp("github"))
+        self.assertEqual(len(self.connects), 1)
+        self.assertFalse(self.connects[0]["check_same_thread"])
+
+    def test_handles_work_across_threads(self):
+        """Test that a handle can be used from other threads."""
+        errors = []
+
+        def save(source):
+            try:
+                with self._acquire() as adapter:
+                    adapter.save_refresh_timestamp(source, datetime(2024, 1, 1))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save, args=(f"source{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self._acquire() as adapter:
+            self.assertEqual(len(adapter.get_all_refresh_timestamps()), 8)
+        self.assertEqual(len(self.connects), 1)
+
+    def test_close_waits_for_release(self):
+        """Test that closing keeps in-use adapters connected until released."""
+        handle = self._acquire()
+        with handle.locked() as adapter:
+            shared = adapter
+
+        self.registry.close(self.db_path)
+        self.assertTrue(shared.is_connected())
+        handle.release()
+        self.assertFalse(shared.is_connected())
+
+        # A released handle can't be used, and later acquires reconnect
+        with self.assertRaises(DatabaseError):
+            handle.get_node_count()
+        with self._acquire() as adapter:
+            self.assertEqual(adapter.get_node_count(), 0)
+        self.assertEqual(len(self.connects), 2)
+
+    def test_disconnect_only_releases_the_handle(self):
+        """Test that disconnecting a handle leaves the shared connection open."""
+        first = self._acquire()
+        with self._acquire() as second:
+            first.disconnect()
+            self.assertTrue(second.is_connected())
+            self.assertEqual(second.get_node_count(), 0)
+
+    def test_metadata_helpers_share_a_connection(self):
+        """Test that refresh bookkeeping doesn't reconnect on every call."""
+        with patch.dict(os.environ, {"ARC_DB_PATH": str(self.db_path)}), \
+                patch("arc_memory.db.registry.get_adapter_registry", return_value=self.registry):
+            self.registry.acquire("sqlite", connection_params={"check_exists": False}).release()
+
+            for i in range(5):
+                save_refresh_timestamp("github", datetime(2024, 1, i + 1), adapter_type="sqlite")
+                self.assertEqual(get_refresh_timestamp("github", adapter_type="sqlite"), datetime(2024, 1, i + 1))
+
+            for name in ("git", "github", "adr"):
+                self.assertTrue(save_ingestor_metadata(name, {"files": {name: "1"}}, self.db_path))
+            for name in ("git", "github", "adr"):
+                self.assertEqual(get_ingestor_metadata(name, self.db_path), {"files": {name: "1"}})
+
+        self.assertEqual(len(self.connects), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
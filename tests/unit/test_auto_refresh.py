@@ -1,16 +1,25 @@
 """Tests for auto-refresh functionality."""
 
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from arc_memory.auto_refresh.core import (
+    RefreshWriter,
     check_refresh_needed,
+    get_ingestor_metadata,
     get_sources_needing_refresh,
     refresh_all_sources,
     refresh_source,
+    save_ingestor_metadata,
 )
+from arc_memory.db import get_adapter
+from arc_memory.db.registry import AdapterRegistry
 from arc_memory.errors import AutoRefreshError
 
 
@@ -178,3 +187,176 @@ class TestAutoRefresh(unittest.TestCase):
             # Verify the mocks were called correctly
             mock_get_sources_needing_refresh.assert_called_once_with(None, None, None)
             self.assertEqual(mock_refresh_source.call_count, 2)
+
+
+class TestParallelRefresh(unittest.TestCase):
+    """Tests for concurrent source refreshes with a single writer."""
+
+    def setUp(self):
+        """Set up a mock adapter that records the thread of every call."""
+        self.writer_threads = set()
+        self.mock_adapter = MagicMock()
+        self.mock_adapter.is_connected.return_value = True
+        self.mock_adapter.save_refresh_timestamp.side_effect = (
+            lambda *args: self.writer_threads.add(threading.current_thread().name)
+        )
+        self.mock_adapter.add_nodes_and_edges.side_effect = (
+            lambda *args: self.writer_threads.add(threading.current_thread().name)
+        )
+        self.get_adapter_patcher = patch(
+            "arc_memory.auto_refresh.core.get_adapter", return_value=self.mock_adapter
+        )
+        self.get_adapter_patcher.start()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.get_adapter_patcher.stop()
+
+    def _source_modules(self, behaviors):
+        """Create source modules whose refresh runs a behavior, then writes."""
+        modules = {}
+        for source, behavior in behaviors.items():
+            def refresh(adapter, behavior=behavior):
+                behavior()
+                adapter.add_nodes_and_edges([], [])
+                return True
+
+            module = MagicMock()
+            module.refresh = refresh
+            modules[f"arc_memory.auto_refresh.sources.{source}"] = module
+        return modules
+
+    def test_sources_run_concurrently(self):
+        """Test that sources are fetched at the same time."""
+        # Each source waits until all of them are running; run one at a
+        # time, the barrier would break and every source would fail
+        barrier = threading.Barrier(3, timeout=5)
+        behaviors = {source: barrier.wait for source in ("github", "linear", "adr")}
+        with patch.dict("sys.modules", self._source_modules(behaviors)):
+            results = refresh_all_sources(["github", "linear", "adr"], force=True)
+
+        self.assertEqual(results, {"github": True, "linear": True, "adr": True})
+        # Every database call happened on the single writer thread
+        self.assertEqual(self.writer_threads, {"arc-refresh-writer"})
+        self.assertEqual(self.mock_adapter.save_refresh_timestamp.call_count, 3)
+
+    def test_failure_is_isolated(self):
+        """Test that a failing source doesn't prevent the others from completing."""
+        def fail():
+            raise RuntimeError("github is down")
+
+        behaviors = {"github": fail, "linear": lambda: None}
+        with patch.dict("sys.modules", self._source_modules(behaviors)):
+            with self.assertRaises(AutoRefreshError) as ctx:
+                refresh_all_sources(["github", "linear"], force=True)
+
+        details = ctx.exception.details
+        self.assertEqual(details["results"], {"github": False, "linear": True})
+        self.assertIn("github", details["errors"])
+        self.assertEqual(self.mock_adapter.save_refresh_timestamp.call_count, 1)
+
+    def test_timeout_cancels_slow_source(self):
+        """Test that a source exceeding its timeout is reported and can't write."""
+        release = threading.Event()
+        finished = threading.Event()
+        worker = {}
+
+        def hang():
+            worker["daemon"] = threading.current_thread().daemon
+            release.wait(5)
+
+        def refresh(adapter):
+            try:
+                hang()
+                adapter.add_nodes_and_edges([], [])
+            except AutoRefreshError as e:
+                worker["error"] = e
+            finally:
+                finished.set()
+            return True
+
+        modules = self._source_modules({"adr": lambda: None})
+        modules["arc_memory.auto_refresh.sources.github"] = MagicMock(refresh=refresh)
+        with patch.dict("sys.modules", modules):
+            with self.assertRaises(AutoRefreshError) as ctx:
+                refresh_all_sources(["github", "adr"], force=True, timeout=0.1)
+
+            # Let the abandoned worker finish; its writes must be rejected
+            release.set()
+            self.assertTrue(finished.wait(5))
+
+        details = ctx.exception.details
+        self.assertEqual(details["results"], {"github": False, "adr": True})
+        self.assertIn("Timed out", details["errors"]["github"])
+        self.assertEqual(self.mock_adapter.add_nodes_and_edges.call_count, 1)
+        self.assertIsInstance(worker["error"], AutoRefreshError)
+        # An abandoned worker can't keep the interpreter from exiting
+        self.assertTrue(worker["daemon"])
+
+    def test_timed_out_source_frees_its_slot(self):
+        """Test that queued sources still run when a source times out."""
+        release = threading.Event()
+        modules = self._source_modules({"github": lambda: release.wait(10), "linear": lambda: None})
+        try:
+            with patch.dict("sys.modules", modules):
+                start = time.monotonic()
+                with self.assertRaises(AutoRefreshError) as ctx:
+                    refresh_all_sources(["github", "linear"], force=True, max_workers=1, timeout=0.2)
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 5)
+        self.assertEqual(ctx.exception.details["results"], {"github": False, "linear": True})
+
+    def test_writer_rejects_calls_after_close(self):
+        """Test that calls made after the writer is closed fail instead of hanging."""
+        writer = RefreshWriter(adapter=self.mock_adapter)
+        source_adapter = writer.adapter_for("github")
+        writer.close()
+
+        with self.assertRaises(AutoRefreshError):
+            source_adapter.get_node_by_id("x")
+        self.mock_adapter.get_node_by_id.assert_not_called()
+
+    def test_ingestor_metadata_uses_the_writer(self):
+        """Test that build metadata goes through the writer on the shared connection."""
+        registry = AdapterRegistry()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "graph.db"
+            # The writer opens a real SQLite adapter rather than the mock
+            with patch("arc_memory.db.registry.get_adapter_registry", return_value=registry), \
+                    patch("arc_memory.auto_refresh.core.get_adapter", get_adapter):
+                writer = RefreshWriter("sqlite", db_path=db_path, connection_params={"check_exists": False})
+                try:
+                    self.assertTrue(save_ingestor_metadata("git", {"last_commit": "abc"}, db_path, writer=writer))
+                    self.assertEqual(
+                        get_ingestor_metadata("git", db_path, writer=writer), {"last_commit": "abc"}
+                    )
+                    writer_conn = writer.submit(lambda adapter: adapter.conn).result()
+                    with registry.acquire("sqlite", db_path) as handle, handle.locked() as adapter:
+                        self.assertIs(adapter.conn, writer_conn)
+                finally:
+                    writer.close()
+                    registry.close()
+
+    def test_ingestor_metadata_without_sql(self):
+        """Test that adapters without a SQL connection keep ingestor metadata as metadata."""
+        adapter = MagicMock(conn=None)
+        adapter.get_metadata.return_value = {"last_commit": "abc"}
+        writer = RefreshWriter(adapter=adapter)
+        try:
+            self.assertTrue(save_ingestor_metadata("git", {"last_commit": "abc"}, "graph.db", writer=writer))
+            adapter.save_metadata.assert_called_once_with("ingestor_metadata:git", {"last_commit": "abc"})
+        finally:
+            writer.close()
+
+    def test_writer_propagates_errors(self):
+        """Test that adapter errors raised on the writer thread reach the caller."""
+        self.mock_adapter.get_node_by_id.side_effect = ValueError("bad id")
+        writer = RefreshWriter(adapter=self.mock_adapter)
+        try:
+            with self.assertRaises(ValueError):
+                writer.adapter_for("github").get_node_by_id("x")
+        finally:
+            writer.close()
@@ -0,0 +1,48 @@
+"""Tests for lazy loading of CLI commands."""
+
+import importlib
+import unittest
+
+import click
+import typer
+from typer.testing import CliRunner
+
+from arc_memory.cli import LAZY_COMMANDS, app
+from tests.benchmark.startup import FORBIDDEN_MODULES, loaded_forbidden_modules, measure_import
+
+
+class TestCLIStartup(unittest.TestCase):
+    """Tests for lazy loading of CLI commands."""
+
+    def test_lazy_commands_resolve(self):
+        """Test that every lazy command points at an importable command."""
+        for name, (module_name, attribute) in LAZY_COMMANDS.items():
+            target = getattr(importlib.import_module(module_name), attribute)
+            self.assertTrue(isinstance(target, typer.Typer) or callable(target), name)
+
+    def test_lazy_group_lists_and_loads_commands(self):
+        """Test that the root group lists lazy commands and loads them on demand."""
+        group = typer.main.get_command(app)
+        ctx = click.Context(group)
+
+        self.assertEqual(group.list_commands(ctx), list(LAZY_COMMANDS) + ["version"])
+        self.assertIsInstance(group.get_command(ctx, "trace"), click.Group)
+        self.assertIn("trace", group.commands)
+        self.assertIsNone(group.get_command(ctx, "missing"))
+
+    def test_version_command(self):
+        """Test that eagerly registered commands still run."""
+        result = CliRunner().invoke(app, ["version"])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Arc Memory version", result.stdout)
+
+    def test_startup_skips_heavy_imports(self):
+        """Test that starting the CLI does not import other commands' dependencies."""
+        for module in FORBIDDEN_MODULES:
+            measurement = measure_import(module)
+            self.assertEqual(loaded_forbidden_modules(module, measurement["modules"]), [], module)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -177,6 +177,38 @@ class TestSQLiteAdapter(unittest.TestCase):
         self.assertEqual(edges_by_dst[0]["rel"], "MENTIONS")
         self.assertEqual(edges_by_dst[0]["properties"]["key"], "value")
 
+    def test_iter_related(self):
+        """Test that filters, ordering and limits run in the related-entities query."""
+        self.adapter.connect({"db_path": self.db_path, "check_exists": False})
+        self.adapter.init_db()
+
+        nodes = [Node(id="file:hub.py", type=NodeType.FILE, title="hub.py")]
+        edges = []
+        for i in range(5):
+            nodes.append(Node(
+                id=f"commit:{i}", type=NodeType.COMMIT, title=f"Commit {i}", ts=datetime(2024, 1, i + 1)
+            ))
+            edges.append(Edge(src=f"commit:{i}", dst="file:hub.py", rel=EdgeRel.MODIFIES))
+        nodes.append(Node(id="file:dep.py", type=NodeType.FILE, title="dep.py"))
+        edges.append(Edge(
+            src="file:hub.py", dst="file:dep.py", rel=EdgeRel.DEPENDS_ON, properties={"kind": "import"}
+        ))
+        self.adapter.add_nodes_and_edges(nodes, edges)
+
+        rows = list(self.adapter.iter_related(
+            "file:hub.py", rel_types=["modifies"], order_by="-timestamp", limit=2
+        ))
+        self.assertEqual([row["node"]["id"] for row in rows], ["commit:4", "commit:3"])
+        self.assertTrue(all(row["direction"] == "incoming" for row in rows))
+
+        rows = list(self.adapter.iter_related("file:hub.py", direction="outgoing"))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["node"]["title"], "dep.py")
+        self.assertEqual(rows[0]["edge"]["properties"], {"kind": "import"})
+
+        with self.assertRaises(ValueError):
+            self.adapter.iter_related("file:hub.py", direction="sideways")
+
     def test_metadata(self):
         """Test saving and retrieving metadata."""
         # Connect to the database
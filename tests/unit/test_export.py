@@ -12,13 +12,16 @@ from git import Repo
 
 from arc_memory.errors import ExportError, GitError
 from arc_memory.export import (
+    ExportWriter,
     export_graph,
     extract_dependencies_from_file,
     format_export_data,
     get_pr_modified_files,
     get_related_nodes,
     infer_service_from_path,
-    sign_file,
+    iter_export_records,
+    iter_raw_export_records,
+    optimize_export_for_llm,
 )
 from arc_memory.schema.models import EdgeRel, NodeType
 
@@ -209,44 +212,6 @@ def test_get_related_nodes(mock_get_edges_by_dst, mock_get_edges_by_src, mock_ge
     assert edges[0]["rel"] == EdgeRel.MODIFIES.value
 
 
-@mock.patch("subprocess.run")
-def test_sign_file(mock_run):
-    """Test signing a file."""
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile() as temp_file:
-        # Set up the mock
-        mock_run.return_value = mock.MagicMock(returncode=0)
-
-        # Call the function
-        result = sign_file(Path(temp_file.name), "ABCD1234")
-
-        # Check that subprocess.run was called with the expected arguments
-        mock_run.assert_called_once()
-        args, kwargs = mock_run.call_args
-        assert args[0][0] == "gpg"
-        assert "--detach-sign" in args[0]
-        assert "--local-user" in args[0]
-        assert "ABCD1234" in args[0]
-
-        # Check the result
-        assert result == Path(f"{temp_file.name}.sig")
-
-
-@mock.patch("subprocess.run")
-def test_sign_file_error(mock_run):
-    """Test signing a file with an error."""
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile() as temp_file:
-        # Set up the mock to raise an exception
-        mock_run.side_effect = Exception("Test error")
-
-        # Call the function
-        result = sign_file(Path(temp_file.name))
-
-        # Check the result
-        assert result is None
-
-
 def test_infer_service_from_path():
     """Test inferring service and component from file paths."""
     # Test common patterns
@@ -345,11 +310,11 @@ import com.example.utils.Helper;
 @mock.patch("arc_memory.export.get_pr_modified_files")
 @mock.patch("arc_memory.export.get_node_by_id")
 @mock.patch("arc_memory.export.get_related_nodes")
-@mock.patch("arc_memory.export.format_export_data")
-@mock.patch("arc_memory.export.sign_file")
+@mock.patch("arc_memory.export.iter_nodes_by_ids")
+@mock.patch("arc_memory.export.ExportWriter._start_signer")
 def test_export_graph(
-    mock_sign_file,
-    mock_format_export_data,
+    mock_start_signer,
+    mock_iter_nodes_by_ids,
     mock_get_related_nodes,
     mock_get_node_by_id,
     mock_get_pr_modified_files
@@ -364,29 +329,17 @@ def test_export_graph(
         "body": None,
         "extra": {"path": node_id.split(":", 1)[1]}
     } if node_id.startswith("file:") else None
-    mock_get_related_nodes.return_value = (
-        [
-            {
-                "id": "file:test.txt",
-                "type": NodeType.FILE.value,
-                "title": "Test File",
-                "body": None,
-                "extra": {"path": "test.txt"}
-            }
-        ],
-        []
-    )
-    mock_format_export_data.return_value = {
-        "schema_version": "0.2",
-        "generated_at": "2023-05-08T14:23:00Z",
-        "pr": {
-            "sha": "abc123",
-            "changed_files": ["test.txt", "new.txt"]
-        },
-        "nodes": [],
-        "edges": []
-    }
-    mock_sign_file.return_value = Path("output.json.sig")
+    mock_get_related_nodes.return_value = (["file:test.txt"], [])
+    mock_iter_nodes_by_ids.return_value = iter([
+        {
+            "id": "file:test.txt",
+            "type": NodeType.FILE.value,
+            "title": "Test File",
+            "body": None,
+            "extra": {"path": "test.txt"}
+        }
+    ])
+    mock_start_signer.return_value = None
 
     # Create temporary paths
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -420,5 +373,211 @@ def test_export_graph(
             mock_get_node_by_id.assert_any_call(mock.ANY, "file:test.txt")
             mock_get_node_by_id.assert_any_call(mock.ANY, "file:new.txt")
             mock_get_related_nodes.assert_called_once()
-            mock_format_export_data.assert_called_once()
-            mock_sign_file.assert_called_once()
+            mock_iter_nodes_by_ids.assert_called_once_with(mock.ANY, ["file:test.txt"])
+            mock_start_signer.assert_called_once_with("ABCD1234")
+
+            with gzip.open(result, "rt") as f:
+                data = json.load(f)
+            assert [node["id"] for node in data["nodes"]] == ["file:test.txt"]
+            assert "reasoning_paths" in data
+
+
+def test_iter_export_records():
+    """Test converting an export document into newline-delimited records."""
+    export_data = format_export_data(
+        "abc123",
+        [{"id": "file:test.txt", "type": NodeType.FILE.value, "title": None,
+          "body": None, "extra": {"path": "test.txt"}}],
+        [{"src": "commit:def456", "dst": "file:test.txt",
+          "rel": EdgeRel.MODIFIES.value, "properties": {}}],
+        ["test.txt"],
+    )
+    export_data["reasoning_paths"] = [{"name": "path"}]
+
+    records = list(iter_export_records(export_data))
+
+    assert [r["kind"] for r in records] == ["header", "node", "edge", "section"]
+    assert records[0]["pr"]["sha"] == "abc123"
+    assert records[1]["path"] == "test.txt"
+    assert records[2]["type"] == EdgeRel.MODIFIES.value
+    assert records[3] == {"kind": "section", "name": "reasoning_paths",
+                          "data": [{"name": "path"}]}
+
+    raw_records = list(iter_raw_export_records(
+        "abc123",
+        [{"id": "file:test.txt", "type": NodeType.FILE.value, "title": None,
+          "body": None, "extra": {"path": "test.txt"}}],
+        [],
+        ["test.txt"],
+    ))
+    assert raw_records[1] == records[1]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_export_writer_streams_records(compression):
+    """Test that the export writer compresses and hashes in a single pass."""
+    import hashlib
+
+    import zstandard
+
+    records = [{"kind": "node", "id": f"file:{i}.py", "metadata": {}} for i in range(500)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "export.jsonl"
+        with ExportWriter(path, compression=compression, buffer_size=128) as writer:
+            for record in records:
+                writer.write_record(record)
+
+        raw = path.read_bytes()
+        assert writer.sha256 == hashlib.sha256(raw).hexdigest()
+        assert writer.bytes_written == len(raw)
+        assert writer.signature_path is None
+
+        if compression == "gzip":
+            raw = gzip.decompress(raw)
+        elif compression == "zstd":
+            raw = zstandard.ZstdDecompressor().stream_reader(raw).read()
+
+        lines = raw.decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == records
+        # Output is compact, not indented
+        assert lines[0] == '{"kind":"node","id":"file:0.py","metadata":{}}'
+
+
+def test_export_writer_signs_stream():
+    """Test that the signature is produced from the bytes as they are written."""
+    signer = mock.MagicMock()
+    signer.returncode = 0
+    signer.communicate.return_value = (b"", b"")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "export.json"
+        with mock.patch("subprocess.Popen", return_value=signer) as mock_popen:
+            with ExportWriter(path, sign=True, key_id="ABCD1234") as writer:
+                writer.write_document({"nodes": [], "edges": []})
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[0] == "gpg"
+        assert "--detach-sign" in cmd
+        assert "ABCD1234" in cmd
+        signed = b"".join(call.args[0] for call in signer.stdin.write.call_args_list)
+        assert signed == path.read_bytes()
+        assert writer.signature_path == Path(f"{path}.sig")
+
+
+@pytest.mark.parametrize("format", ["json", "jsonl"])
+def test_export_graph_streams_nodes(format):
+    """Test that exports without LLM optimization stream nodes from the database."""
+    from arc_memory.sql.db import add_nodes_and_edges, init_db
+    from arc_memory.schema.models import Edge, Node
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / "graph.db"
+        conn = init_db(db_path)
+        files = [f"file:src/{i}.py" for i in range(5)]
+        add_nodes_and_edges(
+            conn,
+            [Node(id=file_id, type=NodeType.FILE, title=file_id, body="x" * 100) for file_id in files],
+            [Edge(src=files[i], dst=files[i + 1], rel=EdgeRel.DEPENDS_ON) for i in range(4)],
+        )
+        conn.close()
+
+        expected_nodes, expected_edges = get_related_nodes(
+            init_db(db_path), [files[0]], max_hops=3, include_adrs=True, include_causal=True
+        )
+        expected = format_export_data("abc123", expected_nodes, expected_edges, ["src/0.py"])
+
+        with mock.patch("arc_memory.export.get_pr_modified_files", return_value=["src/0.py"]), \
+                mock.patch("arc_memory.export.get_recent_commits_for_file", return_value=[]), \
+                mock.patch("arc_memory.export.extract_dependencies_from_file", return_value=[]), \
+                mock.patch("arc_memory.export.get_related_nodes", wraps=get_related_nodes) as related:
+            result = export_graph(
+                db_path=db_path,
+                repo_path=Path(temp_dir),
+                pr_sha="abc123",
+                output_path=Path(temp_dir) / "export",
+                compress=False,
+                enhance_for_llm=False,
+                format=format,
+            )
+
+        # Only node IDs are kept during the traversal
+        assert related.call_args.kwargs["ids_only"] is True
+        text = result.read_text()
+        if format == "json":
+            data = json.loads(text)
+        else:
+            records = [json.loads(line) for line in text.splitlines()]
+            data = {
+                "nodes": [{k: v for k, v in r.items() if k != "kind"} for r in records if r["kind"] == "node"],
+                "edges": [{k: v for k, v in r.items() if k != "kind"} for r in records if r["kind"] == "edge"],
+            }
+        assert data["nodes"] == json.loads(json.dumps(expected["nodes"]))
+        assert data["edges"] == json.loads(json.dumps(expected["edges"]))
+
+
+@pytest.mark.parametrize("format", ["json", "jsonl"])
+def test_export_graph_streams_llm_sections(format):
+    """Test that LLM-optimized exports stream nodes and match the buffered sections."""
+    from arc_memory.sql.db import add_nodes_and_edges, init_db
+    from arc_memory.schema.models import Edge, Node
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / "graph.db"
+        conn = init_db(db_path)
+        add_nodes_and_edges(
+            conn,
+            [
+                Node(id="file:src/app.py", type=NodeType.FILE, title="app.py", body="x" * 100),
+                Node(id="decision:cache", type=NodeType.DECISION, title="Cache reads",
+                     extra={"decision_type": "design"}),
+                Node(id="implication:stale", type=NodeType.IMPLICATION, title="Stale reads",
+                     extra={"severity": "high"}),
+            ],
+            [
+                Edge(src="decision:cache", dst="file:src/app.py", rel=EdgeRel.MENTIONS),
+                Edge(src="decision:cache", dst="implication:stale", rel=EdgeRel.LEADS_TO),
+            ],
+        )
+        conn.close()
+
+        expected_nodes, expected_edges = get_related_nodes(
+            init_db(db_path), ["file:src/app.py"], max_hops=3, include_adrs=True, include_causal=True
+        )
+        expected = optimize_export_for_llm(
+            format_export_data("abc123", expected_nodes, expected_edges, ["src/app.py"])
+        )
+
+        with mock.patch("arc_memory.export.get_pr_modified_files", return_value=["src/app.py"]), \
+                mock.patch("arc_memory.export.get_recent_commits_for_file", return_value=[]), \
+                mock.patch("arc_memory.export.extract_dependencies_from_file", return_value=[]), \
+                mock.patch("arc_memory.export.get_related_nodes", wraps=get_related_nodes) as related:
+            result = export_graph(
+                db_path=db_path,
+                repo_path=Path(temp_dir),
+                pr_sha="abc123",
+                output_path=Path(temp_dir) / "export",
+                compress=False,
+                enhance_for_llm=True,
+                format=format,
+            )
+
+        assert related.call_args.kwargs["ids_only"] is True
+        text = result.read_text()
+        if format == "json":
+            data = json.loads(text)
+        else:
+            records = [json.loads(line) for line in text.splitlines()]
+            data = {
+                record["name"]: record["data"] for record in records if record["kind"] == "section"
+            }
+            data["nodes"] = [
+                {k: v for k, v in r.items() if k != "kind"} for r in records if r["kind"] == "node"
+            ]
+
+        expected = json.loads(json.dumps(expected))
+        assert data["nodes"] == expected["nodes"]
+        for name in ("reasoning_paths", "semantic_context", "temporal_patterns",
+                     "thought_structures", "causal_relationships"):
+            assert data[name] == expected[name]
+        assert data["causal_relationships"]["decision_chains"][0]["implications"][0]["id"] == "implication:stale"
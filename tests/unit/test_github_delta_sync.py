@@ -0,0 +1,231 @@
+"""Tests for incremental GitHub syncs against a local mock GitHub API."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from arc_memory.auto_refresh.sources import github as github_source
+from arc_memory.ingest.github import GitHubIngestor, merge_known_ids
+from arc_memory.schema.models import EdgeRel
+
+
+def make_pr(number, updated_at, body=""):
+    """Create a pull request as returned by the GraphQL API."""
+    return {
+        "id": f"PR_{number}",
+        "number": number,
+        "title": f"PR {number}",
+        "body": body,
+        "state": "OPEN",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+        "closedAt": None,
+        "mergedAt": None,
+        "author": {"login": "octocat"},
+        "baseRefName": "main",
+        "headRefName": f"branch-{number}",
+        "url": f"https://github.com/octo/repo/pull/{number}",
+        "mergeCommit": None,
+        "commits": {"nodes": []},
+    }
+
+
+def make_issue(number, updated_at, body=""):
+    """Create an issue as returned by the GraphQL API."""
+    return {
+        "id": f"ISSUE_{number}",
+        "number": number,
+        "title": f"Issue {number}",
+        "body": body,
+        "state": "OPEN",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+        "closedAt": None,
+        "author": {"login": "octocat"},
+        "url": f"https://github.com/octo/repo/issues/{number}",
+        "labels": {"nodes": []},
+    }
+
+
+class MockGitHub:
+    """A minimal GitHub API serving GraphQL listings and REST details."""
+
+    def __init__(self):
+        self.prs = []
+        self.issues = []
+        self.comments = {}
+        self.requests = []
+
+        github = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                github.requests.append(("GET", path))
+                if path == "/rate_limit":
+                    self._reply({"resources": {"core": {"limit": 5000, "remaining": 5000, "reset": 0}}})
+                    return
+                parts = path.strip("/").split("/")
+                if len(parts) == 6 and parts[3] == "issues" and parts[5] == "comments":
+                    self._reply(github.comments.get(int(parts[4]), []))
+                    return
+                self._reply([])
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                request = json.loads(self.rfile.read(length))
+                field = "pullRequests" if "pullRequests" in request["query"] else "issues"
+                github.requests.append(("POST", field))
+                items = github.prs if field == "pullRequests" else github.issues
+                nodes = sorted(items, key=lambda item: item["updatedAt"], reverse=True)
+                self._reply({
+                    "data": {
+                        "repository": {
+                            field: {
+                                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                                "nodes": nodes,
+                            }
+                        },
+                        "rateLimit": {"limit": 5000, "remaining": 5000, "resetAt": "2030-01-01T00:00:00Z"},
+                    }
+                })
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def detail_requests(self):
+        """Get the REST requests made for PR and issue details."""
+        return [path for method, path in self.requests if method == "GET" and path != "/rate_limit"]
+
+
+@pytest.fixture
+def mock_github():
+    """Run a mock GitHub API and point the clients at it."""
+    github = MockGitHub()
+    thread = threading.Thread(target=github.server.serve_forever, daemon=True)
+    thread.start()
+    with patch("arc_memory.ingest.github_rest.GITHUB_API_URL", github.url), \
+         patch("arc_memory.ingest.github_graphql.GITHUB_GRAPHQL_URL", f"{github.url}/graphql"), \
+         patch("arc_memory.ingest.github.get_repo_info", return_value=("octo", "repo")), \
+         patch("arc_memory.ingest.github.get_installation_token_for_repo", return_value=None), \
+         patch("arc_memory.ingest.github.get_github_token", return_value="test-token"):
+        yield github
+    github.server.shutdown()
+    github.server.server_close()
+
+
+class TestGitHubDeltaSync:
+    """Tests for syncing only what changed since the last sync."""
+
+    def test_delta_sync(self, mock_github):
+        """Test that later syncs only fetch and rewrite changed items."""
+        mock_github.prs = [
+            make_pr(1, "2024-01-01T00:00:00Z"),
+            make_pr(2, "2024-01-02T00:00:00Z"),
+        ]
+        mock_github.issues = [make_issue(3, "2024-01-01T00:00:00Z", body="Reported in #1")]
+        mock_github.comments = {
+            3: [{"body": "Duplicate of #2", "created_at": "2024-01-01T01:00:00Z", "user": {"login": "octocat"}}],
+        }
+        ingestor = GitHubIngestor()
+
+        # The first sync fetches everything
+        nodes, edges, metadata = ingestor.ingest(Path("."), last_processed=None)
+        assert {node.id for node in nodes} == {"PR_1", "PR_2", "ISSUE_3"}
+        assert {(edge.src, edge.dst) for edge in edges if edge.rel == EdgeRel.MENTIONS} == {
+            ("ISSUE_3", "PR_1"),
+            ("ISSUE_3", "PR_2"),
+        }
+        state = metadata["repositories"]["octo/repo"]
+        assert state["pull_requests"] == "2024-01-02T00:00:00Z"
+        assert state["issues"] == "2024-01-01T00:00:00Z"
+        assert state["comments"] == "2024-01-01T01:00:00Z"
+        assert state["issue_ids"] == {"3": "ISSUE_3"}
+
+        # Nothing changed: only the two listing queries, and no detail requests
+        mock_github.requests.clear()
+        nodes, edges, metadata = ingestor.ingest(Path("."), last_processed=metadata)
+        assert (nodes, edges) == ([], [])
+        assert [r for r in mock_github.requests if r[0] == "POST"] == [("POST", "pullRequests"), ("POST", "issues")]
+        assert mock_github.detail_requests() == []
+
+        # One PR changed: only it is fetched, and its mention of the unchanged
+        # issue resolves from the stored IDs
+        mock_github.prs[0] = make_pr(1, "2024-02-01T00:00:00Z", body="Fixes #3")
+        mock_github.requests.clear()
+        nodes, edges, metadata = ingestor.ingest(Path("."), last_processed=metadata)
+        assert [node.id for node in nodes] == ["PR_1"]
+        assert [(edge.src, edge.dst) for edge in edges] == [("PR_1", "ISSUE_3")]
+        assert mock_github.detail_requests()
+        assert all("/pulls/1/" in path or "/issues/1/" in path for path in mock_github.detail_requests())
+        state = metadata["repositories"]["octo/repo"]
+        assert state["pull_requests"] == "2024-02-01T00:00:00Z"
+        # Known IDs are ordered by last change, and there is no review cursor
+        assert list(state["pr_ids"]) == ["2", "1"]
+        assert "reviews" not in state
+
+    def test_known_ids_are_bounded(self):
+        """Test that only the most recently changed items' IDs are kept."""
+        ids = {str(number): f"PR_{number}" for number in range(1, 6)}
+
+        merged = merge_known_ids(ids, {"2": "PR_2", "6": "PR_6"}, limit=4)
+
+        assert list(merged) == ["4", "5", "2", "6"]
+
+    def test_failed_items_hold_back_cursor(self, mock_github):
+        """Test that an item whose details can't be fetched is retried next sync."""
+        mock_github.prs = [
+            make_pr(1, "2024-01-01T00:00:00Z"),
+            make_pr(2, "2024-01-02T00:00:00Z"),
+        ]
+        ingestor = GitHubIngestor()
+
+        with patch(
+            "arc_memory.ingest.github_fetcher.GitHubFetcher.fetch_pr_details_sync",
+            side_effect=lambda owner, repo, number: None if number == 1 else {},
+        ):
+            nodes, _, metadata = ingestor.ingest(Path("."), last_processed=None)
+
+        assert [node.id for node in nodes] == ["PR_2"]
+        assert metadata["repositories"]["octo/repo"]["pull_requests"] < "2024-01-01T00:00:00"
+
+        nodes, _, _ = ingestor.ingest(Path("."), last_processed=metadata)
+        assert "PR_1" in {node.id for node in nodes}
+
+    def test_refresh_source_saves_cursors(self, mock_github):
+        """Test that the refresh source resumes from and saves the sync cursors."""
+        mock_github.prs = [make_pr(1, "2024-01-01T00:00:00Z")]
+        adapter = MagicMock()
+        stored = {"pull_requests": "2024-01-01T00:00:00Z", "pr_ids": {"1": "PR_1"}}
+        adapter.get_metadata.side_effect = [
+            {"repositories": {"octo/repo": dict(stored)}},
+            # A webhook recorded another PR while the sync was running
+            {"repositories": {"octo/repo": {**stored, "pr_ids": {"1": "PR_1", "7": "PR_7"}}}},
+        ]
+
+        with patch("arc_memory.auto_refresh.sources.github.get_github_token", return_value="test-token"):
+            assert github_source.refresh(adapter)
+
+        adapter.get_metadata.assert_called_with(github_source.SYNC_METADATA_KEY)
+        adapter.get_refresh_timestamp.assert_not_called()
+        key, saved = adapter.save_metadata.call_args[0]
+        assert key == github_source.SYNC_METADATA_KEY
+        assert saved["repositories"]["octo/repo"]["pr_ids"] == {"7": "PR_7", "1": "PR_1"}
+        # The PR that set the cursor comes back from the listing but isn't rewritten
+        adapter.add_nodes_and_edges.assert_not_called()
+        assert mock_github.detail_requests() == []
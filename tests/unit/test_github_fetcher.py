@@ -83,12 +83,18 @@ class TestGitHubFetcher:
         mock_graphql_client.paginate_query.assert_called_once()
 
         # Check that the function was called with the correct arguments
-        mock_graphql_client.paginate_query.assert_called_once_with(
+        args, kwargs = mock_graphql_client.paginate_query.call_args
+        assert args == (
             UPDATED_PRS_QUERY,
             {"owner": "test-owner", "repo": "test-repo"},
             ["repository", "pullRequests"]
         )
 
+        # Paging stops at the first item updated before the since time
+        stop_at = kwargs["stop_at"]
+        assert not stop_at({"updatedAt": "2023-01-01T00:00:00Z"})
+        assert stop_at({"updatedAt": "2022-12-31T23:59:59Z"})
+
     @pytest.mark.asyncio
     async def test_fetch_issues(self, github_fetcher, mock_graphql_client):
         """Test fetching issues."""
@@ -131,12 +137,18 @@ class TestGitHubFetcher:
         mock_graphql_client.paginate_query.assert_called_once()
 
         # Check that the function was called with the correct arguments
-        mock_graphql_client.paginate_query.assert_called_once_with(
+        args, kwargs = mock_graphql_client.paginate_query.call_args
+        assert args == (
             UPDATED_ISSUES_QUERY,
             {"owner": "test-owner", "repo": "test-repo"},
             ["repository", "issues"]
         )
 
+        # Paging stops at the first item updated before the since time
+        stop_at = kwargs["stop_at"]
+        assert not stop_at({"updatedAt": "2023-01-01T00:00:00Z"})
+        assert stop_at({"updatedAt": "2022-12-31T23:59:59Z"})
+
     @pytest.mark.asyncio
     async def test_fetch_pr_details(self, github_fetcher, mock_rest_client):
         """Test fetching PR details."""
@@ -172,6 +172,39 @@ class TestGitHubGraphQLClient:
         assert results[1]["id"] == "PR_2"
         assert results[2]["id"] == "PR_3"
 
+    @pytest.mark.asyncio
+    async def test_paginate_query_stop_at(self, graphql_client):
+        """Test that paging stops at the first node matching stop_at."""
+        pages = []
+
+        async def mock_execute_query(query_str, variables):
+            pages.append(variables.get("cursor"))
+            return {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "cursor1"},
+                        "nodes": [
+                            {"id": "PR_3", "updatedAt": "2023-01-03T00:00:00Z"},
+                            {"id": "PR_2", "updatedAt": "2023-01-02T00:00:00Z"},
+                            {"id": "PR_1", "updatedAt": "2022-12-31T00:00:00Z"},
+                        ],
+                    }
+                }
+            }
+
+        graphql_client.execute_query = mock_execute_query
+
+        results = await graphql_client.paginate_query(
+            "query { ... }",
+            {"owner": "test-owner", "repo": "test-repo"},
+            ["repository", "pullRequests"],
+            stop_at=lambda node: node["updatedAt"] < "2023-01-01",
+        )
+
+        # The older node and the next page are never returned
+        assert [r["id"] for r in results] == ["PR_3", "PR_2"]
+        assert pages == [None]
+
     def test_execute_query_sync(self, graphql_client):
         """Test synchronous query execution."""
         # Mock the async method
@@ -191,7 +224,7 @@ class TestGitHubGraphQLClient:
     def test_paginate_query_sync(self, graphql_client):
         """Test synchronous paginated query execution."""
         # Mock the async method
-        async def mock_paginate_query(query_str, variables, path, extract_nodes):
+        async def mock_paginate_query(query_str, variables, path, extract_nodes, stop_at=None):
             return [
                 {"id": "PR_1", "number": 1},
                 {"id": "PR_2", "number": 2},
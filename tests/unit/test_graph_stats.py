@@ -0,0 +1,133 @@
+"""Tests for the materialized graph statistics tables."""
+
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from arc_memory.db.sqlite_adapter import SQLiteAdapter
+from arc_memory.migrations.registry import ensure_schema, set_schema_version
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
+from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sdk.impact import _evaluate_component_importance
+from arc_memory.sql.db import add_nodes_and_edges
+
+
+class TestGraphStats(unittest.TestCase):
+    """Tests for node type, relationship and degree statistics."""
+
+    def setUp(self):
+        """Set up a database with a small graph."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "graph.db"
+        self.adapter = SQLiteAdapter()
+        self.adapter.connect({"db_path": str(self.db_path), "check_exists": False})
+        self.adapter.init_db()
+
+        nodes = NodeBatch()
+        nodes.add("commit:1", NodeType.COMMIT, title="First", ts=datetime(2024, 1, 1))
+        nodes.add("commit:2", NodeType.COMMIT, title="Second", ts=datetime(2024, 2, 1))
+        nodes.add("file:a.py", NodeType.FILE, title="a.py")
+        edges = EdgeBatch()
+        edges.add("commit:1", "file:a.py", EdgeRel.MODIFIES)
+        edges.add("commit:2", "file:a.py", EdgeRel.MODIFIES)
+        edges.add("commit:2", "commit:1", EdgeRel.DEPENDS_ON)
+        self.adapter.add_nodes_and_edges(nodes, edges)
+
+    def tearDown(self):
+        """Close the database and remove it."""
+        self.adapter.disconnect()
+        self.temp_dir.cleanup()
+
+    def _recount(self):
+        """Count the graph with full scans, for comparison."""
+        conn = self.adapter.conn
+        types = dict(conn.execute("SELECT type, COUNT(*) FROM nodes GROUP BY type").fetchall())
+        rels = dict(conn.execute("SELECT rel, COUNT(*) FROM edges GROUP BY rel").fetchall())
+        return types, rels
+
+    def test_counts_after_writes(self):
+        """Test that batch writes update counts and degrees."""
+        self.assertEqual(self.adapter.get_type_counts(), {"commit": 2, "file": 1})
+        self.assertEqual(self.adapter.get_relationship_counts(), {"MODIFIES": 2, "DEPENDS_ON": 1})
+        self.assertEqual(
+            self.adapter.get_degrees(["file:a.py", "commit:2", "issue:9"]),
+            {"file:a.py": (2, 0), "commit:2": (0, 2), "issue:9": (0, 0)},
+        )
+
+    def test_replacements_are_not_double_counted(self):
+        """Test that rewriting nodes and edges only moves changed types."""
+        self.adapter.add_nodes_and_edges(
+            [
+                Node(id="file:a.py", type=NodeType.DOCUMENT, title="a.py"),
+                Node(id="issue:1", type=NodeType.ISSUE, title="Bug"),
+                Node(id="issue:1", type=NodeType.ISSUE, title="Bug, again"),
+            ],
+            [
+                Edge(src="commit:1", dst="file:a.py", rel=EdgeRel.MODIFIES),
+                Edge(src="issue:1", dst="file:a.py", rel=EdgeRel.MENTIONS),
+            ],
+        )
+
+        self.assertEqual(self.adapter.get_type_counts(), {"commit": 2, "document": 1, "issue": 1})
+        self.assertEqual((self.adapter.get_type_counts(), self.adapter.get_relationship_counts()), self._recount())
+        self.assertEqual(self.adapter.get_degrees(["file:a.py"])["file:a.py"], (3, 0))
+
+    def test_deletes_update_counts(self):
+        """Test that deleting nodes and edges is reflected by the triggers."""
+        self.adapter.conn.execute("DELETE FROM edges WHERE src = 'commit:2'")
+        self.adapter.conn.execute("DELETE FROM nodes WHERE id = 'commit:2'")
+        self.adapter.conn.commit()
+
+        self.assertEqual(self.adapter.get_type_counts(), {"commit": 1, "file": 1})
+        self.assertEqual(self.adapter.get_relationship_counts(), {"MODIFIES": 1})
+        self.assertEqual(
+            self.adapter.get_degrees(["file:a.py", "commit:1", "commit:2"]),
+            {"file:a.py": (1, 0), "commit:1": (0, 1), "commit:2": (0, 0)},
+        )
+
+    def test_sql_writer_updates_counts(self):
+        """Test that the module-level writer keeps the same statistics."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            add_nodes_and_edges(
+                conn,
+                [Node(id="pr:1", type=NodeType.PR, title="Fix")],
+                [Edge(src="pr:1", dst="commit:2", rel=EdgeRel.MERGES)],
+            )
+        finally:
+            conn.close()
+
+        self.assertEqual(self.adapter.get_type_counts()["pr"], 1)
+        self.assertEqual(self.adapter.get_degrees(["commit:2"])["commit:2"], (1, 2))
+
+    def test_existing_graph_is_counted_on_upgrade(self):
+        """Test that the schema step fills the tables for a graph written before it."""
+        conn = self.adapter.conn
+        conn.execute("DELETE FROM node_type_counts")
+        conn.execute("DELETE FROM edge_rel_counts")
+        conn.execute("DELETE FROM node_degrees")
+        set_schema_version(conn, 8)
+        conn.commit()
+
+        ensure_schema(conn, self.db_path)
+
+        self.assertEqual((self.adapter.get_type_counts(), self.adapter.get_relationship_counts()), self._recount())
+        self.assertEqual(self.adapter.get_degrees(["commit:2"])["commit:2"], (0, 2))
+
+    def test_importance_uses_degrees(self):
+        """Test that impact scoring reads degrees instead of fetching edges."""
+        node = self.adapter.get_node_by_id("file:a.py")
+        with patch.object(SQLiteAdapter, "get_edges_by_src") as by_src, \
+                patch.object(SQLiteAdapter, "get_edges_by_dst") as by_dst:
+            importance = _evaluate_component_importance(node, self.adapter)
+
+        by_src.assert_not_called()
+        by_dst.assert_not_called()
+        self.assertGreater(importance, 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for packing graph nodes into LLM prompt context."""
+
+import json
+import unittest
+
+from arc_memory.llm.context import estimate_tokens, pack_context
+
+
+def make_nodes(count, body_words=300):
+    """Create search results with long bodies, as the semantic search returns them."""
+    return [
+        {
+            "id": f"pr:{number}",
+            "type": "pr",
+            "title": f"Rework authentication flow part {number}",
+            "body": " ".join(f"detail{number}_{word} of the login change" for word in range(body_words // 5)),
+            "url": f"https://github.com/example/repo/pull/{number}",
+            "timestamp": "2024-01-0{}T12:00:00".format(number % 9 + 1),
+            "status": "merged",
+        }
+        for number in range(count)
+    ]
+
+
+class TestPackContext(unittest.TestCase):
+    """Tests for the pack_context function."""
+
+    def test_compact_encoding(self):
+        """Test that packing uses several times fewer tokens than indented JSON."""
+        nodes = make_nodes(10)
+        packed = pack_context(nodes, token_budget=100000)
+        verbose = json.dumps(nodes, indent=2)
+        self.assertGreaterEqual(estimate_tokens(verbose) / estimate_tokens(packed), 3)
+        self.assertIn("[1] pr pr:0 | 2024-01-01 | merged | Rework authentication flow part 0", packed)
+        self.assertNotIn("https://", packed)
+
+    def test_token_budget(self):
+        """Test that the budget is respected by dropping bodies, then nodes."""
+        nodes = make_nodes(20)
+        packed = pack_context(nodes, token_budget=600)
+        self.assertLessEqual(estimate_tokens(packed), 600)
+        self.assertIn("[1] pr pr:0", packed)
+        self.assertIn("nodes omitted to fit the context budget", packed)
+
+    def test_ranking_and_deduplication(self):
+        """Test that higher scores come first and repeated bodies are referenced."""
+        nodes = [
+            {"id": "commit:abc", "type": "commit", "body": "Fix the token refresh race.\n", "relevance": 2},
+            {"id": "pr:7", "type": "pr", "body": "Fix the token refresh race", "relevance": 9},
+        ]
+        lines = pack_context(nodes).splitlines()
+        self.assertTrue(lines[1].startswith("[1] pr pr:7"))
+        self.assertEqual(lines[2], "  Fix the token refresh race")
+        self.assertEqual(lines[4], "  (body same as [1])")
+
+
+if __name__ == "__main__":
+    unittest.main()
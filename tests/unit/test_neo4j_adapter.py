@@ -10,8 +10,9 @@ sys.modules['neo4j'] = MagicMock()
 sys.modules['neo4j'].GraphDatabase = MagicMock()
 
 from arc_memory.db.neo4j_adapter import Neo4jAdapter
-from arc_memory.errors import DatabaseError
+from arc_memory.errors import DatabaseError, GraphQueryError
 from arc_memory.schema.models import Edge, EdgeRel, Node, NodeType
+from arc_memory.sql.temporal import utc_iso
 
 
 class TestNeo4jAdapter(unittest.TestCase):
@@ -26,6 +27,7 @@ class TestNeo4jAdapter(unittest.TestCase):
         self.mock_driver = MagicMock()
         self.mock_session = MagicMock()
         self.mock_driver.session.return_value = self.mock_session
+        self.mock_session.__enter__.return_value = self.mock_session
 
         # Mock the GraphDatabase module
         self.patcher = patch("neo4j.GraphDatabase")
@@ -95,105 +97,256 @@ class TestNeo4jAdapter(unittest.TestCase):
 
         # Check that the session was used to create constraints and indexes
         self.mock_driver.session.assert_called()
-        # We don't check self.mock_session.run.assert_called() because the Neo4j adapter
-        # is a stub implementation and doesn't actually call run() in init_db
+        queries = [call.args[0] for call in self.mock_session.run.call_args_list]
+        self.assertTrue(any("CONSTRAINT node_id" in query for query in queries))
+        self.assertTrue(any("FULLTEXT INDEX node_text" in query for query in queries))
 
-    def test_stub_methods(self):
-        """Test that stub methods log warnings and return expected values."""
-        # Connect to the database
-        self.adapter.connect({
+    def _connect(self, **params):
+        """Connect the adapter to the mocked driver."""
+        connection_params = {
             "uri": "neo4j://localhost:7687",
             "auth": ("neo4j", "password"),
-            "database": "neo4j"
-        })
+            "database": "neo4j",
+        }
+        connection_params.update(params)
+        self.adapter.connect(connection_params)
+        self.mock_session.run.reset_mock()
+
+    def _written_queries(self):
+        """Run the managed write calls against a recording transaction."""
+        tx = MagicMock()
+        for call in self.mock_session.execute_write.call_args_list:
+            func, query, params = call.args
+            func(tx, query, params)
+        return [(call.args[0], call.kwargs) for call in tx.run.call_args_list]
+
+    def test_connect_pool_options(self):
+        """Test that pool settings are passed to the driver."""
+        self._connect(max_connection_pool_size=20, batch_size=50)
+
+        self.mock_graph_db.driver.assert_called_once_with(
+            "neo4j://localhost:7687",
+            auth=("neo4j", "password"),
+            max_connection_pool_size=20,
+        )
+        self.assertEqual(self.adapter.batch_size, 50)
+
+    def test_add_nodes_and_edges_batches_rows(self):
+        """Test that writes are sent as chunked UNWIND statements."""
+        self._connect(batch_size=2)
 
-        # Create test data
         nodes = [
             Node(
-                id="test:1",
+                id=f"test:{i}",
                 type=NodeType.COMMIT,
-                title="Test Node 1",
-                body="Test Body 1",
-                ts=datetime.now(),
-                extra={"key1": "value1"}
+                title=f"Test Node {i}",
+                body="Test Body",
+                ts=datetime(2025, 1, 1),
+                metadata={"key": "value"}
             )
+            for i in range(5)
         ]
-
         edges = [
-            Edge(
-                src="test:1",
-                dst="test:2",
-                rel=EdgeRel.MENTIONS,
-                properties={"key": "value"}
-            )
+            Edge(src="test:0", dst="test:1", rel=EdgeRel.MENTIONS, properties={"key": "value"}),
+            Edge(src="test:1", dst="test:2", rel=EdgeRel.MENTIONS),
+            Edge(src="test:2", dst="test:3", rel=EdgeRel.MODIFIES),
         ]
 
-        # Test stub methods
-        with self.assertLogs(level="WARNING") as cm:
-            # Add nodes and edges
-            self.adapter.add_nodes_and_edges(nodes, edges)
-
-            # Get node by ID
-            node = self.adapter.get_node_by_id("test:1")
-            self.assertIsNone(node)
-
-            # Get node count
-            count = self.adapter.get_node_count()
-            self.assertEqual(count, 0)
-
-            # Get edge count
-            count = self.adapter.get_edge_count()
-            self.assertEqual(count, 0)
+        self.adapter.add_nodes_and_edges(nodes, edges)
+
+        queries = self._written_queries()
+        # 5 nodes in chunks of 2, then one chunk per relationship type
+        self.assertEqual(len(queries), 5)
+        node_queries = queries[:3]
+        for query, params in node_queries:
+            self.assertIn("UNWIND $rows AS row", query)
+            self.assertIn("MERGE (n:Node {id: row.id})", query)
+        self.assertEqual([len(params["rows"]) for _, params in node_queries], [2, 2, 1])
+
+        row = node_queries[0][1]["rows"][0]
+        self.assertEqual(row["id"], "test:0")
+        self.assertEqual(row["props"]["type"], "commit")
+        self.assertEqual(row["props"]["timestamp"], utc_iso(datetime(2025, 1, 1)))
+        self.assertEqual(row["props"]["extra"], '{"key": "value"}')
+
+        mentions_query, mentions_params = queries[3]
+        self.assertIn("MERGE (s)-[r:MENTIONS]->(d)", mentions_query)
+        self.assertEqual(len(mentions_params["rows"]), 2)
+        self.assertEqual(mentions_params["rows"][0]["properties"], '{"key": "value"}')
+        self.assertIn("MERGE (s)-[r:MODIFIES]->(d)", queries[4][0])
+
+    def test_add_nodes_and_edges_in_transaction(self):
+        """Test that writes use the open transaction instead of new sessions."""
+        self._connect(batch_size=1)
+        tx = self.adapter.begin_transaction()
+
+        nodes = [Node(id="test:1", type=NodeType.COMMIT), Node(id="test:2", type=NodeType.COMMIT)]
+        self.adapter.add_nodes_and_edges(nodes, [])
+        self.adapter.commit_transaction(tx)
+
+        self.assertEqual(tx.run.call_count, 2)
+        tx.commit.assert_called_once()
+        self.mock_session.execute_write.assert_not_called()
+        self.assertIsNone(self.adapter._transaction)
+
+    def test_get_node_by_id(self):
+        """Test converting a stored node back to a dictionary."""
+        self._connect()
+        self.mock_session.run.return_value = [{
+            "node": {
+                "id": "test:1",
+                "type": "commit",
+                "title": "Test Node 1",
+                "timestamp": "2025-01-01T00:00:00",
+                "extra": '{"key1": "value1"}',
+                "metadata": '{"key1": "value1"}',
+            }
+        }]
+
+        node = self.adapter.get_node_by_id("test:1")
+
+        self.assertEqual(node["id"], "test:1")
+        self.assertEqual(node["type"], "commit")
+        self.assertEqual(node["extra"], {"key1": "value1"})
+        self.assertEqual(node["metadata"], {"key1": "value1"})
+
+        self.mock_session.run.return_value = []
+        self.assertIsNone(self.adapter.get_node_by_id("missing"))
+
+    def test_get_edges_by_src(self):
+        """Test filtering edges by source and relationship type."""
+        self._connect()
+        self.mock_session.run.return_value = [
+            {"src": "test:1", "dst": "test:2", "rel": "MENTIONS", "properties": '{"key": "value"}'}
+        ]
 
-            # Get edges by source
-            edges = self.adapter.get_edges_by_src("test:1")
-            self.assertEqual(edges, [])
+        edges = self.adapter.get_edges_by_src("test:1", EdgeRel.MENTIONS)
+
+        self.assertEqual(edges, [
+            {"src": "test:1", "dst": "test:2", "rel": "MENTIONS", "properties": {"key": "value"}}
+        ])
+        query = self.mock_session.run.call_args.args[0]
+        self.assertIn("[r:MENTIONS]", query)
+        self.assertIn("s.id = $id", query)
+
+    def test_traverse(self):
+        """Test that traversals run as a single variable-length match."""
+        self._connect()
+        self.mock_session.run.return_value = [{
+            "node": {"id": "file:b.py", "type": "file"},
+            "source": {"id": "file:a.py", "type": "file"},
+            "src": "file:a.py",
+            "dst": "file:b.py",
+            "rel": "IMPORTS",
+            "properties": None,
+            "path": ["file:a.py", "file:b.py"],
+            "depth": 1,
+        }]
+
+        results = self.adapter.traverse(
+            "file:a.py", max_depth=3, rel_types=["imports", "DEPENDS_ON"],
+            direction="outgoing", limit=10
+        )
 
-            # Get edges by destination
-            edges = self.adapter.get_edges_by_dst("test:2")
-            self.assertEqual(edges, [])
+        self.mock_session.run.assert_called_once()
+        query = self.mock_session.run.call_args.args[0]
+        params = self.mock_session.run.call_args.kwargs
+        self.assertIn("-[:IMPORTS|DEPENDS_ON*1..3]->", query)
+        self.assertIn("LIMIT $limit", query)
+        self.assertEqual(params["start_ids"], ["file:a.py"])
+        self.assertEqual(params["limit"], 10)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["node"]["id"], "file:b.py")
+        self.assertEqual(results[0]["edge"]["rel"], "IMPORTS")
+        self.assertEqual(results[0]["path"], ["file:a.py", "file:b.py"])
+
+    def test_traverse_rejects_unsafe_rel_types(self):
+        """Test that relationship types are validated before interpolation."""
+        self._connect()
+        with self.assertRaises(GraphQueryError):
+            self.adapter.traverse("file:a.py", rel_types=["IMPORTS]->() DETACH DELETE (n"])
+
+    def test_iter_related(self):
+        """Test that related entities are fetched with one joined query."""
+        self._connect()
+        self.mock_session.run.return_value = [{
+            "direction": "incoming",
+            "src": "pr:1",
+            "dst": "commit:1",
+            "rel": "MERGES",
+            "properties": None,
+            "valid_from": None,
+            "valid_until": None,
+            "node": {"id": "pr:1", "type": "pr", "title": "Fix"},
+        }]
+
+        rows = list(self.adapter.iter_related(
+            "commit:1", rel_types=["merges"], direction="both", order_by="-timestamp", limit=5
+        ))
+
+        self.mock_session.run.assert_called_once()
+        query = self.mock_session.run.call_args.args[0]
+        params = self.mock_session.run.call_args.kwargs
+        self.assertIn("UNION ALL", query)
+        self.assertIn("ORDER BY node.timestamp DESC", query)
+        self.assertIn("LIMIT $limit", query)
+        self.assertEqual(params["rels"], ["MERGES"])
+        self.assertEqual(params["limit"], 5)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["node"]["id"], "pr:1")
+        self.assertEqual(rows[0]["edge"]["rel"], "MERGES")
+        self.assertEqual(rows[0]["direction"], "incoming")
+
+    def test_get_degrees(self):
+        """Test that degrees are read for all nodes in one query."""
+        self._connect()
+        self.mock_session.run.return_value = [
+            {"id": "file:a.py", "in_degree": 3, "out_degree": 1},
+        ]
 
-            # Search entities
-            results = self.adapter.search_entities("test")
-            self.assertEqual(results, [])
+        degrees = self.adapter.get_degrees(["file:a.py", "file:b.py"])
 
-            # Begin transaction
-            transaction = self.adapter.begin_transaction()
-            self.assertIsNone(transaction)
+        query = self.mock_session.run.call_args.args[0]
+        self.assertIn("UNWIND $ids", query)
+        self.assertEqual(self.mock_session.run.call_args.kwargs["ids"], ["file:a.py", "file:b.py"])
+        self.assertEqual(degrees, {"file:a.py": (3, 1), "file:b.py": (0, 0)})
 
-            # Commit transaction
-            self.adapter.commit_transaction(transaction)
+    def test_remove_repository_nodes(self):
+        """Test that repository nodes are removed in batch-sized write transactions."""
+        self._connect(batch_size=2)
+        self.mock_session.execute_write.side_effect = [2, 1]
 
-            # Rollback transaction
-            self.adapter.rollback_transaction(transaction)
+        removed = self.adapter.remove_repository_nodes("repository:1")
 
-            # Save metadata
-            self.adapter.save_metadata("test_key", "test_value")
+        self.assertEqual(removed, 3)
+        self.assertEqual(self.mock_session.execute_write.call_count, 2)
+        _, query, params = self.mock_session.execute_write.call_args.args
+        self.assertIn("DETACH DELETE n", query)
+        self.assertEqual(params, {"repo_id": "repository:1", "limit": 2})
 
-            # Get metadata
-            value = self.adapter.get_metadata("test_key")
-            self.assertIsNone(value)
+    def test_metadata_and_refresh_timestamps(self):
+        """Test metadata and refresh timestamp round trips."""
+        self._connect()
 
-            # Get all metadata
-            metadata = self.adapter.get_all_metadata()
-            self.assertEqual(metadata, {})
+        self.adapter.save_metadata("test_key", {"value": 1})
+        now = datetime(2025, 1, 1, 12, 0)
+        self.adapter.save_refresh_timestamp("github", now)
 
-            # Save refresh timestamp
-            now = datetime.now()
-            self.adapter.save_refresh_timestamp("github", now)
+        queries = self._written_queries()
+        self.assertIn("MERGE (m:Metadata {key: $key})", queries[0][0])
+        self.assertEqual(queries[0][1]["value"], '{"value": 1}')
+        self.assertEqual(queries[1][1]["timestamp"], now.isoformat())
 
-            # Get refresh timestamp
-            timestamp = self.adapter.get_refresh_timestamp("github")
-            self.assertIsNone(timestamp)
+        self.mock_session.run.return_value = [{"value": '{"value": 1}'}]
+        self.assertEqual(self.adapter.get_metadata("test_key"), {"value": 1})
 
-            # Get all refresh timestamps
-            timestamps = self.adapter.get_all_refresh_timestamps()
-            self.assertEqual(timestamps, {})
+        self.mock_session.run.return_value = []
+        self.assertEqual(self.adapter.get_metadata("missing", "default"), "default")
 
-        # Check that warnings were logged for all stub methods
-        self.assertGreater(len(cm.output), 10)
-        for log in cm.output:
-            self.assertIn("stub implementation", log)
+        self.mock_session.run.return_value = [{"source": "github", "timestamp": now.isoformat()}]
+        self.assertEqual(self.adapter.get_all_refresh_timestamps(), {"github": now})
 
     def test_not_connected_errors(self):
         """Test that methods raise errors when not connected."""
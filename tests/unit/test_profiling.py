@@ -0,0 +1,163 @@
+"""Tests for the build profiler."""
+
+import json
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from arc_memory import profiling
+from arc_memory.profiling import (
+    GIT_SUBPROCESSES,
+    HTTP_REQUESTS,
+    LLM_CALLS,
+    LLM_PROMPT_TOKENS,
+    SQL_STATEMENTS,
+    SUBPROCESSES,
+    Profiler,
+    count,
+    count_llm_usage,
+    span,
+    trace_connection,
+)
+from arc_memory.schema.batch import EdgeBatch, NodeBatch
+from arc_memory.schema.models import EdgeRel, NodeType
+from arc_memory.sql.db import add_nodes_and_edges, init_db
+
+
+class TestProfiler(unittest.TestCase):
+    """Tests for spans, counters and trace export."""
+
+    def test_helpers_are_no_ops_without_profiler(self):
+        """Test that instrumentation does nothing when profiling is off."""
+        self.assertIsNone(profiling.get_profiler())
+        with span("stage") as opened:
+            count(HTTP_REQUESTS)
+            count_llm_usage(10, 5)
+        self.assertIsNone(opened)
+
+    def test_nested_spans_and_counters(self):
+        """Test that counters go to the innermost span and roll up in the summary."""
+        profiler = Profiler()
+        with profiler.activate():
+            with span("ingest.github", source="github"):
+                count(HTTP_REQUESTS)
+                with span("page"):
+                    count(HTTP_REQUESTS, 2)
+                with span("page"):
+                    count_llm_usage(100, None)
+        self.assertIsNone(profiling.get_profiler())
+
+        self.assertEqual([s.name for s in profiler.spans], ["ingest.github", "page", "page"])
+        self.assertEqual([s.depth for s in profiler.spans], [0, 1, 1])
+        self.assertEqual(profiler.spans[0].counters, {HTTP_REQUESTS: 1})
+        self.assertEqual(profiler.counters[HTTP_REQUESTS], 3)
+        self.assertEqual(profiler.counters[LLM_PROMPT_TOKENS], 100)
+
+        rows = {row["name"]: row for row in profiler.summary()}
+        self.assertEqual(rows["page"]["calls"], 2)
+        self.assertEqual(rows["ingest.github"]["counters"][HTTP_REQUESTS], 3)
+        self.assertEqual(rows["ingest.github"]["counters"][LLM_CALLS], 1)
+        self.assertLessEqual(rows["ingest.github"]["self_s"], rows["ingest.github"]["total_s"])
+        self.assertIn("ingest.github", profiler.format_summary())
+
+    def test_worker_threads_have_their_own_stacks(self):
+        """Test that spans opened on worker threads don't nest under the main thread's."""
+        def work():
+            with span("refresh.github"):
+                pass
+
+        profiler = Profiler()
+        with profiler.activate(), span("refresh"):
+            worker = threading.Thread(target=work)
+            worker.start()
+            worker.join()
+
+        worker_span = profiler.spans[1]
+        self.assertEqual(worker_span.depth, 0)
+        self.assertNotEqual(worker_span.thread_id, profiler.spans[0].thread_id)
+
+    def test_chrome_trace(self):
+        """Test that the trace has complete events with attributes and counters."""
+        profiler = Profiler()
+        with profiler.activate():
+            with span("db.write", nodes=3):
+                count(SQL_STATEMENTS, 4)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = profiler.write_chrome_trace(Path(temp_dir) / "trace.json")
+            trace = json.loads(path.read_text())
+
+        event = trace["traceEvents"][0]
+        self.assertEqual((event["name"], event["ph"]), ("db.write", "X"))
+        self.assertGreaterEqual(event["dur"], 0)
+        self.assertEqual(event["args"], {"nodes": 3, SQL_STATEMENTS: 4})
+        self.assertEqual(trace["traceEvents"][-1]["ph"], "C")
+
+    def test_subprocesses_are_counted(self):
+        """Test that git and other subprocesses are counted while profiling."""
+        profiler = Profiler()
+        with profiler.activate(), span("ingest.git"):
+            subprocess.run(["git", "--version"], capture_output=True)
+            subprocess.run([sys.executable, "-c", "pass"], capture_output=True)
+
+        self.assertEqual(profiler.counters[GIT_SUBPROCESSES], 1)
+        self.assertEqual(profiler.counters[SUBPROCESSES], 2)
+
+    def test_sql_statements_are_counted(self):
+        """Test that writes on a traced connection count their statements."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            conn = init_db(Path(temp_dir) / "graph.db")
+            nodes = NodeBatch()
+            nodes.add("file:a.py", NodeType.FILE, title="a.py")
+            nodes.add("file:b.py", NodeType.FILE, title="b.py")
+            edges = EdgeBatch()
+            edges.add("file:a.py", "file:b.py", EdgeRel.DEPENDS_ON)
+
+            profiler = Profiler()
+            with profiler.activate(), span("db.write"):
+                trace_connection(conn)
+                add_nodes_and_edges(conn, nodes, edges)
+            conn.close()
+
+        names = [s.name for s in profiler.spans]
+        self.assertIn("db.insert_nodes", names)
+        self.assertIn("db.insert_edges", names)
+        rows = {row["name"]: row for row in profiler.summary()}
+        self.assertEqual(rows["db.insert_nodes"]["counters"][SQL_STATEMENTS], 2)
+        self.assertGreater(rows["db.write"]["counters"][SQL_STATEMENTS], 3)
+
+    def test_cprofile_capture(self):
+        """Test that top-level stages are captured with cProfile."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = Profiler(capture="cprofile", capture_dir=Path(temp_dir))
+            with profiler.activate():
+                with span("enhance.semantic"):
+                    with span("inner"):
+                        sum(range(1000))
+
+            self.assertEqual([p.name for p in profiler.captures], ["00-enhance.semantic.prof"])
+            self.assertTrue(profiler.captures[0].exists())
+            self.assertEqual(profiler.spans[0].args["capture"], str(profiler.captures[0]))
+
+    def test_invalid_capture_mode(self):
+        """Test that an unknown capture mode is rejected."""
+        with self.assertRaises(ValueError):
+            Profiler(capture="perf")
+
+    def test_traced_connection_only_counts_while_active(self):
+        """Test that the module-level helper leaves connections alone when profiling is off."""
+        conn = sqlite3.connect(":memory:")
+        trace_connection(conn)
+        profiler = Profiler()
+        with profiler.activate():
+            conn.execute("SELECT 1")
+        self.assertEqual(profiler.counters, {})
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
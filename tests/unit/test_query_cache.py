@@ -0,0 +1,85 @@
+"""Tests for the query caches."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from arc_memory.query_cache import QueryCache, graph_version, node_set_hash, normalize_query
+from arc_memory.sql.db import get_connection, init_db
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQueryCache(unittest.TestCase):
+    """Tests for the QueryCache class."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = QueryCache(ttl=10, max_entries=2, clock=self.clock)
+
+    def test_ttl(self):
+        """Test that entries expire after the TTL."""
+        self.cache.set("key", "value")
+        self.clock.now = 9
+        self.assertEqual(self.cache.get("key"), "value")
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_version_invalidation(self):
+        """Test that entries from another graph version are dropped."""
+        self.cache.set("key", "value", version=(1, 1))
+        self.assertIsNone(self.cache.get("key", version=(2, 1)))
+        self.assertIsNone(self.cache.get("key", version=(1, 1)))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.assertEqual((self.cache.get("a"), self.cache.get("b"), self.cache.get("c")), (1, None, 3))
+
+
+class TestKeys(unittest.TestCase):
+    """Tests for the cache key helpers."""
+
+    def test_normalize_query(self):
+        """Test that case, whitespace and trailing punctuation are ignored."""
+        self.assertEqual(normalize_query("  Who merged   the PRs? "), "who merged the prs")
+
+    def test_node_set_hash(self):
+        """Test that node hashes ignore order but not content."""
+        a, b = {"id": "a", "title": "A"}, {"id": "b", "title": "B"}
+        self.assertEqual(node_set_hash([a, b]), node_set_hash([b, a]))
+        self.assertNotEqual(node_set_hash([a, b]), node_set_hash([a, {**b, "title": "C"}]))
+
+    def test_graph_version(self):
+        """Test that the graph version changes when nodes are inserted or updated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "graph.db"
+            init_db(db_path).close()
+            conn = get_connection(db_path)
+            try:
+                before = graph_version(conn)
+                conn.execute("INSERT INTO nodes (id, type, title) VALUES ('n1', 'commit', 'Commit')")
+                self.assertNotEqual(graph_version(conn), before)
+
+                # Updates that keep every rowid and count still change it
+                before = graph_version(conn)
+                conn.execute("UPDATE nodes SET repo_id = NULL")
+                self.assertNotEqual(graph_version(conn), before)
+            finally:
+                conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+"""Tests for the resident refresh daemon."""
+
+import json
+import os
+import tempfile
+import unittest
+import urllib.request
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from arc_memory.auto_refresh.daemon import GitChangeWatcher, RefreshDaemon
+from arc_memory.auto_refresh.sources import adr, github, linear
+from arc_memory.db.sqlite_adapter import SQLiteAdapter
+from arc_memory.errors import AutoRefreshError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestGitChangeWatcher(unittest.TestCase):
+    """Tests for GitChangeWatcher."""
+
+    def test_detects_ref_changes(self):
+        """Test that writing a ref is detected after the baseline poll."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            git_dir = Path(temp_dir) / ".git"
+            (git_dir / "refs" / "heads").mkdir(parents=True)
+            (git_dir / "logs").mkdir()
+            (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+            (git_dir / "refs" / "heads" / "main").write_text("a" * 40)
+
+            watcher = GitChangeWatcher(temp_dir)
+            self.assertFalse(watcher.poll())  # baseline
+            self.assertFalse(watcher.poll())
+
+            (git_dir / "logs" / "HEAD").write_text("commit entry\n")
+            self.assertTrue(watcher.poll())
+            self.assertFalse(watcher.poll())
+
+            (git_dir / "refs" / "heads" / "feature").write_text("b" * 40)
+            self.assertTrue(watcher.poll())
+
+    def test_not_a_repository(self):
+        """Test that a plain directory never reports changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watcher = GitChangeWatcher(temp_dir)
+            self.assertIsNone(watcher.git_dir)
+            self.assertFalse(watcher.poll())
+            self.assertFalse(watcher.poll())
+
+
+class TestRefreshDaemon(unittest.TestCase):
+    """Tests for RefreshDaemon scheduling."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.adapter = MagicMock()
+        self.adapter.is_connected.return_value = True
+        self.adapter.get_refresh_timestamp.return_value = None
+        self.calls = []
+
+        self.daemon = RefreshDaemon(
+            repo_path=self.temp_dir.name,
+            sources=["github", "adr"],
+            adapter=self.adapter,
+            min_interval=timedelta(hours=1),
+            debounce_seconds=5.0,
+            max_delay_seconds=20.0,
+            clock=self.clock,
+        )
+        for source in ["github", "adr"]:
+            self.daemon._refresh_funcs[source] = (
+                lambda adapter, source=source: self.calls.append(source)
+            )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_debounce_collapses_triggers(self):
+        """Test that repeated triggers result in a single refresh."""
+        self.daemon.trigger("github", reason="git")
+        self.clock.advance(3)
+        self.daemon.trigger("github", reason="git")
+        self.clock.advance(3)
+        self.assertEqual(self.daemon.run_pending(), [])
+
+        self.clock.advance(3)
+        self.assertEqual(self.daemon.run_pending(), ["github"])
+        self.assertEqual(self.calls, ["github"])
+        self.assertEqual(self.daemon.states["github"].triggers["git"], 2)
+
+    def test_max_delay_caps_debounce(self):
+        """Test that a stream of triggers cannot postpone a refresh forever."""
+        self.daemon.trigger("adr", reason="git")
+        for _ in range(10):
+            self.clock.advance(4)
+            self.daemon.trigger("adr", reason="git")
+            self.daemon.run_pending()
+
+        self.assertIn("adr", self.calls)
+
+    def test_priority_orders_due_refreshes(self):
+        """Test that lower priority values run first when both are due."""
+        self.daemon.trigger("github", priority=1, delay=0)
+        self.daemon.trigger("adr", priority=0, delay=0)
+
+        self.assertEqual(self.daemon.run_pending(), ["adr", "github"])
+
+    def test_refresh_reuses_adapter_and_records_watermark(self):
+        """Test that refreshes use the shared adapter and reschedule periodically."""
+        self.daemon.trigger("github", delay=0)
+        self.daemon.run_pending()
+
+        self.adapter.save_refresh_timestamp.assert_called_once()
+        self.adapter.connect.assert_not_called()
+        state = self.daemon.states["github"]
+        self.assertEqual(state.runs, 1)
+        self.assertIsNotNone(state.last_success)
+        self.assertAlmostEqual(
+            self.daemon.pending_sources()["github"], self.clock.now + 3600
+        )
+
+    def test_failures_back_off(self):
+        """Test that a failing source is isolated and retried with backoff."""
+        def failing(adapter):
+            raise RuntimeError("boom")
+
+        self.daemon._refresh_funcs["github"] = failing
+        self.daemon.trigger("github", delay=0)
+        self.daemon.trigger("adr", delay=0)
+
+        self.assertEqual(sorted(self.daemon.run_pending()), ["adr", "github"])
+        self.assertEqual(self.calls, ["adr"])
+        state = self.daemon.states["github"]
+        self.assertEqual(state.failures, 1)
+        self.assertEqual(state.last_error, "boom")
+        self.assertAlmostEqual(
+            self.daemon.pending_sources()["github"], self.clock.now + 60
+        )
+
+    def test_initial_schedule_uses_stored_watermarks(self):
+        """Test that recently refreshed sources are not refreshed on startup."""
+        recent = datetime.now() - timedelta(minutes=10)
+        self.adapter.get_refresh_timestamp.side_effect = (
+            lambda source: recent if source == "github" else None
+        )
+
+        self.daemon.schedule_initial_refreshes()
+
+        self.assertEqual(self.daemon.run_pending(), ["adr"])
+        pending = self.daemon.pending_sources()
+        self.assertGreater(pending["github"] - self.clock.now, 49 * 60)
+
+    def test_unknown_source(self):
+        """Test that triggering an unmanaged source raises an error."""
+        with self.assertRaises(AutoRefreshError):
+            self.daemon.trigger("jira")
+
+    def test_status_endpoint(self):
+        """Test the status and metrics HTTP endpoint."""
+        self.daemon.status_port = 0
+        host, port = self.daemon.start_status_server()
+        try:
+            self.daemon.trigger("adr", delay=0)
+            self.daemon.run_pending()
+
+            with urllib.request.urlopen(f"http://{host}:{port}/status") as response:
+                status = json.loads(response.read())
+            self.assertEqual(status["sources"]["adr"]["runs"], 1)
+            self.assertIn("adr", status["pending"])
+
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                metrics = response.read().decode()
+            self.assertIn('arc_refresh_runs_total{source="adr"} 1', metrics)
+        finally:
+            self.daemon.stop_status_server()
+
+
+class TestSourceRefresh(unittest.TestCase):
+    """Tests for the source refresh functions the daemon calls."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo_path = Path(self.temp_dir.name) / "repo"
+        (self.repo_path / "docs" / "adr").mkdir(parents=True)
+        (self.repo_path / "docs" / "adr" / "adr-001.md").write_text(
+            "---\nstatus: Accepted\ndate: 2024-01-01\n---\n# Use SQLite\n"
+        )
+        self.adapter = SQLiteAdapter()
+        self.adapter.connect({"db_path": str(Path(self.temp_dir.name) / "graph.db"), "check_exists": False})
+        self.adapter.init_db()
+        self.env_patcher = patch.dict(os.environ, {"ARC_REPO_PATH": str(self.repo_path)})
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.adapter.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_adr_uses_the_given_adapter_and_repository(self):
+        """Test that ADR refreshes read and write the daemon's database."""
+        with patch("arc_memory.db.get_adapter") as mock_get_adapter:
+            self.assertTrue(adr.refresh(self.adapter))
+            mock_get_adapter.assert_not_called()
+
+        self.assertEqual(self.adapter.get_node_count(), 1)
+        manifest = self.adapter.get_metadata(adr.MANIFEST_METADATA_KEY)
+        self.assertEqual(list(manifest["files"]), [os.path.join("docs", "adr", "adr-001.md")])
+
+        # Unchanged ADRs are skipped on the next run
+        with patch.object(self.adapter, "add_nodes_and_edges") as mock_add:
+            adr.refresh(self.adapter)
+            mock_add.assert_not_called()
+
+    def test_sources_reuse_http_sessions(self):
+        """Test that every run of a source shares one HTTP session."""
+        with patch("arc_memory.auto_refresh.sources.github.get_github_token", return_value="token"), \
+                patch("arc_memory.auto_refresh.sources.github.GitHubIngestor") as mock_github, \
+                patch("arc_memory.auto_refresh.sources.linear.get_linear_token", return_value="token"), \
+                patch("arc_memory.auto_refresh.sources.linear.LinearIngestor") as mock_linear:
+            mock_github.return_value.ingest.return_value = ([], [], {})
+            mock_linear.return_value.ingest.return_value = ([], [], {})
+            for _ in range(2):
+                github.refresh(self.adapter)
+                linear.refresh(self.adapter)
+
+        github_sessions = {call.kwargs["session"] for call in mock_github.call_args_list}
+        linear_sessions = {call.kwargs["session"] for call in mock_linear.call_args_list}
+        self.assertEqual(len(github_sessions), 1)
+        self.assertEqual(len(linear_sessions), 1)
+        self.assertEqual(mock_linear.return_value.ingest.call_args.kwargs["repo_path"], self.repo_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the schema version registry."""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from arc_memory.db.sqlite_adapter import SQLiteAdapter
+from arc_memory.migrations import registry
+from arc_memory.migrations.registry import (
+    SCHEMA_VERSION,
+    ensure_schema,
+    get_schema_version,
+)
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    """Tests for ensure_schema."""
+
+    def setUp(self):
+        """Set up a temporary database path."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "graph.db"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _columns(self, conn, table):
+        return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+    def test_new_database_is_stamped(self):
+        """Test that a new database gets every step and the current version."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertTrue(ensure_schema(conn, self.db_path))
+            self.assertEqual(get_schema_version(conn), SCHEMA_VERSION)
+            indexes = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            self.assertIn("idx_nodes_repo_type", indexes)
+        finally:
+            conn.close()
+
+    def test_lock_file_is_kept_out_of_database_directory(self):
+        """Test that the upgrade lock file goes to the cache directory."""
+        home = Path(self.temp_dir.name) / "home"
+        home.mkdir()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with patch.dict(os.environ, {"HOME": str(home)}):
+                ensure_schema(conn, self.db_path)
+        finally:
+            conn.close()
+
+        self.assertEqual(sorted(path.name for path in self.db_path.parent.iterdir()), ["graph.db", "home"])
+        self.assertEqual(len(list((home / ".arc" / "cache" / "locks").glob("schema-*.lock"))), 1)
+
+    def test_current_database_skips_ddl(self):
+        """Test that an up-to-date database only reads the schema version."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            ensure_schema(conn, self.db_path)
+            statements = []
+            conn.set_trace_callback(statements.append)
+
+            self.assertFalse(ensure_schema(conn, self.db_path))
+            self.assertEqual(statements, ["PRAGMA user_version"])
+        finally:
+            conn.close()
+
+    def test_legacy_database_is_migrated(self):
+        """Test that a database from before repositories gets its columns and indexes."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                "CREATE TABLE nodes(id TEXT PRIMARY KEY, type TEXT NOT NULL, "
+                "title TEXT, body TEXT, extra TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE edges(src TEXT NOT NULL, dst TEXT NOT NULL, rel TEXT NOT NULL, "
+                "properties TEXT, PRIMARY KEY (src, dst, rel))"
+            )
+            conn.execute("INSERT INTO nodes(id, type, title) VALUES ('commit:1', 'commit', 'Old')")
+            conn.commit()
+
+            ensure_schema(conn, self.db_path)
+
+            self.assertEqual(get_schema_version(conn), SCHEMA_VERSION)
+            columns = self._columns(conn, "nodes")
+            self.assertTrue({"timestamp", "repo_id", "valid_from", "embedding"} <= columns)
+            self.assertIn("metadata", self._columns(conn, "refresh_timestamps"))
+            self.assertEqual(conn.execute("SELECT title FROM nodes").fetchone()[0], "Old")
+        finally:
+            conn.close()
+
+    def test_failed_step_is_retried(self):
+        """Test that a failed migration stops the upgrade at the last good step."""
+        steps = list(registry.SCHEMA_STEPS)
+        steps[2] = (3, "add repo_id column", lambda conn, db_path: False)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with patch.object(registry, "SCHEMA_STEPS", steps):
+                self.assertTrue(ensure_schema(conn, self.db_path))
+            self.assertEqual(get_schema_version(conn), 2)
+
+            self.assertTrue(ensure_schema(conn, self.db_path))
+            self.assertEqual(get_schema_version(conn), SCHEMA_VERSION)
+        finally:
+            conn.close()
+
+    def test_adapter_init_db_uses_registry(self):
+        """Test that reopening a database with the adapter skips schema work."""
+        adapter = SQLiteAdapter()
+        adapter.connect({"db_path": str(self.db_path), "check_exists": False})
+        adapter.init_db()
+        adapter.disconnect()
+
+        adapter = SQLiteAdapter()
+        adapter.connect({"db_path": str(self.db_path)})
+        try:
+            with patch.object(registry, "schema_lock") as mock_lock:
+                adapter.init_db()
+            mock_lock.assert_not_called()
+            self.assertEqual(get_schema_version(adapter.conn), SCHEMA_VERSION)
+        finally:
+            adapter.disconnect()
+
+    def test_sql_init_db_adds_search_to_stamped_database(self):
+        """Test that WAL and FTS5 are set up for databases stamped by the adapter."""
+        from arc_memory.sql.db import init_db
+
+        adapter = SQLiteAdapter()
+        adapter.connect({"db_path": str(self.db_path), "check_exists": False})
+        adapter.init_db()
+        adapter.conn.execute("INSERT INTO nodes(id, type, title, body) VALUES ('1', 'commit', 'Fix', 'caching bug')")
+        adapter.conn.commit()
+        adapter.disconnect()
+
+        conn = init_db(self.db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(
+                conn.execute("SELECT rowid FROM fts_nodes WHERE fts_nodes MATCH 'caching'").fetchall(),
+                [(1,)],
+            )
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from arc_memory.process.semantic_analysis import (
+    _create_concept_nodes_and_edges,
+    _merge_concepts,
+    _plan_concept_chunks,
     enhance_with_semantic_analysis,
     extract_key_concepts,
     infer_semantic_relationships,
@@ -200,6 +203,115 @@ def test_extract_key_concepts(mock_ollama_client, mock_nodes, mock_edges):
     assert all(edge.rel == EdgeRel.MENTIONS for edge in concept_edges)
 
 
+def test_extract_key_concepts_covers_all_nodes(mock_ollama_client):
+    """Test that concept extraction sends every node to the LLM in chunks."""
+    nodes = [
+        Node(
+            id=f"commit:{i}",
+            type=NodeType.COMMIT,
+            title=f"Change {i} to data processing",
+            body=f"marker{i} " + "payload " * 50,
+        )
+        for i in range(200)
+    ]
+
+    concept_nodes, concept_edges = extract_key_concepts(
+        nodes, [], mock_ollama_client, max_workers=4, chunk_tokens=500
+    )
+
+    # Far more text than the old 10,000 character window, split across calls
+    prompts = [call.kwargs["prompt"] for call in mock_ollama_client.generate.call_args_list]
+    assert len(prompts) > 1
+    assert all(f"marker{i} " in "".join(prompts) for i in range(200))
+
+    # Concepts returned by every chunk are merged into one node each
+    assert sorted(node.name for node in concept_nodes) == ["Application Architecture", "Data Processing"]
+    data_edges = [edge for edge in concept_edges if edge.dst == "concept:data_processing"]
+    assert len(data_edges) == 200
+
+
+def test_extract_key_concepts_limits_chunks(mock_ollama_client):
+    """Test that large graphs are sampled down to the chunk limit."""
+    nodes = [
+        Node(
+            id=f"commit:{i}",
+            type=NodeType.COMMIT,
+            title=f"Change {i} to data processing",
+            body=f"marker{i} " + "payload " * 50,
+        )
+        for i in range(200)
+    ]
+
+    _, concept_edges = extract_key_concepts(nodes, [], mock_ollama_client, chunk_tokens=500, max_chunks=5)
+
+    prompts = [call.kwargs["prompt"] for call in mock_ollama_client.generate.call_args_list]
+    assert len(prompts) == 5
+    # The sample spans the whole graph, and every node is still linked
+    assert "marker0 " in prompts[0] and "marker199 " in prompts[-1]
+    assert len([edge for edge in concept_edges if edge.dst == "concept:data_processing"]) == 200
+
+    # Without an explicit limit, the configured one applies
+    mock_ollama_client.generate.reset_mock()
+    with patch("arc_memory.process.semantic_analysis.get_config_value", return_value=3):
+        extract_key_concepts(nodes, [], mock_ollama_client, chunk_tokens=500)
+    assert mock_ollama_client.generate.call_count == 3
+
+
+def test_plan_concept_chunks_groups_by_topic():
+    """Test that chunks stay within budget and group nodes by dominant term."""
+    nodes = []
+    for i in range(20):
+        topic = "authentication session" if i % 2 else "graph traversal"
+        nodes.append(Node(id=f"commit:{i}", type=NodeType.COMMIT, title=f"{topic} work", body=f"{topic} item{i}"))
+
+    chunks = _plan_concept_chunks(nodes, chunk_tokens=60)
+
+    assert len(chunks) > 1
+    assert all(len(chunk["text"]) <= 60 * 4 for chunk in chunks)
+    for chunk in chunks:
+        # No chunk mixes the two topics, since each topic fills whole chunks
+        assert not ("graph traversal" in chunk["text"] and "authentication session" in chunk["text"])
+    assert {hint for chunk in chunks for hint in chunk["hints"]} == {"graph", "authentication"}
+
+
+def test_merge_concepts_deduplicates():
+    """Test that partial concept lists are merged by normalized name."""
+    merged = _merge_concepts([
+        [{"name": "Data Processing", "definition": "Short.", "related_terms": ["etl"]}],
+        [
+            {"name": "data-processing", "definition": "A longer definition.", "related_terms": ["ETL", "cleaning"]},
+            {"name": "Caching", "definition": "Storing results."},
+        ],
+    ])
+
+    assert [concept["name"] for concept in merged] == ["Data Processing", "Caching"]
+    assert merged[0]["definition"] == "A longer definition."
+    assert merged[0]["related_terms"] == ["etl", "cleaning"]
+
+
+def test_concept_edges_match_partial_words():
+    """Test that concepts link to nodes containing the name inside longer words."""
+    nodes = [
+        Node(id="pr:1", type=NodeType.PR, title="Version the REST APIs", body=None),
+        Node(id="commit:1", type=NodeType.COMMIT, title="Add rate limiting", body="Limits api-key usage"),
+        Node(id="commit:2", type=NodeType.COMMIT, title="Speed up rendering", body="Use rapid drawing"),
+        Node(id="file:cache.py", type=NodeType.FILE, title="cache.py", body="Caches query results."),
+    ]
+    data = {"concepts": [{"name": "API"}, {"name": "Query Result"}, {"name": "Rate Limit"}]}
+
+    _, edges = _create_concept_nodes_and_edges(data, nodes)
+
+    linked = {(edge.dst, edge.src) for edge in edges}
+    assert linked == {
+        ("concept:api", "pr:1"),
+        ("concept:api", "commit:1"),
+        # Plain substring matching, as before the index was added
+        ("concept:api", "commit:2"),
+        ("concept:query_result", "file:cache.py"),
+        ("concept:rate_limit", "commit:1"),
+    }
+
+
 def test_infer_semantic_relationships():
     """Test infer_semantic_relationships function."""
     # This is a placeholder test since the function is a placeholder
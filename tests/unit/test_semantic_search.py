@@ -2,6 +2,7 @@
 
 import json
 import unittest
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 import re
 
@@ -12,7 +13,11 @@ from arc_memory.semantic_search import (
     _search_knowledge_graph,
     _expand_search,
     _score_nodes,
-    _generate_response
+    _generate_response,
+    _parse_query_with_rules,
+    _JsonStringFieldReader,
+    clear_query_caches,
+    stream_query
 )
 
 
@@ -156,6 +161,9 @@ class TestProcessQueryIntent(unittest.TestCase):
 class TestProcessQuery(unittest.TestCase):
     """Test the process_query function."""
 
+    def setUp(self):
+        clear_query_caches()
+
     @patch("arc_memory.semantic_search._process_query_intent")
     @patch("arc_memory.semantic_search._search_knowledge_graph")
     @patch("arc_memory.semantic_search._generate_response")
@@ -271,5 +279,171 @@ class TestProcessQuery(unittest.TestCase):
         self.assertEqual(result["results"], [])
 
 
+class TestParseQueryWithRules(unittest.TestCase):
+    """Test the rule-based query parser."""
+
+    NOW = datetime(2024, 3, 15, 12, 0)
+
+    def test_entity_keywords_and_window(self):
+        """Test a who question with an entity type and a relative window."""
+        intent = _parse_query_with_rules("Who merged the authentication PRs in the last 2 weeks?", now=self.NOW)
+        self.assertEqual(intent["entity_types"], ["pr"])
+        self.assertEqual(intent["attributes"]["title_keywords"], ["authentication"])
+        self.assertEqual(intent["temporal_constraints"], {"after": "2024-03-01"})
+        self.assertEqual(intent["parser"], "rules")
+
+    def test_absolute_windows(self):
+        """Test years and explicit dates."""
+        intent = _parse_query_with_rules("When were the caching decisions made in 2023?", now=self.NOW)
+        self.assertEqual(intent["entity_types"], ["adr"])
+        self.assertEqual(intent["temporal_constraints"], {"after": "2023-01-01", "before": "2024-01-01"})
+
+        intent = _parse_query_with_rules("Why were commits to parser.py reverted since 2024-01-10?", now=self.NOW)
+        self.assertEqual(intent["entity_types"], ["commit"])
+        self.assertEqual(intent["attributes"]["title_keywords"], ["parser.py", "reverted"])
+        self.assertEqual(intent["temporal_constraints"], {"after": "2024-01-10"})
+
+    def test_unsupported_shapes(self):
+        """Test that other questions are left to the LLM."""
+        self.assertIsNone(_parse_query_with_rules("Who implemented the authentication feature?"))
+        self.assertIsNone(_parse_query_with_rules("How do the PRs relate to the roadmap?"))
+
+
+@patch("arc_memory.semantic_search.get_connection")
+@patch("arc_memory.semantic_search.ensure_ollama_available", return_value=True)
+@patch("arc_memory.semantic_search._search_knowledge_graph")
+@patch("arc_memory.semantic_search._generate_response")
+@patch("arc_memory.semantic_search._process_query_intent")
+class TestProcessQueryCaching(unittest.TestCase):
+    """Test the intent and answer caches of process_query."""
+
+    NODES = [{"type": "pr", "id": "pr:42", "title": "Implement authentication", "relevance": 10}]
+    RESPONSE = {"understanding": "Auth", "summary": "PR #42", "answer": "PR #42", "results": NODES, "confidence": 8}
+
+    def setUp(self):
+        clear_query_caches()
+
+    def test_rules_skip_intent_llm(self, mock_intent, mock_generate, mock_search, mock_ensure_ollama, mock_get_conn):
+        """Test that rule-parsed queries don't call the intent LLM."""
+        mock_search.return_value = self.NODES
+        mock_generate.return_value = dict(self.RESPONSE)
+
+        process_query("dummy/path", "Who merged the authentication PRs last week?")
+
+        mock_intent.assert_not_called()
+        self.assertEqual(mock_search.call_args[0][1]["entity_types"], ["pr"])
+
+    def test_intent_and_answer_cache(self, mock_intent, mock_generate, mock_search, mock_ensure_ollama, mock_get_conn):
+        """Test that repeated queries reuse the intent and the answer."""
+        mock_intent.return_value = {"understanding": "Auth", "entity_types": ["pr"]}
+        mock_search.return_value = self.NODES
+        mock_generate.return_value = dict(self.RESPONSE)
+
+        first = process_query("dummy/path", "Who implemented the authentication feature?")
+        second = process_query("dummy/path", "who implemented the  authentication feature")
+
+        self.assertEqual(first, second)
+        mock_intent.assert_called_once()
+        mock_generate.assert_called_once()
+        mock_ensure_ollama.assert_called_once()
+
+        # Different evidence means a new answer
+        mock_search.return_value = [{**self.NODES[0], "title": "Rework authentication"}]
+        process_query("dummy/path", "Who implemented the authentication feature?")
+        self.assertEqual(mock_generate.call_count, 2)
+
+        # Bypassing the cache calls both LLM stages again
+        process_query("dummy/path", "Who implemented the authentication feature?", use_cache=False)
+        self.assertEqual(mock_intent.call_count, 2)
+        self.assertEqual(mock_generate.call_count, 3)
+
+    @patch("arc_memory.semantic_search.graph_version")
+    def test_graph_change_invalidates_answers(
+        self, mock_version, mock_intent, mock_generate, mock_search, mock_ensure_ollama, mock_get_conn
+    ):
+        """Test that answers aren't reused once the graph changes."""
+        mock_version.return_value = (1, 1)
+        mock_search.return_value = self.NODES
+        mock_generate.return_value = dict(self.RESPONSE)
+
+        process_query("dummy/path", "Who merged the authentication PRs?")
+        process_query("dummy/path", "Who merged the authentication PRs?")
+        self.assertEqual(mock_generate.call_count, 1)
+
+        mock_version.return_value = (2, 1)
+        process_query("dummy/path", "Who merged the authentication PRs?")
+        self.assertEqual(mock_generate.call_count, 2)
+
+    def test_failed_answers_are_not_cached(
+        self, mock_intent, mock_generate, mock_search, mock_ensure_ollama, mock_get_conn
+    ):
+        """Test that fallback responses from failed generations are retried."""
+        mock_search.return_value = self.NODES
+        mock_generate.return_value = {**self.RESPONSE, "confidence": 1}
+
+        process_query("dummy/path", "Who merged the authentication PRs?")
+        process_query("dummy/path", "Who merged the authentication PRs?")
+        self.assertEqual(mock_generate.call_count, 2)
+
+
+class TestJsonStringFieldReader(unittest.TestCase):
+    """Test reading a JSON string field while it streams in."""
+
+    def test_split_escapes(self):
+        """Test that escape sequences split across chunks are decoded."""
+        reader = _JsonStringFieldReader("answer")
+        chunks = ['{"summary": "S", "ans', 'wer": "Line one\\', 'nLine \\u00', 'e9", "confidence": 7}']
+        self.assertEqual("".join(reader.feed(chunk) for chunk in chunks), "Line one\nLine \u00e9")
+
+    def test_thinking_is_skipped(self):
+        """Test that JSON quoted while thinking is ignored."""
+        reader = _JsonStringFieldReader("answer")
+        text = reader.feed('<think>Use {"answer": "draft"}</think>')
+        text += reader.feed('```json\n{"answer": "final"}```')
+        self.assertEqual(text, "final")
+
+
+@patch("arc_memory.semantic_search.get_connection")
+@patch("arc_memory.semantic_search.ensure_ollama_available", return_value=True)
+@patch("arc_memory.semantic_search._search_knowledge_graph")
+@patch("arc_memory.semantic_search.OllamaClient")
+class TestStreamQuery(unittest.TestCase):
+    """Test the stream_query function."""
+
+    NODES = [{"type": "pr", "id": "pr:42", "title": "Implement authentication", "relevance": 10}]
+
+    def setUp(self):
+        clear_query_caches()
+
+    def test_stream_events(self, mock_ollama, mock_search, mock_ensure_ollama, mock_get_conn):
+        """Test that results come first, then answer tokens, then the final response."""
+        mock_search.return_value = self.NODES
+        mock_ollama.return_value.generate_stream.return_value = iter(
+            ['{"summary": "PR #42", "answer": "Alice ', 'merged PR #42.", ', '"confidence": 8}']
+        )
+
+        events = list(stream_query("dummy/path", "Who merged the authentication PRs?"))
+
+        self.assertEqual([event["type"] for event in events], ["results", "token", "token", "final"])
+        self.assertEqual(events[0]["results"], self.NODES)
+        self.assertEqual("".join(event["text"] for event in events[1:3]), "Alice merged PR #42.")
+        response = events[-1]["response"]
+        self.assertEqual((response["summary"], response["confidence"]), ("PR #42", 8))
+
+        # The streamed answer is cached for process_query too
+        self.assertEqual(process_query("dummy/path", "Who merged the authentication PRs?"), response)
+        mock_ollama.return_value.generate_stream.assert_called_once()
+
+    def test_stream_no_results(self, mock_ollama, mock_search, mock_ensure_ollama, mock_get_conn):
+        """Test that a query without results ends with a final event only."""
+        mock_search.return_value = []
+
+        events = list(stream_query("dummy/path", "Who merged the authentication PRs?"))
+
+        self.assertEqual([event["type"] for event in events], ["final"])
+        self.assertEqual(events[0]["response"]["results"], [])
+        mock_ollama.return_value.generate_stream.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
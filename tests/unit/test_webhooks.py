@@ -0,0 +1,329 @@
+"""Tests for the webhook receiver."""
+
+import hashlib
+import hmac
+import http.client
+import json
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+from arc_memory.auto_refresh.sources.github import SYNC_METADATA_KEY
+from arc_memory.auto_refresh.webhooks import (
+    MAX_BODY_BYTES, WebhookReceiver, github_delta, linear_delta, verify_signature
+)
+from arc_memory.db.sqlite_adapter import SQLiteAdapter
+from arc_memory.ingest.github_fetcher import GitHubFetcher
+from arc_memory.schema.models import EdgeRel
+from arc_memory.sql.db import init_db
+
+
+def pull_request_event(number, body="", merged=False):
+    """Create a GitHub pull_request webhook payload."""
+    return {
+        "action": "closed" if merged else "opened",
+        "repository": {"full_name": "octo/repo"},
+        "pull_request": {
+            "node_id": f"PR_{number}",
+            "number": number,
+            "title": f"PR {number}",
+            "body": body,
+            "state": "closed" if merged else "open",
+            "merged": merged,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-02T00:00:00Z",
+            "merged_at": "2024-01-02T00:00:00Z" if merged else None,
+            "merge_commit_sha": "abc123" if merged else None,
+            "user": {"login": "octocat"},
+            "base": {"ref": "main"},
+            "head": {"ref": f"branch-{number}"},
+            "html_url": f"https://github.com/octo/repo/pull/{number}",
+        },
+    }
+
+
+def issue_event(number, body=""):
+    """Create a GitHub issues webhook payload."""
+    return {
+        "action": "opened",
+        "repository": {"full_name": "octo/repo"},
+        "issue": {
+            "node_id": f"ISSUE_{number}",
+            "number": number,
+            "title": f"Issue {number}",
+            "body": body,
+            "state": "open",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "user": {"login": "octocat"},
+            "labels": [{"name": "bug"}],
+            "html_url": f"https://github.com/octo/repo/issues/{number}",
+        },
+    }
+
+
+def make_fetcher():
+    """Create a fetcher without contacting GitHub."""
+    with patch("arc_memory.ingest.github_rest.GitHubRESTClient._update_rate_limit_info"):
+        return GitHubFetcher("")
+
+
+class TestDeltas(unittest.TestCase):
+    """Tests for converting payloads into graph deltas."""
+
+    def setUp(self):
+        self.fetcher = make_fetcher()
+
+    def test_verify_signature(self):
+        """Test GitHub-style and bare hex signatures."""
+        body = b'{"a": 1}'
+        digest = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+        self.assertTrue(verify_signature("secret", body, f"sha256={digest}"))
+        self.assertTrue(verify_signature("secret", body, digest))
+        self.assertFalse(verify_signature("other", body, digest))
+        self.assertFalse(verify_signature("secret", body, None))
+
+    def test_merged_pull_request(self):
+        """Test that a merged PR becomes a node with mention and merge edges."""
+        delta = github_delta(
+            "pull_request",
+            pull_request_event(5, body="Fixes #3", merged=True),
+            self.fetcher,
+            known={"issue_ids": {"3": "ISSUE_3"}},
+        )
+        (node,) = delta.nodes
+        self.assertEqual((node.id, node.number, node.state), ("PR_5", 5, "MERGED"))
+        self.assertEqual(
+            {(edge.dst, edge.rel) for edge in delta.edges},
+            {("ISSUE_3", EdgeRel.MENTIONS), ("abc123", EdgeRel.MERGES)},
+        )
+        self.assertEqual(delta.pr_ids, {"5": "PR_5"})
+
+    def test_issue_comment_on_pull_request(self):
+        """Test that comments on PRs mention from the PR node."""
+        payload = {
+            "action": "created",
+            "repository": {"full_name": "octo/repo"},
+            "issue": {"number": 5, "node_id": "I_5", "pull_request": {}},
+            "comment": {"body": "See #3"},
+        }
+        delta = github_delta(
+            "issue_comment", payload, self.fetcher,
+            known={"pr_ids": {"5": "PR_5"}, "issue_ids": {"3": "ISSUE_3"}},
+        )
+        self.assertEqual([(edge.src, edge.dst) for edge in delta.edges], [("PR_5", "ISSUE_3")])
+        self.assertEqual(delta.nodes, [])
+
+        # The payload's node ID is the issue's, so unknown PRs are resolved later
+        delta = github_delta("issue_comment", payload, self.fetcher, known={"issue_ids": {"3": "ISSUE_3"}})
+        self.assertEqual(delta.edges, [])
+        self.assertEqual(delta.pending_mentions, [("5", "See #3")])
+
+    def test_push_commits_mention_prs(self):
+        """Test that pushed commit messages mention known PRs."""
+        payload = {
+            "repository": {"full_name": "octo/repo"},
+            "commits": [{
+                "id": "def456",
+                "message": "Merge pull request #5\n\nDetails",
+                "timestamp": "2024-01-02T03:04:05+02:00",
+                "author": {"name": "Octo Cat"},
+                "added": ["a.py"],
+                "modified": ["b.py"],
+            }],
+        }
+        delta = github_delta("push", payload, self.fetcher, known={"pr_ids": {"5": "PR_5"}})
+        self.assertEqual([(edge.src, edge.dst) for edge in delta.edges], [("commit:def456", "PR_5")])
+        (node,) = delta.nodes
+        self.assertEqual(
+            (node.id, node.sha, node.title, node.author, node.files),
+            ("commit:def456", "def456", "Merge pull request #5", "Octo Cat", ["a.py", "b.py"]),
+        )
+
+    def test_unhandled_events(self):
+        """Test that other events and deletions don't change the graph."""
+        self.assertIsNone(github_delta("ping", {}, self.fetcher))
+        self.assertIsNone(github_delta("issues", {**issue_event(1), "action": "deleted"}, self.fetcher))
+        self.assertIsNone(linear_delta({"type": "Comment", "action": "create"}, "repo"))
+
+    def test_linear_issue(self):
+        """Test that Linear issue webhooks reuse the ingestor's node builder."""
+        payload = {
+            "type": "Issue",
+            "action": "update",
+            "data": {
+                "id": "abc",
+                "identifier": "ARC-12",
+                "title": "Linear issue",
+                "description": "Details",
+                "createdAt": "2024-01-01T00:00:00.000Z",
+                "url": "https://linear.app/arc/issue/ARC-12",
+                "state": {"name": "In Progress"},
+                "team": {"key": "ARC"},
+                "labels": [{"name": "bug"}],
+            },
+        }
+        delta = linear_delta(payload, "repo")
+        (node,) = delta.nodes
+        self.assertEqual((node.id, node.number, node.state, node.labels), ("linear:abc", 12, "In Progress", ["bug"]))
+        self.assertEqual(delta.edges[0].dst, "repo:repo")
+
+
+class TestWebhookReceiver(unittest.TestCase):
+    """Tests for receiving and applying webhooks."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "graph.db"
+        init_db(self.db_path).close()
+        self.receiver = WebhookReceiver(
+            github_secret="secret",
+            linear_secret="secret",
+            db_path=self.db_path,
+            adapter=SQLiteAdapter(),
+            fetcher=make_fetcher(),
+            fetch_details=False,
+            flush_interval=0.2,
+        )
+        self.host, self.port = self.receiver.start()
+
+    def tearDown(self):
+        self.receiver.shutdown()
+        self.temp_dir.cleanup()
+
+    def post(self, payload, event="pull_request", delivery="1", secret="secret"):
+        body = json.dumps(payload).encode()
+        signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        request = urllib.request.Request(
+            f"http://{self.host}:{self.port}/github",
+            data=body,
+            headers={
+                "X-GitHub-Event": event,
+                "X-GitHub-Delivery": delivery,
+                "X-Hub-Signature-256": f"sha256={signature}",
+            },
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_deliveries_are_batched_and_deduplicated(self):
+        """Test that deliveries are written together, once each."""
+        self.assertEqual(self.post(issue_event(3), event="issues", delivery="a")[0], 202)
+        self.assertEqual(self.post(pull_request_event(5, body="Fixes #3"), delivery="b")[0], 202)
+        status, response = self.post(pull_request_event(5, body="Fixes #3"), delivery="b")
+        self.assertEqual((status, response["status"]), (200, "duplicate"))
+        self.receiver.flush()
+
+        self.assertEqual(self.receiver.counts["applied"], 2)
+        self.assertEqual(self.receiver.counts["batches"], 1)
+        self.assertEqual(self.receiver.counts["duplicates"], 1)
+
+        self.receiver.shutdown()
+        adapter = SQLiteAdapter()
+        adapter.connect({"db_path": str(self.db_path)})
+        try:
+            self.assertEqual(adapter.get_node_by_id("PR_5")["title"], "PR 5")
+            self.assertIsNotNone(adapter.get_node_by_id("ISSUE_3"))
+            self.assertEqual([edge["dst"] for edge in adapter.get_edges_by_src("PR_5")], ["ISSUE_3"])
+            # The new IDs are shared with polling syncs
+            stored = adapter.get_metadata(SYNC_METADATA_KEY)
+            self.assertEqual(stored["repositories"]["octo/repo"]["pr_ids"], {"5": "PR_5"})
+        finally:
+            adapter.disconnect()
+
+    def test_invalid_signature_is_rejected(self):
+        """Test that deliveries signed with the wrong secret are rejected."""
+        status, _ = self.post(pull_request_event(5), secret="wrong")
+        self.assertEqual(status, 401)
+        self.assertEqual(self.receiver.counts["rejected"], 1)
+        self.assertEqual(self.receiver.counts["queued"], 0)
+
+    def test_unsigned_deliveries_need_loopback(self):
+        """Test that sources without a secret are only accepted on loopback."""
+        body = json.dumps(pull_request_event(5)).encode()
+        headers = {"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "unsigned"}
+
+        exposed = WebhookReceiver(host="0.0.0.0", fetcher=make_fetcher())
+        exposed.github_secret = None
+        self.assertEqual(exposed.handle("github", headers, body)[0], 401)
+        self.assertEqual(exposed.counts["rejected"], 1)
+
+        local = WebhookReceiver(host="127.0.0.1", fetcher=make_fetcher())
+        local.github_secret = None
+        self.assertEqual(local.handle("github", headers, body)[0], 202)
+
+    def test_comment_on_unknown_pull_request(self):
+        """Test that comments on PRs that aren't known yet mention from the PR node."""
+        payload = {
+            "action": "created",
+            "repository": {"full_name": "octo/repo"},
+            "issue": {"number": 8, "node_id": "I_8", "pull_request": {}},
+            "comment": {"body": "Closes #3"},
+        }
+        self.post(issue_event(3), event="issues", delivery="a")
+        fetcher = self.receiver._get_fetcher()
+        fetcher.token = "token"
+        with patch.object(fetcher.rest_client, "request", return_value={"node_id": "PR_8"}) as request:
+            self.assertEqual(self.post(payload, event="issue_comment", delivery="b")[0], 202)
+            self.receiver.flush()
+        request.assert_called_once_with("GET", "/repos/octo/repo/pulls/8")
+
+        self.receiver.shutdown()
+        adapter = SQLiteAdapter()
+        adapter.connect({"db_path": str(self.db_path)})
+        try:
+            self.assertEqual([edge["dst"] for edge in adapter.get_edges_by_src("PR_8")], ["ISSUE_3"])
+        finally:
+            adapter.disconnect()
+
+    def test_failed_batches_are_spooled_and_replayed(self):
+        """Test that accepted deliveries survive a failed write."""
+        with patch.object(WebhookReceiver, "apply", side_effect=RuntimeError("disk full")):
+            self.assertEqual(self.post(pull_request_event(5), delivery="a")[0], 202)
+            self.receiver.flush()
+        self.assertEqual(self.receiver.counts["spooled"], 1)
+        self.receiver.shutdown()
+
+        receiver = WebhookReceiver(
+            github_secret="secret", db_path=self.db_path, adapter=SQLiteAdapter(), fetcher=make_fetcher()
+        )
+        receiver.start()
+        try:
+            receiver.flush()
+            self.assertEqual(receiver.counts["applied"], 1)
+        finally:
+            receiver.shutdown()
+        self.assertFalse(receiver.spool_path.exists())
+
+        adapter = SQLiteAdapter()
+        adapter.connect({"db_path": str(self.db_path)})
+        try:
+            self.assertIsNotNone(adapter.get_node_by_id("PR_5"))
+        finally:
+            adapter.disconnect()
+
+    def test_oversized_bodies_are_rejected(self):
+        """Test that bodies above the size limit are refused without being read."""
+        connection = http.client.HTTPConnection(self.host, self.port)
+        try:
+            connection.putrequest("POST", "/github")
+            connection.putheader("Content-Length", str(MAX_BODY_BYTES + 1))
+            connection.endheaders()
+            self.assertEqual(connection.getresponse().status, 413)
+        finally:
+            connection.close()
+
+    def test_ignored_events(self):
+        """Test that events without graph changes are acknowledged and skipped."""
+        status, response = self.post({"zen": "Keep it simple"}, event="ping")
+        self.assertEqual((status, response["status"]), (200, "ignored"))
+
+
+if __name__ == "__main__":
+    unittest.main()
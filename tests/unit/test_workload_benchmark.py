@@ -0,0 +1,104 @@
+"""Tests for the recorded-workload benchmark helpers."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from arc_memory.sdk import Arc
+from tests.benchmark.workload import (
+    GraphSpec,
+    WORKLOADS,
+    build_script,
+    compare_to_baseline,
+    generate_graph,
+    run_benchmark,
+    summarize,
+)
+
+
+class TestWorkloadBenchmark(unittest.TestCase):
+    """Tests for graph generation, summaries and baseline comparison."""
+
+    def _generate(self, spec):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            arc = Arc(
+                repo_path=temp_dir,
+                adapter_type="sqlite",
+                connection_params={"db_path": str(Path(temp_dir) / "graph.db"), "check_exists": False},
+            )
+            try:
+                counts = generate_graph(arc, spec)
+                top = arc.adapter.conn.execute(
+                    "SELECT MAX(in_degree) FROM node_degrees WHERE id LIKE 'file:%'"
+                ).fetchone()[0]
+            finally:
+                arc.close()
+        return counts, top
+
+    def test_generate_graph(self):
+        """Test that the generator writes the requested shape."""
+        counts, _ = self._generate(GraphSpec(nodes=500, edges=2000, distribution="uniform"))
+
+        self.assertEqual(counts["nodes"], 500)
+        self.assertGreater(counts["edges"], 1900)
+        self.assertLessEqual(counts["edges"], 2000)
+
+    def test_powerlaw_concentrates_edges(self):
+        """Test that a power-law graph has larger hubs than a uniform one."""
+        _, uniform_top = self._generate(GraphSpec(nodes=500, edges=2000, distribution="uniform"))
+        _, powerlaw_top = self._generate(GraphSpec(nodes=500, edges=2000, distribution="powerlaw"))
+
+        self.assertGreater(powerlaw_top, uniform_top * 3)
+
+    def test_invalid_distribution(self):
+        """Test that an unknown distribution is rejected."""
+        with self.assertRaises(ValueError):
+            self._generate(GraphSpec(distribution="zipf"))
+
+    def test_build_script_is_reproducible(self):
+        """Test that the same seed replays the same calls for every workload."""
+        spec = GraphSpec(nodes=100, edges=200)
+        script = build_script(spec, iterations=4, seed=1)
+
+        self.assertEqual(script, build_script(spec, iterations=4, seed=1))
+        self.assertEqual({call["workload"] for call in script}, set(WORKLOADS))
+        self.assertEqual(len(script), 4 * len(WORKLOADS))
+
+    def test_summarize(self):
+        """Test latency percentiles and throughput."""
+        summary = summarize([float(i) for i in range(1, 101)], elapsed_s=2.0)
+
+        self.assertEqual(summary["ops"], 100)
+        self.assertAlmostEqual(summary["p50_ms"], 50.5)
+        self.assertAlmostEqual(summary["p95_ms"], 95.05)
+        self.assertAlmostEqual(summary["p99_ms"], 99.01)
+        self.assertEqual(summary["throughput"], 50.0)
+        self.assertGreater(summary["peak_rss_mb"], 0)
+
+    def test_compare_to_baseline(self):
+        """Test that only regressions beyond their threshold are reported."""
+        baseline = {"workloads": {"query": {"p95_ms": 10.0, "throughput": 100.0, "peak_rss_mb": 50.0}}}
+        results = {"workloads": {
+            "query": {"p95_ms": 14.0, "throughput": 70.0, "peak_rss_mb": 55.0},
+            "refresh": {"p95_ms": 99.0},
+        }}
+
+        regressions = compare_to_baseline(results, baseline)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("query p95_ms"))
+        self.assertTrue(regressions[1].startswith("query throughput"))
+        self.assertEqual(compare_to_baseline(results, baseline, {"p95_ms": 0.5, "throughput": 0.5}), [])
+
+    def test_run_benchmark(self):
+        """Test a small end-to-end run of every workload."""
+        results = run_benchmark(GraphSpec(nodes=300, edges=1000), iterations=3, warmup=1)
+
+        self.assertEqual(set(results["workloads"]), set(WORKLOADS))
+        for summary in results["workloads"].values():
+            self.assertEqual(summary["ops"], 3)
+        self.assertEqual(compare_to_baseline(results, results), [])
+
+
+if __name__ == "__main__":
+    unittest.main()